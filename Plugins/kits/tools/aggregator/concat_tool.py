@@ -13,6 +13,7 @@ class AggregatorConcatTool(ToolBase):
     description: str = Field(
         "Concatenate upstream outputs into a single string or JSON array.",
     )
+    deterministic = True
 
     async def _execute_impl(
         self,
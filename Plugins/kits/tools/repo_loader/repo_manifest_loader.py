@@ -13,6 +13,8 @@ class RepoManifestLoaderTool(ToolBase):
     description: str = Field(
         "Scan a mounted repository path for plugins.v0 manifests and register components.",
     )
+    # Blocking filesystem scan that also writes to the in-process registry
+    execution_mode = "thread"
 
     async def _execute_impl(
         self,
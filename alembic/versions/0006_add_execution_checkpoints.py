@@ -0,0 +1,34 @@
+"""add execution_checkpoints table
+
+Revision ID: 0006_add_execution_checkpoints
+Revises: 0005_add_workspaces_projects_mounts
+Create Date: 2025-09-20 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006_add_execution_checkpoints"
+down_revision = "0005_add_workspaces_projects_mounts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:  # noqa: D401
+    """Create the per-node checkpoint table used for crash recovery."""
+    op.create_table(
+        "execution_checkpoints",
+        sa.Column("execution_id", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column("node_key", sa.String(length=255), primary_key=True, nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()")),
+    )
+
+
+def downgrade() -> None:  # noqa: D401
+    """Drop the execution_checkpoints table."""
+    op.drop_table("execution_checkpoints")
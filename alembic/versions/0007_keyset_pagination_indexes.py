@@ -0,0 +1,65 @@
+"""add keyset pagination sort keys and indexes
+
+Revision ID: 0007_keyset_pagination_ix
+Revises: 0006_add_execution_checkpoints
+Create Date: 2025-09-27 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+# Keep revision id <= 32 chars to fit default alembic_version column
+revision = "0007_keyset_pagination_ix"
+down_revision = "0006_add_execution_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:  # noqa: D401
+    """Add executions.created_at and the composite indexes behind keyset pages.
+
+    B-tree indexes are scanned backwards for the ``DESC, DESC`` listings, so
+    every column is indexed ascending.
+    """
+    # Executions had no stable creation timestamp (started_at is NULL until
+    # the run starts); backfill from started_at where known
+    op.add_column(
+        "executions",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    op.execute(
+        sa.text(
+            "UPDATE executions SET created_at = started_at WHERE started_at IS NOT NULL"
+        )
+    )
+    op.create_index("ix_executions_created_id", "executions", ["created_at", "id"])
+
+    # Library listings: ORDER BY created_at DESC, id DESC within a scope,
+    # with and without an org filter
+    op.create_index(
+        "ix_semantic_scope_org_created_id",
+        "semantic_memory",
+        ["scope", "org_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_semantic_scope_created_id",
+        "semantic_memory",
+        ["scope", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:  # noqa: D401
+    """Drop the keyset indexes and executions.created_at."""
+    op.drop_index("ix_semantic_scope_created_id", table_name="semantic_memory")
+    op.drop_index("ix_semantic_scope_org_created_id", table_name="semantic_memory")
+    op.drop_index("ix_executions_created_id", table_name="executions")
+    op.drop_column("executions", "created_at")
@@ -0,0 +1,35 @@
+"""Content of offloaded node outputs (see :mod:`ice_core.utils.blob_store`)."""
+
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
+
+from ice_api.security import require_auth
+from ice_core.utils.blob_store import get_blob_store
+
+router = APIRouter(
+    prefix="/api/v1/blobs", tags=["blobs"], dependencies=[Depends(require_auth)]
+)
+
+
+@router.get("/{digest}")
+async def get_blob(digest: str) -> Response:
+    """Return the raw bytes behind a ``{"$blob": digest}`` reference.
+
+    Blobs are content-addressed and therefore immutable.
+    """
+    try:
+        data = await asyncio.to_thread(get_blob_store().get, digest)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Blob not found") from None
+    return Response(
+        content=data,
+        media_type="application/octet-stream",
+        headers={
+            "ETag": f'"{digest}"',
+            "Cache-Control": "private, max-age=31536000, immutable",
+        },
+    )
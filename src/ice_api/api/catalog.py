@@ -7,9 +7,11 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel, Field
 
+from ice_api.http_cache import cached_response, response_cache
+
 
 class UIHints(BaseModel):
     """Optional UI rendering hints for studio forms."""
@@ -57,7 +59,7 @@ router = APIRouter(prefix="/api/v1/meta", tags=["discovery", "catalog"])
 
 
 @router.get("/nodes", response_model=NodeCatalog)
-async def list_node_catalog() -> NodeCatalog:  # noqa: D401
+async def list_node_catalog(request: Request) -> Response:  # noqa: D401
     """Return catalog of nodes with schemas for tools.
 
     Notes
@@ -65,8 +67,19 @@ async def list_node_catalog() -> NodeCatalog:  # noqa: D401
     - Tool schemas are discovered from the registered tool factories.
     - Other node categories are listed by name at this tier (schemas are
       typically resolved at compile-time or via specialized endpoints).
+    - The catalog is rebuilt only when the registry generation changes and
+      supports ``If-None-Match`` revalidation.
     """
 
+    from ice_core.registry import registry
+
+    cached = await response_cache.get(
+        "meta.nodes", registry.generation, _build_node_catalog
+    )
+    return cached_response(request, cached)
+
+
+def _build_node_catalog() -> NodeCatalog:
     from ice_api.security import is_tool_allowed
     from ice_core.models import NodeType
     from ice_core.registry import global_agent_registry, global_chain_registry, registry
@@ -205,7 +218,7 @@ class ModelsCatalog(BaseModel):
 
 
 @router.get("/models", response_model=ModelsCatalog)
-async def list_models() -> ModelsCatalog:  # noqa: D401
+async def list_models(request: Request) -> Response:  # noqa: D401
     """Return approved providers and models for UI dropdowns.
 
     Returns
@@ -220,6 +233,12 @@ async def list_models() -> ModelsCatalog:  # noqa: D401
     >>> # fetch('/api/v1/meta/models').then(r => r.json())
     """
 
+    # Static list: a single cached body, revalidated by ETag
+    cached = await response_cache.get("meta.models", 0, _build_models_catalog)
+    return cached_response(request, cached)
+
+
+def _build_models_catalog() -> ModelsCatalog:
     providers = [
         ProviderInfo(id="openai", label="OpenAI"),
         ProviderInfo(id="anthropic", label="Anthropic"),
@@ -16,7 +16,16 @@ from ice_api.db.database_session_async import session_scope
 from ice_api.db.database_session_async import get_session as _get_db_session
 from ice_api.db.orm_models_core import BlueprintRecord as _BPRec
 from ice_api.db.orm_models_core import ExecutionRecord, ExecutionEventRecord
+from ice_api.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+    stream_pages,
+    wants_ndjson,
+)
 from ice_api.redis_client import get_redis
+from ice_core.metrics import EXEC_IN_FLIGHT
 from ice_core.models.mcp import Blueprint
 
 
@@ -68,6 +77,7 @@ class ExecutionsListItem(BaseModel):
 
 class ExecutionsListResponse(BaseModel):
     executions: List[ExecutionsListItem]
+    next_cursor: Optional[str] = None
 
 
 class ExecutionStartRequest(BaseModel):
@@ -161,6 +171,7 @@ async def _run_workflow_async(
         service = WorkflowExecutionService()
     except Exception:
         # In minimal builds orchestrator may be unavailable
+        EXEC_IN_FLIGHT.labels(surface="executions").dec()
         raise RuntimeError("Orchestrator runtime not available")
     record = store[execution_id]
     try:
@@ -206,10 +217,12 @@ async def _run_workflow_async(
         # Execute with event emitter if the service supports it
         try:
             # Preferred path: execute from NodeSpec list
+            # run_id lets a checkpoint-enabled runtime resume this execution
             result = await service.execute_blueprint(
                 bp.nodes,
                 inputs=inputs,
                 name=f"run_{execution_id}",
+                run_id=execution_id,
             )
         except Exception:
             # As a last resort, construct a Workflow and execute
@@ -306,6 +319,8 @@ async def _run_workflow_async(
                 pass
         except Exception:
             pass
+    finally:
+        EXEC_IN_FLIGHT.labels(surface="executions").dec()
 
 
 # ---------------------------------------------------------------------------
@@ -386,24 +401,24 @@ async def start_execution(  # noqa: D401 – API route
     try:
         from importlib import import_module
 
-        from ice_core.utils.node_conversion import convert_node_specs
-
         runtime_config = getattr(
             import_module("ice_orchestrator.config"), "runtime_config"
         )
-        WorkflowCostEstimator = getattr(
-            import_module("ice_orchestrator.execution.cost_estimator"),
-            "WorkflowCostEstimator",
+        get_plan_cache = getattr(
+            import_module("ice_orchestrator.execution.plan_cache"), "get_plan_cache"
         )
 
-        node_cfgs = convert_node_specs(blueprint.nodes)
-        estimator = WorkflowCostEstimator()
-        est = estimator.estimate_workflow_cost(node_cfgs)
+        # Estimated once per blueprint content, cached with the compiled plan
+        est = (await get_plan_cache().get_or_convert(blueprint.nodes)).estimate
         env_budget = os.getenv("ORG_BUDGET_USD")
         budget_limit = (
             float(env_budget) if env_budget else runtime_config.org_budget_usd
         )
-        if budget_limit is not None and est.total_avg_cost > budget_limit:
+        if (
+            est is not None
+            and budget_limit is not None
+            and est.total_avg_cost > budget_limit
+        ):
             raise HTTPException(
                 status_code=402,
                 detail=f"Estimated cost ${est.total_avg_cost:.2f} exceeds budget ${budget_limit:.2f}",
@@ -457,6 +472,9 @@ async def start_execution(  # noqa: D401 – API route
     except Exception:
         pass
 
+    # Track accepted-but-unfinished runs (queue depth) for load testing
+    EXEC_IN_FLIGHT.labels(surface="executions").inc()
+
     # Run in background by default. In tests (in-process TestClient), the
     # request loop may cancel orphan tasks. Allow a sync path via env toggle.
     if (
@@ -570,23 +588,64 @@ async def get_execution_status(
     raise HTTPException(status_code=500, detail="unreachable")
 
 
-@router.get("/", dependencies=[Depends(rate_limit), Depends(require_auth)])
-async def list_executions(request: Request) -> ExecutionsListResponse:  # noqa: D401
-    """List executions from Postgres (authoritative)."""
-    async with session_scope() as session:
-        rows = (
-            await session.execute(sa.select(ExecutionRecord))
-        ).scalars().all()
-        items = [
-            ExecutionsListItem(
-                execution_id=r.id, status=r.status, blueprint_id=r.blueprint_id
-            )
-            for r in rows
-        ]
-        return ExecutionsListResponse(executions=items)
+@router.get(
+    "/",
+    dependencies=[Depends(rate_limit), Depends(require_auth)],
+    response_model=ExecutionsListResponse,
+)
+async def list_executions(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor value"),
+) -> Any:  # noqa: D401
+    """List executions from Postgres (authoritative), newest first.
 
-    # If no session yielded, return empty list (defensive)
-    return ExecutionsListResponse(executions=[])
+    Keyset-paginated on ``(created_at, id)``; ``Accept: application/x-ndjson``
+    streams every execution from *cursor* on, one item per line.
+    """
+
+    async def fetch_page(page_cursor: Optional[str]) -> Page:
+        return await _executions_page(limit, page_cursor)
+
+    if wants_ndjson(request):
+        return ndjson_response(stream_pages(fetch_page, cursor))
+    items, next_cursor = await fetch_page(cursor)
+    return ExecutionsListResponse(executions=items, next_cursor=next_cursor)
+
+
+async def _executions_page(limit: int, cursor: Optional[str]) -> Page:
+    stmt = (
+        sa.select(
+            ExecutionRecord.id,
+            ExecutionRecord.status,
+            ExecutionRecord.blueprint_id,
+            ExecutionRecord.created_at,
+        )
+        .order_by(ExecutionRecord.created_at.desc(), ExecutionRecord.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        after_ts, after_id = decode_cursor(cursor, arity=2)
+        stmt = stmt.where(
+            sa.tuple_(ExecutionRecord.created_at, ExecutionRecord.id)
+            < sa.tuple_(
+                sa.literal(after_ts, sa.DateTime(timezone=True)), sa.literal(after_id)
+            )
+        )
+    async with session_scope() as session:
+        rows = (await session.execute(stmt)).all()
+
+    next_cursor: Optional[str] = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    items = [
+        ExecutionsListItem(
+            execution_id=r.id, status=r.status, blueprint_id=r.blueprint_id
+        )
+        for r in rows
+    ]
+    return items, next_cursor
 
 
 @router.post(
@@ -632,3 +691,74 @@ async def cancel_execution(request: Request, execution_id: str) -> Dict[str, Any
     except Exception:
         pass
     return {"status": "canceled"}
+
+
+@router.post(
+    "/{execution_id}/resume",
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(rate_limit), Depends(require_auth)],
+)
+async def resume_execution(
+    request: Request, execution_id: str
+) -> ExecutionStartResponse:  # noqa: D401
+    """Re-schedule an interrupted execution on this worker.
+
+    Requires ``ICE_CHECKPOINT_STORE``: nodes persisted by the previous worker
+    are reused and only the remaining nodes run.
+    """
+    from importlib import import_module
+
+    checkpoint_store_from_env = getattr(
+        import_module("ice_orchestrator.execution.checkpoint_store"),
+        "checkpoint_store_from_env",
+    )
+    ckpt_store = checkpoint_store_from_env()
+    if ckpt_store is None:
+        raise HTTPException(status_code=409, detail="Checkpointing is not enabled")
+    checkpoint = await ckpt_store.load(execution_id)
+    if not checkpoint:
+        raise HTTPException(status_code=404, detail="No checkpoint for execution")
+
+    exec_store = _get_exec_store(request)
+    existing = exec_store.get(execution_id)
+    if existing is not None and existing.get("status") in {"pending", "running"}:
+        raise HTTPException(status_code=409, detail="Execution is still active")
+
+    blueprint_id: Optional[str] = existing.get("blueprint_id") if existing else None
+    if blueprint_id is None:
+        try:
+            async with session_scope() as session:
+                row = await session.get(ExecutionRecord, execution_id)
+                if row is not None:
+                    blueprint_id = row.blueprint_id
+        except Exception:
+            pass
+    if blueprint_id is None:
+        try:
+            raw = await get_redis().hget(_exec_key(execution_id), "blueprint_id")  # type: ignore[misc]
+            if raw:
+                blueprint_id = raw.decode() if isinstance(raw, bytes) else str(raw)
+        except Exception:
+            pass
+    if blueprint_id is None:
+        raise HTTPException(status_code=404, detail="Execution not found")
+
+    blueprint = await _get_blueprint(request, blueprint_id)
+    inputs = checkpoint.get("inputs")
+    exec_store[execution_id] = cast(
+        _ExecutionRecord,
+        {"status": "pending", "blueprint_id": blueprint_id, "_event": asyncio.Event()},
+    )
+    EXEC_IN_FLIGHT.labels(surface="executions").inc()
+    if (
+        os.getenv("ICE_EXEC_SYNC_FOR_TESTS", "0") == "1"
+        or "PYTEST_CURRENT_TEST" in os.environ
+    ):
+        await _run_workflow_async(execution_id, blueprint, inputs, exec_store)
+    else:
+        asyncio.create_task(
+            _run_workflow_async(execution_id, blueprint, inputs, exec_store)
+        )
+    return ExecutionStartResponse(
+        execution_id=execution_id, status=exec_store[execution_id]["status"]
+    )
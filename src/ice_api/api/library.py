@@ -5,11 +5,19 @@ from hashlib import sha256
 from typing import Any, Dict, List, Optional
 
 import sqlalchemy as sa
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
-from sqlalchemy import bindparam, text
+from sqlalchemy import BindParameter, bindparam, text
 
 from ice_api.db.database_session_async import session_scope
+from ice_api.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+    stream_pages,
+    wants_ndjson,
+)
 from ice_api.security import require_auth
 from ice_api.services.semantic_memory_repository import insert_semantic_entry
 
@@ -175,50 +183,87 @@ async def add_asset(payload: LibraryAssetIn) -> Dict[str, Any]:
 
 @router.get("/assets", response_model=Dict[str, Any])
 async def list_assets(
+    request: Request,
     *,
     org_id: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
     prefix: Optional[str] = Query(None, description="Filter by label prefix"),
     limit: int = Query(20, ge=1, le=200),
-) -> Dict[str, Any]:
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor value"),
+) -> Any:
+    """List library assets, newest first, one keyset page at a time.
+
+    Returns ``{"items": [...], "next_cursor": str | None}``; pass
+    ``next_cursor`` back as ``cursor`` for the following page.  With
+    ``Accept: application/x-ndjson`` every asset from *cursor* on is streamed
+    instead, fetched *limit* rows at a time.
+    """
+
     prefix_key = _asset_key(user_id, (prefix or ""))
+
+    async def fetch_page(page_cursor: Optional[str]) -> Page:
+        return await _assets_page(prefix_key, org_id, limit, page_cursor)
+
+    if wants_ndjson(request):
+        return ndjson_response(stream_pages(fetch_page, cursor))
+    items, next_cursor = await fetch_page(cursor)
+    return {"items": items, "next_cursor": next_cursor}
+
+
+async def _assets_page(
+    prefix_key: str, org_id: Optional[str], limit: int, cursor: Optional[str]
+) -> Page:
+    where_parts = ["scope = :scope", "key LIKE :prefix"]
+    params: Dict[str, Any] = {
+        "scope": "library",
+        "prefix": prefix_key + "%",
+        # One extra row tells whether another page exists
+        "limit": limit + 1,
+    }
+    binds: List[BindParameter[Any]] = [
+        bindparam("scope", type_=sa.String()),
+        bindparam("prefix", type_=sa.String()),
+        bindparam("limit", type_=sa.Integer()),
+    ]
+    if org_id is not None:
+        where_parts.append("org_id = :org_id")
+        params["org_id"] = org_id
+        binds.append(bindparam("org_id", type_=sa.String()))
+    if cursor is not None:
+        # Keyset: rows strictly after the last one returned, in index order
+        after_ts, after_id = decode_cursor(cursor, arity=2)
+        where_parts.append("(created_at, id) < (:after_ts, :after_id)")
+        params["after_ts"] = after_ts
+        params["after_id"] = after_id
+        binds.append(bindparam("after_ts", type_=sa.DateTime(timezone=True)))
+        binds.append(bindparam("after_id", type_=sa.Integer()))
+    sql = f"""
+        SELECT id, key, meta_json, org_id, user_id, scope, created_at
+        FROM semantic_memory
+        WHERE {' AND '.join(where_parts)}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+    """
     async with session_scope() as session:
-        where_parts = ["scope = :scope", "key LIKE :prefix"]
-        params: Dict[str, Any] = {
-            "scope": "library",
-            "prefix": prefix_key + "%",
-            "limit": limit,
-        }
-        if org_id is not None:
-            where_parts.append("org_id = :org_id")
-            params["org_id"] = org_id
-        sql = f"""
-            SELECT key, meta_json, org_id, user_id, scope, created_at
-            FROM semantic_memory
-            WHERE {' AND '.join(where_parts)}
-            ORDER BY created_at DESC
-            LIMIT :limit
-        """
-        stmt = text(sql).bindparams(
-            bindparam("scope", type_=sa.String()),
-            bindparam("prefix", type_=sa.String()),
-            bindparam("limit", type_=sa.Integer()),
-        )
-        if org_id is not None:
-            stmt = stmt.bindparams(bindparam("org_id", type_=sa.String()))
-        rows = await session.execute(stmt, params)
-        items: List[Dict[str, Any]] = []
-        for r in rows.mappings():
-            rec = dict(r)
-            ca = rec.get("created_at")
-            try:
-                if ca is not None:
-                    rec["created_at"] = ca.isoformat()
-            except Exception:
-                pass
-            items.append(rec)
-        return {"items": items}
-    return {"items": []}
+        rows = (await session.execute(text(sql).bindparams(*binds), params)).mappings()
+        records = [dict(r) for r in rows]
+
+    next_cursor: Optional[str] = None
+    if len(records) > limit:
+        records = records[:limit]
+        last = records[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    items: List[Dict[str, Any]] = []
+    for rec in records:
+        rec.pop("id", None)
+        ca = rec.get("created_at")
+        try:
+            if ca is not None:
+                rec["created_at"] = ca.isoformat()
+        except Exception:
+            pass
+        items.append(rec)
+    return items, next_cursor
 
 
 @router.get("/assets/{label}", response_model=LibraryAssetOut)
@@ -25,13 +25,16 @@ the canvas UI to build workflows progressively without executing them.
 from __future__ import annotations
 
 import asyncio
+import bisect
 import datetime as _dt
 import json
 import logging
 import uuid
 from typing import Any, Dict, List, Literal, Optional, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 # Try to import EventSourceResponse, fallback if not available
@@ -46,6 +49,7 @@ import os
 
 # Redis helper
 from ice_api.redis_client import get_redis
+from ice_core.metrics import EXEC_IN_FLIGHT
 from ice_core.models import INode, NodeType
 from ice_core.models.enums import ModelProvider
 from ice_core.models.llm import LLMConfig
@@ -92,6 +96,15 @@ def _get_workflow_service() -> IWorkflowService:
 
 router = APIRouter(tags=["mcp"])
 from ice_api.dependencies import rate_limit
+from ice_api.http_cache import cached_response, response_cache
+from ice_api.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+    stream_pages,
+    wants_ndjson,
+)
 from ice_api.security import require_auth
 
 # ---------------------------------------------------------------------------
@@ -688,31 +701,20 @@ async def chat_turn(agent_name: str, req: ChatRequest, request: Request) -> Chat
 
     - Resolves data-first AgentDefinition if present.
     - Builds an LLM node on-the-fly using the agent's llm_config and system_prompt.
-    - Persists message history per (agent_name, session_id) in Redis.
+    - Appends the turn to the per-(agent_name, session_id) Redis list and
+      prompts with a token-budgeted tail of it (see ``ChatHistory``).
     """
 
-    redis = get_redis()
-    chat_key = f"chat:{agent_name}:{req.session_id}"
+    from ice_api.services.chat_history import ChatHistory  # local import
+
+    history = ChatHistory(get_redis(), agent_name, req.session_id)
     if req.reset:
-        await redis.hset(chat_key, mapping={"messages": json.dumps([])})
+        await history.reset()
 
-    # Load previous messages if any
-    raw_prev = await redis.hget(chat_key, "messages")  # type: ignore[misc]
-    prev: list[dict[str, str]] = []
-    if raw_prev:
-        try:
-            if isinstance(raw_prev, str):
-                as_text = raw_prev
-            elif isinstance(raw_prev, (bytes, bytearray)):
-                try:
-                    as_text = raw_prev.decode()
-                except Exception:
-                    as_text = "[]"
-            else:
-                as_text = str(raw_prev)
-            prev = json.loads(as_text)
-        except Exception:
-            prev = []
+    # Load only the newest messages that fit the prompt budget
+    prev, history_summary = await history.tail(
+        int(os.getenv("CHAT_HISTORY_TOKEN_BUDGET", "3000"))
+    )
 
     # Resolve agent definition for system prompt and llm_config
     system_prompt = ""
@@ -778,6 +780,8 @@ async def chat_turn(agent_name: str, req: ChatRequest, request: Request) -> Chat
     prompt_lines: list[str] = []
     if system_prompt:
         prompt_lines.append(f"System: {system_prompt}")
+    if history_summary:
+        prompt_lines.append(f"Summary of earlier conversation:\n{history_summary}")
     for m in messages:
         role = m.get("role", "user")
         content = m.get("content", "")
@@ -917,16 +921,7 @@ async def chat_turn(agent_name: str, req: ChatRequest, request: Request) -> Chat
 
     # Update history and persist (Redis for fast session access)
     messages.append({"role": "assistant", "content": assistant})
-    await redis.hset(chat_key, mapping={"messages": json.dumps(messages)})
-    # Apply TTL for chat sessions if configured
-    try:
-        ttl = int(os.getenv("CHAT_TTL_SECONDS", "0"))
-        if ttl > 0:
-            # _RedisStub may not implement expire; guard with hasattr
-            if hasattr(redis, "expire"):
-                await redis.expire(chat_key, ttl)  # type: ignore[misc]
-    except Exception:
-        pass
+    await history.append(messages[-2], messages[-1])
 
     # Also write a durable transcript entry to Postgres semantic_memory (DB as SSOT)
     try:
@@ -1013,8 +1008,20 @@ async def register_component(
     "/components",
     dependencies=[Depends(rate_limit), Depends(require_auth)],
 )
-async def list_all_components(request: Request) -> Dict[str, Any]:  # noqa: D401
-    """List stored components from the Redis index plus current registry view."""
+async def list_all_components(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor value"),
+) -> Response:  # noqa: D401
+    """List stored components from the Redis index plus current registry view.
+
+    Stored components are paged by key (``next_cursor``); the registry view
+    is included on the first page only.  ``Accept: application/x-ndjson``
+    streams every stored component from *cursor* on instead.
+
+    The index maps each component to its version lock, so the first page is
+    rebuilt only when the index or the registry generation changes.
+    """
 
     from ice_api.services.component_service import ComponentService
 
@@ -1027,8 +1034,40 @@ async def list_all_components(request: Request) -> Dict[str, Any]:  # noqa: D401
         )  # type: ignore[attr-defined]
     service: ComponentService = request.app.state.component_service  # type: ignore[attr-defined]
     index = await service.list_index()
+    keys = sorted(index)
+
+    async def fetch_page(page_cursor: Optional[str]) -> Page:
+        return await _stored_components_page(service, keys, limit, page_cursor)
+
+    if wants_ndjson(request):
+        return ndjson_response(stream_pages(fetch_page, cursor))
+
+    async def build() -> Dict[str, Any]:
+        stored, next_cursor = await fetch_page(cursor)
+        body: Dict[str, Any] = {"stored": stored, "next_cursor": next_cursor}
+        if cursor is None:
+            body["registered"] = _registered_components()
+        return body
+
+    if cursor is not None:
+        # Later pages are fetched once per listing; only the polled first page
+        # is worth caching
+        return JSONResponse(content=jsonable_encoder(await build()))
+    version = (registry.generation, limit, tuple(sorted(index.items())))
+    cached = await response_cache.get("mcp.components", version, build)
+    return cached_response(request, cached)
+
+
+async def _stored_components_page(
+    service: Any, keys: List[str], limit: int, cursor: Optional[str]
+) -> Page:
+    start = 0
+    if cursor is not None:
+        (after,) = decode_cursor(cursor, arity=1)
+        start = bisect.bisect_right(keys, str(after))
+    page_keys = keys[start : start + limit]
     stored: list[Dict[str, Any]] = []
-    for key in index.keys():
+    for key in page_keys:
         ctype, name = key.split(":", 1)
         rec, _ = await service.get(ctype, name)
         version = rec.get("version") if rec else None
@@ -1043,7 +1082,11 @@ async def list_all_components(request: Request) -> Dict[str, Any]:  # noqa: D401
                 "updated_at": updated_at,
             }
         )
+    next_cursor = encode_cursor(page_keys[-1]) if start + limit < len(keys) else None
+    return stored, next_cursor
 
+
+def _registered_components() -> List[Dict[str, Any]]:
     # Include registered factories as a convenience
     tools = [
         {"type": "tool", "name": n} for n, _ in registry.available_tool_factories()
@@ -1056,8 +1099,7 @@ async def list_all_components(request: Request) -> Dict[str, Any]:  # noqa: D401
         {"type": "workflow", "name": n}
         for n, _ in registry.available_workflow_factories()
     ]
-
-    return {"stored": stored, "registered": tools + agents + workflows}
+    return tools + agents + workflows
 
 
 @router.get(
@@ -1377,39 +1419,34 @@ async def start_run(req: RunRequest) -> RunAck:
     if bp is None:
         raise HTTPException(status_code=404, detail="blueprint_id not found")
 
-    from ice_core.validation.schema_validator import validate_blueprint
+    from importlib import import_module
 
+    # Validation, conversion and cost estimation run once per blueprint
+    # content; repeat runs reuse the compiled plan.
     try:
-        await validate_blueprint(bp)
-
-        bp.validate_runtime()
-        from ice_core.utils.node_conversion import convert_node_specs
-
-        conv_nodes = convert_node_specs(bp.nodes)
-        for cfg in conv_nodes:
-            if hasattr(cfg, "runtime_validate"):
-                cfg.runtime_validate()  # type: ignore[attr-defined]
+        get_plan_cache = getattr(
+            import_module("ice_orchestrator.execution.plan_cache"), "get_plan_cache"
+        )
+        plan = await get_plan_cache().get_or_compile(bp)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Invalid blueprint: {exc}")
+    conv_nodes = list(plan.nodes)
 
     # Budget preflight parity with /api/v1/executions -------------------------
     try:
-        from importlib import import_module
-
         runtime_config = getattr(
             import_module("ice_orchestrator.config"), "runtime_config"
         )
-        WorkflowCostEstimator = getattr(
-            import_module("ice_orchestrator.execution.cost_estimator"),
-            "WorkflowCostEstimator",
-        )
-        estimator = WorkflowCostEstimator()
-        est = estimator.estimate_workflow_cost(conv_nodes)
+        est = plan.estimate
         env_budget = os.getenv("ORG_BUDGET_USD")
         budget_limit = (
             float(env_budget) if env_budget else runtime_config.org_budget_usd
         )
-        if budget_limit is not None and est.total_avg_cost > budget_limit:
+        if (
+            est is not None
+            and budget_limit is not None
+            and est.total_avg_cost > budget_limit
+        ):
             raise HTTPException(
                 status_code=402,
                 detail=(
@@ -1426,6 +1463,7 @@ async def start_run(req: RunRequest) -> RunAck:
     run_id = f"run_{uuid.uuid4().hex[:8]}"
     start_ts = _dt.datetime.utcnow()
 
+    EXEC_IN_FLIGHT.labels(surface="mcp_runs").inc()
     try:
         redis = get_redis()
 
@@ -1445,6 +1483,7 @@ async def start_run(req: RunRequest) -> RunAck:
             req.options.max_parallel,
             run_id=run_id,
             event_emitter=_emit,
+            plan=plan,
         )
         from pydantic import BaseModel
 
@@ -1469,6 +1508,8 @@ async def start_run(req: RunRequest) -> RunAck:
         success = False
         output = {}
         error_msg = str(exc)
+    finally:
+        EXEC_IN_FLIGHT.labels(surface="mcp_runs").dec()
 
     end_ts = _dt.datetime.utcnow()
 
@@ -1518,8 +1559,16 @@ try:
     @router.get("/runs/{run_id}/events")
     async def event_stream(
         run_id: str,
+        request: Request,
     ) -> EventSourceResponse:  # – async generator
-        """Stream events for *run_id* via Server-Sent Events."""
+        """Stream events for *run_id* via Server-Sent Events.
+
+        Every event carries its stream id, so a reconnecting client resumes
+        after the ``Last-Event-ID`` it sends (``?last_event_id=`` also works).
+        All clients of a run share one Redis reader in this process.
+        """
+
+        from ice_api.run_streams import get_stream_multiplexer
 
         redis = get_redis()
 
@@ -1529,17 +1578,15 @@ try:
         if not exists:
             raise HTTPException(status_code=404, detail="run_id not found")
 
-        async def _gen() -> AsyncGenerator[str, None]:
-            last_id: str = "0-0"
-            while True:
-                events = await redis.xread({stream: last_id}, block=1000, count=10)  # type: ignore[arg-type,misc]
-                if events:
-                    for _, batches in events:
-                        for ev_id, data in batches:
-                            last_id = ev_id
-                            yield f"event: {data['event']}\ndata: {data['payload']}\n\n"
-                            if data.get("event") == "workflow.finished":
-                                return
+        last_event_id = request.headers.get(
+            "last-event-id"
+        ) or request.query_params.get("last_event_id")
+
+        async def _gen() -> AsyncGenerator[Dict[str, str], None]:
+            async for ev_id, data in get_stream_multiplexer().subscribe(
+                stream, last_event_id=last_event_id
+            ):
+                yield {"id": ev_id, "event": data["event"], "data": data["payload"]}
 
         return EventSourceResponse(_gen())
 
@@ -1566,6 +1613,7 @@ async def get_workflow_graph_metrics(workflow_id: str) -> Dict[str, Any]:
     workflow_service = _get_workflow_service()
     try:
         workflow = await workflow_service.get_workflow(workflow_id)
+        await workflow.warm_analytics()
         metrics = workflow.get_graph_metrics()
         return {"workflow_id": workflow_id, "metrics": metrics}
     except Exception as e:
@@ -1578,6 +1626,7 @@ async def get_workflow_layout_hints(workflow_id: str) -> Dict[str, Any]:
     workflow_service = _get_workflow_service()
     try:
         workflow = await workflow_service.get_workflow(workflow_id)
+        await workflow.warm_analytics()
         layout_hints = workflow.get_visual_layout_hints()
         return {"workflow_id": workflow_id, "layout_hints": layout_hints}
     except Exception as e:
@@ -1590,6 +1639,7 @@ async def get_workflow_graph_analysis(workflow_id: str) -> Dict[str, Any]:
     workflow_service = _get_workflow_service()
     try:
         workflow = await workflow_service.get_workflow(workflow_id)
+        await workflow.warm_analytics()
 
         analysis = {
             "metrics": workflow.get_graph_metrics(),
@@ -1609,6 +1659,7 @@ async def analyze_node_impact(workflow_id: str, node_id: str) -> Dict[str, Any]:
     workflow_service = _get_workflow_service()
     try:
         workflow = await workflow_service.get_workflow(workflow_id)
+        await workflow.warm_analytics()
         impact = workflow.analyze_node_impact(node_id)
         return {"workflow_id": workflow_id, "node_id": node_id, "impact": impact}
     except Exception as e:
@@ -1621,6 +1672,7 @@ async def get_node_suggestions(workflow_id: str, node_id: str) -> Dict[str, Any]
     workflow_service = _get_workflow_service()
     try:
         workflow = await workflow_service.get_workflow(workflow_id)
+        await workflow.warm_analytics()
         suggestions = workflow.suggest_next_nodes(node_id)
         return {
             "workflow_id": workflow_id,
@@ -1639,6 +1691,7 @@ async def find_workflow_patterns(
     workflow_service = _get_workflow_service()
     try:
         workflow = await workflow_service.get_workflow(workflow_id)
+        await workflow.warm_analytics()
         patterns = workflow.find_workflow_patterns(pattern_nodes)
         return {
             "workflow_id": workflow_id,
@@ -12,15 +12,16 @@ Notes
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, Field, ValidationError
 
 from ice_api.db.database_session_async import session_scope
 from ice_api.db.orm_models_core import BlueprintRecord
 from ice_api.dependencies import rate_limit
+from ice_api.http_cache import cached_response, response_cache
 from ice_api.security import require_auth
 from ice_core.models.mcp import Blueprint
 from ice_core.unified_registry import registry
@@ -63,13 +64,16 @@ class TemplatesList(BaseModel):
     response_model=TemplatesList,
     dependencies=[Depends(rate_limit), Depends(require_auth)],
 )
-async def list_templates() -> TemplatesList:  # noqa: D401
+async def list_templates(request: Request) -> Response:  # noqa: D401
     """Return available template workflows.
 
     Merges two sources for zero-setup UX:
     - Registry (manifest-based) workflows when available
     - Filesystem templates under plugins/bundles/**/workflows/*.yaml
 
+    The list is rebuilt only when the registry generation or the template
+    files (by mtime) change, and supports ``If-None-Match`` revalidation.
+
     Returns:
         TemplatesList: List of available templates with ids and paths.
 
@@ -78,6 +82,29 @@ async def list_templates() -> TemplatesList:  # noqa: D401
     project_root = Path(__file__).resolve().parents[3]
     bundles_root = project_root / "plugins" / "bundles"
 
+    version = (registry.generation, _bundles_fingerprint(bundles_root))
+    cached = await response_cache.get(
+        "templates", version, lambda: _build_templates(project_root, bundles_root)
+    )
+    return cached_response(request, cached)
+
+
+def _bundles_fingerprint(bundles_root: Path) -> Tuple[Tuple[str, int], ...]:
+    """Cheap change detector for the YAML templates: paths and mtimes."""
+
+    if not bundles_root.exists():
+        return ()
+    entries: List[Tuple[str, int]] = []
+    for pattern in ("*/bundle.yaml", "*/workflows/*.yaml"):
+        for path in bundles_root.glob(pattern):
+            try:
+                entries.append((str(path), path.stat().st_mtime_ns))
+            except OSError:
+                continue
+    return tuple(sorted(entries))
+
+
+def _build_templates(project_root: Path, bundles_root: Path) -> TemplatesList:
     items: Dict[str, TemplateEntry] = {}
 
     # 1) Filesystem scan of built-in YAML templates (dev-friendly)
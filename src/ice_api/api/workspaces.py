@@ -20,10 +20,27 @@ from typing import Any, Dict, List, Optional
 import sqlalchemy as sa
 from ice_api.redis_client import get_redis
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from pydantic import BaseModel, Field, ValidationError
 
 from ice_api.dependencies import rate_limit
+from ice_api.pagination import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+    stream_pages,
+    wants_ndjson,
+)
 from ice_api.security import require_auth
 from ice_core.unified_registry import registry
 from ice_api.db.database_session_async import session_scope
@@ -344,6 +361,7 @@ async def bootstrap_defaults(request: Request) -> BootstrapResponse:  # noqa: D4
 
 class ProjectBlueprintsList(BaseModel):
     blueprint_ids: List[str]
+    next_cursor: Optional[str] = None
 
 
 class ProjectBlueprintAddResponse(BaseModel):
@@ -369,10 +387,13 @@ async def _append_project_blueprint(
     request.app.state._kv = store  # type: ignore[attr-defined]
 
 
-async def _list_project_blueprint_ids(project_id: str, request: Request) -> List[str]:
+async def _read_project_blueprint_ids(
+    project_id: str, request: Request, start: int, end: int
+) -> List[str]:
+    """Return list entries *start*..*end* (inclusive, like ``LRANGE``)."""
     try:
         redis = get_redis()
-        raw = await redis.lrange(_project_blueprints_key(project_id), 0, -1)  # type: ignore[misc]
+        raw = await redis.lrange(_project_blueprints_key(project_id), start, end)  # type: ignore[misc]
         ids: List[str] = []
         for r in raw:
             if isinstance(r, (bytes, bytearray)):
@@ -388,10 +409,50 @@ async def _list_project_blueprint_ids(project_id: str, request: Request) -> List
     store: Dict[str, Any] = getattr(request.app.state, "_kv", {})
     key = _project_blueprints_key(project_id)
     if isinstance(store.get(key), list):
-        return [str(x) for x in store.get(key, [])]
+        return [str(x) for x in store.get(key, [])[start : end + 1]]
     return []
 
 
+async def _list_project_blueprint_ids(
+    project_id: str, request: Request, *, limit: int, cursor: Optional[str] = None
+) -> Page:
+    """Return one page of the project's blueprint ids, in insertion order.
+
+    The list only grows at the tail and shrinks by removal, so the cursor
+    carries the next position *and* the id just before it.  When removals
+    have shifted the list, the page resumes right after that id instead of
+    at the stale position.
+    """
+    start = 0
+    if cursor is not None:
+        start, anchor = decode_cursor(cursor, arity=2)
+        if not isinstance(start, int) or start < 1:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Anchor, the page and one extra entry (does another page exist?)
+        window = await _read_project_blueprint_ids(
+            project_id, request, start - 1, start + limit
+        )
+        if window[:1] == [anchor]:
+            ids = window[1:]
+        else:
+            head = await _read_project_blueprint_ids(project_id, request, 0, start - 1)
+            if anchor in head:
+                start = len(head) - head[::-1].index(anchor)
+            else:
+                start = min(start, len(head))
+            ids = await _read_project_blueprint_ids(
+                project_id, request, start, start + limit
+            )
+    else:
+        ids = await _read_project_blueprint_ids(project_id, request, 0, limit)
+
+    next_cursor: Optional[str] = None
+    if len(ids) > limit:
+        ids = ids[:limit]
+        next_cursor = encode_cursor(start + limit, ids[-1])
+    return ids, next_cursor
+
+
 async def _remove_project_blueprint(
     project_id: str, blueprint_id: str, request: Request
 ) -> None:
@@ -418,17 +479,30 @@ async def _remove_project_blueprint(
     response_model=ProjectBlueprintsList,
 )
 async def list_project_blueprints(
-    request: Request, project_id: str
-) -> ProjectBlueprintsList:  # noqa: D401
-    """List blueprint identifiers associated with the project."""
+    request: Request,
+    project_id: str,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor value"),
+) -> Any:  # noqa: D401
+    """List blueprint identifiers associated with the project (paginated).
+
+    ``Accept: application/x-ndjson`` streams every id from *cursor* on.
+    """
     # Ensure project exists in DB
     async with session_scope() as session:
         pr = await session.get(ProjectRecord, project_id)
         if pr is None:
             raise HTTPException(status_code=404, detail="project not found")
-    return ProjectBlueprintsList(
-        blueprint_ids=await _list_project_blueprint_ids(project_id, request)
-    )
+
+    async def fetch_page(page_cursor: Optional[str]) -> Page:
+        return await _list_project_blueprint_ids(
+            project_id, request, limit=limit, cursor=page_cursor
+        )
+
+    if wants_ndjson(request):
+        return ndjson_response(stream_pages(fetch_page, cursor))
+    ids, next_cursor = await fetch_page(cursor)
+    return ProjectBlueprintsList(blueprint_ids=ids, next_cursor=next_cursor)
 
 
 @router.post(
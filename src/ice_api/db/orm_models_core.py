@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     UniqueConstraint,
     func,
@@ -71,11 +72,19 @@ class ExecutionRecord(Base):
     )
     cost_meta: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
     org_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[Any] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     events: Mapped[list[ExecutionEventRecord]] = relationship(
         back_populates="execution", cascade="all, delete-orphan"
     )  # type: ignore[name-defined]
 
+    __table_args__ = (
+        # Keyset pagination for execution listings (newest first)
+        Index("ix_executions_created_id", "created_at", "id"),
+    )
+
 
 class ExecutionEventRecord(Base):
     __tablename__ = "execution_events"
@@ -182,3 +191,20 @@ class MountRecord(Base):
     created_at: Mapped[Any] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+
+
+# ---------------------------------------------------------------------------
+# Durable per-node execution checkpoints ------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class ExecutionCheckpointRecord(Base):
+    __tablename__ = "execution_checkpoints"
+
+    # Not a FK to executions: MCP runs and CLI runs checkpoint too
+    execution_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    node_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    updated_at: Mapped[Any] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
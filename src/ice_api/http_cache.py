@@ -0,0 +1,114 @@
+"""Versioned response caching with strong ETags for read-mostly endpoints.
+
+Discovery and catalog payloads are pure functions of the component registry
+(plus, for some endpoints, a cheap fingerprint of another source).  Instead
+of rebuilding them on every poll, a handler names the *version* its payload
+depends on and lets :class:`VersionedResponseCache` serialise it once::
+
+    cached = await response_cache.get(
+        "catalog.nodes", registry.generation, _build_catalog
+    )
+    return cached_response(request, cached)
+
+The serialised body is reused until the version changes.  Responses carry a
+strong ``ETag`` (a hash of the body, so it is identical across workers) and
+``Cache-Control: no-cache``; a request whose ``If-None-Match`` matches gets
+an empty ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from ice_core.utils.hashing import HashMode, compute_hash
+from ice_core.utils.singleflight import SingleFlight
+
+__all__ = [
+    "CachedBody",
+    "VersionedResponseCache",
+    "cached_response",
+    "etag_matches",
+    "response_cache",
+]
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """A serialised JSON body and its strong entity tag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "CachedBody":
+        body = bytes(JSONResponse(content=jsonable_encoder(payload)).body)
+        digest = compute_hash(body.decode("utf-8"), HashMode.SECURITY)
+        return cls(body=body, etag=f'"{digest[:32]}"')
+
+
+class VersionedResponseCache:
+    """Latest serialised payload per endpoint, valid for a single version."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Hashable, CachedBody]] = {}
+        self._inflight: SingleFlight[CachedBody] = SingleFlight()
+
+    async def get(
+        self, name: str, version: Hashable, build: Callable[[], Any]
+    ) -> CachedBody:
+        """Return the body for *name* at *version*, calling *build* on a miss.
+
+        *build* may be sync or async and returns any JSON-encodable payload
+        (pydantic models included).
+        """
+
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        async def _build() -> CachedBody:
+            payload = build()
+            if inspect.isawaitable(payload):
+                payload = await payload
+            cached = CachedBody.from_payload(payload)
+            self._entries[name] = (version, cached)
+            return cached
+
+        cached, _ = await self._inflight.do(f"{name}:{version!r}", _build)
+        return cached
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Apply the weak comparison ``If-None-Match`` uses (RFC 9110 §13.1.2)."""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cached_response(request: Request, cached: CachedBody) -> Response:
+    """Return *cached* as JSON, or ``304`` when the client already has it."""
+
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+# Process-wide cache shared by the discovery, catalog and template routers
+response_cache = VersionedResponseCache()
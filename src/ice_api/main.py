@@ -101,6 +101,37 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Initialize runtime orchestrator services
     initialize_orchestrator()
 
+    # Make the Postgres checkpoint backend selectable (ICE_CHECKPOINT_STORE=postgres)
+    try:
+        register_checkpoint_backend = importlib.import_module(
+            "ice_orchestrator.execution.checkpoint_store"
+        ).register_checkpoint_backend
+        from ice_api.services.checkpoint_repository import PostgresCheckpointStore
+
+        register_checkpoint_backend("postgres", PostgresCheckpointStore)
+    except Exception:
+        logger.debug("postgres checkpoint backend unavailable", exc_info=True)
+
+    # Pre-warm sandbox workers so the first code nodes skip interpreter start-up
+    if os.getenv("ICE_SANDBOX_POOL_PREWARM", "1") == "1":
+        try:
+            await (
+                importlib.import_module("ice_orchestrator.execution.sandbox.worker_pool")
+                .get_sandbox_pool()
+                .start()
+            )
+        except Exception:
+            logger.debug("sandbox worker pool prewarm skipped", exc_info=True)
+
+    # Build the default model's tokenizer now: it may download its BPE file,
+    # which must not happen on the event loop in the middle of a request
+    try:
+        from ice_core.utils.token_counter import preload_encodings
+
+        await preload_encodings()
+    except Exception:
+        logger.debug("tokenizer preload skipped", exc_info=True)
+
     # Optionally run DB migrations
     await run_alembic_migrations_if_enabled()
 
@@ -344,6 +375,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             await redis.close()  # type: ignore[attr-defined]
     except Exception as exc:
         logger.warning("Error while closing Redis connection: %s", exc)
+    try:
+        await (
+            importlib.import_module("ice_orchestrator.execution.sandbox.worker_pool")
+            .get_sandbox_pool()
+            .close()
+        )
+    except Exception:
+        pass
+    try:
+        importlib.import_module(
+            "ice_orchestrator.execution.tool_offload"
+        ).shutdown_tool_pools()
+    except Exception:
+        pass
     # Ensure DB engines are disposed to avoid GC warnings on event loop teardown
     try:
         await dispose_all_engines()
@@ -448,6 +493,7 @@ if os.getenv("ICEOS_ENABLE_DRAFTS", "0") == "1":
             await _draft_ws.unregister(session_id, ws)
 
 
+from ice_api.api.blobs import router as blobs_router
 from ice_api.api.blueprints import router as blueprint_router  # ensure module import
 from ice_api.api.catalog import router as catalog_router
 from ice_api.api.discovery import router as discovery_router
@@ -504,6 +550,7 @@ app.include_router(
     tags=["discovery", "health"],
 )
 app.include_router(tokens_router, prefix="", tags=["tokens"])
+app.include_router(blobs_router, prefix="", tags=["blobs"])
 app.include_router(
     library_router,
     prefix="",
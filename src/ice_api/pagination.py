@@ -0,0 +1,101 @@
+"""Keyset pagination cursors and NDJSON streaming for list endpoints.
+
+List endpoints page by *keyset* rather than offset: each page ends with the
+sort key of its last row, and the next page asks for rows strictly after
+it (``WHERE (created_at, id) < (:ts, :id)``), which an index on the same
+columns answers without scanning the skipped rows.  The key travels to the
+client as an opaque cursor::
+
+    cursor = encode_cursor(row.created_at, row.id)
+    created_at, row_id = decode_cursor(cursor, arity=2)
+
+Clients that send ``Accept: application/x-ndjson`` (or ``?format=ndjson``)
+get the whole remaining result set as newline-delimited JSON instead; it is
+produced page by page with :func:`stream_pages`, so neither the database
+session nor the response ever holds more than one page.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime as _dt
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+__all__ = [
+    "NDJSON_MEDIA_TYPE",
+    "Page",
+    "decode_cursor",
+    "encode_cursor",
+    "ndjson_response",
+    "stream_pages",
+    "wants_ndjson",
+]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# A page: the items plus the cursor of the next page (None on the last one)
+Page = Tuple[List[Any], Optional[str]]
+
+
+def encode_cursor(*values: Any) -> str:
+    """Return an opaque cursor for the sort-key *values* of a row."""
+
+    parts = [{"t": v.isoformat()} if isinstance(v, _dt.datetime) else v for v in values]
+    raw = json.dumps(parts, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, arity: int) -> List[Any]:
+    """Return the sort-key values of *cursor* (HTTP 400 when malformed)."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(parts, list) or len(parts) != arity:
+            raise ValueError("wrong arity")
+        return [
+            _dt.datetime.fromisoformat(p["t"]) if isinstance(p, dict) else p
+            for p in parts
+        ]
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Return ``True`` when the client asked for an NDJSON stream."""
+
+    if request.query_params.get("format") == "ndjson":
+        return True
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def stream_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Page]],
+    cursor: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """Yield every item from *cursor* onwards, one ``fetch_page`` at a time."""
+
+    while True:
+        items, cursor = await fetch_page(cursor)
+        for item in items:
+            yield item
+        if cursor is None or not items:
+            return
+
+
+def ndjson_response(items: AsyncIterator[Any]) -> StreamingResponse:
+    """Stream *items* as one JSON document per line."""
+
+    async def _lines() -> AsyncIterator[bytes]:
+        async for item in items:
+            yield json.dumps(jsonable_encoder(item), separators=(",", ":")).encode(
+                "utf-8"
+            ) + b"\n"
+
+    return StreamingResponse(_lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -41,6 +41,9 @@ class AsyncRedisLike(Protocol):  # pragma: no cover - typing protocol
     async def lpush(self, key: str, value: str) -> int: ...
     async def lrem(self, key: str, count: int, value: str) -> int: ...
     async def lrange(self, key: str, start: int, end: int) -> list[str | bytes]: ...
+    async def llen(self, key: str) -> int: ...
+    async def ltrim(self, key: str, start: int, end: int) -> bool: ...
+    async def delete(self, *keys: str) -> int: ...
     async def sadd(self, key: str, member: str) -> int: ...
     async def smembers(self, key: str) -> list[str | bytes]: ...
     def scan_iter(self, pattern: str) -> AsyncIterator[str]: ...
@@ -167,6 +170,31 @@ class _RedisStub:  # type: ignore
             end_idx = end + 1
         return lst[start:end_idx]
 
+    async def llen(self, key: str) -> int:  # type: ignore[override]
+        return len(self._lists.get(key, []))
+
+    async def ltrim(self, key: str, start: int, end: int) -> bool:  # type: ignore[override]
+        lst = self._lists.get(key, [])
+        n = len(lst)
+        lo = start + n if start < 0 else start
+        hi = end + n if end < 0 else end
+        self._lists[key] = lst[max(lo, 0) : hi + 1] if hi >= 0 else []
+        return True
+
+    async def delete(self, *keys: str) -> int:  # type: ignore[override]
+        removed = 0
+        for key in keys:
+            for bucket in (
+                self._hashes,
+                self._streams,
+                self._strings,
+                self._lists,
+                self._sets,
+            ):
+                if bucket.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
     async def sadd(self, key: str, member: str) -> int:  # type: ignore[override]
         s = self._sets.setdefault(key, set())
         pre_size = len(s)
@@ -200,8 +228,9 @@ class _RedisStub:  # type: ignore
 
     async def xadd(self, stream: str, data: dict[str, str]) -> str:  # type: ignore[override]
         lst = self._streams.setdefault(stream, [])
-        # Simplified ID generation (monotonic counter per stream)
-        seq_id = f"{len(lst)}-0"
+        # Simplified ID generation (monotonic counter per stream, starting
+        # at 1 like Redis so "0-0" means "from the beginning")
+        seq_id = f"{len(lst) + 1}-0"
         lst.append((seq_id, data))
         return seq_id
 
@@ -217,9 +246,10 @@ class _RedisStub:  # type: ignore
         for stream, last_id in streams.items():
             entries = []
             all_items = self._streams.get(stream, [])
-            # Collect items with ID greater than last_id (string compare OK here)
+            # Collect items with ID greater than last_id (numeric "ms-seq" order)
+            after = tuple(int(p or 0) for p in last_id.partition("-")[::2])
             for seq_id, data in all_items:
-                if seq_id > last_id:
+                if tuple(int(p) for p in seq_id.partition("-")[::2]) > after:
                     entries.append((seq_id, data))
                     if count and len(entries) >= count:
                         break
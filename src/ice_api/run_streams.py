@@ -0,0 +1,265 @@
+"""Per-process fan-out of run event streams to SSE subscribers.
+
+Every ``GET /runs/{run_id}/events`` client used to run its own
+``XREAD block=1000 count=10`` loop, so N dashboards watching one run cost N
+Redis connections and N times the reads.  :class:`StreamMultiplexer` keeps a
+single reader task per active stream instead; it reads in larger batches
+into a bounded ring buffer and wakes every subscriber attached to it::
+
+    async for event_id, fields in get_stream_multiplexer().subscribe(
+        stream, last_event_id=request.headers.get("last-event-id")
+    ):
+        ...
+
+Subscribers start after ``last_event_id`` (the beginning of the stream when
+omitted), which gives browsers a proper ``Last-Event-ID`` resume.  A
+subscriber whose position has already been evicted from the buffer
+(``ICE_SSE_BUFFER_SIZE``, 1000 entries) catches up with direct reads from
+Redis before joining the shared buffer.  Readers stop after the terminal
+``workflow.finished`` event and are discarded once they have had no
+subscribers for ``ICE_SSE_IDLE_SECONDS`` (30).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import os
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+__all__ = ["StreamMultiplexer", "get_stream_multiplexer"]
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_EVENT = "workflow.finished"
+
+Entry = Tuple[str, Dict[str, str]]
+
+
+def _id_key(event_id: str) -> Tuple[int, int]:
+    """Order stream ids numerically (``"10-0"`` sorts after ``"9-0"``)."""
+
+    ms, _, seq = event_id.partition("-")
+    try:
+        return int(ms), int(seq or 0)
+    except ValueError:
+        return 0, 0
+
+
+def _is_terminal(fields: Dict[str, str]) -> bool:
+    return fields.get("event") == TERMINAL_EVENT
+
+
+class _StreamReader:
+    """One ``XREAD`` loop for one stream, buffering what it reads."""
+
+    def __init__(self, mux: "StreamMultiplexer", stream: str) -> None:
+        self.mux = mux
+        self.stream = stream
+        self.buffer: Deque[Entry] = deque(maxlen=mux.buffer_size)
+        # Position (since the reader started) of ``buffer[0]``
+        self.base = 0
+        self.last_id = "0-0"
+        self.finished = False
+        self.subscribers = 0
+        self.idle_since = asyncio.get_running_loop().time()
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.buffer)
+
+    def seek(self, event_id: str, *, inclusive: bool = False) -> int:
+        """Return the position of the first entry after (or at) *event_id*.
+
+        ``base - 1`` means entries the caller still needs may already have
+        been evicted.
+        """
+
+        key = _id_key(event_id)
+        for offset, (ev_id, _) in enumerate(self.buffer):
+            found = _id_key(ev_id)
+            if inclusive and found == key:
+                return self.base + offset
+            if found > key:
+                if offset == 0 and self.base > 0:
+                    return self.base - 1
+                return self.base + offset
+        return self.end
+
+    def entries_from(self, position: int) -> List[Entry]:
+        return list(itertools.islice(self.buffer, position - self.base, None))
+
+    def _append(self, entries: List[Entry]) -> None:
+        for entry in entries:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.base += 1
+            self.buffer.append(entry)
+            if _is_terminal(entry[1]):
+                self.finished = True
+        self.last_id = entries[-1][0]
+        # Wake everyone waiting on the previous batch
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    def _idle(self) -> bool:
+        loop = asyncio.get_running_loop()
+        return (
+            self.subscribers == 0
+            and loop.time() - self.idle_since >= self.mux.idle_seconds
+        )
+
+    async def run(self) -> None:
+        try:
+            while not self._idle():
+                if self.finished:
+                    # Keep the buffer for late subscribers until idle
+                    await asyncio.sleep(min(1.0, self.mux.idle_seconds))
+                    continue
+                try:
+                    result = await self.mux.redis.xread(
+                        {self.stream: self.last_id},
+                        block=self.mux.block_ms,
+                        count=self.mux.batch_size,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning("Run stream %s read failed: %s", self.stream, exc)
+                    await asyncio.sleep(1.0)
+                    continue
+                entries = [entry for _, batch in result or [] for entry in batch]
+                if entries:
+                    self._append(entries)
+                else:
+                    # Block timed out (or a client that ignores ``block``)
+                    await asyncio.sleep(0.05)
+        finally:
+            self.mux._discard(self)
+
+
+class StreamMultiplexer:
+    """Shares one reader task per Redis stream among all its subscribers."""
+
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        buffer_size: Optional[int] = None,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        idle_seconds: Optional[float] = None,
+    ) -> None:
+        self.redis = redis
+        self.buffer_size = (
+            buffer_size
+            if buffer_size is not None
+            else int(os.getenv("ICE_SSE_BUFFER_SIZE", "1000"))
+        )
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.idle_seconds = (
+            idle_seconds
+            if idle_seconds is not None
+            else float(os.getenv("ICE_SSE_IDLE_SECONDS", "30"))
+        )
+        self._readers: Dict[str, _StreamReader] = {}
+
+    @property
+    def active_streams(self) -> List[str]:
+        return list(self._readers)
+
+    def _reader(self, stream: str) -> _StreamReader:
+        reader = self._readers.get(stream)
+        if reader is None:
+            reader = _StreamReader(self, stream)
+            reader.task = asyncio.create_task(reader.run(), name=f"run-stream:{stream}")
+            self._readers[stream] = reader
+        return reader
+
+    def _discard(self, reader: _StreamReader) -> None:
+        if self._readers.get(reader.stream) is reader:
+            del self._readers[reader.stream]
+
+    async def _catch_up(self, stream: str, after: str, until: str) -> List[Entry]:
+        """Read entries in ``(after, until)`` directly (evicted from the buffer)."""
+
+        entries: List[Entry] = []
+        stop = _id_key(until)
+        while True:
+            result = await self.redis.xread({stream: after}, count=self.batch_size)
+            batch = [entry for _, items in result or [] for entry in items]
+            for entry in batch:
+                if _id_key(entry[0]) >= stop:
+                    return entries
+                entries.append(entry)
+            if not batch:
+                return entries
+            after = batch[-1][0]
+
+    async def subscribe(
+        self, stream: str, *, last_event_id: Optional[str] = None
+    ) -> AsyncIterator[Entry]:
+        """Yield ``(event_id, fields)`` for *stream* after *last_event_id*.
+
+        Ends after the terminal ``workflow.finished`` event.
+        """
+
+        reader = self._reader(stream)
+        reader.subscribers += 1
+        try:
+            last_id = last_event_id or "0-0"
+            position = reader.seek(last_id)
+            while True:
+                changed = reader.changed
+                if position < reader.base:
+                    # Fell behind the ring buffer – replay the gap from Redis
+                    head = reader.buffer[0][0]
+                    for entry in await self._catch_up(stream, last_id, head):
+                        last_id = entry[0]
+                        yield entry
+                        if _is_terminal(entry[1]):
+                            return
+                    position = reader.seek(head, inclusive=True)
+                    continue
+                entries = reader.entries_from(position)
+                position += len(entries)
+                for entry in entries:
+                    if _id_key(entry[0]) <= _id_key(last_id):
+                        continue  # resumed ahead of what the reader has seen
+                    last_id = entry[0]
+                    yield entry
+                    if _is_terminal(entry[1]):
+                        return
+                if not entries:
+                    await changed.wait()
+        finally:
+            reader.subscribers -= 1
+            if reader.subscribers == 0:
+                reader.idle_since = asyncio.get_running_loop().time()
+
+    async def aclose(self) -> None:
+        """Cancel every reader task (tests and shutdown)."""
+
+        tasks = [r.task for r in self._readers.values() if r.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._readers.clear()
+
+
+_multiplexer: Optional[StreamMultiplexer] = None
+
+
+def get_stream_multiplexer() -> StreamMultiplexer:
+    """Return the process-wide multiplexer bound to :func:`get_redis`."""
+
+    global _multiplexer  # pylint: disable=global-statement
+    if _multiplexer is None:
+        from ice_api.redis_client import get_redis
+
+        _multiplexer = StreamMultiplexer(get_redis())
+    return _multiplexer
@@ -0,0 +1,213 @@
+"""Append-only chat session history backed by a Redis list.
+
+Each message is one list element (``RPUSH``), so a turn costs O(1) writes
+regardless of session length, and prompts are built from a windowed,
+token-budgeted tail read newest-first with ``LRANGE``.
+
+Keys per ``(agent, session)``:
+
+* ``chat:{agent}:{session}:turns``   – list of JSON ``{"role", "content"}``
+* ``chat:{agent}:{session}:summary`` – rolling summary of evicted messages
+
+Sessions written by the previous format (the whole history as one JSON
+string in the ``messages`` field of the ``chat:{agent}:{session}`` hash)
+are migrated on first read.
+
+Lists are capped at ``CHAT_HISTORY_MAX_MESSAGES``.  When
+``CHAT_HISTORY_SUMMARIZE=1`` the messages trimmed off the head are folded
+into the session summary by a background task, and the summary is handed
+back alongside the tail.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from ice_core.utils.token_counter import get_token_service
+
+__all__ = ["ChatHistory", "Summarizer", "extractive_summary"]
+
+logger = logging.getLogger(__name__)
+
+Message = Dict[str, str]
+# (previous summary, evicted messages) -> new summary
+Summarizer = Callable[[str, List[Message]], Awaitable[str]]
+
+_SUMMARY_MAX_CHARS = 2000
+_background: Set["asyncio.Task[None]"] = set()
+# One lock per session summary so concurrent evictions fold in sequentially
+_summary_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+async def extractive_summary(previous: str, evicted: List[Message]) -> str:
+    """Cheap default summarizer: keep the first sentence of each message."""
+
+    lines = [previous] if previous else []
+    for message in evicted:
+        text = " ".join(str(message.get("content", "")).split())
+        first = text.split(". ")[0][:160]
+        if first:
+            lines.append(f"{message.get('role', 'user')}: {first}")
+    summary = "\n".join(lines)
+    # Keep the most recent part when the rolling summary grows too long
+    return summary[-_SUMMARY_MAX_CHARS:]
+
+
+def _decode(raw: Any) -> Optional[Message]:
+    if isinstance(raw, (bytes, bytearray)):
+        raw = raw.decode("utf-8", "replace")
+    try:
+        value = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    return value if isinstance(value, dict) else None
+
+
+class ChatHistory:
+    """Message history of one chat session."""
+
+    READ_WINDOW = 16
+
+    def __init__(
+        self,
+        redis: Any,
+        agent_name: str,
+        session_id: str,
+        *,
+        max_messages: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        summarizer: Optional[Summarizer] = None,
+        model: str = "gpt-4o",
+    ) -> None:
+        self._redis = redis
+        base = f"chat:{agent_name}:{session_id}"
+        self.legacy_key = base
+        self.turns_key = f"{base}:turns"
+        self.summary_key = f"{base}:summary"
+        self.max_messages = max_messages or int(
+            os.getenv("CHAT_HISTORY_MAX_MESSAGES", "500")
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else int(os.getenv("CHAT_TTL_SECONDS", "0"))
+        )
+        if summarizer is None and os.getenv("CHAT_HISTORY_SUMMARIZE", "0") == "1":
+            summarizer = extractive_summary
+        self._summarizer = summarizer
+        self.model = model
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    async def reset(self) -> None:
+        await self._redis.delete(self.turns_key, self.summary_key)
+        await self._redis.hdel(self.legacy_key, "messages")
+
+    async def append(self, *messages: Message) -> None:
+        """Append *messages* and evict from the head beyond the cap."""
+
+        length = 0
+        for message in messages:
+            length = await self._redis.rpush(self.turns_key, json.dumps(message))
+        overflow = (length or 0) - self.max_messages
+        if overflow > 0:
+            evicted: List[Message] = []
+            if self._summarizer is not None:
+                raw = await self._redis.lrange(self.turns_key, 0, overflow - 1)
+                evicted = [m for m in map(_decode, raw) if m is not None]
+            await self._redis.ltrim(self.turns_key, overflow, -1)
+            if evicted:
+                self._summarize_later(evicted)
+        if self.ttl_seconds > 0:
+            await self._redis.expire(self.turns_key, self.ttl_seconds)
+            await self._redis.expire(self.summary_key, self.ttl_seconds)
+
+    def _summarize_later(self, evicted: List[Message]) -> None:
+        task = asyncio.create_task(self._summarize(evicted))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+    async def _summarize(self, evicted: List[Message]) -> None:
+        assert self._summarizer is not None
+        lock = _summary_locks.get(self.summary_key)
+        if lock is None:
+            lock = _summary_locks[self.summary_key] = asyncio.Lock()
+        try:
+            async with lock:
+                previous = await self._redis.get(self.summary_key) or ""
+                if isinstance(previous, (bytes, bytearray)):
+                    previous = previous.decode("utf-8", "replace")
+                summary = await self._summarizer(previous, evicted)
+                await self._redis.set(self.summary_key, summary)
+        except Exception as exc:  # summaries are best-effort
+            logger.warning("Chat history summarization failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    async def _migrate_legacy(self) -> None:
+        raw = await self._redis.hget(self.legacy_key, "messages")
+        if not raw:
+            return
+        if isinstance(raw, (bytes, bytearray)):
+            raw = raw.decode("utf-8", "replace")
+        try:
+            messages = json.loads(raw)
+        except (TypeError, ValueError):
+            messages = []
+        for message in messages if isinstance(messages, list) else []:
+            if isinstance(message, dict):
+                await self._redis.rpush(self.turns_key, json.dumps(message))
+        await self._redis.hdel(self.legacy_key, "messages")
+
+    async def tail(self, token_budget: int) -> Tuple[List[Message], str]:
+        """Return the newest messages that fit *token_budget*, plus the summary.
+
+        Messages are read newest-first in ``READ_WINDOW``-sized ``LRANGE``
+        windows (each counted as one batch) until the budget is spent, and
+        returned oldest-first.
+        """
+
+        length = await self._redis.llen(self.turns_key)
+        if not length:
+            await self._migrate_legacy()
+            length = await self._redis.llen(self.turns_key)
+
+        picked: List[Message] = []
+        spent = 0
+        end = -1
+        while length and -end <= length:
+            start = max(end - self.READ_WINDOW + 1, -length)
+            window = await self._redis.lrange(self.turns_key, start, end)
+            if not window:
+                break
+            messages = [m for m in map(_decode, reversed(window)) if m is not None]
+            costs = await get_token_service().count_each_message(
+                messages, model=self.model
+            )
+            for message, cost in zip(messages, costs):
+                if picked and spent + cost > token_budget:
+                    picked.reverse()
+                    return picked, await self.summary()
+                picked.append(message)
+                spent += cost
+            end = start - 1
+
+        picked.reverse()
+        return picked, await self.summary()
+
+    async def summary(self) -> str:
+        if self._summarizer is None:
+            return ""
+        value = await self._redis.get(self.summary_key)
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode("utf-8", "replace")
+        return value or ""
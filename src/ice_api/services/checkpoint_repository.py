@@ -0,0 +1,72 @@
+"""Postgres backend for per-node execution checkpoints.
+
+One row per ``(execution_id, node_key)``; upserts overwrite a node's previous
+record so the table never holds more than one row per node.  Registered as
+the ``postgres`` checkpoint backend at API startup.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, List
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from ice_api.db.database_session_async import session_scope
+from ice_api.db.orm_models_core import ExecutionCheckpointRecord
+from ice_orchestrator.execution.checkpoint_store import CheckpointStore
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresCheckpointStore(CheckpointStore):
+    """Checkpoint store backed by the ``execution_checkpoints`` table."""
+
+    async def _append(self, run_id: str, key: str, blob: bytes) -> None:
+        stmt = pg_insert(ExecutionCheckpointRecord).values(
+            execution_id=run_id, node_key=key, payload=blob
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["execution_id", "node_key"],
+            set_={"payload": stmt.excluded.payload, "updated_at": sa.func.now()},
+        )
+        async with session_scope() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def discard(self, run_id: str, node_ids: Iterable[str]) -> None:
+        ids = list(node_ids)
+        if not ids:
+            return
+        async with session_scope() as session:
+            await session.execute(
+                sa.delete(ExecutionCheckpointRecord).where(
+                    ExecutionCheckpointRecord.execution_id == run_id,
+                    ExecutionCheckpointRecord.node_key.in_(ids),
+                )
+            )
+            await session.commit()
+
+    async def _read(self, run_id: str) -> List[bytes]:
+        async with session_scope() as session:
+            rows = (
+                await session.execute(
+                    sa.select(
+                        ExecutionCheckpointRecord.node_key,
+                        ExecutionCheckpointRecord.payload,
+                    ).where(ExecutionCheckpointRecord.execution_id == run_id)
+                )
+            ).all()
+        # Header first so node records are folded on top of it
+        rows.sort(key=lambda r: r[0] != "__header__")
+        return [bytes(r[1]) for r in rows]
+
+    async def delete(self, run_id: str) -> None:
+        async with session_scope() as session:
+            await session.execute(
+                sa.delete(ExecutionCheckpointRecord).where(
+                    ExecutionCheckpointRecord.execution_id == run_id
+                )
+            )
+            await session.commit()
@@ -8,23 +8,39 @@ Authentication: simple bearer token via `Sec-WebSocket-Protocol` header.
 Validation: every incoming JSON payload validated against a registry of
 `jsonschema` Draft 2020-12 schemas.
 
-The gateway stays stateless: it forwards valid messages to an
-`asyncio.Queue` for later consumption by Frosty agents and broadcasts
-runtime events pushed into the same queue.
+Fan-out
+-------
+Connections join a per-blueprint *room* (``/ws/mcp/{blueprint_id}`` or
+``?blueprint_id=``; clients without one share a default room) and only
+receive that room's traffic.  Every client has its own bounded send queue
+drained by its own task, so a slow client never delays the others:
+
+* ``cursor`` and ``telemetry`` messages are latest-wins – a newer message
+  for the same user/node replaces the queued one, and they are the first
+  to be shed when the queue is full;
+* other messages (patches) are never dropped; a client whose queue
+  overflows with them is disconnected (1013) and must reconnect/resync.
+
+With ``REDIS_URL`` set (``ICE_WS_REDIS=0`` disables it) room traffic is
+bridged over Redis pub/sub so clients on different API processes share
+rooms.  Tunables: ``ICE_WS_SEND_QUEUE`` (256 messages per client) and
+``ICE_WS_SEND_TIMEOUT_SECONDS`` (5).
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import os
 import uuid
-from typing import Any
+from typing import Any, Hashable, Optional, Tuple
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
-from fastapi.websockets import WebSocketState
 from jsonschema import Draft202012Validator
 
+from ice_core.metrics import WS_MESSAGES_SHED
+
 router = APIRouter(prefix="/ws/mcp", tags=["mcp"])
 
 # ---------------------------------------------------------------------------
@@ -96,34 +112,200 @@ _SCHEMAS: dict[str, dict[str, Any]] = {
 _VALIDATORS = {name: Draft202012Validator(schema) for name, schema in _SCHEMAS.items()}
 
 # ---------------------------------------------------------------------------
-# Broadcast infrastructure (naïve asyncio queues) ----------------------------
+# Rooms and per-client send queues --------------------------------------------
 # ---------------------------------------------------------------------------
-_clients: set[WebSocket] = set()
-_broadcast_q: asyncio.Queue[str] = asyncio.Queue()
+logger = logging.getLogger(__name__)
+
+_DEFAULT_ROOM = "_default"
+# Latest-wins message types and the field identifying what they describe
+_COALESCE_BY: dict[str, str] = {"cursor": "user", "telemetry": "node_id"}
+
+
+def _coalesce_slot(data: dict[str, Any]) -> Optional[Tuple[str, str]]:
+    field = _COALESCE_BY.get(str(data.get("t", "")))
+    if field is None:
+        return None
+    return (str(data["t"]), str(data.get(field, "")))
+
+
+class _Client:
+    """A connection with a bounded, coalescing send queue and sender task."""
+
+    def __init__(self, ws: WebSocket, room: str, maxsize: int) -> None:
+        self.ws = ws
+        self.room = room
+        self.maxsize = maxsize
+        # Insertion-ordered: replacing a coalesced entry keeps its position
+        self._pending: dict[Hashable, str] = {}
+        self._seq = 0
+        self._ready = asyncio.Event()
+        self.overflowed = False
+
+    def offer(self, data: dict[str, Any], text: str) -> None:
+        """Queue *text* (the serialised *data*) without ever blocking."""
+
+        if self.overflowed:
+            return
+        msg_type = str(data.get("t", ""))
+        slot: Hashable = _coalesce_slot(data)
+        if slot is not None and slot in self._pending:
+            self._pending[slot] = text
+            WS_MESSAGES_SHED.labels(msg_type, "coalesced").inc()
+            return
+        if len(self._pending) >= self.maxsize:
+            victim = next((k for k in self._pending if isinstance(k, tuple)), None)
+            if victim is not None:
+                # Shed the oldest latest-wins message to make room
+                del self._pending[victim]
+                WS_MESSAGES_SHED.labels(victim[0], "dropped").inc()
+            elif slot is not None:
+                WS_MESSAGES_SHED.labels(msg_type, "dropped").inc()
+                return
+            else:
+                # Only reliable messages queued: the client cannot keep up
+                WS_MESSAGES_SHED.labels(msg_type, "overflow").inc()
+                self.overflowed = True
+                self._pending.clear()
+                self._ready.set()
+                return
+        if slot is None:
+            self._seq += 1
+            slot = self._seq
+        self._pending[slot] = text
+        self._ready.set()
+
+    async def run(self, send_timeout: float) -> None:
+        """Drain the queue until the connection fails, stalls or overflows."""
+
+        try:
+            while True:
+                await self._ready.wait()
+                while self._pending and not self.overflowed:
+                    slot = next(iter(self._pending))
+                    text = self._pending.pop(slot)
+                    await asyncio.wait_for(self.ws.send_text(text), send_timeout)
+                # Checked after draining: offer() may overflow mid-send
+                if self.overflowed:
+                    await self.ws.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                    return
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Disconnected or too slow: stop the receive loop as well
+            logger.debug("ws client dropped: %s", exc)
+            try:
+                await self.ws.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            except Exception:
+                pass
+
+
+_rooms: dict[str, set[_Client]] = {}
+
 
+def _deliver(room: str, data: dict[str, Any], text: str) -> None:
+    """Queue a message for every local client in *room*."""
 
-async def _broadcast_worker() -> None:
-    """Background task: pop messages from queue and fan-out to clients."""
-    while True:
-        msg = await _broadcast_q.get()
-        disconnected: list[WebSocket] = []
-        for ws in _clients:
-            from typing import cast
+    for client in tuple(_rooms.get(room, ())):
+        client.offer(data, text)
 
-            if cast(Any, ws.application_state) == WebSocketState.CONNECTED:
-                try:
-                    await ws.send_text(msg)
-                except Exception:
-                    disconnected.append(ws)
-        for dead in disconnected:
-            _clients.discard(dead)
 
+class _RedisBridge:
+    """Shares room traffic between API processes via Redis pub/sub."""
 
-aio_bg_task: asyncio.Task[None] | None = None
+    CHANNEL_PREFIX = "ws:mcp:"
+    _RETRY_SECONDS = 5.0
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._origin = uuid.uuid4().hex
+        self._redis: Any = None
+        self._task: asyncio.Task[None] | None = None
+
+    def _client(self) -> Any:
+        if self._redis is None:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(self._url, decode_responses=True)
+        return self._redis
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def publish(self, room: str, text: str) -> None:
+        try:
+            await self._client().publish(
+                self.CHANNEL_PREFIX + room, json.dumps({"o": self._origin, "m": text})
+            )
+        except Exception as exc:
+            logger.debug("ws redis publish failed: %s", exc)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self._client().pubsub()
+                await pubsub.psubscribe(self.CHANNEL_PREFIX + "*")
+                async for item in pubsub.listen():
+                    if item.get("type") != "pmessage":
+                        continue
+                    room = str(item["channel"])[len(self.CHANNEL_PREFIX) :]
+                    if room not in _rooms:
+                        continue
+                    envelope = json.loads(item["data"])
+                    if envelope.get("o") == self._origin:
+                        continue  # already delivered locally
+                    text = envelope["m"]
+                    _deliver(room, json.loads(text), text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.debug("ws redis bridge error: %s", exc)
+                await asyncio.sleep(self._RETRY_SECONDS)
+
+
+_bridge: _RedisBridge | None = None
+_bridge_checked = False
+
+
+def _get_bridge() -> Optional[_RedisBridge]:
+    global _bridge, _bridge_checked  # pylint: disable=global-statement
+    if not _bridge_checked:
+        _bridge_checked = True
+        url = os.getenv("REDIS_URL")
+        disabled = os.getenv("ICE_WS_REDIS", "1").lower() in {"0", "false", "off"}
+        if url and not disabled:
+            try:
+                import redis.asyncio  # noqa: F401 – optional dependency
+
+                _bridge = _RedisBridge(url)
+            except Exception:  # pragma: no cover – optional dep
+                _bridge = None
+    return _bridge
+
+
+async def publish(room: Optional[str], data: dict[str, Any]) -> None:
+    """Send *data* to every client in *room* across all API processes.
+
+    Server-side producers (runtime telemetry, suggestions) use this as well
+    as the WebSocket handler.
+    """
+
+    room = room or _DEFAULT_ROOM
+    data.setdefault("mid", uuid.uuid4().hex)
+    data.setdefault("ts", asyncio.get_event_loop().time())
+    text = json.dumps(data)
+    _deliver(room, data, text)
+    bridge = _get_bridge()
+    if bridge is not None:
+        await bridge.publish(room, text)
 
 
 @router.websocket("/")
-async def mcp_ws(ws: WebSocket) -> None:  # – FastAPI handler
+@router.websocket("/{blueprint_id}")
+async def mcp_ws(
+    ws: WebSocket, blueprint_id: Optional[str] = None
+) -> None:  # – FastAPI handler
     """Bidirectional WS endpoint for live patch + telemetry messages."""
 
     # Echo the expected subprotocol for clients that use it
@@ -133,11 +315,15 @@ async def mcp_ws(ws: WebSocket) -> None:  # – FastAPI handler
     except WebSocketDisconnect:
         return
 
-    global aio_bg_task  # – single global background task
-    if aio_bg_task is None:
-        aio_bg_task = asyncio.create_task(_broadcast_worker())
-
-    _clients.add(ws)
+    room = blueprint_id or ws.query_params.get("blueprint_id") or _DEFAULT_ROOM
+    client = _Client(ws, room, int(os.getenv("ICE_WS_SEND_QUEUE", "256")))
+    sender = asyncio.create_task(
+        client.run(float(os.getenv("ICE_WS_SEND_TIMEOUT_SECONDS", "5")))
+    )
+    _rooms.setdefault(room, set()).add(client)
+    bridge = _get_bridge()
+    if bridge is not None:
+        bridge.start()
     try:
         while True:
             raw = await ws.receive_text()
@@ -146,16 +332,26 @@ async def mcp_ws(ws: WebSocket) -> None:  # – FastAPI handler
                 msg_type: str = data.get("t", "")
                 validator = _VALIDATORS.get(msg_type)
                 if validator is None:
-                    await ws.send_text(json.dumps({"error": "unknown message type"}))
+                    error = {"error": "unknown message type"}
+                    client.offer(error, json.dumps(error))
                     continue
                 validator.validate(data)
             except Exception as exc:  # schema error or JSON error
-                await ws.send_text(json.dumps({"error": str(exc)}))
+                error = {"error": str(exc)}
+                client.offer(error, json.dumps(error))
                 continue
 
             # Attach message id & timestamp
             data["mid"] = uuid.uuid4().hex
             data["ts"] = asyncio.get_event_loop().time()
-            await _broadcast_q.put(json.dumps(data))
+            await publish(room, data)
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: receive after the sender closed a stalled connection
+        pass
     finally:
-        _clients.discard(ws)
+        members = _rooms.get(room)
+        if members is not None:
+            members.discard(client)
+            if not members:
+                _rooms.pop(room, None)
+        sender.cancel()
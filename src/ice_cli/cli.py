@@ -362,6 +362,11 @@ from ice_cli.commands.build import cli_build as _build_cmd
 
 cli.add_command(_build_cmd)
 
+# Load generator (executions / MCP runs)
+from ice_cli.commands.loadtest import cli_loadtest as _loadtest_cmd
+
+cli.add_command(_loadtest_cmd)
+
 # Generate group (tool scaffolding)
 from ice_cli.commands.generate import generate as _generate_group
 
@@ -0,0 +1,660 @@
+"""CLI command: ice loadtest – async load generator for the execution APIs.
+
+Drives ``/api/v1/executions`` or the MCP ``/runs`` endpoint from a single
+event loop with a shared connection pool, so thousands of in-flight runs cost
+one socket each instead of one client (and one interpreter thread) each.
+
+Two load models are supported:
+
+* **closed** – ``--concurrency`` virtual users each submit a run, wait for its
+  completion and immediately submit the next one (throughput follows latency).
+* **open** – runs arrive at ``--rps`` regardless of how many are still in
+  flight (latency under a fixed offered load; exposes queueing collapse).
+
+Completion is consumed push-style: MCP runs via their SSE event stream and
+executions via the ``/ws/executions/{id}`` WebSocket when the optional
+``websockets`` package is installed, otherwise via the server-side
+``wait_seconds`` long-wait.  No client-side status polling is performed.
+
+For a deterministic local target, start the API with the stand-in LLM::
+
+    ICE_ECHO_LLM_FOR_TESTS=1 ICEOS_ENABLE_METRICS=1 make api
+    ice loadtest --target executions --blueprint-id my_bp --rps 20 --duration 30
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import click
+import httpx
+
+# Histogram bucket upper bounds in seconds (roughly log-spaced)
+_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    math.inf,
+)
+
+# Prometheus series sampled from ``/metrics`` while the test runs
+_QUEUE_GAUGES: Tuple[str, ...] = ("executions_in_flight",)
+_COUNTERS: Tuple[str, ...] = (
+    "executions_started_total",
+    "executions_completed_total",
+    "executions_failed_total",
+)
+
+
+# ---------------------------------------------------------------------------
+# Statistics -----------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class LatencyHistogram:
+    """Latency recorder with exact percentiles and fixed display buckets."""
+
+    def __init__(self, buckets: Sequence[float] = _BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._counts = [0] * len(self._buckets)
+        self._samples: List[float] = []
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        for idx, upper in enumerate(self._buckets):
+            if seconds <= upper:
+                self._counts[idx] += 1
+                break
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> float:
+        """Return the nearest-rank *pct* percentile (0–100) in seconds."""
+
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def mean(self) -> float:
+        return sum(self._samples) / len(self._samples) if self._samples else 0.0
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        return list(zip(self._buckets, self._counts))
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": float(self.count),
+            "mean": round(self.mean(), 4),
+            "p50": round(self.percentile(50), 4),
+            "p95": round(self.percentile(95), 4),
+            "p99": round(self.percentile(99), 4),
+            "max": round(max(self._samples), 4) if self._samples else 0.0,
+        }
+
+
+@dataclass
+class LoadStats:
+    """Aggregated outcome of a load-test run."""
+
+    started: int = 0
+    succeeded: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    accept_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    server: Dict[str, Any] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return sum(self.errors.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.succeeded + self.failed
+        return {
+            "started": self.started,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "error_rate": round(self.failed / finished, 4) if finished else 0.0,
+            "errors": dict(self.errors),
+            "elapsed_sec": round(self.elapsed, 3),
+            "throughput_rps": round(finished / self.elapsed, 3)
+            if self.elapsed > 0
+            else 0.0,
+            "latency_sec": self.latency.summary(),
+            "accept_latency_sec": self.accept_latency.summary(),
+            "latency_histogram": [
+                {"le": ("+Inf" if math.isinf(le) else le), "count": n}
+                for le, n in self.latency.buckets()
+            ],
+            "server": self.server,
+        }
+
+
+class RunFailed(Exception):
+    """A single run finished but was reported as failed (or never finished)."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+# ---------------------------------------------------------------------------
+# Server-side metrics --------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def parse_prometheus_text(text: str, names: Sequence[str]) -> Dict[str, float]:
+    """Sum samples of each metric in *names* across label sets."""
+
+    totals: Dict[str, float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        metric, _, rest = line.partition(" ")
+        base = metric.split("{", 1)[0]
+        if base not in names:
+            continue
+        try:
+            value = float(rest.split()[0])
+        except (IndexError, ValueError):
+            continue
+        totals[base] = totals.get(base, 0.0) + value
+    return totals
+
+
+class _MetricsSampler:
+    """Periodically scrape ``/metrics`` to observe server-side queue depth."""
+
+    def __init__(self, client: httpx.AsyncClient, interval: float) -> None:
+        self._client = client
+        self._interval = interval
+        self._available = True
+        self.before: Dict[str, float] = {}
+        self.after: Dict[str, float] = {}
+        self.gauge_samples: Dict[str, List[float]] = {g: [] for g in _QUEUE_GAUGES}
+
+    async def scrape(self) -> Dict[str, float]:
+        if not self._available:
+            return {}
+        try:
+            resp = await self._client.get("/metrics")
+        except httpx.HTTPError:
+            self._available = False
+            return {}
+        if resp.status_code != 200 or not resp.text:
+            # Metrics route disabled (ICEOS_ENABLE_METRICS!=1) or no Prometheus
+            self._available = False
+            return {}
+        return parse_prometheus_text(resp.text, _QUEUE_GAUGES + _COUNTERS)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set() and self._available:
+            values = await self.scrape()
+            for gauge in _QUEUE_GAUGES:
+                if gauge in values:
+                    self.gauge_samples[gauge].append(values[gauge])
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.before and not self.after:
+            return {"available": False}
+        out: Dict[str, Any] = {"available": True}
+        for name in _COUNTERS:
+            if name in self.after:
+                out[f"{name}_delta"] = self.after[name] - self.before.get(name, 0.0)
+        for gauge, samples in self.gauge_samples.items():
+            if samples:
+                out[gauge] = {
+                    "max": max(samples),
+                    "mean": round(sum(samples) / len(samples), 3),
+                    "last": samples[-1],
+                }
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Targets --------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _render_inputs(inputs: Mapping[str, str], seq: int) -> Dict[str, Any]:
+    """Substitute ``{n}`` with the request sequence number in input values."""
+
+    return {k: v.replace("{n}", str(seq)) for k, v in inputs.items()}
+
+
+async def _iter_sse(response: httpx.Response) -> Any:
+    """Yield ``(event, data)`` tuples from a text/event-stream response."""
+
+    event = "message"
+    data: List[str] = []
+    async for line in response.aiter_lines():
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+            continue
+        if line.startswith(":"):
+            continue
+        key, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if key == "event":
+            event = value
+        elif key == "data":
+            data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+
+@dataclass
+class LoadTarget:
+    """What to drive and how to observe completion."""
+
+    kind: str
+    completion: str
+    timeout: float
+    blueprint_id: Optional[str] = None
+    blueprint: Optional[Dict[str, Any]] = None
+    inputs: Dict[str, str] = field(default_factory=dict)
+    mcp_prefix: str = "/api/mcp"
+    ws_url: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    async def run_once(
+        self, client: httpx.AsyncClient, seq: int, stats: LoadStats
+    ) -> None:
+        if self.kind == "executions":
+            await self._run_execution(client, seq, stats)
+        else:
+            await self._run_mcp(client, seq, stats)
+
+    async def _run_execution(
+        self, client: httpx.AsyncClient, seq: int, stats: LoadStats
+    ) -> None:
+        payload: Dict[str, Any] = {"blueprint_id": self.blueprint_id}
+        if self.inputs:
+            payload["inputs"] = _render_inputs(self.inputs, seq)
+        params: Dict[str, Any] = {}
+        if self.completion == "wait":
+            params["wait_seconds"] = self.timeout
+        t0 = time.perf_counter()
+        resp = await client.post("/api/v1/executions/", json=payload, params=params)
+        stats.accept_latency.observe(time.perf_counter() - t0)
+        if resp.status_code >= 400:
+            raise RunFailed(f"http_{resp.status_code}")
+        data = resp.json()
+        status = data.get("status")
+        if status not in {"completed", "failed"}:
+            if self.completion != "ws":
+                raise RunFailed("timeout")
+            status = await self._await_ws(str(data["execution_id"]))
+        if status != "completed":
+            raise RunFailed("run_failed")
+
+    async def _await_ws(self, execution_id: str) -> str:
+        import websockets  # type: ignore[import-not-found]
+
+        url = f"{self.ws_url}/ws/executions/{execution_id}"
+        async with websockets.connect(url, extra_headers=self.headers) as ws:
+            while True:
+                msg = json.loads(await ws.recv())
+                if "error" in msg:
+                    raise RunFailed("ws_not_found")
+                status = msg.get("status")
+                if status in {"completed", "failed"}:
+                    return str(status)
+
+    async def _run_mcp(
+        self, client: httpx.AsyncClient, seq: int, stats: LoadStats
+    ) -> None:
+        prefix = self.mcp_prefix.rstrip("/")
+        payload: Dict[str, Any] = {}
+        if self.blueprint is not None:
+            payload["blueprint"] = self.blueprint
+        else:
+            payload["blueprint_id"] = self.blueprint_id
+        t0 = time.perf_counter()
+        resp = await client.post(f"{prefix}/runs", json=payload)
+        stats.accept_latency.observe(time.perf_counter() - t0)
+        if resp.status_code >= 400:
+            raise RunFailed(f"http_{resp.status_code}")
+        run_id = resp.json()["run_id"]
+        async with client.stream("GET", f"{prefix}/runs/{run_id}/events") as stream:
+            if stream.status_code >= 400:
+                raise RunFailed(f"sse_http_{stream.status_code}")
+            async for event, data in _iter_sse(stream):
+                if event == "workflow.finished":
+                    try:
+                        success = bool(json.loads(data).get("success"))
+                    except ValueError:
+                        success = False
+                    if not success:
+                        raise RunFailed("run_failed")
+                    return
+        raise RunFailed("sse_closed")
+
+
+# ---------------------------------------------------------------------------
+# Drivers --------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+async def _timed(
+    target: LoadTarget, client: httpx.AsyncClient, seq: int, stats: LoadStats
+) -> None:
+    stats.started += 1
+    t0 = time.perf_counter()
+    try:
+        await asyncio.wait_for(target.run_once(client, seq, stats), target.timeout)
+    except RunFailed as exc:
+        stats.errors[exc.reason] += 1
+    except asyncio.TimeoutError:
+        stats.errors["timeout"] += 1
+    except httpx.TimeoutException:
+        stats.errors["timeout"] += 1
+    except httpx.HTTPError as exc:
+        stats.errors[type(exc).__name__] += 1
+    else:
+        stats.succeeded += 1
+        stats.latency.observe(time.perf_counter() - t0)
+
+
+async def run_load(
+    target: LoadTarget,
+    client: httpx.AsyncClient,
+    *,
+    mode: str,
+    duration: float,
+    concurrency: int = 1,
+    rps: float = 1.0,
+    max_requests: Optional[int] = None,
+    max_inflight: Optional[int] = None,
+    poisson: bool = False,
+    warmup: int = 0,
+    metrics_interval: float = 1.0,
+) -> LoadStats:
+    """Drive *target* until *duration* elapses or *max_requests* are issued."""
+
+    for i in range(warmup):
+        await _timed(target, client, -1 - i, LoadStats())
+
+    stats = LoadStats()
+    sampler = _MetricsSampler(client, metrics_interval)
+    sampler.before = await sampler.scrape()
+    stop_sampling = asyncio.Event()
+    sampler_task = asyncio.create_task(sampler.run(stop_sampling))
+
+    seq = 0
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+
+    def _budget_left() -> bool:
+        if max_requests is not None and seq >= max_requests:
+            return False
+        return time.perf_counter() < deadline
+
+    if mode == "closed":
+
+        async def _user() -> None:
+            nonlocal seq
+            while _budget_left():
+                n = seq
+                seq += 1
+                await _timed(target, client, n, stats)
+
+        await asyncio.gather(*(_user() for _ in range(max(1, concurrency))))
+    else:
+        inflight: set[asyncio.Task[None]] = set()
+        interval = 1.0 / rps
+        next_at = time.perf_counter()
+        while _budget_left():
+            now = time.perf_counter()
+            if next_at > now:
+                await asyncio.sleep(next_at - now)
+                continue
+            next_at += random.expovariate(rps) if poisson else interval
+            n = seq
+            seq += 1
+            if max_inflight is not None and len(inflight) >= max_inflight:
+                # Client saturation – count it instead of silently queueing
+                stats.started += 1
+                stats.errors["client_saturated"] += 1
+                continue
+            task = asyncio.create_task(_timed(target, client, n, stats))
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+        if inflight:
+            await asyncio.gather(*inflight)
+
+    stats.elapsed = time.perf_counter() - start
+    stop_sampling.set()
+    await sampler_task
+    sampler.after = await sampler.scrape()
+    stats.server = sampler.summary()
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Reporting ------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def format_report(stats: LoadStats) -> str:
+    data = stats.to_dict()
+    lat = data["latency_sec"]
+    lines = [
+        f"requests   : {data['started']} started, {data['succeeded']} ok, "
+        f"{data['failed']} failed (error rate {data['error_rate']:.2%})",
+        f"throughput : {data['throughput_rps']} runs/s over {data['elapsed_sec']}s",
+        f"latency    : p50={lat['p50'] * 1000:.1f}ms p95={lat['p95'] * 1000:.1f}ms "
+        f"p99={lat['p99'] * 1000:.1f}ms max={lat['max'] * 1000:.1f}ms",
+    ]
+    if data["errors"]:
+        lines.append(
+            "errors     : "
+            + ", ".join(f"{k}={v}" for k, v in sorted(data["errors"].items()))
+        )
+    peak = max((n for _, n in stats.latency.buckets()), default=0)
+    if peak:
+        lines.append("histogram  :")
+        for le, n in stats.latency.buckets():
+            label = "+Inf" if math.isinf(le) else f"{le * 1000:g}ms"
+            bar = "#" * max(1 if n else 0, round(40 * n / peak))
+            lines.append(f"  <= {label:>8} {n:>7} {bar}")
+    server = data["server"]
+    if server.get("available"):
+        lines.append("server     : " + json.dumps(server, sort_keys=True))
+    else:
+        lines.append("server     : /metrics unavailable (set ICEOS_ENABLE_METRICS=1)")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Click command --------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def _resolve_completion(kind: str, completion: str) -> str:
+    if kind == "mcp-runs":
+        return "sse"
+    if completion == "auto":
+        try:
+            import websockets  # type: ignore[import-not-found]  # noqa: F401
+
+            return "ws"
+        except ImportError:
+            return "wait"
+    return completion
+
+
+@click.command("loadtest")
+@click.option(
+    "--target",
+    "kind",
+    type=click.Choice(["executions", "mcp-runs"]),
+    default="executions",
+    show_default=True,
+    help="API surface to drive.",
+)
+@click.option("--blueprint-id", default=None, help="Stored blueprint id to run.")
+@click.option(
+    "--blueprint-file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Inline blueprint JSON (mcp-runs only).",
+)
+@click.option(
+    "--input",
+    "inputs",
+    multiple=True,
+    help="key=value workflow inputs; '{n}' expands to the request number.",
+)
+@click.option(
+    "--mode",
+    type=click.Choice(["closed", "open"]),
+    default="closed",
+    show_default=True,
+    help="closed: fixed concurrency; open: fixed arrival rate.",
+)
+@click.option("--concurrency", type=int, default=10, show_default=True)
+@click.option("--rps", type=float, default=5.0, show_default=True)
+@click.option(
+    "--poisson", is_flag=True, help="Exponential inter-arrival times (open mode)."
+)
+@click.option(
+    "--max-inflight",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="Open mode: arrivals beyond this many outstanding runs count as errors.",
+)
+@click.option("--duration", type=float, default=30.0, show_default=True)
+@click.option("--requests", "max_requests", type=int, default=None)
+@click.option("--warmup", type=int, default=1, show_default=True)
+@click.option("--timeout", type=float, default=120.0, show_default=True)
+@click.option(
+    "--completion",
+    type=click.Choice(["auto", "ws", "wait"]),
+    default="auto",
+    show_default=True,
+    help="How executions report completion (mcp-runs always use SSE).",
+)
+@click.option("--mcp-prefix", default="/api/mcp", show_default=True)
+@click.option("--api", "api_url", envvar="ICE_API_URL", default="http://localhost")
+@click.option("--token", envvar="ICE_API_TOKEN", default="dev-token")
+@click.option("--json", "as_json", is_flag=True, help="Emit the report as JSON.")
+def cli_loadtest(
+    kind: str,
+    blueprint_id: Optional[str],
+    blueprint_file: Optional[str],
+    inputs: List[str],
+    mode: str,
+    concurrency: int,
+    rps: float,
+    poisson: bool,
+    max_inflight: int,
+    duration: float,
+    max_requests: Optional[int],
+    warmup: int,
+    timeout: float,
+    completion: str,
+    mcp_prefix: str,
+    api_url: str,
+    token: str,
+    as_json: bool,
+) -> None:  # noqa: D401
+    """Generate load against the execution APIs and report latency/error rates."""
+
+    blueprint: Optional[Dict[str, Any]] = None
+    if blueprint_file:
+        if kind != "mcp-runs":
+            raise click.UsageError("--blueprint-file requires --target mcp-runs")
+        with open(blueprint_file, encoding="utf-8") as fh:
+            blueprint = json.load(fh)
+    if blueprint is None and not blueprint_id:
+        raise click.UsageError("--blueprint-id (or --blueprint-file) is required")
+    if mode == "open" and rps <= 0:
+        raise click.UsageError("--rps must be positive in open mode")
+
+    input_dict: Dict[str, str] = {}
+    for pair in inputs:
+        if "=" not in pair:
+            raise click.UsageError(f"Invalid --input '{pair}', expected key=value")
+        k, v = pair.split("=", 1)
+        input_dict[k] = v
+
+    resolved = _resolve_completion(kind, completion)
+    if resolved == "ws":
+        try:
+            import websockets  # type: ignore[import-not-found]  # noqa: F401
+        except ImportError:
+            raise click.UsageError("--completion ws requires the 'websockets' package")
+
+    headers = {"Authorization": f"Bearer {token}"}
+    base = api_url.rstrip("/")
+    target = LoadTarget(
+        kind=kind,
+        completion=resolved,
+        timeout=timeout,
+        blueprint_id=blueprint_id,
+        blueprint=blueprint,
+        inputs=input_dict,
+        mcp_prefix=mcp_prefix,
+        ws_url=base.replace("http://", "ws://", 1).replace("https://", "wss://", 1),
+        headers=headers,
+    )
+    pool = concurrency if mode == "closed" else max_inflight
+    limits = httpx.Limits(max_connections=pool + 4, max_keepalive_connections=pool)
+
+    async def _main() -> LoadStats:
+        async with httpx.AsyncClient(
+            base_url=base,
+            headers=headers,
+            limits=limits,
+            timeout=httpx.Timeout(timeout, connect=5.0),
+        ) as client:
+            return await run_load(
+                target,
+                client,
+                mode=mode,
+                duration=duration,
+                concurrency=concurrency,
+                rps=rps,
+                max_requests=max_requests,
+                max_inflight=max_inflight,
+                poisson=poisson,
+                warmup=warmup,
+            )
+
+    stats = asyncio.run(_main())
+    if as_json:
+        click.echo(json.dumps(stats.to_dict(), indent=2))
+    else:
+        click.echo(format_report(stats))
+    if stats.started and stats.succeeded == 0:
+        sys.exit(1)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, Literal
 
 from pydantic import BaseModel, ConfigDict
 
@@ -21,6 +21,17 @@ class ToolBase(BaseModel, ABC):
     name: str = ""
     description: str = ""
 
+    # Where the orchestrator runs ``execute``: on the event loop ("async"),
+    # in a shared process pool for CPU-bound work ("process"), or in a thread
+    # pool for tools that block on I/O ("thread").  Can be overridden per
+    # deployment with ``ICE_TOOL_EXECUTION_MODES=name=mode,...``.
+    execution_mode: ClassVar[Literal["async", "process", "thread"]] = "async"
+
+    # Same inputs always produce the same output with no side effects.  With
+    # ``ICE_TOOL_SINGLEFLIGHT=1`` identical concurrent calls to such tools
+    # share a single execution.
+    deterministic: ClassVar[bool] = False
+
     @abstractmethod
     async def _execute_impl(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
         """Override in subclasses to provide tool-specific logic."""
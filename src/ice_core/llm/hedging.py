@@ -0,0 +1,160 @@
+"""Hedged LLM requests for tail-latency control.
+
+When a request has not answered within the latency percentile learned for
+its model (``ICE_LLM_HEDGE_PERCENTILE``, p95 by default), a backup request is
+launched – to the same model, or to ``LLMConfig.fallback_provider`` /
+``fallback_model`` when set.  The first successful answer wins and the other
+request is cancelled.
+
+Hedging is bounded three ways:
+
+* no hedge before ``ICE_LLM_HEDGE_MIN_SAMPLES`` latencies are known for the
+  model, so cold models are never duplicated on a guess;
+* hedges per model may not exceed ``ICE_LLM_HEDGE_MAX_RATIO`` of its
+  requests (5% by default) – the cap on duplicate spend;
+* no hedge when the remaining deadline is shorter than the backup's median
+  latency, since it could not finish in time anyway.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Set, Tuple, TypeVar
+
+__all__ = ["HedgePolicy", "LatencyTracker", "race"]
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Sliding window of successful request latencies per key."""
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def count(self, key: str) -> int:
+        return len(self._samples.get(key, ()))
+
+    def percentile(self, key: str, pct: float) -> Optional[float]:
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class HedgePolicy:
+    """Decides when (and whether) a request may be hedged."""
+
+    def __init__(
+        self,
+        *,
+        percentile: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        max_ratio: Optional[float] = None,
+        tracker: Optional[LatencyTracker] = None,
+    ) -> None:
+        self.percentile = (
+            percentile
+            if percentile is not None
+            else float(os.getenv("ICE_LLM_HEDGE_PERCENTILE", "95"))
+        )
+        self.min_samples = (
+            min_samples
+            if min_samples is not None
+            else int(os.getenv("ICE_LLM_HEDGE_MIN_SAMPLES", "20"))
+        )
+        self.max_ratio = (
+            max_ratio
+            if max_ratio is not None
+            else float(os.getenv("ICE_LLM_HEDGE_MAX_RATIO", "0.05"))
+        )
+        self.tracker = tracker or LatencyTracker()
+        # key -> (requests, hedges)
+        self._spend: Dict[str, Tuple[int, int]] = {}
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a request for *key*, or ``None``."""
+
+        if self.tracker.count(key) < self.min_samples:
+            return None
+        return self.tracker.percentile(key, self.percentile)
+
+    def note_request(self, key: str) -> None:
+        requests, hedges = self._spend.get(key, (0, 0))
+        self._spend[key] = (requests + 1, hedges)
+
+    def try_spend(self, key: str) -> bool:
+        """Reserve one hedge for *key* if the spend cap allows it."""
+
+        requests, hedges = self._spend.get(key, (0, 0))
+        if hedges + 1 > self.max_ratio * requests:
+            return False
+        self._spend[key] = (requests, hedges + 1)
+        return True
+
+    def fits_deadline(self, key: str, remaining: Optional[float]) -> bool:
+        if remaining is None:
+            return True
+        median = self.tracker.percentile(key, 50)
+        return median is None or remaining >= median
+
+
+async def race(
+    primary: Awaitable[T],
+    start_backup: Callable[[], Optional[Awaitable[T]]],
+    delay: float,
+    succeeded: Callable[[T], bool],
+) -> Tuple[T, Optional[str]]:
+    """Run *primary*; after *delay* seconds also run the backup.
+
+    *start_backup* is called once the delay expires and may return ``None``
+    to decline hedging (e.g. spend cap reached).  Returns the first result
+    for which *succeeded* is true – or the primary's result when neither
+    succeeds – together with the winner (``None`` when no hedge was sent,
+    else ``"primary"`` or ``"backup"``).  The losing request is cancelled.
+    """
+
+    first: "asyncio.Future[T]" = asyncio.ensure_future(primary)
+    tasks: Dict["asyncio.Future[T]", str] = {first: "primary"}
+    done: Set["asyncio.Future[T]"]
+    pending: Set["asyncio.Future[T]"]
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result(), None
+        backup = start_backup()
+        if backup is None:
+            return await first, None
+        tasks[asyncio.ensure_future(backup)] = "backup"
+
+        pending = set(tasks)
+        failures: Dict[str, T] = {}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                result = task.result()
+                if succeeded(result):
+                    return result, tasks[task]
+                failures[tasks[task]] = result
+        reported = "primary" if "primary" in failures else "backup"
+        return failures[reported], reported
+    finally:
+        losers = [task for task in tasks if not task.done()]
+        for task in losers:
+            task.cancel()
+        if losers:
+            # Let the losers unwind (release rate-limit slots, record latency)
+            await asyncio.gather(*losers, return_exceptions=True)
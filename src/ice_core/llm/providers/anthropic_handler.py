@@ -4,7 +4,6 @@ from __future__ import annotations
 """Anthropic LLM provider handler (migrated)."""  # pragma: no cover
 
 import logging
-import os
 from typing import Any, Optional, cast
 
 # ----------------------------------------
@@ -32,6 +31,8 @@ __all__: list[str] = ["AnthropicHandler"]
 class AnthropicHandler(BaseLLMHandler):
     """Handler for Anthropic Claude models."""
 
+    API_KEY_ENV = "ANTHROPIC_API_KEY"
+
     async def generate_text(
         self,
         llm_config: LLMConfig,
@@ -53,7 +54,7 @@ class AnthropicHandler(BaseLLMHandler):
                 ),
             )
 
-        api_key = llm_config.api_key or os.getenv("ANTHROPIC_API_KEY")
+        api_key = self.api_key(llm_config)
         if not api_key:
             return "", None, "ANTHROPIC_API_KEY not set"
 
@@ -67,7 +68,7 @@ class AnthropicHandler(BaseLLMHandler):
         messages = [{"role": "user", "content": prompt}]
         try:
             async with client:
-                response = await client.messages.create(  # type: ignore[call-overload,arg-type]
+                raw = await client.messages.with_raw_response.create(  # type: ignore[call-overload,arg-type]
                     model=str(llm_config.model),
                     system=system_param,  # type: ignore[arg-type]
                     messages=messages,  # type: ignore[arg-type]
@@ -75,8 +76,16 @@ class AnthropicHandler(BaseLLMHandler):
                     temperature=llm_config.temperature or 1.0,
                     top_p=llm_config.top_p or 1.0,
                 )
+                response = raw.parse()
+            await self._observe_rate_limits(llm_config, api_key, raw.headers)
         except Exception as exc:  # pragma: no cover
             logger.error("Anthropic API error", exc_info=True)
+            await self._observe_rate_limits(
+                llm_config,
+                api_key,
+                getattr(getattr(exc, "response", None), "headers", None),
+                getattr(exc, "status_code", None),
+            )
             return "", None, str(exc)
 
         if (
@@ -9,6 +9,7 @@ Migrated from ``ice_tools.llm_providers.base_handler`` to the new
 
 import json
 import logging
+import os
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
@@ -23,6 +24,19 @@ _logger = logging.getLogger(__name__)
 class BaseLLMHandler(ABC):
     """Abstract base class for concrete provider handlers."""
 
+    #: Environment variable holding the provider's API key
+    API_KEY_ENV: str = ""
+
+    def api_key(self, llm_config: LLMConfig) -> Optional[str]:
+        """Return the API key requests for *llm_config* are sent with.
+
+        Callers key per-account state (rate limits) on the same value.
+        """
+
+        return llm_config.api_key or (
+            os.getenv(self.API_KEY_ENV) if self.API_KEY_ENV else None
+        )
+
     # ---------------------------------------------------------------------
     # Common helpers shared by concrete providers --------------------------
     # ---------------------------------------------------------------------
@@ -45,6 +59,27 @@ class BaseLLMHandler(ABC):
             "total_tokens": getattr(usage, "total_tokens", 0),
         }
 
+    @staticmethod
+    async def _observe_rate_limits(
+        llm_config: LLMConfig,
+        api_key: Optional[str],
+        headers: Any,
+        status: Optional[int] = None,
+    ) -> None:
+        """Feed provider rate-limit headers into the shared limiter."""
+
+        if not headers:
+            return
+        from ice_core.llm.rate_limiter import get_rate_limiter
+
+        limiter = get_rate_limiter(llm_config.provider, llm_config.model, api_key)
+        if limiter is None:
+            return
+        try:
+            await limiter.observe(headers, status)
+        except Exception:  # pragma: no cover – never fail the call over this
+            _logger.debug("Could not apply rate-limit headers", exc_info=True)
+
     @staticmethod
     def _format_function_call(name: str, arguments_json: str) -> str:
         """Convert *function_call* into the compact JSON string shared by SDK.
@@ -22,6 +22,11 @@ DEEPSEEK_BASE_URL = "https://api.deepseek.com/v1"
 
 
 class DeepSeekHandler(BaseLLMHandler):
+    API_KEY_ENV = "DEEPSEEK_API_KEY"
+
+    def api_key(self, llm_config: LLMConfig) -> Optional[str]:
+        return os.getenv(self.API_KEY_ENV) or llm_config.api_key
+
     async def generate_text(
         self,
         llm_config: LLMConfig,
@@ -29,7 +34,7 @@ class DeepSeekHandler(BaseLLMHandler):
         context: dict[str, Any],
         tools: Optional[list[dict[str, Any]]] = None,
     ) -> tuple[str, Optional[dict[str, int]], Optional[str]]:
-        api_key = os.getenv("DEEPSEEK_API_KEY") or llm_config.api_key
+        api_key = self.api_key(llm_config)
         if not api_key:
             return "", None, "DEEPSEEK_API_KEY not set"
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 """Google Gemini (generative AI) handler (migrated)."""  # pragma: no cover
 
 import logging
-import os
 from typing import Any, Optional
 
 import google.generativeai as genai
@@ -22,6 +21,8 @@ __all__: list[str] = ["GoogleGeminiHandler"]
 class GoogleGeminiHandler(BaseLLMHandler):
     """Handler for Google Gemini models via google-generativeai SDK."""
 
+    API_KEY_ENV = "GOOGLE_API_KEY"
+
     async def generate_text(
         self,
         llm_config: LLMConfig,
@@ -29,7 +30,7 @@ class GoogleGeminiHandler(BaseLLMHandler):
         context: dict[str, Any],
         tools: Optional[list[dict[str, Any]]] = None,
     ) -> tuple[str, Optional[dict[str, int]], Optional[str]]:
-        api_key = llm_config.api_key or os.getenv("GOOGLE_API_KEY")
+        api_key = self.api_key(llm_config)
         if not api_key:
             return "", None, "GOOGLE_API_KEY not set"
 
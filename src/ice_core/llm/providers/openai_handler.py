@@ -23,6 +23,12 @@ __all__: list[str] = ["OpenAIHandler"]
 class OpenAIHandler(BaseLLMHandler):
     """Handler for OpenAI Chat Completions API."""
 
+    API_KEY_ENV = "OPENAI_API_KEY"
+
+    def api_key(self, llm_config: LLMConfig) -> Optional[str]:
+        # The deployment key always wins for OpenAI
+        return os.getenv(self.API_KEY_ENV)
+
     async def generate_text(
         self,
         llm_config: LLMConfig,
@@ -32,7 +38,7 @@ class OpenAIHandler(BaseLLMHandler):
     ) -> tuple[str, Optional[dict[str, int]], Optional[str]]:
         """Generate text (and optional tool/function call) via OpenAI API."""
 
-        api_key = os.getenv("OPENAI_API_KEY")
+        api_key = self.api_key(llm_config)
         if not api_key:
             return "", None, "OPENAI_API_KEY not set"
 
@@ -48,7 +54,7 @@ class OpenAIHandler(BaseLLMHandler):
             async with client:
                 logger.info("🔄 OpenAI call: model=%s", llm_config.model)
                 model_name: str = llm_config.model or get_default_model_id()
-                response = await client.chat.completions.create(  # type: ignore[arg-type,misc]
+                raw = await client.chat.completions.with_raw_response.create(  # type: ignore[arg-type,misc]
                     model=model_name,
                     messages=messages,  # type: ignore[arg-type]
                     temperature=llm_config.temperature,
@@ -59,8 +65,16 @@ class OpenAIHandler(BaseLLMHandler):
                     stop=llm_config.stop_sequences,
                     functions=tools or None,  # type: ignore[arg-type]
                 )
+                response = raw.parse()
+            await self._observe_rate_limits(llm_config, api_key, raw.headers)
         except Exception as exc:  # pragma: no cover – network failures etc.
             logger.error("OpenAI API error", exc_info=True)
+            await self._observe_rate_limits(
+                llm_config,
+                api_key,
+                getattr(getattr(exc, "response", None), "headers", None),
+                getattr(exc, "status_code", None),
+            )
             return "", None, str(exc)
 
         # --------------------------------------------------------------
@@ -0,0 +1,505 @@
+"""Adaptive requests/tokens-per-minute limiter for LLM providers.
+
+One limiter exists per ``(provider, model, API key)``.  Each holds two token
+buckets – requests per minute (RPM) and tokens per minute (TPM) – that refill
+continuously.  Callers reserve one request plus an estimate of the tokens
+the call will consume (prompt tokens + ``max_tokens``) *before* the request
+is sent, and the reservation is settled against the real usage afterwards.
+
+Limits come from two places:
+
+* ``ICE_LLM_RATE_LIMITS`` – comma separated ``provider[:model]=rpm/tpm``
+  entries, e.g. ``openai:gpt-4o=500/30000,anthropic=50/40000``.  The most
+  specific entry wins; ``0`` means "no limit" for that dimension.
+* Provider response headers (``x-ratelimit-*`` for OpenAI-style APIs,
+  ``anthropic-ratelimit-*`` for Anthropic, ``retry-after`` on 429s).  These
+  override the configured limits, clamp the local buckets to the remaining
+  quota the provider reports, and block the key until a 429 clears.
+
+Until any limit is known, calls pass straight through.
+
+State lives in Redis when ``REDIS_URL`` is set (``ICE_LLM_RATE_LIMIT_REDIS=0``
+turns it off), so every API/worker process draws from one budget; bucket
+updates run as Lua scripts and are atomic.  Redis errors are never fatal –
+the limiter falls back to process-local buckets for a short cooldown.
+
+Within a process, waiters are served strictly first-come first-served: only
+the head of the queue polls the bucket, so a burst is spread out instead of
+every caller retrying in lockstep.  ``ICE_LLM_RATE_LIMIT=0`` disables the
+limiter entirely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+__all__ = [
+    "RateLimitUpdate",
+    "RateLimiter",
+    "get_rate_limiter",
+    "parse_rate_limit_headers",
+    "reset_rate_limiters",
+]
+
+logger = logging.getLogger(__name__)
+
+# Never sleep longer than this in one go, so limit changes (headers seen by
+# other workers, settled reservations) are picked up promptly.
+_MAX_POLL_SECONDS = 1.0
+_REDIS_COOLDOWN_SECONDS = 30.0
+
+
+@dataclass
+class RateLimitUpdate:
+    """Rate-limit facts extracted from one provider response."""
+
+    rpm: Optional[float] = None
+    tpm: Optional[float] = None
+    remaining_requests: Optional[float] = None
+    remaining_tokens: Optional[float] = None
+    block_seconds: Optional[float] = None
+
+
+# ---------------------------------------------------------------------------
+# Header parsing
+# ---------------------------------------------------------------------------
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _duration(value: Any) -> Optional[float]:
+    """Parse ``"6m0s"`` / ``"20ms"`` / ``"1.5"`` / RFC 3339 into seconds."""
+
+    if value is None:
+        return None
+    text = str(value).strip()
+    seconds = _number(text)
+    if seconds is not None:
+        return seconds
+    parts = _DURATION_RE.findall(text)
+    if parts and "".join(n + u for n, u in parts) == text:
+        return sum(float(n) * _UNIT_SECONDS[u] for n, u in parts)
+    try:
+        reset_at = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, Any], status: Optional[int] = None
+) -> RateLimitUpdate:
+    """Extract limits, remaining quota and back-off from response *headers*."""
+
+    h = {str(k).lower(): v for k, v in headers.items()}
+    update = RateLimitUpdate()
+    for prefix, names in (
+        (
+            "x-ratelimit-",
+            (
+                "limit-requests",
+                "limit-tokens",
+                "remaining-requests",
+                "remaining-tokens",
+                "reset-requests",
+                "reset-tokens",
+            ),
+        ),
+        (
+            "anthropic-ratelimit-",
+            (
+                "requests-limit",
+                "tokens-limit",
+                "requests-remaining",
+                "tokens-remaining",
+                "requests-reset",
+                "tokens-reset",
+            ),
+        ),
+    ):
+        values = [h.get(prefix + name) for name in names]
+        if not any(v is not None for v in values):
+            continue
+        update.rpm = _number(values[0])
+        update.tpm = _number(values[1])
+        update.remaining_requests = _number(values[2])
+        update.remaining_tokens = _number(values[3])
+        # Exhausted quota: nothing will succeed before the reset
+        waits = [
+            wait
+            for remaining, reset in (
+                (update.remaining_requests, values[4]),
+                (update.remaining_tokens, values[5]),
+            )
+            if remaining is not None
+            and remaining <= 0
+            and (wait := _duration(reset)) is not None
+        ]
+        if waits:
+            update.block_seconds = max(waits)
+        break
+
+    retry_after = _duration(h.get("retry-after-ms"))
+    retry_after = (
+        retry_after / 1000.0
+        if retry_after is not None
+        else _duration(h.get("retry-after"))
+    )
+    if retry_after is not None:
+        update.block_seconds = max(update.block_seconds or 0.0, retry_after)
+    elif status == 429 and update.block_seconds is None:
+        update.block_seconds = 1.0
+    return update
+
+
+# ---------------------------------------------------------------------------
+# Bucket arithmetic (mirrored by the Lua scripts below)
+# ---------------------------------------------------------------------------
+@dataclass
+class _Bucket:
+    rpm: float = 0.0
+    tpm: float = 0.0
+    requests: float = 0.0
+    tokens: float = 0.0
+    ts: float = 0.0
+    blocked_until: float = 0.0
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.ts)
+        if self.rpm > 0:
+            self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+        if self.tpm > 0:
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+        self.ts = now
+
+    def try_acquire(self, now: float, tokens: float) -> float:
+        """Reserve one request and *tokens*; return 0 or seconds to wait."""
+
+        self.refill(now)
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        wait = 0.0
+        if self.rpm > 0 and self.requests < 1:
+            wait = (1 - self.requests) * 60.0 / self.rpm
+        # A single call larger than the whole budget waits for a full bucket
+        need = min(tokens, self.tpm) if self.tpm > 0 else 0.0
+        if self.tpm > 0 and self.tokens < need:
+            wait = max(wait, (need - self.tokens) * 60.0 / self.tpm)
+        if wait > 0:
+            return wait
+        if self.rpm > 0:
+            self.requests -= 1
+        if self.tpm > 0:
+            self.tokens -= need
+        return 0.0
+
+    def apply(self, now: float, update: RateLimitUpdate, refund: float) -> None:
+        self.refill(now)
+        if update.rpm is not None:
+            if self.rpm <= 0:
+                self.requests = update.rpm
+            self.rpm = update.rpm
+        if update.tpm is not None:
+            if self.tpm <= 0:
+                self.tokens = update.tpm
+            self.tpm = update.tpm
+        if update.remaining_requests is not None:
+            self.requests = min(self.requests, update.remaining_requests)
+        if update.remaining_tokens is not None:
+            self.tokens = min(self.tokens, update.remaining_tokens)
+        if self.tpm > 0:
+            # Over-use (negative refund) may drive the bucket into debt
+            self.tokens = min(self.tpm, self.tokens + refund)
+        if update.block_seconds:
+            self.blocked_until = max(self.blocked_until, now + update.block_seconds)
+
+
+_LUA_PRELUDE = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local s = redis.call('HMGET', KEYS[1], 'rpm', 'tpm', 'req', 'tok', 'ts', 'blocked')
+local rpm = tonumber(s[1]) or tonumber(ARGV[1])
+local tpm = tonumber(s[2]) or tonumber(ARGV[2])
+local req = tonumber(s[3]) or rpm
+local tok = tonumber(s[4]) or tpm
+local ts = tonumber(s[5]) or now
+local blocked = tonumber(s[6]) or 0
+local elapsed = math.max(0, now - ts)
+if rpm > 0 then req = math.min(rpm, req + elapsed * rpm / 60) end
+if tpm > 0 then tok = math.min(tpm, tok + elapsed * tpm / 60) end
+"""
+
+_LUA_SAVE = """
+redis.call('HSET', KEYS[1], 'rpm', rpm, 'tpm', tpm, 'req', req, 'tok', tok,
+           'ts', now, 'blocked', blocked)
+redis.call('EXPIRE', KEYS[1], 3600)
+"""
+
+# ARGV: default rpm, default tpm, tokens -> wait seconds as string
+_LUA_ACQUIRE = _LUA_PRELUDE + """
+local tokens = tonumber(ARGV[3])
+local wait = 0
+if blocked > now then
+  wait = blocked - now
+else
+  if rpm > 0 and req < 1 then wait = (1 - req) * 60 / rpm end
+  local need = 0
+  if tpm > 0 then need = math.min(tokens, tpm) end
+  if tpm > 0 and tok < need then wait = math.max(wait, (need - tok) * 60 / tpm) end
+  if wait <= 0 then
+    if rpm > 0 then req = req - 1 end
+    if tpm > 0 then tok = tok - need end
+  end
+end
+""" + _LUA_SAVE + "return tostring(wait)\n"
+
+# ARGV: default rpm, default tpm, rpm, tpm, remaining req, remaining tok,
+#       block seconds, refund  ('' = unchanged)
+_LUA_APPLY = _LUA_PRELUDE + """
+local new_rpm = tonumber(ARGV[3])
+local new_tpm = tonumber(ARGV[4])
+if new_rpm then
+  if rpm <= 0 then req = new_rpm end
+  rpm = new_rpm
+end
+if new_tpm then
+  if tpm <= 0 then tok = new_tpm end
+  tpm = new_tpm
+end
+local rem_req = tonumber(ARGV[5])
+local rem_tok = tonumber(ARGV[6])
+if rem_req then req = math.min(req, rem_req) end
+if rem_tok then tok = math.min(tok, rem_tok) end
+if tpm > 0 then tok = math.min(tpm, tok + tonumber(ARGV[8])) end
+local block = tonumber(ARGV[7])
+if block and block > 0 then blocked = math.max(blocked, now + block) end
+""" + _LUA_SAVE + "return 1\n"
+
+
+def _arg(value: Optional[float]) -> str:
+    return "" if value is None else repr(float(value))
+
+
+# ---------------------------------------------------------------------------
+# Limiter
+# ---------------------------------------------------------------------------
+def _configured_limits(provider: str, model: str) -> Tuple[float, float]:
+    spec = os.getenv("ICE_LLM_RATE_LIMITS", "")
+    best: Tuple[int, float, float] = (-1, 0.0, 0.0)
+    for entry in filter(None, (e.strip() for e in spec.split(","))):
+        target, _, limits = entry.partition("=")
+        prov, _, mdl = target.strip().partition(":")
+        if prov.lower() != provider or (mdl and mdl != model):
+            continue
+        rpm, _, tpm = limits.partition("/")
+        specificity = 1 if mdl else 0
+        if specificity > best[0]:
+            best = (specificity, _number(rpm) or 0.0, _number(tpm) or 0.0)
+    return best[1], best[2]
+
+
+class RateLimiter:
+    """RPM/TPM budget for one ``(provider, model, API key)``."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        key_id: str = "",
+        *,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        redis_client: Any = None,
+        redis_url: Optional[str] = None,
+    ) -> None:
+        self.provider = provider
+        self.model = model
+        default_rpm, default_tpm = _configured_limits(provider, model)
+        self.default_rpm = default_rpm if rpm is None else rpm
+        self.default_tpm = default_tpm if tpm is None else tpm
+        self.redis_key = f"llm:ratelimit:{provider}:{model}:{key_id}"
+        self._local = _Bucket(
+            rpm=self.default_rpm,
+            tpm=self.default_tpm,
+            requests=self.default_rpm,
+            tokens=self.default_tpm,
+            ts=time.time(),
+        )
+        # Whether any limit is known at all; until then acquire() is free
+        self._active = bool(self.default_rpm or self.default_tpm)
+        self._redis = redis_client
+        self._redis_url = redis_url
+        self._redis_down_until = 0.0
+        self._fifo: Optional[asyncio.Lock] = None
+        self._fifo_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # Redis state (best-effort)
+    # ------------------------------------------------------------------
+    def _client(self) -> Any:
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None and self._redis_url:
+            try:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.from_url(
+                    self._redis_url,
+                    decode_responses=True,
+                    socket_timeout=0.25,
+                    socket_connect_timeout=0.25,
+                )
+            except Exception as exc:  # pragma: no cover – optional dep
+                logger.debug("LLM rate limiter Redis unavailable: %s", exc)
+                self._redis_url = None
+        return self._redis
+
+    async def _remote(self, script: str, *args: str) -> Optional[Any]:
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            return await client.eval(
+                script,
+                1,
+                self.redis_key,
+                _arg(self.default_rpm),
+                _arg(self.default_tpm),
+                *args,
+            )
+        except Exception as exc:
+            logger.warning("LLM rate limiter Redis error, using local budget: %s", exc)
+            self._redis_down_until = time.monotonic() + _REDIS_COOLDOWN_SECONDS
+            return None
+
+    async def _try_acquire(self, tokens: float) -> float:
+        raw = await self._remote(_LUA_ACQUIRE, _arg(tokens))
+        if raw is not None:
+            return float(raw)
+        return self._local.try_acquire(time.time(), tokens)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def active(self) -> bool:
+        """Whether any limit is known; until then :meth:`acquire` is free."""
+
+        return self._active
+
+    def _queue(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._fifo is None or self._fifo_loop is not loop:
+            self._fifo = asyncio.Lock()
+            self._fifo_loop = loop
+        return self._fifo
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait until one request and *tokens* fit the budget.
+
+        Returns the number of tokens reserved, to be passed to :meth:`settle`.
+        Waiters are served first-come first-served.
+        """
+
+        if not self._active:
+            return 0.0
+        async with self._queue():
+            while True:
+                wait = await self._try_acquire(float(tokens))
+                if wait <= 0:
+                    return float(tokens)
+                await asyncio.sleep(min(wait, _MAX_POLL_SECONDS))
+
+    async def settle(self, reserved: float, actual_tokens: Optional[int]) -> None:
+        """Correct the token reservation once real usage is known.
+
+        Pass ``0`` for a call that failed without consuming tokens.
+        """
+
+        if not self._active or actual_tokens is None:
+            return
+        await self._apply(RateLimitUpdate(), reserved - float(actual_tokens))
+
+    async def observe(
+        self, headers: Optional[Mapping[str, Any]], status: Optional[int] = None
+    ) -> None:
+        """Adapt to the rate-limit headers (and status) of a provider response."""
+
+        update = parse_rate_limit_headers(headers or {}, status)
+        if update == RateLimitUpdate():
+            return
+        self._active = True
+        await self._apply(update, 0.0)
+
+    async def _apply(self, update: RateLimitUpdate, refund: float) -> None:
+        done = await self._remote(
+            _LUA_APPLY,
+            _arg(update.rpm),
+            _arg(update.tpm),
+            _arg(update.remaining_requests),
+            _arg(update.remaining_tokens),
+            _arg(update.block_seconds),
+            repr(float(refund)),
+        )
+        if done is None:
+            self._local.apply(time.time(), update, refund)
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+_limiters: Dict[Tuple[str, str, str], RateLimiter] = {}
+
+
+def _key_id(api_key: Optional[str]) -> str:
+    # Never put the key itself into Redis keys or logs
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+def get_rate_limiter(
+    provider: Any, model: Optional[str], api_key: Optional[str] = None
+) -> Optional[RateLimiter]:
+    """Return the shared limiter for ``(provider, model, api_key)``.
+
+    Returns ``None`` when limiting is disabled via ``ICE_LLM_RATE_LIMIT=0``.
+    """
+
+    if os.getenv("ICE_LLM_RATE_LIMIT", "1") == "0":
+        return None
+    provider_name = str(getattr(provider, "value", provider) or "").lower()
+    key = (provider_name, model or "", _key_id(api_key))
+    limiter = _limiters.get(key)
+    if limiter is None:
+        redis_url = (
+            os.getenv("REDIS_URL")
+            if os.getenv("ICE_LLM_RATE_LIMIT_REDIS", "1") != "0"
+            else None
+        )
+        limiter = RateLimiter(*key, redis_url=redis_url)
+        _limiters[key] = limiter
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all limiters (tests, configuration reloads)."""
+
+    _limiters.clear()
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Optional, Tuple
+import os
+import time
+from typing import Any, Awaitable, Optional, Tuple
 
+from ice_core.llm.hedging import HedgePolicy, race
 from ice_core.llm.providers import (
     AnthropicHandler,
     DeepSeekHandler,
@@ -13,7 +16,12 @@ from ice_core.llm.providers import (
     OpenAIHandler,
 )
 from ice_core.llm.providers.base_handler import BaseLLMHandler
+from ice_core.llm.rate_limiter import get_rate_limiter
+from ice_core.metrics import LLM_HEDGES, SINGLEFLIGHT_COALESCED
 from ice_core.models import LLMConfig, ModelProvider
+from ice_core.utils.deadline import remaining
+from ice_core.utils.singleflight import SingleFlight, fingerprint
+from ice_core.utils.token_counter import get_token_service
 
 try:
     from openai import error as openai_error  # type: ignore
@@ -30,6 +38,45 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+GenerateResult = Tuple[str, Optional[dict[str, int]], Optional[str]]
+
+# Shared by every LLMService instance so that identical prompts issued by
+# different nodes/runs in this process coalesce.
+_inflight: SingleFlight[GenerateResult] = SingleFlight()
+
+# Per-model latency history and hedge spend, shared by all instances
+_hedge_policy = HedgePolicy()
+
+
+def _latency_key(llm_config: LLMConfig) -> str:
+    provider = getattr(llm_config.provider, "value", llm_config.provider)
+    return f"{provider}:{llm_config.model or ''}"
+
+
+def _backup_config(llm_config: LLMConfig) -> LLMConfig:
+    """Config for the hedge request: the configured fallback, else the same."""
+
+    provider = llm_config.fallback_provider or llm_config.provider
+    update: dict[str, Any] = {"model": llm_config.fallback_model or llm_config.model}
+    if provider != llm_config.provider:
+        # The primary's key belongs to a different provider
+        update.update(provider=provider, api_key=None, base_url=None)
+    return llm_config.model_copy(update=update)
+
+
+def _follower_usage(usage: Optional[dict[str, int]]) -> Optional[dict[str, int]]:
+    """Usage reported to callers that shared another caller's request.
+
+    Token counts are zeroed so spend is attributed once; the tokens the
+    caller would have consumed are kept under ``coalesced_tokens``.
+    """
+
+    if usage is None:
+        return None
+    shared = {k: 0 if isinstance(v, (int, float)) else v for k, v in usage.items()}
+    shared["coalesced_tokens"] = int(usage.get("total_tokens", 0) or 0)
+    return shared
+
 
 class LLMService:
     """High-level helper for synchronous/asynchronous LLM calls.
@@ -41,9 +88,29 @@ class LLMService:
     • Built-in retries with exponential backoff (via *tenacity*).
     • An optional global timeout that wraps the entire request.
     • Error-capture semantics: instead of raising, return ``(text, usage, error)``.
+    • Opt-in coalescing of identical concurrent requests (``coalesce=True`` or
+      ``ICE_LLM_SINGLEFLIGHT=1``): callers share one provider call and only
+      one of them is charged the token usage.  The shared call runs with the
+      first caller's deadline-clamped timeout, so a follower with a later
+      deadline can still see that caller's timeout error.
+    • Deadline awareness: the timeout is clamped to the deadline propagated
+      by the orchestrator (:mod:`ice_core.utils.deadline`).
+    • Opt-in hedging (``hedge=True`` or ``ICE_LLM_HEDGE=1``): a backup request
+      is sent when the primary is slower than the model's learned latency
+      percentile; see :mod:`ice_core.llm.hedging`.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, *, coalesce: Optional[bool] = None, hedge: Optional[bool] = None
+    ) -> None:
+        self.coalesce = (
+            coalesce
+            if coalesce is not None
+            else os.getenv("ICE_LLM_SINGLEFLIGHT", "0") == "1"
+        )
+        self.hedge = (
+            hedge if hedge is not None else os.getenv("ICE_LLM_HEDGE", "0") == "1"
+        )
         # Instantiate available handlers only. Optional ones may be *None*
         self.handlers: dict[ModelProvider, BaseLLMHandler] = {}
 
@@ -66,11 +133,130 @@ class LLMService:
         context: Optional[dict[str, Any]] = None,
         tools: Optional[list[dict[str, Any]]] = None,
         *,
-        timeout_seconds: Optional[int] = 30,
+        timeout_seconds: Optional[float] = 30,
         max_retries: int = 2,
     ) -> Tuple[str, Optional[dict[str, int]], Optional[str]]:
         """Return *(text, usage, error)* from the configured LLM provider."""
 
+        requested_timeout = timeout_seconds
+        budget = remaining()
+        if budget is not None:
+            if budget <= 0:
+                return "", None, "Deadline exceeded"
+            timeout_seconds = (
+                budget if timeout_seconds is None else min(timeout_seconds, budget)
+            )
+
+        def _call() -> Awaitable[GenerateResult]:
+            return self._hedged(
+                llm_config,
+                prompt,
+                context,
+                tools,
+                timeout_seconds=timeout_seconds,
+                max_retries=max_retries,
+            )
+
+        # Keyed on the requested timeout, not the clamped one: deadlines
+        # differ per run and would defeat coalescing.  Followers therefore
+        # share the leader's clamped timeout.
+        key = (
+            fingerprint(
+                "llm",
+                llm_config.model_dump(mode="json"),
+                prompt,
+                context,
+                tools,
+                requested_timeout,
+                max_retries,
+            )
+            if self.coalesce
+            else None
+        )
+        if key is None:
+            return await _call()
+
+        (text, usage, error), shared = await _inflight.do(key, _call)
+        if not shared:
+            return text, usage, error
+        SINGLEFLIGHT_COALESCED.labels("llm").inc()
+        return text, _follower_usage(usage), error
+
+    async def _hedged(
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: Optional[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]],
+        *,
+        timeout_seconds: Optional[float],
+        max_retries: int,
+    ) -> GenerateResult:
+        """Run the request, hedging it once it exceeds the learned percentile."""
+
+        started = time.monotonic()
+
+        async def _timed(cfg: LLMConfig, timeout: Optional[float]) -> GenerateResult:
+            key = _latency_key(cfg)
+            t0 = time.monotonic()
+            # A cancelled hedge loser raises here and is deliberately not
+            # recorded: its elapsed time is only a lower bound, and counting
+            # it would drag the percentile (and so the hedge delay) down
+            result = await self._generate(
+                cfg,
+                prompt,
+                context,
+                tools,
+                timeout_seconds=timeout,
+                max_retries=max_retries,
+            )
+            if not result[2]:
+                _hedge_policy.tracker.record(key, time.monotonic() - t0)
+            return result
+
+        primary_key = _latency_key(llm_config)
+        _hedge_policy.note_request(primary_key)
+        delay = _hedge_policy.hedge_delay(primary_key) if self.hedge else None
+        if delay is None:
+            return await _timed(llm_config, timeout_seconds)
+
+        backup_cfg = _backup_config(llm_config)
+
+        def _start_backup() -> Optional[Awaitable[GenerateResult]]:
+            left = (
+                None
+                if timeout_seconds is None
+                else timeout_seconds - (time.monotonic() - started)
+            )
+            if left is not None and left <= 0:
+                return None
+            if not _hedge_policy.fits_deadline(_latency_key(backup_cfg), left):
+                return None
+            if not _hedge_policy.try_spend(primary_key):
+                return None
+            LLM_HEDGES.labels("sent").inc()
+            return _timed(backup_cfg, left)
+
+        result, winner = await race(
+            _timed(llm_config, timeout_seconds),
+            _start_backup,
+            delay,
+            lambda r: not r[2],
+        )
+        if winner == "backup":
+            LLM_HEDGES.labels("won").inc()
+        return result
+
+    async def _generate(
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: Optional[dict[str, Any]] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+        *,
+        timeout_seconds: Optional[float] = 30,
+        max_retries: int = 2,
+    ) -> GenerateResult:
         # Map provider to enum constant when supplied as raw string
         provider_key: ModelProvider
         try:
@@ -97,6 +283,18 @@ class LLMService:
 
         handler_nn: BaseLLMHandler = handler
 
+        # Shared RPM/TPM budget, keyed on the API key the handler will send;
+        # reservations use a pre-call token estimate
+        limiter = get_rate_limiter(
+            provider_key, llm_config.model, handler_nn.api_key(llm_config)
+        )
+        estimated_tokens = (
+            get_token_service().count(prompt, model=llm_config.model)
+            + (llm_config.max_tokens or 0)
+            if limiter is not None and limiter.active
+            else 0
+        )
+
         # ------------------------------------------------------------------
         # Internal helper with logging --------------------------------------
         # ------------------------------------------------------------------
@@ -117,6 +315,8 @@ class LLMService:
                 prompt,
             )
 
+            reserved = await limiter.acquire(estimated_tokens) if limiter else 0.0
+            settled = limiter is None
             try:
                 result_inner = await handler_nn.generate_text(
                     llm_config=llm_config,
@@ -126,6 +326,13 @@ class LLMService:
                 )
                 # Unpack tuple for logging before returning.
                 generated_text, usage_stats, error_msg = result_inner
+                if limiter is not None:
+                    used = (usage_stats or {}).get("total_tokens")
+                    # A failed call without usage consumed no tokens
+                    await limiter.settle(
+                        reserved, 0 if used is None and error_msg else used
+                    )
+                    settled = True
 
                 logger.debug(
                     "LLM response | error=%s usage=%s\nOutput:%s",
@@ -140,14 +347,25 @@ class LLMService:
                 openai_error.Timeout,  # type: ignore[attr-defined]
                 openai_error.APIError,  # type: ignore[attr-defined]
             ) as err:  # pragma: no cover – runtime error path
+                if limiter is not None:
+                    # Back off every caller sharing this budget, not just us
+                    response = getattr(err, "response", None)
+                    await limiter.observe(getattr(response, "headers", None), 429)
                 # Re-raise so *tenacity* can retry.
                 raise err
             except Exception as err:  # pylint: disable=broad-except
+                if limiter is not None and getattr(err, "status_code", None) == 429:
+                    response = getattr(err, "response", None)
+                    await limiter.observe(getattr(response, "headers", None), 429)
                 # Retry on generic 502/503 HTTP gateway errors.
                 if getattr(err, "status", None) in {502, 503}:
                     raise err
                 logger.error("LLM handler raised unexpected exception", exc_info=True)
                 return "", None, str(err)
+            finally:
+                if not settled and limiter is not None:
+                    # Raised or cancelled: hand the reserved tokens back
+                    await limiter.settle(reserved, 0)
 
         async def _call_with_retry() -> (
             Tuple[str, Optional[dict[str, int]], Optional[str]]
@@ -1,9 +1,25 @@
-"""Episodic memory for storing conversation and interaction history."""
+"""Episodic memory for storing conversation and interaction history.
+
+Redis layout:
+
+* ``episode:{key}`` – hash with ``content``, ``metadata`` and ``timestamp``
+* ``episode_idx:all`` – sorted set of every episode key scored by timestamp
+* ``episode_idx:lex`` – the same keys with score 0 for prefix lookups
+  (``ZRANGEBYLEX``) used by :meth:`list_keys` and :meth:`clear`
+* ``episode_idx:{attr}:{value}`` – time-ordered sorted sets per type,
+  participant, session, user, tag, outcome and date
+* ``episode_idx:registry`` – set of the index keys above
+
+Every query is a range over one sorted set (or a server-side
+``ZINTERSTORE`` of several) followed by pipelined ``HGETALL`` batches, so no
+operation ever walks the keyspace with ``KEYS``/``SCAN``.
+"""
 
-import hashlib
 import json
+import logging
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 from ice_core.costs import TokenCostCalculator
 from ice_core.metrics import MEMORY_COST_TOTAL, MEMORY_TOKEN_TOTAL
@@ -13,13 +29,21 @@ from ice_core.utils.token_counter import TokenCounter
 from .memory_base_protocol import BaseMemory, MemoryConfig, MemoryEntry
 
 try:
-    import redis
-    from redis import Redis
-    from redis.client import Pipeline as RedisPipeline
+    import redis.asyncio as aioredis
 except ImportError:
-    redis = None  # type: ignore[assignment]
-    Redis = None  # type: ignore
-    RedisPipeline = None  # type: ignore
+    aioredis = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Filters that map onto a per-attribute index: filter name -> index name
+_INDEXED_FILTERS = {
+    "type": "type",
+    "participant": "participant",
+    "session_id": "session",
+    "user_id": "user",
+    "outcome": "outcome",
+    "date": "date",
+}
 
 
 class EpisodicMemory(BaseMemory):
@@ -33,6 +57,11 @@ class EpisodicMemory(BaseMemory):
     - Semantic search through metadata
     """
 
+    # Episodes fetched per pipelined HGETALL round trip
+    FETCH_BATCH = 100
+    # Upper bound on candidates inspected by a free-text (substring) search
+    SEARCH_SCAN_LIMIT = 1000
+
     # ------------------------------------------------------------------
     # MemoryGuarantee interface
     # ------------------------------------------------------------------
@@ -62,22 +91,22 @@ class EpisodicMemory(BaseMemory):
         try:
             # Parse Redis connection info from config
             redis_config = self.config.connection_params or {}
-            host = redis_config.get("host", "localhost")
-            port = redis_config.get("port", 6379)
-            db = redis_config.get("db", 0)
-            password = redis_config.get("password")
+            if aioredis is None:
+                raise ImportError("Redis library not installed")
 
             # Create Redis connection
-            if redis is not None:
-                self._redis = redis.Redis(
-                    host=host,
-                    port=port,
-                    db=db,
-                    password=password,
-                    decode_responses=True,
+            if redis_config.get("url"):
+                self._redis = aioredis.from_url(
+                    redis_config["url"], decode_responses=True
                 )
             else:
-                raise ImportError("Redis library not installed")
+                self._redis = aioredis.Redis(
+                    host=redis_config.get("host", "localhost"),
+                    port=redis_config.get("port", 6379),
+                    db=redis_config.get("db", 0),
+                    password=redis_config.get("password"),
+                    decode_responses=True,
+                )
 
             # Test connection
             await self._redis.ping()
@@ -85,11 +114,160 @@ class EpisodicMemory(BaseMemory):
 
         except Exception as e:
             # Fallback to in-memory if Redis not available
-            print(f"Redis connection failed: {e}. Using in-memory storage.")
+            logger.warning("Redis connection failed: %s. Using in-memory storage.", e)
             self._redis = None
             self._memory_store = {}  # Fallback to dict
             self._initialized = True
 
+    # ------------------------------------------------------------------
+    # Index helpers
+    # ------------------------------------------------------------------
+    @property
+    def _all_index(self) -> str:
+        return f"{self._index_prefix}all"
+
+    @property
+    def _lex_index(self) -> str:
+        return f"{self._index_prefix}lex"
+
+    @property
+    def _registry_key(self) -> str:
+        return f"{self._index_prefix}registry"
+
+    def _attr_index(self, attr: str, value: Any) -> str:
+        return f"{self._index_prefix}{attr}:{value}"
+
+    def _index_keys(self, metadata: Dict[str, Any], timestamp: datetime) -> List[str]:
+        """Return the attribute indexes an episode belongs to."""
+        keys = [
+            self._attr_index("type", metadata.get("episode_type", "unknown")),
+            self._attr_index("outcome", metadata.get("outcome", "unknown")),
+            self._attr_index("date", timestamp.strftime("%Y-%m-%d")),
+        ]
+        keys.extend(
+            self._attr_index("participant", p) for p in metadata.get("participants", [])
+        )
+        keys.extend(self._attr_index("tag", t) for t in metadata.get("tags", []))
+        for field, attr in (("session_id", "session"), ("user_id", "user")):
+            if metadata.get(field):
+                keys.append(self._attr_index(attr, metadata[field]))
+        return keys
+
+    def _index_episode(self, pipeline: Any, key: str, entry: MemoryEntry) -> None:
+        """Add the episode to its time-ordered indexes."""
+        score = entry.timestamp.timestamp()
+        cutoff = score - self._ttl
+        for index_key in self._index_keys(entry.metadata, entry.timestamp):
+            pipeline.zadd(index_key, {key: score})
+            # Members older than the TTL point at expired hashes
+            pipeline.zremrangebyscore(index_key, "-inf", cutoff)
+            pipeline.expire(index_key, self._ttl)
+            pipeline.sadd(self._registry_key, index_key)
+        pipeline.expire(self._registry_key, self._ttl)
+        pipeline.zadd(self._all_index, {key: score})
+        pipeline.zadd(self._lex_index, {key: 0})
+
+    async def _prune_expired(self) -> None:
+        """Drop expired episodes from the global indexes, one bounded batch.
+
+        Attribute indexes are trimmed by score whenever they are written and
+        expire as a whole once idle for a TTL.
+        """
+        cutoff = datetime.now().timestamp() - self._ttl
+        assert self._redis is not None
+        stale = await self._redis.zrangebyscore(
+            self._all_index, "-inf", cutoff, start=0, num=self.FETCH_BATCH
+        )
+        if not stale:
+            return
+        pipeline = self._redis.pipeline(transaction=False)
+        pipeline.zrem(self._all_index, *stale)
+        pipeline.zrem(self._lex_index, *stale)
+        await pipeline.execute()
+
+    async def _fetch_many(
+        self, keys: Iterable[str]
+    ) -> List[Tuple[str, Optional[MemoryEntry]]]:
+        """HGETALL *keys* in pipelined batches (``None`` for expired ones)."""
+        assert self._redis is not None
+        keys = list(keys)
+        found: List[Tuple[str, Optional[MemoryEntry]]] = []
+        for start in range(0, len(keys), self.FETCH_BATCH):
+            batch = keys[start : start + self.FETCH_BATCH]
+            pipeline = self._redis.pipeline(transaction=False)
+            for key in batch:
+                pipeline.hgetall(f"{self._key_prefix}{key}")
+            for key, data in zip(batch, await pipeline.execute()):
+                found.append((key, self._decode(key, data) if data else None))
+        return found
+
+    @staticmethod
+    def _decode(key: str, data: Dict[str, str]) -> MemoryEntry:
+        content: Any = data.get("content", "")
+        try:
+            content = json.loads(content)
+        except Exception:
+            pass  # Keep as string if not JSON
+
+        metadata = json.loads(data.get("metadata", "{}"))
+        timestamp = datetime.fromisoformat(
+            data.get("timestamp", datetime.now().isoformat())
+        )
+        return MemoryEntry(
+            key=key, content=content, metadata=metadata, timestamp=timestamp
+        )
+
+    async def _range(
+        self,
+        filters: Dict[str, Any],
+        offset: int,
+        count: int,
+        since: Optional[float],
+    ) -> List[str]:
+        """Return episode keys matching *filters*, newest first.
+
+        Multiple filters are intersected server-side into a short-lived
+        temporary sorted set.
+        """
+        assert self._redis is not None
+        index_keys = [
+            self._attr_index(attr, filters[name])
+            for name, attr in _INDEXED_FILTERS.items()
+            if filters.get(name) is not None
+        ]
+        index_keys.extend(self._attr_index("tag", t) for t in filters.get("tags", []))
+        low = since if since is not None else "-inf"
+
+        if not index_keys:
+            source = self._all_index
+        elif len(index_keys) == 1:
+            source = index_keys[0]
+        else:
+            source = f"{self._index_prefix}tmp:{uuid.uuid4().hex}"
+            pipeline = self._redis.pipeline(transaction=False)
+            pipeline.zinterstore(source, index_keys, aggregate="MAX")
+            pipeline.expire(source, 30)
+            pipeline.zrevrangebyscore(source, "+inf", low, start=offset, num=count)
+            pipeline.delete(source)
+            results = await pipeline.execute()
+            return list(results[2])
+
+        return list(
+            await self._redis.zrevrangebyscore(
+                source, "+inf", low, start=offset, num=count
+            )
+        )
+
+    @staticmethod
+    def _since(filters: Dict[str, Any]) -> Optional[float]:
+        since = filters.get("since")
+        if isinstance(since, datetime):
+            return since.timestamp()
+        return float(since) if since is not None else None
+
+    # ------------------------------------------------------------------
+    # BaseMemory interface
+    # ------------------------------------------------------------------
     async def store(
         self, key: str, content: Any, metadata: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -148,61 +326,34 @@ class EpisodicMemory(BaseMemory):
                 "timestamp": entry.timestamp.isoformat(),
             }
 
-            # Store with TTL
-            pipeline = self._redis.pipeline()
+            # An overwrite must leave the indexes of its old metadata
+            ((_, previous),) = await self._fetch_many([key])
+            stale: set[str] = set()
+            if previous is not None:
+                stale = set(
+                    self._index_keys(previous.metadata, previous.timestamp)
+                ) - set(self._index_keys(entry.metadata, entry.timestamp))
+
+            # Store with TTL and index in a single round trip
+            pipeline = self._redis.pipeline(transaction=False)
+            for index_key in stale:
+                pipeline.zrem(index_key, key)
             pipeline.hset(full_key, mapping=entry_data)
             pipeline.expire(full_key, self._ttl)
-
-            # Index by various attributes for search
             self._index_episode(pipeline, key, entry)
-
-            pipeline.execute()
-
-            # Update aggregate stats
-            self._token_total += token_usage
-            self._cost_total += cost_usd
-
-            # Prometheus metrics
-            MEMORY_TOKEN_TOTAL.labels(memory_type="episodic").inc(token_usage)
-            MEMORY_COST_TOTAL.labels(memory_type="episodic").inc(cost_usd)
+            await pipeline.execute()
+            await self._prune_expired()
         else:
             # Fallback to in-memory
             self._memory_store[key] = entry
 
-            # Update aggregate stats
-            self._token_total += token_usage
-            self._cost_total += cost_usd
-
-            # Prometheus metrics
-            MEMORY_TOKEN_TOTAL.labels(memory_type="episodic").inc(token_usage)
-            MEMORY_COST_TOTAL.labels(memory_type="episodic").inc(cost_usd)
+        # Update aggregate stats
+        self._token_total += token_usage
+        self._cost_total += cost_usd
 
-    def _index_episode(self, pipeline: Any, key: str, entry: MemoryEntry) -> None:
-        """Index episode for efficient search."""
-        # Index by type
-        episode_type = entry.metadata.get("episode_type", "unknown")
-        pipeline.sadd(f"{self._index_prefix}type:{episode_type}", key)
-        pipeline.expire(f"{self._index_prefix}type:{episode_type}", self._ttl)
-
-        # Index by participants
-        for participant in entry.metadata.get("participants", []):
-            pipeline.sadd(f"{self._index_prefix}participant:{participant}", key)
-            pipeline.expire(f"{self._index_prefix}participant:{participant}", self._ttl)
-
-        # Index by tags
-        for tag in entry.metadata.get("tags", []):
-            pipeline.sadd(f"{self._index_prefix}tag:{tag}", key)
-            pipeline.expire(f"{self._index_prefix}tag:{tag}", self._ttl)
-
-        # Index by date (for time-based queries)
-        date_key = entry.timestamp.strftime("%Y-%m-%d")
-        pipeline.sadd(f"{self._index_prefix}date:{date_key}", key)
-        pipeline.expire(f"{self._index_prefix}date:{date_key}", self._ttl)
-
-        # Index by outcome
-        outcome = entry.metadata.get("outcome", "unknown")
-        pipeline.sadd(f"{self._index_prefix}outcome:{outcome}", key)
-        pipeline.expire(f"{self._index_prefix}outcome:{outcome}", self._ttl)
+        # Prometheus metrics
+        MEMORY_TOKEN_TOTAL.labels(memory_type="episodic").inc(token_usage)
+        MEMORY_COST_TOTAL.labels(memory_type="episodic").inc(cost_usd)
 
     async def retrieve(self, key: str) -> Optional[MemoryEntry]:
         """Retrieve a specific episode."""
@@ -210,27 +361,10 @@ class EpisodicMemory(BaseMemory):
             await self.initialize()
 
         if self._redis:
-            full_key = f"{self._key_prefix}{key}"
-            data = self._redis.hgetall(full_key)
-
+            data = await self._redis.hgetall(f"{self._key_prefix}{key}")
             if not data:
                 return None
-
-            # Deserialize
-            content = data.get("content", "")
-            try:
-                content = json.loads(content)
-            except Exception:
-                pass  # Keep as string if not JSON
-
-            metadata = json.loads(data.get("metadata", "{}"))
-            timestamp = datetime.fromisoformat(
-                data.get("timestamp", datetime.now().isoformat())
-            )
-
-            return MemoryEntry(
-                key=key, content=content, metadata=metadata, timestamp=timestamp
-            )
+            return self._decode(key, data)
         else:
             # Fallback to in-memory
             entry = self._memory_store.get(key)
@@ -241,118 +375,111 @@ class EpisodicMemory(BaseMemory):
     async def search(
         self, query: str, limit: int = 10, filters: Optional[Dict[str, Any]] = None
     ) -> List[MemoryEntry]:
-        """Search episodes by content or metadata."""
+        """Search episodes by content or metadata, most recent first.
+
+        Supported filters: ``type``, ``participant``, ``session_id``,
+        ``user_id``, ``tags`` (all must match), ``outcome``, ``date``
+        (``YYYY-MM-DD``) and ``since`` (datetime or epoch seconds).
+
+        On Redis a non-empty *query* is a substring match over the newest
+        ``SEARCH_SCAN_LIMIT`` episodes that pass the filters; older matches
+        are not returned (a debug log notes when the scan was cut short).
+        Narrow the filters to search further back.
+        """
         if not self._initialized:
             await self.initialize()
 
         filters = filters or {}
-        matching_keys = set()
+        needle = query.lower() if query else ""
 
         if self._redis:
-            # Start with all keys if no filters
-            if not filters:
-                # Search by query in content (simple substring match)
-                all_keys = self._redis.keys(f"{self._key_prefix}*")
-                for full_key in all_keys[:100]:  # Limit scan
-                    key = full_key.replace(self._key_prefix, "")
-                    entry = await self.retrieve(key)
-                    if entry and query.lower() in str(entry.content).lower():
-                        matching_keys.add(key)
-            else:
-                # Use indexes for filtered search
-                sets_to_intersect = []
-
-                if "type" in filters:
-                    sets_to_intersect.append(
-                        f"{self._index_prefix}type:{filters['type']}"
-                    )
-
-                if "participant" in filters:
-                    sets_to_intersect.append(
-                        f"{self._index_prefix}participant:{filters['participant']}"
-                    )
-
-                if "tags" in filters:
-                    for tag in filters["tags"]:
-                        sets_to_intersect.append(f"{self._index_prefix}tag:{tag}")
-
-                if "outcome" in filters:
-                    sets_to_intersect.append(
-                        f"{self._index_prefix}outcome:{filters['outcome']}"
-                    )
-
-                if "date" in filters:
-                    sets_to_intersect.append(
-                        f"{self._index_prefix}date:{filters['date']}"
-                    )
-
-                # Get intersection of all filter sets
-                if sets_to_intersect:
-                    if len(sets_to_intersect) == 1:
-                        matching_keys = set(self._redis.smembers(sets_to_intersect[0]))
-                    else:
-                        # Create temporary key for intersection
-                        temp_key = (
-                            f"temp:search:{hashlib.md5(query.encode()).hexdigest()}"
-                        )
-                        self._redis.sinterstore(temp_key, *sets_to_intersect)
-                        matching_keys = set(self._redis.smembers(temp_key))
-                        self._redis.delete(temp_key)
-
-                # Further filter by query if provided
-                if query and matching_keys:
-                    filtered_keys = set()
-                    for key in matching_keys:
-                        entry = await self.retrieve(key)
-                        if (
-                            entry is not None
-                            and query.lower() in str(entry.content).lower()
-                        ):
-                            filtered_keys.add(key)
-                    matching_keys = filtered_keys
-        else:
-            # Fallback to in-memory search
-            for key, entry in self._memory_store.items():
-                # Check query match
-                if entry is None:
-                    continue
-                if query and query.lower() not in str(entry.content).lower():  # type: ignore[union-attr]
-                    continue
-
-                # Check filters
-                if filters:
-                    if (
-                        "type" in filters
-                        and entry.metadata.get("episode_type") != filters["type"]
-                    ):  # type: ignore[union-attr]
+            entries: List[MemoryEntry] = []
+            # Without a text query the index range *is* the answer; with one,
+            # page through candidates until enough match (bounded scan).
+            page = limit if not needle else self.FETCH_BATCH
+            budget = limit if not needle else self.SEARCH_SCAN_LIMIT
+            offset = 0
+            since = self._since(filters)
+            exhausted = False
+            while len(entries) < limit and offset < budget:
+                keys = await self._range(filters, offset, page, since)
+                if not keys:
+                    exhausted = True
+                    break
+                offset += len(keys)
+                for _, entry in await self._fetch_many(keys):
+                    if entry is None:
                         continue
-                    if "participant" in filters and filters[
-                        "participant"
-                    ] not in entry.metadata.get("participants", []):  # type: ignore[union-attr]
+                    if needle and needle not in str(entry.content).lower():
                         continue
-                    if "tags" in filters:
-                        entry_tags = set(entry.metadata.get("tags", []))  # type: ignore[union-attr]
-                        if not all(tag in entry_tags for tag in filters["tags"]):
-                            continue
-                    if (
-                        "outcome" in filters
-                        and entry.metadata.get("outcome") != filters["outcome"]
-                    ):  # type: ignore[union-attr]
-                        continue
-
-                matching_keys.add(key)
-
-        # Retrieve matching entries
-        entries = []
-        for key in list(matching_keys)[:limit]:
-            entry = await self.retrieve(key)
-            if entry:
-                entries.append(entry)
+                    entries.append(entry)
+                if len(keys) < page:
+                    exhausted = True
+                    break
+            if needle and len(entries) < limit and not exhausted:
+                logger.debug(
+                    "Episodic search for %r stopped after %d candidates",
+                    query,
+                    offset,
+                )
+            return entries[:limit]
+
+        # Fallback to in-memory search
+        since_ts = self._since(filters)
+        matches: List[MemoryEntry] = []
+        for entry in self._memory_store.values():
+            if entry is None:
+                continue
+            if needle and needle not in str(entry.content).lower():
+                continue
+            if since_ts is not None and entry.timestamp.timestamp() < since_ts:
+                continue
+            meta = entry.metadata
+            if "type" in filters and meta.get("episode_type") != filters["type"]:
+                continue
+            if "participant" in filters and filters["participant"] not in meta.get(
+                "participants", []
+            ):
+                continue
+            if "tags" in filters:
+                entry_tags = set(meta.get("tags", []))
+                if not all(tag in entry_tags for tag in filters["tags"]):
+                    continue
+            if "outcome" in filters and meta.get("outcome") != filters["outcome"]:
+                continue
+            if any(
+                field in filters and meta.get(field) != filters[field]
+                for field in ("session_id", "user_id")
+            ):
+                continue
+            if (
+                "date" in filters
+                and entry.timestamp.strftime("%Y-%m-%d") != filters["date"]
+            ):
+                continue
+            matches.append(entry)
 
         # Sort by timestamp (most recent first)
-        entries.sort(key=lambda e: e.timestamp, reverse=True)
-
-        return entries[:limit]
+        matches.sort(key=lambda e: e.timestamp, reverse=True)
+        return matches[:limit]
+
+    async def _delete_many(self, keys: List[str]) -> int:
+        """Delete episodes and their index memberships; return how many existed."""
+        assert self._redis is not None
+        if not keys:
+            return 0
+        existing = 0
+        pipeline = self._redis.pipeline(transaction=False)
+        for key, entry in await self._fetch_many(keys):
+            if entry is not None:
+                existing += 1
+                for index_key in self._index_keys(entry.metadata, entry.timestamp):
+                    pipeline.zrem(index_key, key)
+            pipeline.delete(f"{self._key_prefix}{key}")
+        pipeline.zrem(self._all_index, *keys)
+        pipeline.zrem(self._lex_index, *keys)
+        await pipeline.execute()
+        return existing
 
     async def delete(self, key: str) -> bool:
         """Delete an episode."""
@@ -360,45 +487,24 @@ class EpisodicMemory(BaseMemory):
             await self.initialize()
 
         if self._redis:
-            full_key = f"{self._key_prefix}{key}"
-
-            # Get entry for cleanup
             entry = await self.retrieve(key)
             if not entry:
                 return False
-
-            # Remove from indexes
-            pipeline = self._redis.pipeline()
-
-            # Remove from type index
-            episode_type = entry.metadata.get("episode_type", "unknown")
-            pipeline.srem(f"{self._index_prefix}type:{episode_type}", key)
-
-            # Remove from participant indexes
-            for participant in entry.metadata.get("participants", []):
-                pipeline.srem(f"{self._index_prefix}participant:{participant}", key)
-
-            # Remove from tag indexes
-            for tag in entry.metadata.get("tags", []):
-                pipeline.srem(f"{self._index_prefix}tag:{tag}", key)
-
-            # Remove from date index
-            date_key = entry.timestamp.strftime("%Y-%m-%d")
-            pipeline.srem(f"{self._index_prefix}date:{date_key}", key)
-
-            # Remove from outcome index
-            outcome = entry.metadata.get("outcome", "unknown")
-            pipeline.srem(f"{self._index_prefix}outcome:{outcome}", key)
-
-            # Delete the entry
-            pipeline.delete(full_key)
-
-            results = pipeline.execute()
-            return bool(results[-1] > 0)  # Check if delete was successful
+            return await self._delete_many([key]) > 0
         else:
             # Fallback to in-memory
             return self._memory_store.pop(key, None) is not None
 
+    async def _keys_with_prefix(self, prefix: str, limit: int) -> List[str]:
+        assert self._redis is not None
+        low = f"[{prefix}" if prefix else "-"
+        high = f"[{prefix}\xff" if prefix else "+"
+        return list(
+            await self._redis.zrangebylex(
+                self._lex_index, low, high, start=0, num=limit
+            )
+        )
+
     async def clear(self, pattern: Optional[str] = None) -> int:
         """Clear episodes matching pattern."""
         if not self._initialized:
@@ -408,26 +514,33 @@ class EpisodicMemory(BaseMemory):
 
         if self._redis:
             if pattern:
-                # Clear by pattern
-                keys = self._redis.keys(f"{self._key_prefix}{pattern}*")
-                for full_key in keys:
-                    key = full_key.replace(self._key_prefix, "")
-                    if await self.delete(key):
-                        count += 1
+                # Prefix range over the lexicographic index, batch by batch
+                while True:
+                    keys = await self._keys_with_prefix(pattern, self.FETCH_BATCH)
+                    if not keys:
+                        break
+                    count += await self._delete_many(keys)
             else:
-                # Clear all episodes
-                keys = self._redis.keys(f"{self._key_prefix}*")
-                pipeline = self._redis.pipeline()
-                for key in keys:
-                    pipeline.delete(key)
-                    count += 1
-
-                # Clear all indexes
-                index_keys = self._redis.keys(f"{self._index_prefix}*")
-                for key in index_keys:
-                    pipeline.delete(key)
-
-                pipeline.execute()
+                # Clear all episodes, then every index we ever created
+                while True:
+                    keys = await self._redis.zrange(
+                        self._all_index, 0, self.FETCH_BATCH - 1
+                    )
+                    if not keys:
+                        break
+                    pipeline = self._redis.pipeline(transaction=False)
+                    for key in keys:
+                        pipeline.delete(f"{self._key_prefix}{key}")
+                    pipeline.zrem(self._all_index, *keys)
+                    results = await pipeline.execute()
+                    count += sum(1 for r in results[:-1] if r)
+
+                index_keys = list(await self._redis.smembers(self._registry_key))
+                index_keys += [self._all_index, self._lex_index, self._registry_key]
+                pipeline = self._redis.pipeline(transaction=False)
+                for start in range(0, len(index_keys), self.FETCH_BATCH):
+                    pipeline.delete(*index_keys[start : start + self.FETCH_BATCH])
+                await pipeline.execute()
         else:
             # Fallback to in-memory
             if pattern:
@@ -451,13 +564,7 @@ class EpisodicMemory(BaseMemory):
             await self.initialize()
 
         if self._redis:
-            if pattern:
-                keys = self._redis.keys(f"{self._key_prefix}{pattern}*")
-            else:
-                keys = self._redis.keys(f"{self._key_prefix}*")
-
-            # Remove prefix
-            return [k.replace(self._key_prefix, "") for k in keys[:limit]]
+            return await self._keys_with_prefix(pattern or "", limit)
         else:
             # Fallback to in-memory
             if pattern:
@@ -477,25 +584,21 @@ class EpisodicMemory(BaseMemory):
     async def get_conversation_history(
         self, participant: str, limit: int = 50
     ) -> List[MemoryEntry]:
-        """Get conversation history for a specific participant."""
+        """Get conversation history for a specific participant (newest first)."""
         return await self.search(
             query="", filters={"participant": participant}, limit=limit
         )
 
     async def get_recent_episodes(
-        self, hours: int = 24, episode_type: Optional[str] = None
+        self, hours: int = 24, episode_type: Optional[str] = None, limit: int = 100
     ) -> List[MemoryEntry]:
         """Get recent episodes within specified time window."""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-
-        filters = {}
+        filters: Dict[str, Any] = {"since": datetime.now() - timedelta(hours=hours)}
         if episode_type:
             filters["type"] = episode_type
 
-        # Get episodes and filter by time
-        episodes = await self.search("", filters=filters, limit=100)
-
-        return [e for e in episodes if e.timestamp >= cutoff_time]
+        # A score range over the time-ordered index; no post-filtering needed
+        return await self.search("", filters=filters, limit=limit)
 
     async def analyze_patterns(
         self, participant: Optional[str] = None, episode_type: Optional[str] = None
@@ -1,15 +1,169 @@
 """Procedural memory for storing action patterns and strategies."""
 
 import json
-from collections import defaultdict
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
 
 from ice_core.models.enums import MemoryGuarantee
 
 from .memory_base_protocol import BaseMemory, MemoryConfig, MemoryEntry
 
 
+class _ApplicabilityIndex:
+    """Precompiled form of every procedure's applicability conditions.
+
+    :meth:`ProceduralMemory._is_applicable` accepts a procedure when
+
+    * ``context["type"]`` is one of its ``contexts`` (if it lists any),
+    * every prerequisite is truthy in the context,
+    * every ``applicable_when`` equality condition matches exactly, and
+    * every ``[low, high]`` range condition holds when the field is present.
+
+    Each rule is indexed separately so :meth:`candidates` can prune with
+    hash lookups and bisections instead of visiting every procedure.  The
+    result is a superset of the applicable procedures; callers still run
+    the full check on what remains.
+    """
+
+    def __init__(self) -> None:
+        self.unscoped: Set[str] = set()  # no ``contexts`` restriction
+        self.by_context: Dict[str, Set[str]] = defaultdict(set)
+        self.prereqs: Dict[str, Set[str]] = defaultdict(set)
+        self.equals: Dict[str, Dict[Hashable, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        # field -> sorted (bound, key) lists of range lower / upper bounds
+        self.lows: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self.highs: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self.required: Dict[str, int] = {}  # prereqs + equality conditions
+        self.compiled: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _compile(entry: MemoryEntry) -> Dict[str, Any]:
+        """Split conditions into indexable predicates.
+
+        Conditions that cannot be indexed (non-numeric ranges, unhashable
+        values) are simply left out; the full check still enforces them.
+        """
+        conditions = entry.content.get("applicable_when") or {}
+        equals: List[Tuple[str, Hashable]] = []
+        ranges: List[Tuple[str, float, float]] = []
+        for field, value in conditions.items():
+            if isinstance(value, list) and len(value) == 2:
+                low, high = value
+                if _is_number(low) and _is_number(high):
+                    ranges.append((field, low, high))
+                continue
+            try:
+                hash(value)
+            except TypeError:
+                continue
+            equals.append((field, value))
+        return {
+            "contexts": list(entry.metadata.get("contexts", [])),
+            "prereqs": list(dict.fromkeys(entry.metadata.get("prerequisites", []))),
+            "equals": equals,
+            "ranges": ranges,
+        }
+
+    def add(self, key: str, entry: MemoryEntry) -> None:
+        self.remove(key)
+        spec = self._compile(entry)
+        self.compiled[key] = spec
+
+        if spec["contexts"]:
+            for context in spec["contexts"]:
+                self.by_context[context].add(key)
+        else:
+            self.unscoped.add(key)
+        for prereq in spec["prereqs"]:
+            self.prereqs[prereq].add(key)
+        for field, value in spec["equals"]:
+            self.equals[field][value].add(key)
+        for field, low, high in spec["ranges"]:
+            insort(self.lows[field], (low, key))
+            insort(self.highs[field], (high, key))
+        self.required[key] = len(spec["prereqs"]) + len(spec["equals"])
+
+    def remove(self, key: str) -> None:
+        spec = self.compiled.pop(key, None)
+        if spec is None:
+            return
+        self.unscoped.discard(key)
+        for context in spec["contexts"]:
+            _discard_in(self.by_context, context, key)
+        for prereq in spec["prereqs"]:
+            _discard_in(self.prereqs, prereq, key)
+        for field, value in spec["equals"]:
+            _discard_in(self.equals[field], value, key)
+            if not self.equals[field]:
+                del self.equals[field]
+        for field, low, high in spec["ranges"]:
+            for bounds, bound in ((self.lows, low), (self.highs, high)):
+                items = bounds[field]
+                idx = bisect_left(items, (bound, key))
+                if idx < len(items) and items[idx] == (bound, key):
+                    del items[idx]
+                if not items:
+                    del bounds[field]
+        self.required.pop(key, None)
+
+    def candidates(self, context: Dict[str, Any]) -> Set[str]:
+        """Return keys that may be applicable to *context*."""
+        pool = set(self.unscoped)
+        try:
+            pool |= self.by_context.get(context.get("type", ""), set())
+        except TypeError:  # unhashable type cannot be in any contexts list
+            pass
+        if not pool:
+            return pool
+
+        # Prerequisites and equality conditions: a procedure survives when
+        # every one of its indexed requirements was met by the context.
+        met: Counter[str] = Counter()
+        for prereq, keys in self.prereqs.items():
+            if context.get(prereq):
+                met.update(keys)
+        for field, by_value in self.equals.items():
+            value = context.get(field)
+            try:
+                met.update(by_value.get(value, ()))
+            except TypeError:  # unhashable context value matches nothing
+                pass
+        pool = {key for key in pool if met[key] == self.required.get(key, 0)}
+
+        # Range conditions: drop procedures whose bounds exclude the value
+        for field in self.lows.keys() & context.keys():
+            value = context[field]
+            if not _is_number(value):
+                continue
+            lows, highs = self.lows[field], self.highs[field]
+            too_high = lows[bisect_right(lows, (value, _MAX_KEY)) :]
+            too_low = highs[: bisect_left(highs, (value, ""))]
+            pool.difference_update(key for _, key in too_high)
+            pool.difference_update(key for _, key in too_low)
+            if not pool:
+                break
+        return pool
+
+
+_MAX_KEY = "\U0010ffff"
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _discard_in(index: Dict[Any, Set[str]], bucket: Any, key: str) -> None:
+    keys = index.get(bucket)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[bucket]
+
+
 class ProceduralMemory(BaseMemory):
     """Memory for storing successful action sequences and strategies.
 
@@ -44,6 +198,10 @@ class ProceduralMemory(BaseMemory):
         self._context_index: Dict[str, Dict[str, List[str]]] = defaultdict(
             lambda: defaultdict(list)
         )
+        self._applicability = _ApplicabilityIndex()
+        # Insertion order, used to keep results stable for equal success rates
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
 
     async def initialize(self) -> None:
         """Initialize procedural memory backend."""
@@ -209,8 +367,15 @@ class ProceduralMemory(BaseMemory):
             }
         )
 
-        # Store procedure
+        # Store procedure (replacing a previous version under the same key)
+        previous = self._procedures.get(key)
+        if previous is not None:
+            self._unindex(key, previous)
+        else:
+            self._sequence[key] = self._next_sequence
+            self._next_sequence += 1
         self._procedures[key] = entry
+        self._applicability.add(key, entry)
 
         # Index by category and procedure type for better organization
         category = entry.metadata.get("category", "general")
@@ -286,16 +451,8 @@ class ProceduralMemory(BaseMemory):
 
         return True
 
-    async def delete(self, key: str) -> bool:
-        """Delete a procedure."""
-        if not self._initialized:
-            await self.initialize()
-
-        if key not in self._procedures:
-            return False
-
-        entry = self._procedures[key]
-
+    def _unindex(self, key: str, entry: MemoryEntry) -> None:
+        """Remove *entry* from the category and context indexes."""
         # Remove from nested category index
         category = entry.metadata.get("category", "general")
         procedure_type = entry.metadata.get("type", "generic")
@@ -321,8 +478,20 @@ class ProceduralMemory(BaseMemory):
                         if not self._context_index[domain]:
                             del self._context_index[domain]
 
+    async def delete(self, key: str) -> bool:
+        """Delete a procedure."""
+        if not self._initialized:
+            await self.initialize()
+
+        if key not in self._procedures:
+            return False
+
+        self._unindex(key, self._procedures[key])
+
         # Remove procedure
         del self._procedures[key]
+        self._applicability.remove(key)
+        self._sequence.pop(key, None)
 
         # Clean up nested metrics
         for domain_metrics in self._success_metrics.values():
@@ -373,26 +542,20 @@ class ProceduralMemory(BaseMemory):
         if not self._initialized:
             await self.initialize()
 
-        applicable = []
-
-        # Get procedures by category if specified
+        # Prune with the applicability index, then run the full check only
+        # on the survivors.
+        candidates = self._applicability.candidates(context)
         if category:
-            category_data = self._category_index.get(category, {})
-            category_procedure_keys: List[str] = []
-            for proc_type_dict in category_data.values():
-                category_procedure_keys.extend(proc_type_dict)
-            procedure_keys = category_procedure_keys
-        else:
-            all_procedure_keys: List[str] = list(self._procedures.keys())
-            procedure_keys = all_procedure_keys
+            candidates = {
+                key
+                for key in candidates
+                if self._procedures[key].metadata.get("category") == category
+            }
 
-        for key in procedure_keys:
+        applicable = []
+        for key in sorted(candidates, key=self._sequence.__getitem__):
             entry = self._procedures.get(key)
-            if not entry:
-                continue
-
-            # Check if procedure applies to this context
-            if self._is_applicable(entry, context):
+            if entry and self._is_applicable(entry, context):
                 applicable.append(entry)
 
         # Sort by success rate
@@ -493,6 +656,8 @@ class ProceduralMemory(BaseMemory):
             if "applicable_when" not in content:
                 content["applicable_when"] = {}
             content["applicable_when"].update(adjustments["condition_adjustments"])
+            # Conditions changed: recompile this procedure's index entry
+            self._applicability.add(procedure_key, entry)
 
         # Mark as modified
         entry.metadata["last_modified"] = datetime.now().isoformat()
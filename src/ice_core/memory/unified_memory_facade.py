@@ -1,6 +1,8 @@
 """Unified memory interface combining all memory types."""
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .episodic_memory_store import EpisodicMemory
 from .memory_base_protocol import BaseMemory, MemoryConfig, MemoryEntry
@@ -8,6 +10,8 @@ from .procedural_memory_store import ProceduralMemory
 from .semantic_memory_store import SemanticMemory
 from .working_memory_store import WorkingMemory
 
+logger = logging.getLogger(__name__)
+
 
 class UnifiedMemoryConfig(MemoryConfig):
     """Simplified configuration for unified memory system.
@@ -28,6 +32,16 @@ class UnifiedMemoryConfig(MemoryConfig):
     # Domain-specific configuration
     domains: List[str] = ["general", "marketplace", "pricing", "inventory"]
 
+    # Cross-memory search: per-backend deadline and rank-fusion weights
+    search_timeout_seconds: float = 1.0
+    search_weights: Dict[str, float] = {
+        "working": 1.0,
+        "episodic": 1.0,
+        "semantic": 1.0,
+        "procedural": 1.0,
+    }
+    rrf_k: int = 60
+
     # Advanced configuration (optional)
     working_config: Optional[MemoryConfig] = None
     episodic_config: Optional[MemoryConfig] = None
@@ -197,36 +211,96 @@ class UnifiedMemory:
 
         return await self._memories[memory_type].delete(key)
 
+    async def _search_backend(
+        self,
+        mem_type: str,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> List[MemoryEntry]:
+        """Search one backend, giving up (with no results) after *timeout*."""
+        try:
+            return await asyncio.wait_for(
+                self._memories[mem_type].search(query, limit, filters), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "%s memory search exceeded %.2fs; returning partial results",
+                mem_type,
+                timeout,
+            )
+        except Exception as exc:
+            logger.warning("%s memory search failed: %s", mem_type, exc)
+        return []
+
+    def _fuse(
+        self,
+        ranked: List[Tuple[str, List[MemoryEntry]]],
+        weights: Dict[str, float],
+    ) -> List[MemoryEntry]:
+        """Merge per-backend rankings with weighted reciprocal rank fusion.
+
+        ``score(entry) = weight[type] / (rrf_k + rank)``.  Entries are
+        identified by ``(memory type, key)``: backends have separate key
+        spaces, so the same key in two memories is two results.
+        """
+        k = self.config.rrf_k
+        scores: Dict[Tuple[str, str], float] = {}
+        entries: Dict[Tuple[str, str], MemoryEntry] = {}
+        for mem_type, results in ranked:
+            weight = weights.get(mem_type, 1.0)
+            for rank, entry in enumerate(results, start=1):
+                ident = (mem_type, entry.key)
+                scores[ident] = scores.get(ident, 0.0) + weight / (k + rank)
+                entries.setdefault(ident, entry)
+        # sorted() is stable: ties keep backend order, then backend rank
+        order = sorted(scores, key=scores.__getitem__, reverse=True)
+        return [entries[ident] for ident in order]
+
     async def search(
         self,
         query: str,
         memory_types: Optional[List[str]] = None,
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
     ) -> List[MemoryEntry]:
         """Search across specified memory types.
 
+        Backends are queried concurrently, each with its own deadline; a
+        slow or failing backend contributes nothing instead of delaying the
+        others.  Results are merged by weighted reciprocal rank fusion.
+
         Args:
             query: Search query
             memory_types: Types to search (all if None)
-            limit: Max results per type
+            limit: Max results per type (and overall)
             filters: Optional filters
+            timeout: Per-backend deadline (``search_timeout_seconds`` if None)
+            weights: Per-type fusion weights (``search_weights`` if None)
 
         Returns:
-            Combined results from all searched memories
+            Fused results from all searched memories, best first
         """
         if memory_types is None:
             memory_types = list(self._memories.keys())
-
-        results = []
-        for mem_type in memory_types:
-            if mem_type in self._memories:
-                type_results = await self._memories[mem_type].search(
-                    query, limit, filters
-                )
-                results.extend(type_results)
-
-        return results[:limit]  # Apply overall limit
+        active = [t for t in dict.fromkeys(memory_types) if t in self._memories]
+        if not active:
+            return []
+
+        deadline = (
+            timeout if timeout is not None else self.config.search_timeout_seconds
+        )
+        results = await asyncio.gather(
+            *(self._search_backend(t, query, limit, filters, deadline) for t in active)
+        )
+        fused = self._fuse(
+            list(zip(active, results)), weights or self.config.search_weights
+        )
+        return fused[:limit]  # Apply overall limit
 
     async def clear_all(self) -> Dict[str, int]:
         """Clear all memories.
@@ -1,9 +1,12 @@
 """Working memory implementation for short-term agent state."""
 
 import asyncio
+import heapq
+import re
+import time
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from ice_core.costs import TokenCostCalculator
 from ice_core.metrics import MEMORY_COST_TOTAL, MEMORY_TOKEN_TOTAL
@@ -12,6 +15,17 @@ from ice_core.utils.token_counter import TokenCounter
 
 from .memory_base_protocol import BaseMemory, MemoryConfig, MemoryEntry
 
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _aligned(candidate: str, token: str, *, left: bool, right: bool) -> bool:
+    """Whether a query *token* can sit inside content token *candidate*."""
+    if left:
+        return candidate.startswith(token)
+    if right:
+        return candidate.endswith(token)
+    return token in candidate
+
 
 class WorkingMemory(BaseMemory):
     """In-memory working memory for short-term agent state.
@@ -40,6 +54,15 @@ class WorkingMemory(BaseMemory):
         self._store: OrderedDict[str, MemoryEntry] = OrderedDict()
         self._cleanup_task: Optional[asyncio.Task[None]] = None
 
+        # Search and expiry indexes, kept in step with ``_store``
+        self._normalized: Dict[str, str] = {}  # key -> lower-cased content
+        self._tokens: Dict[str, FrozenSet[str]] = {}  # key -> content tokens
+        self._postings: Dict[str, Set[str]] = {}  # token -> keys
+        self._expires_at: Dict[str, float] = {}  # key -> monotonic deadline
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._order: Dict[str, int] = {}  # key -> recency sequence
+        self._sequence = 0
+
         # Accounting totals
         self._token_total: int = 0
         self._cost_total: float = 0.0
@@ -69,21 +92,104 @@ class WorkingMemory(BaseMemory):
                 # Log error but keep running
                 pass
 
-    async def _cleanup_expired(self) -> None:
-        """Remove expired entries."""
-        if not self.config.ttl_seconds:
-            return
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+    def _index(self, key: str, entry: MemoryEntry) -> None:
+        """Record *entry* in the text index, expiry heap and recency order."""
+        text = str(entry.content).lower()
+        tokens = frozenset(_TOKEN_RE.findall(text))
+        self._normalized[key] = text
+        self._tokens[key] = tokens
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(key)
+        self._touch(key)
+
+        if self.config.ttl_seconds:
+            expires_at = time.monotonic() + self.config.ttl_seconds
+            self._expires_at[key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            # Re-stored keys leave stale heap items behind; compact now and
+            # then so the heap stays proportional to the live entries.
+            if len(self._expiry_heap) > 2 * len(self._store) + 64:
+                self._expiry_heap = [(t, k) for k, t in self._expires_at.items()]
+                heapq.heapify(self._expiry_heap)
+
+    def _touch(self, key: str) -> None:
+        self._sequence += 1
+        self._order[key] = self._sequence
+
+    def _remove(self, key: str) -> Optional[MemoryEntry]:
+        """Drop *key* from the store and every index."""
+        entry = self._store.pop(key, None)
+        for token in self._tokens.pop(key, ()):
+            keys = self._postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[token]
+        self._normalized.pop(key, None)
+        self._expires_at.pop(key, None)
+        self._order.pop(key, None)
+        return entry
 
-        now = datetime.utcnow()
-        expired_keys = []
+    def _is_expired(self, key: str, now: Optional[float] = None) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and expires_at <= (now or time.monotonic())
+
+    def _expire(self) -> int:
+        """Pop every due item off the expiry heap (O(k log n) for k expired)."""
+        now = time.monotonic()
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            # Skip items superseded by a later store of the same key
+            if self._expires_at.get(key) == expires_at:
+                self._remove(key)
+                removed += 1
+        return removed
+
+    def _candidates(self, query: str) -> Optional[Set[str]]:
+        """Return keys whose content may contain *query* (``None`` = all).
+
+        A substring match of the query pins down how each of its tokens
+        aligns with the content's tokens: tokens enclosed by non-word
+        characters must match exactly, the leading one may be a suffix, the
+        trailing one a prefix.  Exact tokens are O(1) lookups; partial ones
+        scan the vocabulary, never the entries.
+        """
+        matches = list(_TOKEN_RE.finditer(query))
+        if not matches:
+            return None
 
-        for key, entry in self._store.items():
-            age = (now - entry.timestamp).total_seconds()
-            if age > self.config.ttl_seconds:
-                expired_keys.append(key)
+        candidate_sets: List[Set[str]] = []
+        for match in matches:
+            token = match.group()
+            left = match.start() > 0
+            right = match.end() < len(query)
+            if left and right:
+                keys = set(self._postings.get(token, ()))
+            else:
+                keys = set()
+                for vocab_token, postings in self._postings.items():
+                    if _aligned(vocab_token, token, left=left, right=right):
+                        keys |= postings
+            if not keys:
+                return set()
+            candidate_sets.append(keys)
+
+        candidate_sets.sort(key=len)
+        result = candidate_sets[0]
+        for keys in candidate_sets[1:]:
+            result = result & keys
+            if not result:
+                break
+        return result
 
-        for key in expired_keys:
-            del self._store[key]
+    async def _cleanup_expired(self) -> None:
+        """Remove expired entries."""
+        self._expire()
 
     def _enforce_size_limit(self) -> None:
         """Enforce maximum entry limit using LRU eviction."""
@@ -92,7 +198,7 @@ class WorkingMemory(BaseMemory):
 
         while len(self._store) > self.config.max_entries:
             # Remove oldest (first) item
-            self._store.popitem(last=False)
+            self._remove(next(iter(self._store)))
 
     async def store(
         self, key: str, content: Any, metadata: Optional[Dict[str, Any]] = None
@@ -131,9 +237,9 @@ class WorkingMemory(BaseMemory):
         )
 
         # Update or add entry (moves to end if exists)
-        if key in self._store:
-            del self._store[key]
+        self._remove(key)
         self._store[key] = entry
+        self._index(key, entry)
 
         # Update aggregate stats
         self._token_total += token_usage
@@ -160,16 +266,14 @@ class WorkingMemory(BaseMemory):
             return None
 
         # Check if expired
-        if self.config.ttl_seconds:
-            age = (datetime.utcnow() - entry.timestamp).total_seconds()
-            if age > self.config.ttl_seconds:
-                del self._store[key]
-                return None
+        if self._is_expired(key):
+            self._remove(key)
+            return None
 
         # Update access count and move to end (LRU)
         entry.access_count += 1
-        del self._store[key]
-        self._store[key] = entry
+        self._store.move_to_end(key)
+        self._touch(key)
 
         return entry
 
@@ -178,6 +282,10 @@ class WorkingMemory(BaseMemory):
     ) -> List[MemoryEntry]:
         """Search working memory by substring match.
 
+        Candidates come from the token index; the substring test then runs
+        against precomputed lower-cased content.  Results are returned in
+        least- to most-recently-used order.
+
         Args:
             query: Text to search for in content
             limit: Maximum results
@@ -186,19 +294,20 @@ class WorkingMemory(BaseMemory):
         Returns:
             Matching entries
         """
-        results = []
-
-        for entry in self._store.values():
-            # Skip expired
-            if self.config.ttl_seconds:
-                age = (datetime.utcnow() - entry.timestamp).total_seconds()
-                if age > self.config.ttl_seconds:
-                    continue
+        self._expire()
+        needle = query.lower()
+        candidates = self._candidates(needle)
+        keys: List[str] = (
+            list(self._store)
+            if candidates is None
+            else sorted(candidates, key=self._order.__getitem__)
+        )
 
-            # Check query match
-            content_str = str(entry.content)
-            if query.lower() not in content_str.lower():
+        results = []
+        for key in keys:
+            if needle not in self._normalized[key]:
                 continue
+            entry = self._store[key]
 
             # Check filters
             if filters:
@@ -221,10 +330,7 @@ class WorkingMemory(BaseMemory):
         Returns:
             True if deleted
         """
-        if key in self._store:
-            del self._store[key]
-            return True
-        return False
+        return self._remove(key) is not None
 
     async def clear(self, pattern: Optional[str] = None) -> int:
         """Clear entries matching pattern.
@@ -238,13 +344,19 @@ class WorkingMemory(BaseMemory):
         if not pattern:
             count = len(self._store)
             self._store.clear()
+            self._normalized.clear()
+            self._tokens.clear()
+            self._postings.clear()
+            self._expires_at.clear()
+            self._expiry_heap.clear()
+            self._order.clear()
             return count
 
         # Clear by prefix
         keys_to_delete = [k for k in self._store.keys() if k.startswith(pattern)]
 
         for key in keys_to_delete:
-            del self._store[key]
+            self._remove(key)
 
         return len(keys_to_delete)
 
@@ -43,6 +43,14 @@ class HistogramLike(Protocol):
     def observe(self, value: float) -> None: ...
 
 
+@runtime_checkable
+class GaugeLike(Protocol):
+    def labels(self, *args: object, **kwargs: object) -> "GaugeLike": ...
+    def inc(self, amount: float = 1.0) -> None: ...
+    def dec(self, amount: float = 1.0) -> None: ...
+    def set(self, value: float) -> None: ...
+
+
 class _NoOpCounter:
     """Minimal metric stub with Prometheus-like API.
 
@@ -79,6 +87,27 @@ class _NoOpHistogram:
         return None
 
 
+class _NoOpGauge:
+    def __init__(
+        self,
+        *_: object,
+        **__: object,
+    ) -> None:
+        pass
+
+    def labels(self, *args: object, **kwargs: object) -> "_NoOpGauge":  # noqa: D401
+        return self
+
+    def inc(self, amount: float = 1.0) -> None:  # noqa: D401
+        return None
+
+    def dec(self, amount: float = 1.0) -> None:  # noqa: D401
+        return None
+
+    def set(self, value: float) -> None:  # noqa: D401
+        return None
+
+
 def _make_counter(
     name: str,
     documentation: str,
@@ -116,6 +145,18 @@ def _make_histogram(
     return _NoOpHistogram()
 
 
+def _make_gauge(
+    name: str,
+    documentation: str,
+    *,
+    labelnames: Optional[Iterable[str]] = None,
+) -> GaugeLike:
+    if _PROM_AVAILABLE and _prom is not None:  # pragma: no cover - passthrough
+        g = _prom.Gauge(name, documentation, labelnames=tuple(labelnames or ()))  # type: ignore[misc]
+        return cast(GaugeLike, g)
+    return _NoOpGauge()
+
+
 EXEC_STARTED: CounterLike = _make_counter(
     MetricName.EXECUTIONS_STARTED.value,
     "Total number of workflow executions started",
@@ -136,6 +177,12 @@ LLM_COST_TOTAL: CounterLike = _make_counter(
     "Accumulated USD cost of LLM calls",
 )
 
+EXEC_IN_FLIGHT: GaugeLike = _make_gauge(
+    MetricName.EXECUTIONS_IN_FLIGHT.value,
+    "Workflow executions accepted by the API and not yet finished",
+    labelnames=["surface"],
+)
+
 DRAFT_MUTATION_TOTAL: CounterLike = _make_counter(
     MetricName.DRAFT_MUTATION_TOTAL.value,
     "Count of draft mutations (lock / position / instantiate)",
@@ -179,3 +226,52 @@ SANDBOX_MAX_RSS_BYTES: HistogramLike = _make_histogram(
         1024 * 1024 * 1024,
     ),
 )
+
+# ---------------------------------------------------------------------------
+# Tool offload pool metrics -------------------------------------------------
+# ---------------------------------------------------------------------------
+TOOL_POOL_QUEUE_DEPTH: GaugeLike = _make_gauge(
+    "tool_pool_queue_depth",
+    "Tool calls submitted to an offload pool and not yet started",
+    labelnames=["pool"],
+)
+
+TOOL_POOL_IN_FLIGHT: GaugeLike = _make_gauge(
+    "tool_pool_in_flight",
+    "Tool calls currently running in an offload pool",
+    labelnames=["pool"],
+)
+
+TOOL_POOL_WAIT_SECONDS: HistogramLike = _make_histogram(
+    "tool_pool_wait_seconds",
+    "Time tool calls spent queued before an offload worker picked them up",
+    labelnames=["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+# ---------------------------------------------------------------------------
+# Request coalescing --------------------------------------------------------
+# ---------------------------------------------------------------------------
+SINGLEFLIGHT_COALESCED: CounterLike = _make_counter(
+    "singleflight_coalesced_total",
+    "Calls served by an identical request that was already in flight",
+    labelnames=["kind"],
+)
+
+LLM_HEDGES: CounterLike = _make_counter(
+    "llm_hedged_requests_total",
+    "Backup LLM requests sent for slow primaries (outcome=sent|won)",
+    labelnames=["outcome"],
+)
+
+PLAN_CACHE_LOOKUPS: CounterLike = _make_counter(
+    "workflow_plan_cache_lookups_total",
+    "Compiled workflow plan lookups by result (hit|remote|miss)",
+    labelnames=["result"],
+)
+
+WS_MESSAGES_SHED: CounterLike = _make_counter(
+    "ws_gateway_messages_shed_total",
+    "WebSocket gateway messages not delivered as sent (reason=coalesced|dropped|overflow)",
+    labelnames=["type", "reason"],
+)
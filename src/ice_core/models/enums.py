@@ -39,6 +39,7 @@ class MetricName(str, Enum):
     EXECUTIONS_FAILED = "executions_failed_total"
     DRAFT_MUTATION_TOTAL = "draft_mutation_total"
     LLM_COST_TOTAL = "llm_cost_total"
+    EXECUTIONS_IN_FLIGHT = "executions_in_flight"
 
 
 # ---------------------------------------------------------------------------
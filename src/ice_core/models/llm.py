@@ -197,6 +197,9 @@ class LLMConfig(BaseModel):
     frequency_penalty: Optional[float] = None
     presence_penalty: Optional[float] = None
     stop_sequences: Optional[list[str]] = None
+    # Target for hedged backup requests (defaults to the primary model)
+    fallback_provider: Optional[ModelProvider] = None
+    fallback_model: Optional[str] = None
 
     # Provider-specific settings
     openai_api_version: Optional[str] = None
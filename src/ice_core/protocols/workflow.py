@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from typing import Any, Mapping, Protocol
 
 
 class IWorkflow(Protocol):
@@ -25,14 +25,14 @@ class WorkflowLike(Protocol):
 
     # Methods that are directly invoked
     async def execute_node(
-        self, node_id: str, context: dict[str, Any]
+        self, node_id: str, context: Mapping[str, Any]
     ) -> Any:  # pragma: no cover
         ...
 
     async def execute_node_config(
         self,
         node_config: Any,
-        context: dict[str, Any],
+        context: Mapping[str, Any],
         *,
         parent_id: str | None = None,
     ) -> Any:  # pragma: no cover – orchestration internals
@@ -93,6 +93,7 @@ class IWorkflowService(Protocol):
         *,
         run_id: str | None = None,
         event_emitter: Any | None = None,
+        plan: Any | None = None,
     ) -> Any: ...
 
     @abstractmethod
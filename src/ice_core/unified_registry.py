@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib.metadata as metadata
+import json
 import logging
 import pathlib
 from typing import (
@@ -21,6 +22,7 @@ from typing import (
 from pydantic import BaseModel, PrivateAttr
 
 from ice_core.exceptions import RegistryError
+from ice_core.utils.hashing import HashMode, compute_hash
 from ice_core.models import INode, NodeConfig, NodeExecutionResult
 from ice_core.models.enums import NodeType
 from ice_core.models.mcp import AgentDefinition
@@ -114,6 +116,56 @@ class Registry(BaseModel):
     _swarm_factory_cache: Dict[str, Callable[..., Any]] = PrivateAttr(
         default_factory=dict
     )
+    # Bumped on every registration so derived views (API catalogs, caches)
+    # can tell whether they are stale without rebuilding
+    _generation: int = PrivateAttr(default=0)
+    _content_hash: Tuple[int, str] = PrivateAttr(default=(-1, ""))
+
+    @property
+    def generation(self) -> int:
+        """Monotonic counter incremented whenever the registry contents change."""
+        return self._generation
+
+    def _bump_generation(self) -> None:
+        self._generation += 1
+
+    def content_hash(self) -> str:
+        """Hash of what is registered (names and import paths).
+
+        Unlike :attr:`generation` it does not depend on how many
+        registrations happened, so processes with the same plugins agree on
+        it.  Recomputed at most once per generation.
+        """
+
+        if self._content_hash[0] != self._generation:
+
+            def _path(obj: Any) -> str:
+                name = getattr(obj, "__qualname__", type(obj).__qualname__)
+                return f"{getattr(obj, '__module__', '')}.{name}"
+
+            snapshot = {
+                "nodes": {
+                    t.value: {n: _path(c) for n, c in classes.items()}
+                    for t, classes in self._nodes.items()
+                },
+                "instances": {
+                    t.value: {n: _path(type(i)) for n, i in instances.items()}
+                    for t, instances in self._instances.items()
+                },
+                "executors": {n: _path(fn) for n, fn in self._executors.items()},
+                "chains": sorted(self._chains),
+                # Name -> import path maps: agents and every *_factories
+                "paths": {
+                    attr: getattr(self, attr)
+                    for attr in self.__private_attributes__
+                    if attr == "_agents" or attr.endswith("_factories")
+                },
+            }
+            self._content_hash = (
+                self._generation,
+                compute_hash(json.dumps(snapshot, sort_keys=True), HashMode.SECURITY),
+            )
+        return self._content_hash[1]
 
     def register_class(
         self, node_type: NodeType, name: str, implementation: Type[INode]
@@ -124,6 +176,7 @@ class Registry(BaseModel):
         if name in self._nodes[node_type]:
             raise RegistryError(f"Node {node_type.value}:{name} already registered")
         self._nodes[node_type][name] = implementation
+        self._bump_generation()
 
     # Legacy instance registration removed – factories are the only path
 
@@ -184,6 +237,7 @@ class Registry(BaseModel):
         if node_type in self._executors:
             raise RegistryError(f"Executor for {node_type} already registered")
         self._executors[node_type] = executor
+        self._bump_generation()
 
     def get_executor(self, node_type: str) -> ExecCallable:
         """Get executor for a node type."""
@@ -236,6 +290,7 @@ class Registry(BaseModel):
         if name in self._chains:
             raise RegistryError(f"Chain {name} already registered")
         self._chains[name] = chain
+        self._bump_generation()
 
     def get_chain(self, name: str) -> Any:
         """Get a registered chain."""
@@ -361,6 +416,7 @@ class Registry(BaseModel):
                                     return _create
 
                                 self._tool_factory_cache[name] = _factory_bound(obj)  # type: ignore[assignment]
+                                self._bump_generation()
                             except Exception:
                                 pass
                         else:
@@ -394,6 +450,7 @@ class Registry(BaseModel):
                     # Metadata placeholder – no dynamic import
                     stub = _ComponentStub("tool", imp_path)
                     self._instances.setdefault(NodeType.TOOL, {})[name] = stub  # type: ignore[assignment]
+                    self._bump_generation()
 
             elif node_type == "agent":
                 # Agent registry only stores import path; import happens later
@@ -412,6 +469,7 @@ class Registry(BaseModel):
                         ) from exc
                 else:
                     self._chains[name] = _ComponentStub("workflow", imp_path)  # type: ignore[assignment]
+                    self._bump_generation()
 
             else:
                 raise RegistryError(f"Unknown node_type in manifest: {node_type}")
@@ -440,6 +498,7 @@ class Registry(BaseModel):
                 return
             raise RegistryError(f"Agent {name} already registered with different path")
         self._agents[name] = import_path
+        self._bump_generation()
 
     def get_agent_import_path(self, name: str) -> str:
         """Get the import path for a registered agent."""
@@ -456,6 +515,7 @@ class Registry(BaseModel):
         if existing == definition:
             return
         self._agent_definitions[name] = definition
+        self._bump_generation()
 
     def get_agent_definition(self, name: str) -> AgentDefinition:
         """Retrieve a data-first agent definition or raise KeyError."""
@@ -552,6 +612,7 @@ class Registry(BaseModel):
                 f"Tool factory {name} already registered with different path"
             )
         self._tool_factories[name] = import_path
+        self._bump_generation()
         # Preload cache with a wrapper to create instances lazily
         try:
             module_str, attr = import_path.split(":", 1)
@@ -668,6 +729,7 @@ class Registry(BaseModel):
         """
         self._llm_factories.clear()
         self._llm_factory_cache.clear()
+        self._bump_generation()
 
     def clear_tool_factories(self) -> None:
         """Remove all registered Tool factories and caches.
@@ -677,6 +739,7 @@ class Registry(BaseModel):
         """
         self._tool_factories.clear()
         self._tool_factory_cache.clear()
+        self._bump_generation()
 
     def available_agents(self) -> List[Tuple[str, str]]:
         """List all registered agents with their import paths."""
@@ -699,6 +762,7 @@ class Registry(BaseModel):
                 f"Workflow factory {name} already registered with different path"
             )
         self._workflow_factories[name] = import_path
+        self._bump_generation()
 
     def get_workflow_instance(self, name: str, **kwargs: Any) -> "WorkflowLike":
         """Instantiate a workflow via its registered factory and return a fresh instance.
@@ -777,6 +841,7 @@ class Registry(BaseModel):
                 f"LLM factory {name} already registered with different path"
             )
         self._llm_factories[name] = import_path
+        self._bump_generation()
 
     def get_llm_instance(self, name: str, **kwargs: Any) -> Any:
         """Instantiate an LLM node helper via its factory and return a fresh instance.
@@ -855,6 +920,7 @@ class Registry(BaseModel):
                 f"Condition factory {name} already registered with different path"
             )
         self._condition_factories[name] = import_path
+        self._bump_generation()
 
     def get_condition_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -871,6 +937,7 @@ class Registry(BaseModel):
                 f"Loop factory {name} already registered with different path"
             )
         self._loop_factories[name] = import_path
+        self._bump_generation()
 
     def get_loop_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -890,6 +957,7 @@ class Registry(BaseModel):
                 f"Parallel factory {name} already registered with different path"
             )
         self._parallel_factories[name] = import_path
+        self._bump_generation()
 
     def get_parallel_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -909,6 +977,7 @@ class Registry(BaseModel):
                 f"Recursive factory {name} already registered with different path"
             )
         self._recursive_factories[name] = import_path
+        self._bump_generation()
 
     def get_recursive_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -925,6 +994,7 @@ class Registry(BaseModel):
                 f"Code factory {name} already registered with different path"
             )
         self._code_factories[name] = import_path
+        self._bump_generation()
 
     def get_code_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -945,6 +1015,7 @@ class Registry(BaseModel):
                 f"Human factory {name} already registered with different path"
             )
         self._human_factories[name] = import_path
+        self._bump_generation()
 
     def get_human_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -964,6 +1035,7 @@ class Registry(BaseModel):
                 f"Monitor factory {name} already registered with different path"
             )
         self._monitor_factories[name] = import_path
+        self._bump_generation()
 
     def get_monitor_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -980,6 +1052,7 @@ class Registry(BaseModel):
                 f"Swarm factory {name} already registered with different path"
             )
         self._swarm_factories[name] = import_path
+        self._bump_generation()
 
     def get_swarm_instance(self, name: str, **kwargs: Any) -> Any:
         factory = self._resolve_factory(
@@ -1038,6 +1111,7 @@ def register_tool_factory_callable(name: str, factory: Callable[..., ITool]) ->
     """
     # Overwrite cache entry; keep mapping idempotent
     registry._tool_factory_cache[name] = factory  # type: ignore[attr-defined]
+    registry._bump_generation()
 
 
 def get_tool_instance(name: str, **kwargs: Any) -> ITool:  # noqa: D401
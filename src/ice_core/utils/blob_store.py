@@ -0,0 +1,371 @@
+"""Content-addressed offloading of large node outputs.
+
+Node outputs travel by value through the whole run: accumulated results,
+node contexts, events, the final :class:`ChainExecutionResult` and the
+execution record.  With ``ICE_BLOB_OFFLOAD_BYTES`` set (off by default, e.g.
+``262144`` for 256 KiB) larger values are instead written once to a blob
+store and replaced by a :class:`BlobRef`::
+
+    output = get_blob_store().offload({"text": ten_megabytes})
+    # {"text": {"$blob": "<sha256>", "size": 10485760, "kind": "text",
+    #           "preview": "first 200 characters…"}}
+
+A ``BlobRef`` *is* a small ``dict``, so it serialises as-is through
+``json.dumps``, pydantic, Redis and SQL, and survives a round-trip: any dict
+with a ``"$blob"`` key is a reference.  Access is lazy – ``str(ref)`` (what a
+Jinja ``{{ value }}`` does) returns the content, and :func:`resolve_blobs`
+materialises a whole structure for tools and code.
+
+References leave the process unresolved (API responses, events, stored
+execution records); clients fetch the content from
+``GET /api/v1/blobs/{digest}``.
+
+Blobs live under ``ICE_BLOB_DIR`` (a temp directory by default) as one file
+per digest, read back through ``mmap``.  Point every worker at the same
+directory to share blobs across processes.  A blob expires
+``ICE_BLOB_TTL_SECONDS`` (7 days) after it was last stored; writers sweep
+expired blobs in the background at most once an hour.  References kept
+longer than that (execution records, checkpoints) outlive their content:
+resolving one raises :class:`BlobNotFoundError`.
+
+The store does file I/O; async code uses :meth:`BlobStore.offload_async`
+and :meth:`BlobStore.resolve_async`, which run it in a thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import ChainMap
+from pathlib import Path
+from typing import Any, Mapping, Optional, Tuple, Union
+
+__all__ = [
+    "BlobNotFoundError",
+    "BlobRef",
+    "BlobStore",
+    "get_blob_store",
+    "is_blob_ref",
+    "resolve_blobs",
+]
+
+logger = logging.getLogger(__name__)
+
+_PREVIEW_CHARS = 200
+_DIGEST_RE = re.compile(r"[0-9a-f]{64}")
+
+
+class BlobNotFoundError(KeyError):
+    """The content behind a blob reference is gone (expired or never here)."""
+
+    def __init__(self, digest: str) -> None:
+        super().__init__(digest)
+        self.digest = digest
+
+    def __str__(self) -> str:
+        return (
+            f"blob {self.digest} is not available: it expired "
+            "(ICE_BLOB_TTL_SECONDS) or was stored under another ICE_BLOB_DIR"
+        )
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Return ``True`` for a :class:`BlobRef` or its serialised dict form."""
+
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("$blob"), str)
+        and "kind" in value
+    )
+
+
+class BlobRef(dict):  # type: ignore[type-arg]
+    """Lazy reference to an offloaded value; serialises as a small dict."""
+
+    def __init__(
+        self,
+        digest: str,
+        *,
+        size: int,
+        kind: str,
+        preview: str = "",
+        store: Optional["BlobStore"] = None,
+    ) -> None:
+        super().__init__({"$blob": digest, "size": size, "kind": kind})
+        if preview:
+            self["preview"] = preview
+        self._store = store
+
+    @property
+    def digest(self) -> str:
+        return str(self["$blob"])
+
+    def resolve(self) -> Any:
+        """Load and return the referenced value."""
+
+        return (self._store or get_blob_store()).load(self)
+
+    def __str__(self) -> str:
+        value = self.resolve()
+        if isinstance(value, bytes):
+            return value.decode("utf-8", errors="replace")
+        return str(value)
+
+
+class BlobStore:
+    """Local content-addressed blob store."""
+
+    SWEEP_INTERVAL_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        root: Union[str, Path, None] = None,
+        *,
+        threshold: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        self.root = Path(
+            root
+            or os.getenv("ICE_BLOB_DIR")
+            or Path(tempfile.gettempdir()) / "ice_blobs"
+        )
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else int(os.getenv("ICE_BLOB_OFFLOAD_BYTES", "0"))
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else int(os.getenv("ICE_BLOB_TTL_SECONDS", str(7 * 86400)))
+        )
+        self._next_sweep = time.monotonic() + self.SWEEP_INTERVAL_SECONDS
+        self._sweep_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    # ------------------------------------------------------------------
+    # Raw blobs
+    # ------------------------------------------------------------------
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store *data* (once) and return its sha256 digest."""
+
+        self._maybe_sweep()
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        try:
+            # Still referenced: restart its retention period
+            os.utime(path)
+            return digest
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            # Atomic publish; concurrent writers of the same digest agree
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the bytes stored under *digest*.
+
+        Raises :class:`BlobNotFoundError` (a ``KeyError``) if absent.
+        """
+
+        if not _DIGEST_RE.fullmatch(digest):
+            raise BlobNotFoundError(digest)
+        try:
+            with open(self._path(digest), "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:
+                    return b""
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[:]
+        except FileNotFoundError:
+            raise BlobNotFoundError(digest) from None
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Delete blobs not stored for ``ttl_seconds``; return how many."""
+
+        if self.ttl_seconds <= 0 or not self.root.is_dir():
+            return 0
+        cutoff = (time.time() if now is None else now) - self.ttl_seconds
+        removed = 0
+        for path in self.root.glob("??/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    def _maybe_sweep(self) -> None:
+        if self.ttl_seconds <= 0 or time.monotonic() < self._next_sweep:
+            return
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        self._next_sweep = time.monotonic() + self.SWEEP_INTERVAL_SECONDS
+
+        def _run() -> None:
+            try:
+                removed = self.sweep()
+                if removed:
+                    logger.debug("Swept %d expired blobs from %s", removed, self.root)
+            except OSError as exc:
+                logger.debug("Blob sweep failed: %s", exc)
+            finally:
+                self._sweep_lock.release()
+
+        threading.Thread(target=_run, name="blob-sweep", daemon=True).start()
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+    def load(self, ref: Any) -> Any:
+        """Return the value behind *ref* (a :class:`BlobRef` or its dict)."""
+
+        data = self.get(str(ref["$blob"]))
+        kind = ref.get("kind")
+        if kind == "bytes":
+            return data
+        if kind == "json":
+            return json.loads(data)
+        return data.decode("utf-8")
+
+    def offload(self, value: Any, *, threshold: Optional[int] = None) -> Any:
+        """Return *value* with every part larger than *threshold* offloaded.
+
+        Strings and bytes are offloaded as-is; lists and dicts below the top
+        level are offloaded as JSON when they are still too large once their
+        own large members have been replaced.  The top-level value keeps its
+        shape so dotted output paths keep working.
+        """
+
+        limit = self.threshold if threshold is None else threshold
+        if limit <= 0:
+            return value
+        return self._offload(value, limit, top=True)[0]
+
+    def _offload(self, value: Any, limit: int, *, top: bool) -> Tuple[Any, int]:
+        """Return ``(value, approximate serialised size)``."""
+
+        if is_blob_ref(value):
+            return value, 0
+        if isinstance(value, str):
+            if len(value) * 4 < limit:
+                # Cannot exceed the limit even if every char is 4 bytes
+                return value, len(value)
+            data = value.encode("utf-8")
+            if len(data) <= limit:
+                return value, len(data)
+            return self._ref(data, "text", value[:_PREVIEW_CHARS]), 0
+        if isinstance(value, (bytes, bytearray)):
+            if len(value) <= limit:
+                return value, len(value)
+            return self._ref(bytes(value), "bytes", ""), 0
+
+        if isinstance(value, dict):
+            items = {k: self._offload(v, limit, top=False) for k, v in value.items()}
+            value = {k: v for k, (v, _) in items.items()}
+            size = sum(len(str(k)) + s for k, (_, s) in items.items())
+        elif isinstance(value, (list, tuple)):
+            parts = [self._offload(v, limit, top=False) for v in value]
+            value = [v for v, _ in parts]
+            size = sum(s for _, s in parts)
+        else:
+            return value, 0
+
+        if top or size <= limit:
+            return value, size
+        try:
+            data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return value, size
+        return self._ref(data, "json", data[:_PREVIEW_CHARS].decode(errors="ignore")), 0
+
+    async def offload_async(
+        self, value: Any, *, threshold: Optional[int] = None
+    ) -> Any:
+        """:meth:`offload` with the blob writes run in a thread."""
+
+        limit = self.threshold if threshold is None else threshold
+        if limit <= 0:
+            return value
+        return await asyncio.to_thread(self.offload, value, threshold=limit)
+
+    def _ref(self, data: bytes, kind: str, preview: str) -> BlobRef:
+        return BlobRef(
+            self.put(data), size=len(data), kind=kind, preview=preview, store=self
+        )
+
+    def resolve(self, value: Any) -> Any:
+        """Return *value* with every blob reference replaced by its content.
+
+        Containers without references are returned as-is (not copied).  A
+        layered ``ChainMap`` context gets an overlay holding just the
+        resolved keys.
+        """
+
+        if is_blob_ref(value):
+            return self.resolve(self.load(value))
+        if isinstance(value, Mapping):
+            changed = {}
+            for key, item in value.items():
+                resolved = self.resolve(item)
+                if resolved is not item:
+                    changed[key] = resolved
+            if not changed:
+                return value
+            if isinstance(value, ChainMap):
+                return value.new_child(changed)
+            return {**value, **changed}
+        if isinstance(value, list):
+            items = [self.resolve(v) for v in value]
+            if all(new is old for new, old in zip(items, value)):
+                return value
+            return items
+        return value
+
+    async def resolve_async(self, value: Any) -> Any:
+        """:meth:`resolve` with the blob reads run in a thread."""
+
+        return await asyncio.to_thread(self.resolve, value)
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Return the process-wide blob store (configured from env)."""
+
+    global _blob_store  # pylint: disable=global-statement
+    if _blob_store is None:
+        _blob_store = BlobStore()
+    return _blob_store
+
+
+def resolve_blobs(value: Any) -> Any:
+    """Materialise every blob reference inside *value*."""
+
+    return get_blob_store().resolve(value)
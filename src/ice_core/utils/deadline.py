@@ -0,0 +1,59 @@
+"""Deadlines propagated through ``contextvars``.
+
+The orchestrator opens a scope around each node execution; anything awaited
+inside it (LLM calls, tools) can ask how much time is left and size its own
+timeouts, retries and hedges accordingly::
+
+    with deadline_scope(node.timeout_seconds):
+        await run_node()
+
+    # deep inside the call stack
+    budget = remaining()  # seconds, or None when unbounded
+
+Scopes nest and can only tighten: an inner scope never extends the deadline
+of an outer one.  Tasks created inside a scope inherit it.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+__all__ = ["current_deadline", "deadline_scope", "remaining"]
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "ice_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """Return the active deadline as a ``time.monotonic()`` value, if any."""
+
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Return the seconds left before the active deadline (never negative)."""
+
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """Bound the enclosed block by *seconds* (``None`` keeps the outer deadline)."""
+
+    outer = _deadline.get()
+    deadline = outer
+    if seconds is not None:
+        candidate = time.monotonic() + seconds
+        deadline = candidate if outer is None else min(outer, candidate)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
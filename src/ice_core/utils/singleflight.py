@@ -0,0 +1,116 @@
+"""In-flight request coalescing ("singleflight") for asyncio.
+
+Concurrent callers that ask for the same *key* while a call is running share
+that call instead of starting their own::
+
+    group = SingleFlight()
+    result, shared = await group.do(key, lambda: expensive(arg))
+
+The underlying call runs in its own task so that cancelling one caller never
+cancels the work the others are waiting on; the task is cancelled only when
+*every* caller has gone away.  Exactly one caller, the first to receive the
+result, gets ``shared=False``; all others get ``shared=True``.  Callers use
+that flag to attribute cost (e.g. token usage) to a single owner.
+
+Exceptions raised by the call propagate to every caller.  Nothing is cached:
+the key is forgotten as soon as the call finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ice_core.utils.hashing import HashMode, compute_hash
+
+__all__ = ["SingleFlight", "fingerprint"]
+
+T = TypeVar("T")
+
+
+def _reject(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        # Layered (ChainMap) contexts hash like the dict they stand for
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} is not fingerprintable")
+
+
+def fingerprint(*parts: Any) -> Optional[str]:
+    """Return a stable hash of JSON-serialisable *parts*.
+
+    Returns ``None`` when any part cannot be serialised; such calls should not
+    be coalesced because equality of their arguments is unknown.
+    """
+
+    try:
+        payload = json.dumps(parts, sort_keys=True, default=_reject)
+    except (TypeError, ValueError):
+        return None
+    return compute_hash(payload, HashMode.PERFORMANCE)
+
+
+class _Call(Generic[T]):
+    __slots__ = ("task", "waiters", "claimed")
+
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+        self.claimed = False
+
+
+class SingleFlight(Generic[T]):
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _Call[T]] = {}
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run *fn* unless a call for *key* is already in flight.
+
+        Returns ``(result, shared)``; see the module docstring.
+        """
+
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            owner = call
+
+            def _done(_task: "asyncio.Future[T]") -> None:
+                self._forget(key, owner)
+
+            call.task.add_done_callback(_done)
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Forget the call now, not when the task finishes: a caller
+                # arriving in between must start fresh work, not join this one
+                self._forget(key, call)
+                call.task.cancel()
+            raise
+        call.waiters -= 1
+        shared = call.claimed
+        call.claimed = True
+        return result, shared
+
+    def _forget(self, key: str, call: _Call[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -1,14 +1,108 @@
 """
 Token counting utilities for different model providers.
+
+``TokenCountingService`` is the hot-path entry point: encoders are built once
+per encoding name, counts are memoised in an LRU keyed by a content hash, and
+``count_many`` encodes the cache misses of a batch with ``encode_batch`` off
+the event loop.  When no encoding can be loaded (e.g. the BPE files are not
+available offline) counts degrade to the ``len(text) // 4`` estimate.
+
+Building an encoding may download its BPE file, so hot paths never build one
+on the loop: the API preloads the encodings of the default model at startup
+(:func:`preload_encodings`), ``count_many`` loads others in a thread, and the
+synchronous ``count`` answers with the estimate while an encoding that is not
+loaded yet is built in the background.
 """
 
-from typing import Dict, List
+import asyncio
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
 
 import tiktoken
 
+from ice_core.cache import LRUCache
 from ice_core.models import ModelProvider
+from ice_core.utils.hashing import HashMode, compute_hash
+
+__all__ = [
+    "TokenCounter",
+    "TokenCountingService",
+    "get_token_service",
+    "preload_encodings",
+]
+
+_DEFAULT_ENCODING = "cl100k_base"
+# Role label and separators added per chat message by the OpenAI chat format
+_MESSAGE_OVERHEAD = 4
 
-__all__ = ["TokenCounter"]
+_encodings: Dict[str, Optional[Any]] = {}
+_encodings_lock = threading.Lock()
+_loading: Set[str] = set()
+
+
+def _load_encoding(name: str) -> Optional[Any]:
+    """Return the tiktoken encoding *name*, built once per process.
+
+    Failures are remembered as ``None`` so that an unavailable encoding does
+    not trigger a download attempt on every call.
+    """
+
+    try:
+        return _encodings[name]
+    except KeyError:
+        pass
+    with _encodings_lock:
+        if name not in _encodings:
+            try:
+                _encodings[name] = tiktoken.get_encoding(name)
+            except Exception:
+                _encodings[name] = None
+        return _encodings[name]
+
+
+async def _load_encoding_async(name: str) -> Optional[Any]:
+    if name in _encodings:
+        return _encodings[name]
+    return await asyncio.to_thread(_load_encoding, name)
+
+
+def _load_encoding_in_background(name: str) -> None:
+    """Start building *name* on a daemon thread unless already underway."""
+
+    with _encodings_lock:
+        if name in _encodings or name in _loading:
+            return
+        _loading.add(name)
+
+    def _load() -> None:
+        try:
+            _load_encoding(name)
+        finally:
+            with _encodings_lock:
+                _loading.discard(name)
+
+    threading.Thread(target=_load, name=f"tiktoken-{name}", daemon=True).start()
+
+
+async def preload_encodings(*names: str) -> None:
+    """Build the encodings *names* in a thread.
+
+    By default these are ``cl100k_base`` and the encoding of the token
+    service's default model.
+    """
+
+    if not names:
+        names = (_DEFAULT_ENCODING, get_token_service().encoding_name())
+    for name in dict.fromkeys(names):
+        await _load_encoding_async(name)
+
+
+def _require_encoding(name: str) -> Any:
+    encoding = _load_encoding(name)
+    if encoding is None:
+        # Surface the original tiktoken error to the caller
+        return tiktoken.get_encoding(name)
+    return encoding
 
 
 class TokenCounter:
@@ -50,7 +144,7 @@ class TokenCounter:
     ) -> int:
         if provider == "openai":
             try:
-                encoding = tiktoken.get_encoding(cls.get_encoding_name(model, provider))
+                encoding = _require_encoding(cls.get_encoding_name(model, provider))
                 return len(encoding.encode(text))
             except Exception as e:
                 from ice_core.exceptions import ValidationError
@@ -60,7 +154,7 @@ class TokenCounter:
                 )
         else:
             try:
-                encoding = tiktoken.get_encoding("cl100k_base")
+                encoding = _require_encoding(_DEFAULT_ENCODING)
                 return len(encoding.encode(text))
             except Exception as e:
                 from ice_core.exceptions import ValidationError
@@ -78,7 +172,7 @@ class TokenCounter:
     ) -> int:
         total_tokens = 0
         if provider == "openai":
-            encoding = tiktoken.get_encoding(cls.get_encoding_name(model, provider))
+            encoding = _require_encoding(cls.get_encoding_name(model, provider))
             for message in messages:
                 total_tokens += len(encoding.encode(message["role"]))
                 total_tokens += len(encoding.encode(message["content"]))
@@ -108,3 +202,177 @@ class TokenCounter:
             return token_count <= max_tokens
         except ValueError:
             return cls.estimate_tokens(text, model, provider) <= max_tokens
+
+
+class TokenCountingService:
+    """Cached token counter for hot paths.
+
+    Counts are memoised per ``(encoding, content hash)`` so repeated payloads
+    (context re-serialisation, chat history re-reads) cost one hash instead
+    of one BPE pass.
+    """
+
+    # Below this many uncached characters a batch is encoded inline; thread
+    # hand-off costs more than the encoding itself.
+    OFFLOAD_MIN_CHARS = 16_384
+
+    def __init__(self, capacity: int = 4096, default_model: str = "gpt-4o") -> None:
+        self.default_model = default_model
+        self._counts = LRUCache(capacity=capacity)
+        self._model_encodings: Dict[str, str] = {}
+
+    # ------------------------------------------------------------------
+    # Encoding resolution
+    # ------------------------------------------------------------------
+    def encoding_name(
+        self, model: Optional[str] = None, provider: str | ModelProvider = "openai"
+    ) -> str:
+        model = model or self.default_model
+        cache_key = f"{provider}:{model}"
+        name = self._model_encodings.get(cache_key)
+        if name is None:
+            name = TokenCounter.MODEL_ENCODINGS.get("openai", {}).get(model, "")
+            if not name and provider in ("openai", ModelProvider.OPENAI):
+                try:
+                    name = tiktoken.encoding_name_for_model(model)
+                except KeyError:
+                    name = ""
+            # Non-OpenAI tokenizers are approximated with cl100k_base
+            name = name or _DEFAULT_ENCODING
+            self._model_encodings[cache_key] = name
+        return name
+
+    # ------------------------------------------------------------------
+    # Counting
+    # ------------------------------------------------------------------
+    def _key(self, encoding_name: str, text: str) -> str:
+        return f"{encoding_name}:{compute_hash(text, HashMode.PERFORMANCE)}"
+
+    def count(
+        self,
+        text: str,
+        model: Optional[str] = None,
+        provider: str | ModelProvider = "openai",
+    ) -> int:
+        """Return the number of tokens in *text*.
+
+        Never builds an encoding on the calling thread: until *model*'s
+        encoding is loaded the ``len(text) // 4`` estimate is returned.
+        """
+
+        if not text:
+            return 0
+        name = self.encoding_name(model, provider)
+        encoding = _encodings.get(name)
+        if encoding is None:
+            if name not in _encodings:
+                _load_encoding_in_background(name)
+            return len(text) // 4
+        key = self._key(name, text)
+        cached = self._counts.get(key)
+        if cached is not None:
+            return int(cached)
+        tokens = len(encoding.encode(text, disallowed_special=()))
+        self._counts.set(key, tokens)
+        return tokens
+
+    async def count_many(
+        self,
+        texts: Sequence[str],
+        model: Optional[str] = None,
+        provider: str | ModelProvider = "openai",
+    ) -> List[int]:
+        """Return token counts for *texts*, encoding cache misses in one batch."""
+
+        name = self.encoding_name(model, provider)
+        encoding = await _load_encoding_async(name)
+        if encoding is None:
+            return [len(text) // 4 for text in texts]
+
+        counts: List[Optional[int]] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        missing: List[str] = []
+        for i, text in enumerate(texts):
+            if not text:
+                counts[i] = 0
+                continue
+            key = self._key(name, text)
+            cached = self._counts.get(key)
+            if cached is not None:
+                counts[i] = int(cached)
+            elif key in pending:
+                pending[key].append(i)
+            else:
+                pending[key] = [i]
+                missing.append(text)
+
+        if missing:
+            if sum(map(len, missing)) >= self.OFFLOAD_MIN_CHARS:
+                encoded = await asyncio.to_thread(
+                    encoding.encode_batch, missing, disallowed_special=()
+                )
+            else:
+                encoded = encoding.encode_batch(missing, disallowed_special=())
+            for (key, positions), tokens in zip(pending.items(), encoded):
+                self._counts.set(key, len(tokens))
+                for i in positions:
+                    counts[i] = len(tokens)
+        return [int(c or 0) for c in counts]
+
+    def count_message(
+        self,
+        message: Dict[str, Any],
+        model: Optional[str] = None,
+        provider: str | ModelProvider = "openai",
+    ) -> int:
+        role = str(message.get("role", ""))
+        content = message.get("content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        return (
+            self.count(role, model, provider)
+            + self.count(content, model, provider)
+            + _MESSAGE_OVERHEAD
+        )
+
+    def count_messages(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        model: Optional[str] = None,
+        provider: str | ModelProvider = "openai",
+    ) -> int:
+        return sum(self.count_message(m, model, provider) for m in messages)
+
+    async def count_each_message(
+        self,
+        messages: Sequence[Dict[str, Any]],
+        model: Optional[str] = None,
+        provider: str | ModelProvider = "openai",
+    ) -> List[int]:
+        """Return :meth:`count_message` for every message, as one batch."""
+
+        texts: List[str] = []
+        for message in messages:
+            content = message.get("content", "")
+            texts.append(str(message.get("role", "")))
+            texts.append(content if isinstance(content, str) else str(content))
+        counts = await self.count_many(texts, model, provider)
+        return [
+            counts[i] + counts[i + 1] + _MESSAGE_OVERHEAD
+            for i in range(0, len(counts), 2)
+        ]
+
+    def clear(self) -> None:
+        self._counts.clear()
+
+
+_service: Optional[TokenCountingService] = None
+
+
+def get_token_service() -> TokenCountingService:
+    """Return the process-wide token counting service."""
+
+    global _service  # pylint: disable=global-statement
+    if _service is None:
+        _service = TokenCountingService()
+    return _service
@@ -11,7 +11,7 @@ node execution and managing workflow state.
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from typing import cast as _cast
 from uuid import uuid4
 
@@ -114,6 +114,6 @@ class BaseWorkflow(ABC):
 
     @abstractmethod
     async def execute_node(
-        self, node_id: str, input_data: Dict[str, Any]
+        self, node_id: str, input_data: Mapping[str, Any]
     ) -> NodeExecutionResult:
         pass
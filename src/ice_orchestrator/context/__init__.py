@@ -7,6 +7,7 @@ graph analysis, formatting, and type management during orchestration.
 from .async_manager import BranchContext, GraphContextManager
 from .formatter import ContextFormatter
 from .graph_analyzer import DependencyImpact, GraphAnalyzer, GraphMetrics
+from .layered import LayeredContext, materialize
 from .manager import GraphContext
 from .memory import BaseMemory, NullMemory
 from .scoped_context_store import ScopedContextStore
@@ -32,4 +33,6 @@ __all__ = [
     "ContextFormatter",
     "ToolContext",
     "ContextTypeManager",
+    "LayeredContext",
+    "materialize",
 ]
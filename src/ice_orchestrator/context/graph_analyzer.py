@@ -4,12 +4,17 @@ This module provides graph intelligence that leverages the powerful NetworkX
 infrastructure already in place but underutilized across iceOS layers.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, cast
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, cast
 
 import networkx as nx
 
 from ice_core.models.node_models import NodeConfig
+from ice_orchestrator.graph.analytics_cache import (
+    GraphAnalyticsCache,
+    get_analytics_cache,
+    graph_fingerprint,
+)
 
 
 @dataclass
@@ -46,10 +51,32 @@ class GraphAnalyzer:
     - Performance bottleneck identification
     - Impact analysis for changes
     - Intelligent suggestions for workflow composition
+
+    Results depend only on the graph structure and are memoised in a
+    :class:`GraphAnalyticsCache` keyed by :func:`graph_fingerprint`, so
+    analyzers rebuilt per request (and other workers sharing Redis) reuse
+    them.  *lineage* (typically the workflow name) lets layouts evolve
+    incrementally as nodes are added.
     """
 
-    def __init__(self, graph: nx.DiGraph):
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        *,
+        lineage: Optional[str] = None,
+        cache: Optional[GraphAnalyticsCache] = None,
+    ):
         self.graph = graph
+        self.lineage = lineage
+        self._cache = cache
+
+    @property
+    def cache(self) -> GraphAnalyticsCache:
+        return self._cache if self._cache is not None else get_analytics_cache()
+
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the analysed graph."""
+        return graph_fingerprint(self.graph)
 
     @classmethod
     def from_nodes(cls, nodes: List[NodeConfig]) -> "GraphAnalyzer":
@@ -67,18 +94,21 @@ class GraphAnalyzer:
     def get_metrics(self) -> GraphMetrics:
         """Get comprehensive graph metrics."""
 
+        data = self.cache.get_or_compute(
+            self.fingerprint(), "metrics", lambda: asdict(self._compute_metrics())
+        )
+        return GraphMetrics(**data)
+
+    def _compute_metrics(self) -> GraphMetrics:
         # Basic structure
         total_nodes = self.graph.number_of_nodes()
         total_edges = self.graph.number_of_edges()
 
         # Depth analysis
         try:
-            max_depth = (
-                max(
-                    nx.shortest_path_length(self.graph, source).values()
-                    for source in self.get_root_nodes()
-                )
-                or 0
+            max_depth = max(
+                max(nx.shortest_path_length(self.graph, source).values())
+                for source in self.get_root_nodes()
             )
         except ValueError:
             max_depth = 0
@@ -143,6 +173,11 @@ class GraphAnalyzer:
     def suggest_optimizations(self) -> List[Dict[str, Any]]:
         """Suggest workflow optimizations based on graph analysis."""
 
+        return self.cache.get_or_compute(
+            self.fingerprint(), "suggestions", self._compute_suggestions
+        )
+
+    def _compute_suggestions(self) -> List[Dict[str, Any]]:
         suggestions = []
         metrics = self.get_metrics()
 
@@ -188,22 +223,28 @@ class GraphAnalyzer:
     def get_spatial_layout_hints(self) -> Dict[str, Dict[str, Any]]:
         """Generate spatial layout hints for canvas visualization."""
 
-        layout_hints = {}
+        layout_hints: Dict[str, Dict[str, Any]] = {}
         levels = self._compute_levels()
 
-        # Use force-directed layout as base
-        pos = nx.spring_layout(self.graph, k=3, iterations=50)
+        # Force-directed base layout, computed once per graph shape
+        pos = self.cache.positions(self.graph, lineage=self.lineage)
+        node_analytics = self.cache.get_or_compute(
+            self.fingerprint(), "node_analytics", self._compute_node_analytics
+        )
+        betweenness: Dict[str, float] = node_analytics["betweenness"]
+        critical_path = set(node_analytics["critical_path"])
+        bottlenecks = set(self._identify_bottlenecks())
 
         # Adjust for level-based layout
         for level, nodes in levels.items():
-            for i, node_id in enumerate(nodes):
+            for node_id in nodes:
                 # Get node configuration for styling
                 node_data = self.graph.nodes.get(node_id, {})
                 node_config = node_data.get("config")
 
                 layout_hints[node_id] = {
                     "position": {
-                        "x": pos[node_id][0] * 500,  # Scale for screen coordinates
+                        "x": pos[str(node_id)][0] * 500,  # Scale for screen coordinates
                         "y": level * 150,  # Level-based Y positioning
                     },
                     "level": level,
@@ -214,11 +255,9 @@ class GraphAnalyzer:
                     "graph_metrics": {
                         "in_degree": self.graph.in_degree(node_id),
                         "out_degree": self.graph.out_degree(node_id),
-                        "betweenness": nx.betweenness_centrality(self.graph).get(
-                            node_id, 0
-                        ),
-                        "is_bottleneck": node_id in self._identify_bottlenecks(),
-                        "is_critical_path": self._is_on_critical_path(node_id),
+                        "betweenness": betweenness.get(str(node_id), 0),
+                        "is_bottleneck": node_id in bottlenecks,
+                        "is_critical_path": str(node_id) in critical_path,
                     },
                 }
 
@@ -236,6 +275,12 @@ class GraphAnalyzer:
         if len(pattern_nodes) < 2:
             return []
 
+        kind = "patterns:" + graph_fingerprint(self.graph.subgraph(pattern_nodes))
+        return self.cache.get_or_compute(
+            self.fingerprint(), kind, lambda: self._find_similar(pattern_nodes)
+        )
+
+    def _find_similar(self, pattern_nodes: List[str]) -> List[List[str]]:
         # Extract pattern subgraph
         pattern_subgraph = self.graph.subgraph(pattern_nodes)
 
@@ -255,6 +300,11 @@ class GraphAnalyzer:
     def get_execution_path_analysis(self) -> Dict[str, Any]:
         """Analyze possible execution paths through the workflow."""
 
+        return self.cache.get_or_compute(
+            self.fingerprint(), "path_analysis", self._compute_path_analysis
+        )
+
+    def _compute_path_analysis(self) -> Dict[str, Any]:
         root_nodes = self.get_root_nodes()
         leaf_nodes = self.get_leaf_nodes()
 
@@ -297,21 +347,17 @@ class GraphAnalyzer:
         """Compute topological levels."""
         levels: Dict[int, List[str]] = {}
 
+        node_level: Dict[str, int] = {}
+
         try:
             for node in nx.topological_sort(self.graph):
                 # Level is the longest path from any root node
-                level = 0
-                for pred in self.graph.predecessors(node):
-                    pred_level = next(
-                        level_key
-                        for level_key, nodes in levels.items()
-                        if pred in nodes
-                    )
-                    level = max(level, pred_level + 1)
-
-                if level not in levels:
-                    levels[level] = []
-                levels[level].append(node)
+                level = max(
+                    (node_level[pred] + 1 for pred in self.graph.predecessors(node)),
+                    default=0,
+                )
+                node_level[node] = level
+                levels.setdefault(level, []).append(node)
 
         except nx.NetworkXError:
             # Fallback for graphs with cycles
@@ -387,6 +433,20 @@ class GraphAnalyzer:
         except nx.NetworkXError:
             return False
 
+    def _compute_node_analytics(self) -> Dict[str, Any]:
+        """Per-node centrality and the critical path, computed in one pass."""
+        try:
+            critical_path = [str(n) for n in nx.dag_longest_path(self.graph)]
+        except nx.NetworkXException:
+            critical_path = []
+        return {
+            "betweenness": {
+                str(n): float(score)
+                for n, score in nx.betweenness_centrality(self.graph).items()
+            },
+            "critical_path": critical_path,
+        }
+
     def _get_graph_aware_style(
         self, node_config: NodeConfig, layout_info: Dict[str, Any]
     ) -> Dict[str, Any]:
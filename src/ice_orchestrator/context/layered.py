@@ -0,0 +1,59 @@
+"""Layered, copy-free node execution context.
+
+A node's context is assembled from sources that are shared by every node of
+a run – dependency outputs, session metadata, workflow inputs.  Merging them
+into a fresh ``dict`` per node (and again per loop item or parallel branch)
+copies every key each time.  :class:`LayeredContext` stacks the sources
+instead::
+
+    ctx = LayeredContext(node_inputs, session_metadata, workflow_inputs)
+    item_ctx = ctx.overlay({"item": item})   # O(1), ctx is untouched
+    item_ctx["summary"] = out               # lands in the item overlay only
+
+Lookups search the layers first to last; writes and deletes only ever touch
+the top layer, so lower layers are never modified.  Call :func:`materialize`
+where a real ``dict`` is required (JSON, subprocess/WASM boundaries).
+"""
+
+from __future__ import annotations
+
+from collections import ChainMap
+from typing import Any, Dict, Mapping, MutableMapping, Optional
+
+__all__ = ["LayeredContext", "materialize"]
+
+
+class LayeredContext(ChainMap[str, Any]):
+    """ChainMap of context layers with copy-on-write overlays."""
+
+    def __init__(self, *maps: Mapping[str, Any]) -> None:
+        # Only the top layer is ever written, so read-only layers are fine
+        super().__init__(*maps)  # type: ignore[arg-type]
+
+    def overlay(
+        self, values: Optional[Mapping[str, Any]] = None, **extra: Any
+    ) -> "LayeredContext":
+        """Return a child view whose own writes (and *values*) shadow this one."""
+
+        top: Dict[str, Any] = dict(values or {})
+        top.update(extra)
+        return self.new_child(top)
+
+    @property
+    def local(self) -> MutableMapping[str, Any]:
+        """The top layer – values set for this node/item/branch only."""
+
+        return self.maps[0]
+
+    def materialize(self) -> Dict[str, Any]:
+        """Flatten the visible keys into a plain ``dict`` (shallow)."""
+
+        return dict(self)
+
+
+def materialize(ctx: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return *ctx* as a plain ``dict``, copying only when it is layered."""
+
+    if isinstance(ctx, dict):
+        return ctx
+    return dict(ctx)
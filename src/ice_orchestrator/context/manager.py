@@ -258,14 +258,12 @@ class GraphContextManager:
 
         # Enforce token budget strictly whenever configured
         try:
-            from ice_core.models import ModelProvider
-            from ice_core.utils.token_counter import TokenCounter
+            from ice_core.utils.token_counter import get_token_service
+
+            counter = get_token_service()
 
             def _too_large(text: str) -> bool:
-                tokens = TokenCounter.estimate_tokens(
-                    text, model="", provider=ModelProvider.CUSTOM
-                )
-                return bool(self.max_tokens and tokens > self.max_tokens)
+                return bool(self.max_tokens and counter.count(text) > self.max_tokens)
 
             is_oversized = _too_large(serialised)
             if is_oversized:
@@ -446,14 +444,11 @@ class GraphContextManager:
         effective_max_tokens = max_tokens or self.max_tokens
 
         # Import token counter lazily to avoid heavy startup costs
-        from ice_core.models import ModelProvider
-        from ice_core.utils.token_counter import TokenCounter
+        from ice_core.utils.token_counter import get_token_service
 
         def _estimate_tokens(text: str) -> int:
-            """Return token estimate for *text* as *int*."""
-            return TokenCounter.estimate_tokens(
-                text, model="", provider=ModelProvider.CUSTOM
-            )
+            """Return the (cached) token count of *text*."""
+            return get_token_service().count(text)
 
         # ------------------------------------------------------------------
         # Strategy: truncate (cheap) ---------------------------------------
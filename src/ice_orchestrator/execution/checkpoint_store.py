@@ -0,0 +1,387 @@
+"""Durable per-node checkpoint stores.
+
+Instead of snapshotting the whole :class:`WorkflowExecutionState` on a timer,
+the workflow appends one small record per finished node.  Folding the records
+of a run back together yields a checkpoint dict that
+:meth:`Workflow.execute_incremental` accepts, so a run interrupted on one
+worker can be resumed on another without repeating completed (and paid-for)
+LLM calls.
+
+Records are encoded with msgpack when it is installed and fall back to
+zlib-compressed JSON otherwise; the first byte tags the format so stores
+written by either variant stay readable.
+
+Backends:
+
+* :class:`FileCheckpointStore` – length-prefixed append-only log per run.
+* :class:`RedisCheckpointStore` – one hash per run, one field per node.
+* Postgres – provided by the API layer and registered via
+  :func:`register_checkpoint_backend` (see ``ice_api.services``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+try:  # Optional – denser encoding when available
+    import msgpack  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover – optional dep
+    msgpack = None  # type: ignore[assignment]
+
+from ice_core.models import NodeExecutionResult
+
+__all__ = [
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "RedisCheckpointStore",
+    "checkpoint_store_from_env",
+    "decode_record",
+    "encode_record",
+    "register_checkpoint_backend",
+]
+
+logger = logging.getLogger(__name__)
+
+_TAG_MSGPACK = b"m"
+_TAG_ZJSON = b"z"
+
+# Record kinds -------------------------------------------------------------
+_HEADER = "h"
+_NODE = "n"
+_DISCARD = "x"
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """Encode *record* into the compact binary checkpoint format."""
+
+    if msgpack is not None:
+        packed: bytes = msgpack.packb(record, use_bin_type=True, default=str)
+        return _TAG_MSGPACK + packed
+    text = json.dumps(record, separators=(",", ":"), default=str)
+    return _TAG_ZJSON + zlib.compress(text.encode("utf-8"))
+
+
+def decode_record(blob: bytes) -> Dict[str, Any]:
+    """Decode a record produced by :func:`encode_record`."""
+
+    tag, body = blob[:1], blob[1:]
+    if tag == _TAG_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("checkpoint was written with msgpack, not installed")
+        return dict(msgpack.unpackb(body, raw=False))
+    if tag == _TAG_ZJSON:
+        return dict(json.loads(zlib.decompress(body).decode("utf-8")))
+    raise ValueError(f"Unknown checkpoint record tag {tag!r}")
+
+
+def fold_records(
+    run_id: str, records: Iterable[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Replay *records* in order into a checkpoint dict (``None`` if empty)."""
+
+    header: Dict[str, Any] = {}
+    nodes: Dict[str, Dict[str, Any]] = {}
+    seen = False
+    for rec in records:
+        seen = True
+        kind = rec.get("k")
+        if kind == _HEADER:
+            header = rec
+        elif kind == _NODE:
+            nodes[str(rec["id"])] = rec
+        elif kind == _DISCARD:
+            for nid in rec.get("ids", []):
+                nodes.pop(str(nid), None)
+    if not seen:
+        return None
+
+    node_results: Dict[str, Dict[str, Any]] = {}
+    for nid, rec in nodes.items():
+        node_results.setdefault(str(rec.get("t") or "tool"), {})[nid] = rec["r"]
+    return {
+        "workflow_id": header.get("workflow_id", run_id),
+        "workflow_name": header.get("workflow_name", "restored"),
+        "inputs": header.get("inputs"),
+        "inputs_fingerprint": header.get("inputs_fingerprint"),
+        "node_fingerprints": {nid: rec.get("fp") for nid, rec in nodes.items()},
+        "node_results": node_results,
+        "completed_nodes": [
+            nid for nid, rec in nodes.items() if rec["r"].get("success")
+        ],
+        "failed_nodes": [
+            nid for nid, rec in nodes.items() if not rec["r"].get("success")
+        ],
+    }
+
+
+class CheckpointStore(ABC):
+    """Append-only, per-node checkpoint persistence.
+
+    Subclasses implement three primitives over encoded records; the public
+    helpers build the records and fold them back into a checkpoint.
+    """
+
+    @abstractmethod
+    async def _append(self, run_id: str, key: str, blob: bytes) -> None:
+        """Persist *blob*; *key* is the node id or ``"__header__"``."""
+
+    @abstractmethod
+    async def _read(self, run_id: str) -> List[bytes]:
+        """Return every record for *run_id* in write order."""
+
+    @abstractmethod
+    async def delete(self, run_id: str) -> None:
+        """Remove all checkpoint data for *run_id*."""
+
+    async def write_header(
+        self,
+        run_id: str,
+        *,
+        workflow_name: str,
+        inputs: Optional[Dict[str, Any]],
+        inputs_fingerprint: Optional[str],
+    ) -> None:
+        record = {
+            "k": _HEADER,
+            "workflow_id": run_id,
+            "workflow_name": workflow_name,
+            "inputs": inputs,
+            "inputs_fingerprint": inputs_fingerprint,
+            "ts": datetime.utcnow().isoformat(),
+        }
+        await self._append(run_id, "__header__", encode_record(record))
+
+    async def record_node(
+        self,
+        run_id: str,
+        node_id: str,
+        result: NodeExecutionResult,
+        *,
+        fingerprint: str,
+    ) -> None:
+        node_type = result.metadata.node_type if result.metadata else None
+        record = {
+            "k": _NODE,
+            "id": node_id,
+            "fp": fingerprint,
+            "t": node_type,
+            "r": result.model_dump(mode="json"),
+        }
+        await self._append(run_id, node_id, encode_record(record))
+
+    async def discard(self, run_id: str, node_ids: Iterable[str]) -> None:
+        """Invalidate stored results so the nodes re-run on resume."""
+
+        ids = sorted(node_ids)
+        if ids:
+            await self._append(run_id, "", encode_record({"k": _DISCARD, "ids": ids}))
+
+    async def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Return the folded checkpoint for *run_id* or ``None``."""
+
+        records: List[Dict[str, Any]] = []
+        for blob in await self._read(run_id):
+            try:
+                records.append(decode_record(blob))
+            except Exception as exc:
+                logger.warning("Skipping unreadable checkpoint record: %s", exc)
+        return fold_records(run_id, records)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Append-only log per run under *directory*.
+
+    Each record is framed as a 4-byte big-endian length followed by the
+    payload.  A torn final frame (crash mid-write) is ignored on load and
+    truncated away before this process first appends to the log, so records
+    written after the crash stay readable.
+    """
+
+    _FRAME = struct.Struct(">I")
+
+    def __init__(
+        self, directory: str | os.PathLike[str], *, fsync: bool = True
+    ) -> None:
+        self.directory = Path(directory)
+        self.fsync = fsync
+        # Run logs whose tail has been checked by this process
+        self._repaired: Set[str] = set()
+        self._repair_lock = threading.Lock()
+
+    def _path(self, run_id: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in run_id)
+        return self.directory / f"{safe}.ckpt"
+
+    def _valid_end(self, data: bytes) -> int:
+        """Return the offset just past the last complete frame in *data*."""
+
+        pos, size = 0, self._FRAME.size
+        while pos + size <= len(data):
+            (length,) = self._FRAME.unpack_from(data, pos)
+            if pos + size + length > len(data):
+                break
+            pos += size + length
+        return pos
+
+    def _repair_tail(self, run_id: str) -> None:
+        with self._repair_lock:
+            if run_id in self._repaired:
+                return
+            path = self._path(run_id)
+            if path.exists():
+                end = self._valid_end(path.read_bytes())
+                if end < path.stat().st_size:
+                    logger.warning("Truncating torn checkpoint tail of %s", path)
+                    with open(path, "r+b") as fh:
+                        fh.truncate(end)
+            self._repaired.add(run_id)
+
+    def _append_sync(self, run_id: str, blob: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._repair_tail(run_id)
+        with open(self._path(run_id), "ab") as fh:
+            fh.write(self._FRAME.pack(len(blob)) + blob)
+            fh.flush()
+            if self.fsync:
+                os.fsync(fh.fileno())
+
+    def _read_sync(self, run_id: str) -> List[bytes]:
+        path = self._path(run_id)
+        if not path.exists():
+            return []
+        data = path.read_bytes()
+        end = self._valid_end(data)  # a torn tail is ignored
+        out: List[bytes] = []
+        pos, size = 0, self._FRAME.size
+        while pos < end:
+            (length,) = self._FRAME.unpack_from(data, pos)
+            out.append(data[pos + size : pos + size + length])
+            pos += size + length
+        return out
+
+    async def _append(self, run_id: str, key: str, blob: bytes) -> None:
+        await asyncio.to_thread(self._append_sync, run_id, blob)
+
+    async def _read(self, run_id: str) -> List[bytes]:
+        return await asyncio.to_thread(self._read_sync, run_id)
+
+    async def delete(self, run_id: str) -> None:
+        self._path(run_id).unlink(missing_ok=True)
+        self._repaired.discard(run_id)
+
+
+class RedisCheckpointStore(CheckpointStore):
+    """Redis hash per run (``ckpt:{run_id}``), one field per node.
+
+    HSET overwrites a node's previous record, so the hash stays compact
+    without a separate compaction step.  A binary-safe client is used
+    because records are not UTF-8 text.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: Optional[str] = None,
+        prefix: str = "ckpt:",
+        ttl_seconds: Optional[int] = None,
+        client: Any = None,
+    ) -> None:
+        self.prefix = prefix
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else int(os.getenv("ICE_CHECKPOINT_TTL_SECONDS", "604800"))
+        )
+        if client is None:
+            import redis.asyncio as aioredis
+
+            client = aioredis.from_url(
+                url or os.getenv("REDIS_URL") or "redis://localhost:6379/0",
+                decode_responses=False,
+            )
+        self._redis = client
+
+    def _key(self, run_id: str) -> str:
+        return f"{self.prefix}{run_id}"
+
+    async def _append(self, run_id: str, key: str, blob: bytes) -> None:
+        rkey = self._key(run_id)
+        await self._redis.hset(rkey, key, blob)
+        if self.ttl_seconds > 0:
+            await self._redis.expire(rkey, self.ttl_seconds)
+
+    async def discard(self, run_id: str, node_ids: Iterable[str]) -> None:
+        ids = list(node_ids)
+        if ids:
+            await self._redis.hdel(self._key(run_id), *ids)
+
+    async def _read(self, run_id: str) -> List[bytes]:
+        raw: Dict[Any, bytes] = await self._redis.hgetall(self._key(run_id))
+        header_keys = {"__header__", b"__header__"}
+        # Header first so node records are folded on top of it
+        ordered = [v for k, v in raw.items() if k in header_keys]
+        ordered.extend(v for k, v in raw.items() if k not in header_keys)
+        return ordered
+
+    async def delete(self, run_id: str) -> None:
+        await self._redis.delete(self._key(run_id))
+
+
+# ---------------------------------------------------------------------------
+# Backend selection ----------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+_BACKENDS: Dict[str, Callable[[], CheckpointStore]] = {
+    "file": lambda: FileCheckpointStore(
+        os.getenv("ICE_CHECKPOINT_DIR", ".ice/checkpoints")
+    ),
+    "redis": lambda: RedisCheckpointStore(),
+}
+
+
+def register_checkpoint_backend(
+    name: str, factory: Callable[[], CheckpointStore]
+) -> None:
+    """Make *factory* selectable via ``ICE_CHECKPOINT_STORE=<name>``."""
+
+    _BACKENDS[name] = factory
+    _STORES.pop(name, None)
+
+
+# One store per backend and process – a Redis store owns a connection pool
+_STORES: Dict[str, CheckpointStore] = {}
+
+
+def checkpoint_store_from_env() -> Optional[CheckpointStore]:
+    """Return the store named by ``ICE_CHECKPOINT_STORE`` (unset = disabled).
+
+    The store is built once per process and reused by every run.
+    """
+
+    name = os.getenv("ICE_CHECKPOINT_STORE", "").strip().lower()
+    if not name or name in {"0", "off", "none"}:
+        return None
+    store = _STORES.get(name)
+    if store is not None:
+        return store
+    factory = _BACKENDS.get(name)
+    if factory is None:
+        logger.warning("Unknown ICE_CHECKPOINT_STORE backend %r; disabled", name)
+        return None
+    try:
+        store = factory()
+    except Exception as exc:
+        logger.warning("Checkpoint store %r unavailable: %s", name, exc)
+        return None
+    _STORES[name] = store
+    return store
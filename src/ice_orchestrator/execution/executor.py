@@ -8,7 +8,7 @@ from datetime import datetime
 # ---------------------------------------------------------------------------
 # Local type alias to satisfy static analysis on forward reference annotations.
 # ---------------------------------------------------------------------------
-from typing import TYPE_CHECKING, Any, Dict, cast
+from typing import TYPE_CHECKING, Any, Dict, Mapping, cast
 
 import structlog
 
@@ -62,6 +62,9 @@ import ice_orchestrator.execution.executors  # Import for side effects
 from ice_core.models import NodeConfig, NodeExecutionResult
 from ice_core.models.node_models import NodeMetadata
 from ice_core.unified_registry import get_executor
+from ice_core.utils.blob_store import get_blob_store
+from ice_core.utils.deadline import deadline_scope
+from ice_orchestrator.context.layered import materialize
 from ice_orchestrator.providers.budget_enforcer import BudgetEnforcer
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -88,7 +91,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
     # ------------------------------------------------------------------
 
     async def execute_node(
-        self, node_id: str, input_data: Dict[str, Any]
+        self, node_id: str, input_data: Mapping[str, Any]
     ) -> "NodeExecutionResult":
         """Delegate execution to the node registry while preserving all original
         orchestration semantics (cache, retries, validation, etc.)."""
@@ -191,6 +194,16 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
         last_error: Exception | None = None
         result_raw: Any | None = None
 
+        # Large upstream outputs arrive as blob references (only when
+        # offloading is on).  LLM prompts render them on access; every other
+        # executor gets plain values.
+        blobs = get_blob_store()
+        exec_input = (
+            await blobs.resolve_async(input_data)
+            if blobs.enabled and str(getattr(node, "type", "")) != "llm"
+            else input_data
+        )
+
         for attempt in range(max_retries + 1):
             try:
                 # --------------------------------------------------
@@ -208,7 +221,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                         )
                         payload = {
                             "node_id": node_id,
-                            "input": input_data,
+                            "input": materialize(input_data),
                             "cfg": cfg_payload,
                         }
                         serialized = json.dumps(payload, sort_keys=True, default=str)
@@ -272,9 +285,12 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                                 memory_limit_mb=_mem_mb,
                                 cpu_limit_seconds=_cpu_s,
                             ) as sbx:
-                                result_raw = await sbx.run_with_timeout(
-                                    executor(chain, node, input_data)
-                                )
+                                # Let LLM/tool calls size retries and hedges
+                                # to what is left of the node budget
+                                with deadline_scope(timeout):
+                                    result_raw = await sbx.run_with_timeout(
+                                        executor(chain, node, exec_input)
+                                    )
                         break  # success
                     except Exception as exc:
                         last_error = exc  # remember last
@@ -325,7 +341,13 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                         if node.type == "llm" and isinstance(result_raw.output, dict):
 
                             def _trim(val: Any, max_chars: int = 1500) -> Any:
-                                if isinstance(val, str) and len(val) > max_chars:
+                                # Offloaded below when enabled, keeping the
+                                # full text addressable instead of cutting it
+                                if (
+                                    isinstance(val, str)
+                                    and len(val) > max_chars
+                                    and not blobs.enabled
+                                ):
                                     return val[:max_chars]
                                 return val
 
@@ -347,6 +369,10 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                                 }
                     except Exception:
                         minimal_content = result_raw.output
+                    if minimal_content is not result_raw.output and blobs.enabled:
+                        minimal_content = await blobs.offload_async(
+                            minimal_content, threshold=1500
+                        )
 
                     try:
                         chain.context_manager.update_node_context(
@@ -380,6 +406,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                                 setattr(result_raw, "rendered_prompt_preview", preview)
                     except Exception:
                         pass
+                    result_raw.output = await blobs.offload_async(result_raw.output)
                     return result_raw
 
                 # --------------------------------------------------
@@ -411,6 +438,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                     elif node.type == "code":
                         self.budget.register_code_execution()
 
+                    result_raw.output = await blobs.offload_async(result_raw.output)
                     return result_raw
 
                 # --------------------------------------------------
@@ -549,7 +577,13 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                             ):
                                 # Persist a minimal, size-safe view of LLM output
                                 def _trim(val: Any, max_chars: int = 1500) -> Any:
-                                    if isinstance(val, str) and len(val) > max_chars:
+                                    # Offloaded below when enabled, keeping the
+                                    # full text addressable instead of cutting it
+                                    if (
+                                        isinstance(val, str)
+                                        and len(val) > max_chars
+                                        and not blobs.enabled
+                                    ):
                                         return val[:max_chars]
                                     return val
 
@@ -571,6 +605,10 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                                     }
                         except Exception:
                             content_to_persist = processed_output
+                        if content_to_persist is not processed_output and blobs.enabled:
+                            content_to_persist = await blobs.offload_async(
+                                content_to_persist, threshold=1500
+                            )
 
                         chain.context_manager.update_node_context(
                             node_id=node_id,
@@ -610,6 +648,7 @@ class NodeExecutor:  # – internal utility extracted from ScriptChain
                         self.budget.register_code_execution()
                     # Note: condition, loop, and parallel are orchestration nodes that don't need budget tracking
 
+                    result.output = await blobs.offload_async(result.output)
                     return result
 
                 else:  # If output was None after all processing, return failure
@@ -1,5 +1,6 @@
 """Executor for agent nodes."""
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any, Dict
 
@@ -7,6 +8,7 @@ from ice_core.models import AgentNodeConfig, NodeExecutionResult
 from ice_core.models.node_metadata import NodeMetadata
 from ice_core.protocols.workflow import WorkflowLike  # noqa: F401
 from ice_core.unified_registry import register_node, registry
+from ice_orchestrator.context.layered import materialize
 from ice_orchestrator.services.agent_runtime import AgentRuntime
 
 __all__ = ["agent_node_executor"]
@@ -80,7 +82,7 @@ async def agent_node_executor(
                 ) -> str:
                     # Compact context for the model: include last tool and result snippet
                     agent_ctx = (
-                        context.get("agent", {}) if isinstance(context, dict) else {}
+                        context.get("agent", {}) if isinstance(context, Mapping) else {}
                     )
                     last_tool = (
                         agent_ctx.get("last_tool")
@@ -193,9 +195,11 @@ async def agent_node_executor(
         # ------------------------------------------------------------------
         # 2. Execute agent – trusted code has full DAG context --------------
         # ------------------------------------------------------------------
+        # Agents get a plain dict: they JSON-encode it and write agent state
+        # into it, neither of which works on a layered context
         runtime = AgentRuntime()
         agent_output: Any = await runtime.run(
-            agent, context=ctx, max_iterations=cfg.max_iterations
+            agent, context=materialize(ctx), max_iterations=cfg.max_iterations
         )
 
         if not isinstance(agent_output, dict):
@@ -12,6 +12,7 @@ from ice_core.protocols.workflow import WorkflowLike  # noqa: F401
 import logging
 from ice_core.unified_registry import get_code_instance, has_code_factory, register_node
 from ice_core.validation.schema_validator import SchemaValidator
+from ice_orchestrator.context.layered import materialize
 
 
 @register_node("code")
@@ -296,6 +297,8 @@ async def code_node_executor_legacy(  # noqa: D401
         # ------------------------------------------------------------------
         # 4. Execute in WASM sandbox (gated by ICE_ENABLE_WASM) -----------
         # ------------------------------------------------------------------
+        # Both sandboxes serialise the context – hand them a plain dict
+        ctx = materialize(ctx)
         import os as _os
 
         try:
@@ -8,6 +8,7 @@ from ice_core.models.node_metadata import NodeMetadata
 from ice_core.protocols.workflow import WorkflowLike  # noqa: F401
 from ice_core.unified_registry import register_node, registry
 from ice_core.utils.safe_eval import safe_eval_bool
+from ice_orchestrator.context.layered import LayeredContext
 
 __all__ = ["condition_node_executor"]
 
@@ -38,7 +39,8 @@ async def condition_node_executor(
         # --------------------------------------------------------------
         branch_outputs: Dict[str, Any] = {}
         if branch_nodes:
-            branch_ctx = {**ctx, "condition_result": result}
+            base_ctx = ctx if isinstance(ctx, LayeredContext) else LayeredContext(ctx)
+            branch_ctx = base_ctx.overlay(condition_result=result)
 
             for node in branch_nodes:
                 if hasattr(workflow, "execute_node_config"):
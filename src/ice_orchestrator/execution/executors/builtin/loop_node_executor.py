@@ -1,12 +1,13 @@
 """Executor for loop nodes."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 from ice_core.models import LoopNodeConfig, NodeExecutionResult
 from ice_core.models.node_metadata import NodeMetadata
 from ice_core.protocols.workflow import WorkflowLike  # noqa: F401
 from ice_core.unified_registry import get_executor, register_node, registry
+from ice_orchestrator.context.layered import LayeredContext
 
 __all__ = ["loop_node_executor"]
 
@@ -83,14 +84,17 @@ async def loop_node_executor(  # noqa: D401, ANN001
     # 4. Iterate and execute body ---------------------------------------
     # ------------------------------------------------------------------
     results: List[Any] = []
+    # Each item gets an O(1) overlay instead of a copy of the whole context
+    base_ctx = ctx if isinstance(ctx, LayeredContext) else LayeredContext(ctx)
     for idx, item in enumerate(items[: max_iterations or len(items)]):
-        item_ctx = {**ctx, item_var: item}
+        item_ctx = base_ctx.overlay({item_var: item})
         last_out: Any = None
 
         for node in body:
             executor = get_executor(node.type)
             # Direct call – no hierarchical node-id mutation
-            exec_result = await executor(workflow, node, item_ctx)
+            # Executors take the overlay as their (read-mostly) context dict
+            exec_result = await executor(workflow, node, cast(Dict[str, Any], item_ctx))
             last_out = (
                 exec_result.output if hasattr(exec_result, "output") else exec_result
             )
@@ -9,6 +9,7 @@ from ice_core.models import NodeExecutionResult, ParallelNodeConfig
 from ice_core.models.node_metadata import NodeMetadata
 from ice_core.protocols.workflow import WorkflowLike  # noqa: F401
 from ice_core.unified_registry import register_node, registry
+from ice_orchestrator.context.layered import LayeredContext
 
 __all__ = ["parallel_node_executor"]
 
@@ -69,6 +70,9 @@ async def parallel_node_executor(  # noqa: D401, ANN001
         if not branches:
             raise ValueError(f"Parallel node {cfg.id} has no branches")
 
+        # Branches share the parent context; each writes to its own overlay
+        base_ctx = ctx if isinstance(ctx, LayeredContext) else LayeredContext(ctx)
+
         # --------------------------------------------------------------
         # 2. Helper to execute a branch sequentially ------------------
         # --------------------------------------------------------------
@@ -76,7 +80,7 @@ async def parallel_node_executor(  # noqa: D401, ANN001
             branch_nodes: List[Any], branch_idx: int
         ) -> Dict[str, Any]:
             branch_results: Dict[str, Any] = {}
-            branch_ctx = {**ctx, "branch_index": branch_idx}
+            branch_ctx = base_ctx.overlay(branch_index=branch_idx)
 
             for node in branch_nodes:
                 if hasattr(workflow, "execute_node_config"):
@@ -1,5 +1,7 @@
 """Executor for tool nodes."""
 
+import logging
+import pickle
 from datetime import datetime
 from typing import Any, Dict
 
@@ -12,9 +14,26 @@ from ice_orchestrator.execution.executors.builtin.helpers import (
     resolve_jinja_templates,
 )
 from ice_orchestrator.execution.sandbox.resource_sandbox import ResourceSandbox
+from ice_orchestrator.execution.tool_offload import dispatch_tool
 
 __all__ = ["tool_node_executor"]
 
+logger = logging.getLogger(__name__)
+
+
+def _is_picklable(tool: Any, inputs: Dict[str, Any]) -> bool:
+    """Return True when *tool* and *inputs* can be shipped to a child process."""
+    try:
+        pickle.dumps((tool, inputs))
+        return True
+    except Exception as exc:
+        logger.warning(
+            "Tool %s is not picklable (%s); running in-process with timeout only",
+            getattr(tool, "name", type(tool).__name__),
+            exc,
+        )
+        return False
+
 
 @register_node("tool")
 async def tool_node_executor(
@@ -88,8 +107,14 @@ async def tool_node_executor(
             timeout_seconds=cfg.timeout_seconds or 30,
             memory_limit_mb=_mem_mb,
             cpu_limit_seconds=_cpu_s,
-        ):
-            tool_output: Any = await tool.execute(**safe_inputs)
+            isolation=_os.getenv("ICE_SANDBOX_TOOL_ISOLATION") or None,
+        ) as sbx:
+            if sbx.isolation != "none" and _is_picklable(tool, safe_inputs):
+                # Per-task limits in a child process; nothing process-wide
+                tool_output: Any = await sbx.run_isolated(tool.execute, **safe_inputs)
+            else:
+                # Honours ToolBase.execution_mode (loop / process / thread pool)
+                tool_output = await dispatch_tool(tool, safe_inputs)
 
         # ------------------------------------------------------------------
         # 6. Normalise output back to plain dict ----------------------------
@@ -42,7 +42,8 @@ async def workflow_node_executor(
         # --------------------------------------------------------------
         # 2. Merge context with optional overrides --------------------
         # --------------------------------------------------------------
-        merged_ctx = {**ctx}
+        # Sub-workflows take a plain dict – materialise at this boundary
+        merged_ctx = dict(ctx)
         if getattr(cfg, "config_overrides", None):  # type: ignore[attr-defined]
             merged_ctx.update(cfg.config_overrides)  # type: ignore[attr-defined]
 
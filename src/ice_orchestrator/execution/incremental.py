@@ -0,0 +1,146 @@
+"""Incremental execution planning.
+
+Given a checkpoint from a previous run, decide which nodes can reuse their
+stored result and which must execute again.  A node is *dirty* when its own
+configuration changed (fingerprint mismatch), when the workflow inputs
+changed, or when one of its dependencies re-ran and produced a different
+output.  The last rule gives "early cutoff": re-running an upstream node that
+yields the same output does not invalidate its dependents.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
+
+from ice_core.models import NodeExecutionResult
+from ice_core.utils.hashing import HashMode, compute_hash
+
+__all__ = [
+    "IncrementalPlan",
+    "context_fingerprint",
+    "node_fingerprint",
+]
+
+
+def _stable_hash(payload: Any) -> str:
+    text = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return compute_hash(text, HashMode.PERFORMANCE)
+
+
+def node_fingerprint(node: Any) -> str:
+    """Return a stable fingerprint of a node configuration.
+
+    ``level`` is excluded because :class:`DependencyGraph` assigns it at build
+    time, and ``metadata`` because it carries construction timestamps rather
+    than anything that affects the node's output.
+    """
+
+    try:
+        payload = node.model_dump(mode="json", exclude={"level", "metadata"})
+    except Exception:
+        payload = repr(node)
+    return _stable_hash(payload)
+
+
+def context_fingerprint(metadata: Optional[Mapping[str, Any]]) -> str:
+    """Return a stable fingerprint of the workflow-level inputs."""
+
+    return _stable_hash(dict(metadata or {}))
+
+
+@dataclass
+class IncrementalPlan:
+    """Reuse decisions for a single incremental run.
+
+    Attributes:
+        previous_results: Node results restored from the checkpoint.
+        changed: Nodes whose configuration differs from the checkpoint.
+        dirty: ``changed`` plus everything downstream of it – the upper bound
+            of what may need to run.
+        scope: Nodes that belong to this run at all (``up_to_node_id`` limits
+            it to that node and its ancestors).
+    """
+
+    previous_results: Dict[str, NodeExecutionResult]
+    changed: Set[str]
+    dirty: Set[str]
+    scope: Set[str]
+    executed: Set[str] = field(default_factory=set)
+    reused: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def build(
+        cls,
+        graph: Any,
+        fingerprints: Mapping[str, str],
+        inputs_fingerprint: str,
+        checkpoint: Mapping[str, Any],
+        previous_results: Dict[str, NodeExecutionResult],
+        *,
+        up_to_node_id: Optional[str] = None,
+    ) -> "IncrementalPlan":
+        """Diff current fingerprints against *checkpoint* and build a plan."""
+
+        old_fingerprints: Mapping[str, str] = checkpoint.get("node_fingerprints") or {}
+        all_nodes: Set[str] = set(fingerprints)
+
+        if (
+            not old_fingerprints
+            or checkpoint.get("inputs_fingerprint") != inputs_fingerprint
+        ):
+            # Without fingerprints we cannot prove anything is unchanged, and
+            # different inputs may reach any node through context metadata.
+            changed = set(all_nodes)
+        else:
+            changed = {
+                nid
+                for nid, fp in fingerprints.items()
+                if old_fingerprints.get(nid) != fp
+            }
+
+        if up_to_node_id is not None:
+            scope = graph.get_upstream_nodes(up_to_node_id)
+        else:
+            scope = set(all_nodes)
+
+        return cls(
+            previous_results=previous_results,
+            changed=changed,
+            dirty=graph.get_downstream_nodes(changed),
+            scope=scope,
+        )
+
+    def in_scope(self, node_ids: Iterable[str]) -> list[str]:
+        """Filter *node_ids* down to the nodes this run cares about."""
+
+        return [nid for nid in node_ids if nid in self.scope]
+
+    def can_reuse(
+        self,
+        node_id: str,
+        dependencies: Iterable[str],
+        results: Mapping[str, NodeExecutionResult],
+    ) -> bool:
+        """Return *True* when the checkpointed result for *node_id* is still valid.
+
+        *results* holds what the current run has produced so far, so the
+        dependency check sees fresh outputs for anything that re-executed.
+        """
+
+        previous = self.previous_results.get(node_id)
+        if previous is None or not previous.success or node_id in self.changed:
+            return False
+        if node_id not in self.dirty:
+            return True
+        for dep_id in dependencies:
+            if dep_id not in self.executed:
+                continue
+            fresh = results.get(dep_id)
+            old = self.previous_results.get(dep_id)
+            if fresh is None or old is None or not fresh.success:
+                return False
+            if _stable_hash(fresh.output) != _stable_hash(old.output):
+                return False
+        return True
@@ -15,7 +15,7 @@ confusion with the *_node_executor* modules.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Mapping
 
 import structlog
 
@@ -61,7 +61,7 @@ class NodeExecutor:
         self.budget = BudgetEnforcer()
 
     async def execute_node(
-        self, node_id: str, input_data: Dict[str, Any]
+        self, node_id: str, input_data: Mapping[str, Any]
     ) -> "NodeExecutionResult":
         """Driver entry-point used by workflow runtime."""
         # (Exact implementation copied from previous executor.py without changes)
@@ -0,0 +1,310 @@
+"""Compiled workflow plans cached by blueprint content hash.
+
+Running a blueprint involves a cold path that depends only on the blueprint:
+``validate_blueprint``, ``Blueprint.validate_runtime``, spec → config
+conversion, per-node ``runtime_validate``, tool-schema population, safety
+checks, dependency-graph construction and the cost estimate.  A
+:class:`CompiledPlan` captures the result once; each run then gets a cheap
+:class:`~ice_orchestrator.workflow.Workflow` from :meth:`CompiledPlan.instantiate`
+(the graph is cloned, everything else is shared).
+
+Plans are looked up by a hash of the blueprint *content* – the
+``blueprint_id`` is ignored, so inline blueprints that only differ in their
+generated id share a plan.  Compiling resolves tools, agents and schemas
+from the registry, so the in-process key also carries ``registry.generation``
+(any registration invalidates every plan) and the shared key carries
+:meth:`registry.content_hash() <ice_core.unified_registry.Registry.content_hash>`:
+a worker only reuses validation done by a worker with the same tools,
+agents and executors registered.
+Plans live in:
+
+* an in-process LRU of compiled plans (``ICE_PLAN_CACHE_SIZE``, 256), and
+* a Redis tier holding the validated node configs so other workers can skip
+  validation, enabled when ``REDIS_URL`` is set (``ICE_PLAN_CACHE_REDIS=0``
+  turns it off).  Redis errors are never fatal – the tier is skipped for a
+  short cooldown.
+
+Concurrent misses for the same blueprint compile once.  Failures are not
+cached.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import TypeAdapter
+
+from ice_core.cache import LRUCache
+from ice_core.metrics import PLAN_CACHE_LOOKUPS
+from ice_core.models import NodeConfig
+from ice_core.unified_registry import registry
+from ice_core.utils.hashing import HashMode, compute_hash
+from ice_core.utils.singleflight import SingleFlight
+from ice_orchestrator.execution.cost_estimator import (
+    WorkflowCostEstimate,
+    WorkflowCostEstimator,
+)
+from ice_orchestrator.graph.dependency_graph import DependencyGraph
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ice_core.models.mcp import Blueprint
+    from ice_orchestrator.workflow import Workflow
+
+__all__ = [
+    "CompiledPlan",
+    "PlanCache",
+    "blueprint_hash",
+    "compile_blueprint",
+    "get_plan_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _content_hash(kind: str, payload: Any) -> str:
+    return compute_hash(
+        kind + ":" + json.dumps(payload, sort_keys=True, default=str),
+        HashMode.SECURITY,
+    )
+
+
+def blueprint_hash(blueprint: "Blueprint") -> str:
+    """Return the content hash of *blueprint* (its id excluded)."""
+
+    return _content_hash(
+        "blueprint", blueprint.model_dump(mode="json", exclude={"blueprint_id"})
+    )
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """Validated, blueprint-derived state shared by every run of it."""
+
+    key: str
+    nodes: Tuple[NodeConfig, ...]
+    graph: DependencyGraph
+    estimate: Optional[WorkflowCostEstimate] = None
+
+    def instantiate(self, **kwargs: Any) -> "Workflow":
+        """Return a fresh :class:`Workflow` for one run of this plan.
+
+        *kwargs* are passed to ``Workflow.__init__`` (name, chain_id, …).
+        """
+
+        from ice_orchestrator.workflow import Workflow
+
+        return Workflow(list(self.nodes), dependency_graph=self.graph.clone(), **kwargs)
+
+
+def _build(key: str, configs: List[NodeConfig]) -> CompiledPlan:
+    from ice_orchestrator.workflow import Workflow
+
+    nodes, graph = Workflow.prepare_nodes(configs)
+    estimate: Optional[WorkflowCostEstimate]
+    try:
+        estimate = WorkflowCostEstimator().estimate_workflow_cost(nodes)
+    except Exception:  # – estimator is advisory
+        estimate = None
+    return CompiledPlan(key=key, nodes=tuple(nodes), graph=graph, estimate=estimate)
+
+
+async def _validated_configs(blueprint: "Blueprint") -> List[NodeConfig]:
+    from ice_core.utils.node_conversion import convert_node_specs
+    from ice_core.validation.schema_validator import validate_blueprint
+
+    await validate_blueprint(blueprint)
+    blueprint.validate_runtime()
+    configs = convert_node_specs(blueprint.nodes)
+    for cfg in configs:
+        if hasattr(cfg, "runtime_validate"):
+            cfg.runtime_validate()  # type: ignore[attr-defined]
+    return configs
+
+
+async def _converted_configs(node_specs: Sequence[Any]) -> List[NodeConfig]:
+    from ice_core.utils.node_conversion import convert_node_specs
+
+    return convert_node_specs(list(node_specs))
+
+
+async def compile_blueprint(blueprint: "Blueprint") -> CompiledPlan:
+    """Validate *blueprint* and compile it (uncached)."""
+
+    return _build(blueprint_hash(blueprint), await _validated_configs(blueprint))
+
+
+class PlanCache:
+    """Process-local LRU of compiled plans with an optional Redis tier."""
+
+    _REDIS_COOLDOWN_SECONDS = 30.0
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        *,
+        redis_client: Any = None,
+        redis_url: Optional[str] = None,
+        prefix: str = "plan:",
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        self._local = LRUCache(
+            capacity
+            if capacity is not None
+            else int(os.getenv("ICE_PLAN_CACHE_SIZE", "256"))
+        )
+        self.prefix = prefix
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else int(os.getenv("ICE_PLAN_CACHE_TTL_SECONDS", str(7 * 86400)))
+        )
+        self._redis = redis_client
+        self._redis_url = redis_url
+        self._redis_down_until = 0.0
+        self._inflight: SingleFlight[CompiledPlan] = SingleFlight()
+        self._adapter: Optional[TypeAdapter[Any]] = None
+
+    # ------------------------------------------------------------------
+    # Redis tier (best-effort)
+    # ------------------------------------------------------------------
+    def _client(self) -> Any:
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None and self._redis_url:
+            try:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.from_url(
+                    self._redis_url,
+                    decode_responses=True,
+                    socket_timeout=0.25,
+                    socket_connect_timeout=0.25,
+                )
+            except Exception as exc:  # pragma: no cover – optional dep
+                logger.debug("Plan cache Redis tier unavailable: %s", exc)
+                self._redis_url = None
+        return self._redis
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.debug("Plan cache Redis tier error: %s", exc)
+        self._redis_down_until = time.monotonic() + self._REDIS_COOLDOWN_SECONDS
+
+    async def _load_remote(self, shared_key: str, key: str) -> Optional[CompiledPlan]:
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            raw = await client.get(self.prefix + shared_key)
+        except Exception as exc:
+            self._redis_failed(exc)
+            return None
+        if not raw:
+            return None
+        try:
+            if self._adapter is None:
+                self._adapter = TypeAdapter(NodeConfig)
+            configs = [self._adapter.validate_python(n) for n in json.loads(raw)]
+            return _build(key, configs)
+        except Exception as exc:
+            # Written by an incompatible version – recompile locally
+            logger.debug("Plan cache entry %s unusable: %s", key, exc)
+            return None
+
+    async def _store_remote(self, key: str, plan: CompiledPlan) -> None:
+        client = self._client()
+        if client is None:
+            return
+        try:
+            payload = json.dumps([n.model_dump(mode="json") for n in plan.nodes])
+        except Exception:
+            return  # e.g. pydantic model classes as schemas
+        try:
+            await client.set(self.prefix + key, payload, ex=self.ttl_seconds or None)
+        except Exception as exc:
+            self._redis_failed(exc)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def get_or_compile(self, blueprint: "Blueprint") -> CompiledPlan:
+        """Return the compiled plan for *blueprint*, compiling on a miss.
+
+        Raises whatever validation raises for an invalid blueprint.
+        """
+
+        return await self._get(
+            blueprint_hash(blueprint), lambda: _validated_configs(blueprint)
+        )
+
+    async def get_or_convert(self, node_specs: Sequence[Any]) -> CompiledPlan:
+        """Return the plan for raw *node_specs* (converted, not validated).
+
+        For callers that never ran blueprint validation, e.g. the executions
+        API, so caching does not make them stricter.
+        """
+
+        key = _content_hash(
+            "specs",
+            [
+                spec.model_dump(mode="json") if hasattr(spec, "model_dump") else spec
+                for spec in node_specs
+            ],
+        )
+        return await self._get(key, lambda: _converted_configs(node_specs))
+
+    async def _get(
+        self, content_key: str, configs: Callable[[], Awaitable[List[NodeConfig]]]
+    ) -> CompiledPlan:
+        key = f"{content_key}:g{registry.generation}"
+        plan = self._local.get(key)
+        if plan is not None:
+            PLAN_CACHE_LOOKUPS.labels("hit").inc()
+            return plan  # type: ignore[no-any-return]
+
+        async def _load() -> CompiledPlan:
+            shared_key = f"{content_key}:r{registry.content_hash()[:16]}"
+            remote = await self._load_remote(shared_key, key)
+            if remote is not None:
+                PLAN_CACHE_LOOKUPS.labels("remote").inc()
+                self._local.set(key, remote)
+                return remote
+            PLAN_CACHE_LOOKUPS.labels("miss").inc()
+            compiled = _build(key, await configs())
+            self._local.set(key, compiled)
+            await self._store_remote(shared_key, compiled)
+            return compiled
+
+        plan, _ = await self._inflight.do(key, _load)
+        return plan
+
+    def clear(self) -> None:
+        self._local.clear()
+
+
+_plan_cache: Optional[PlanCache] = None
+
+
+def get_plan_cache() -> PlanCache:
+    """Return the process-wide plan cache (Redis tier from env)."""
+
+    global _plan_cache  # pylint: disable=global-statement
+    if _plan_cache is None:
+        url = os.getenv("REDIS_URL")
+        if os.getenv("ICE_PLAN_CACHE_REDIS", "1").lower() in {"0", "false", "off"}:
+            url = None
+        _plan_cache = PlanCache(redis_url=url)
+    return _plan_cache
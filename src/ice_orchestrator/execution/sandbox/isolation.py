@@ -0,0 +1,298 @@
+"""Per-task resource isolation for sandboxed node execution.
+
+``setrlimit`` applies to the whole process, so limiting one node that way
+also limits every other node running concurrently on the same event loop.
+This module confines limits to the task itself:
+
+* :func:`run_isolated` executes a picklable callable in a short-lived child
+  interpreter.  The child applies CPU/address-space rlimits to itself before
+  running the task and reports its own resource usage back.
+* :class:`CgroupSlot` places a process in its own cgroup v2 (``memory.max``,
+  ``cpu.max``, ``pids.max``) when the host delegates a writable cgroup
+  subtree (``ICE_SANDBOX_CGROUP_ROOT``).  Usage is then read from the
+  cgroup, which also covers grandchildren and processes killed on timeout.
+
+Measured CPU seconds and peak RSS are recorded in ``SANDBOX_CPU_SECONDS``
+and ``SANDBOX_MAX_RSS_BYTES``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import struct
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+
+from ice_core.metrics import SANDBOX_CPU_SECONDS, SANDBOX_MAX_RSS_BYTES
+
+__all__ = [
+    "CgroupSlot",
+    "IsolatedTaskError",
+    "cgroup_root",
+    "record_usage",
+    "run_isolated",
+]
+
+logger = structlog.get_logger(__name__)
+
+_FRAME = struct.Struct(">I")
+
+# Child bootstrap: apply limits, read one pickled task from stdin, write one
+# pickled (ok, value, usage) tuple to stdout.  Kept dependency-free so the
+# child never imports more than the task itself needs.
+_CHILD_SOURCE = r"""
+import asyncio, inspect, os, pickle, resource, struct, sys, traceback
+
+frame = struct.Struct(">I")
+out = os.fdopen(os.dup(1), "wb")
+os.dup2(2, 1)
+
+def _limit(which, value):
+    # Never ask for more than the inherited hard limit: that would fail and
+    # leave the task with no limit at all
+    try:
+        _, hard = resource.getrlimit(which)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(which, (value, value))
+    except (ValueError, OSError):
+        pass
+
+mem_mb, cpu_s = int(sys.argv[1]), int(sys.argv[2])
+if mem_mb > 0:
+    _limit(resource.RLIMIT_AS, mem_mb * 1024 * 1024)
+if cpu_s > 0:
+    _limit(resource.RLIMIT_CPU, cpu_s)
+_limit(resource.RLIMIT_CORE, 0)
+
+header = sys.stdin.buffer.read(frame.size)
+(length,) = frame.unpack(header)
+fn, args, kwargs = pickle.loads(sys.stdin.buffer.read(length))
+try:
+    value = fn(*args, **kwargs)
+    if inspect.isawaitable(value):
+        async def _await(v):
+            return await v
+        value = asyncio.run(_await(value))
+    reply = (True, value)
+except BaseException as exc:
+    try:
+        pickle.dumps(exc)
+        err = exc
+    except Exception:
+        err = RuntimeError(f"{type(exc).__name__}: {exc}")
+    reply = (False, (err, traceback.format_exc()))
+usage = resource.getrusage(resource.RUSAGE_SELF)
+kids = resource.getrusage(resource.RUSAGE_CHILDREN)
+stats = {
+    "cpu_seconds": usage.ru_utime + usage.ru_stime + kids.ru_utime + kids.ru_stime,
+    "max_rss_bytes": max(usage.ru_maxrss, kids.ru_maxrss) * 1024,
+}
+body = pickle.dumps(reply + (stats,))
+out.write(frame.pack(len(body)) + body)
+out.flush()
+"""
+
+
+class IsolatedTaskError(RuntimeError):
+    """The isolated child died without reporting a result (e.g. a limit hit)."""
+
+
+def record_usage(cpu_seconds: Optional[float], max_rss_bytes: Optional[float]) -> None:
+    """Observe per-task usage in the sandbox metrics (never raises)."""
+
+    try:
+        if cpu_seconds is not None:
+            SANDBOX_CPU_SECONDS.observe(max(float(cpu_seconds), 0.0))
+        if max_rss_bytes:
+            SANDBOX_MAX_RSS_BYTES.observe(int(max_rss_bytes))
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# cgroup v2 ----------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+def cgroup_root() -> Optional[Path]:
+    """Return the delegated cgroup v2 directory to create task groups in.
+
+    Enabled only when ``ICE_SANDBOX_CGROUP_ROOT`` points at a writable
+    cgroup v2 directory (e.g. a systemd ``Delegate=yes`` slice).
+    """
+
+    raw = os.getenv("ICE_SANDBOX_CGROUP_ROOT")
+    if not raw:
+        return None
+    root = Path(raw)
+    if not (root / "cgroup.procs").exists() or not os.access(root, os.W_OK):
+        return None
+    return root
+
+
+class CgroupSlot:
+    """A throw-away cgroup v2 holding one sandboxed process (and its children)."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        memory_limit_mb: int,
+        cpu_limit_cores: float = 1.0,
+        pids_max: int = 64,
+        name: Optional[str] = None,
+    ) -> None:
+        self.path = root / (name or f"ice-task-{uuid.uuid4().hex[:12]}")
+        self.path.mkdir()
+        self._write("memory.max", str(memory_limit_mb * 1024 * 1024))
+        self._write("memory.swap.max", "0")
+        period = 100_000
+        self._write("cpu.max", f"{int(cpu_limit_cores * period)} {period}")
+        self._write("pids.max", str(pids_max))
+
+    def _write(self, name: str, value: str) -> None:
+        try:
+            (self.path / name).write_text(value)
+        except OSError:
+            # Controller not enabled for this subtree – skip that limit
+            logger.debug("cgroup control unavailable", file=name)
+
+    def attach(self, pid: int) -> None:
+        (self.path / "cgroup.procs").write_text(str(pid))
+
+    def usage(self) -> Dict[str, Optional[float]]:
+        cpu: Optional[float] = None
+        peak: Optional[float] = None
+        try:
+            for line in (self.path / "cpu.stat").read_text().splitlines():
+                key, _, value = line.partition(" ")
+                if key == "usage_usec":
+                    cpu = int(value) / 1_000_000
+        except OSError:
+            pass
+        try:
+            peak = int((self.path / "memory.peak").read_text().strip())
+        except (OSError, ValueError):
+            pass
+        return {"cpu_seconds": cpu, "max_rss_bytes": peak}
+
+    def remove(self) -> None:
+        try:
+            (self.path / "cgroup.kill").write_text("1")
+        except OSError:
+            pass
+        try:
+            self.path.rmdir()
+        except OSError:
+            logger.debug("cgroup not removed", path=str(self.path))
+
+
+# ---------------------------------------------------------------------------
+# Subprocess execution ------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+async def run_isolated(
+    fn: Callable[..., Any],
+    *args: Any,
+    timeout: float,
+    memory_limit_mb: int,
+    cpu_limit_seconds: int,
+    use_cgroup: bool = True,
+    **kwargs: Any,
+) -> Any:
+    """Run ``fn(*args, **kwargs)`` in a resource-limited child process.
+
+    *fn* and its arguments must be picklable; coroutine functions are run
+    with :func:`asyncio.run` in the child.  Exceptions raised by *fn* are
+    re-raised here.  Raises :class:`asyncio.TimeoutError` after *timeout*
+    seconds and :class:`IsolatedTaskError` if the child dies (e.g. killed
+    by ``RLIMIT_CPU``) without reporting.
+    """
+
+    payload = pickle.dumps((fn, args, kwargs))
+    root = cgroup_root() if use_cgroup else None
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        _CHILD_SOURCE,
+        str(memory_limit_mb),
+        str(cpu_limit_seconds),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env,
+    )
+    slot: Optional[CgroupSlot] = None
+    reported = False
+    try:
+        if root is not None:
+            try:
+                slot = CgroupSlot(root, memory_limit_mb=memory_limit_mb)
+                # The child blocks on stdin until the task is sent, so it is
+                # confined before running any user code.
+                slot.attach(proc.pid)
+            except OSError as exc:
+                logger.debug("cgroup isolation unavailable", error=str(exc))
+                if slot is not None:
+                    slot.remove()
+                slot = None
+
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(_FRAME.pack(len(payload)) + payload)
+        await proc.stdin.drain()
+        proc.stdin.close()
+
+        async def _read() -> bytes:
+            assert proc.stdout is not None
+            header = await proc.stdout.readexactly(_FRAME.size)
+            (length,) = _FRAME.unpack(header)
+            return await proc.stdout.readexactly(length)
+
+        try:
+            body = await asyncio.wait_for(_read(), timeout=timeout)
+        except asyncio.IncompleteReadError as exc:
+            await proc.wait()
+            raise IsolatedTaskError(
+                f"sandboxed task died (exit code {proc.returncode}); "
+                "resource limit exceeded?"
+            ) from exc
+        await proc.wait()
+
+        ok, value, stats = pickle.loads(body)
+        if slot is not None:
+            measured = slot.usage()
+            stats = {
+                key: measured[key] if measured.get(key) is not None else val
+                for key, val in stats.items()
+            }
+        record_usage(stats.get("cpu_seconds"), stats.get("max_rss_bytes"))
+        reported = True
+        if ok:
+            return value
+        raised, tb = value
+        logger.debug("sandboxed task raised", error=str(raised), traceback=tb)
+        raise raised
+    finally:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+        if slot is not None:
+            if not reported:
+                # Killed or crashed: the cgroup still knows what it consumed
+                measured = slot.usage()
+                record_usage(measured["cpu_seconds"], measured["max_rss_bytes"])
+            slot.remove()
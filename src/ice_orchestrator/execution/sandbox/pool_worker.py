@@ -0,0 +1,238 @@
+"""Sandbox worker process for :class:`SandboxWorkerPool`.
+
+Runs as ``python -I -c <this file>`` so it must only depend on the standard
+library.  The parent talks to it over stdin/stdout using length-prefixed
+frames (4-byte big-endian length + compact JSON):
+
+* request  – ``{"code", "context", "allowed", "cpu_seconds", "memory_mb"}``
+* response – ``{"ok": true, "output": {...}, "usage": {...}}`` or
+  ``{"ok": false, "error", "error_type", "recycle", "usage"}``
+
+Each task runs in a child forked from the warm worker, so it starts from
+copy-on-write copies of the preloaded modules: whatever it changes (say,
+monkeypatching ``json``) dies with the child and never reaches later tasks
+or the worker's own framing.  Anything user code prints goes to an
+in-memory buffer, and CPU and address-space limits are set as soft rlimits
+in the child only.
+"""
+
+import builtins
+import io
+import json
+import os
+import resource
+import signal
+import struct
+import sys
+import traceback
+from types import FrameType
+from typing import IO, Any, Dict, Iterable, Mapping, Optional, Sequence
+
+_FRAME = struct.Struct(">I")
+_DENIED_BUILTINS = {
+    "open",
+    "file",
+    "execfile",
+    "reload",
+    "eval",
+    "exec",
+    "compile",
+    "input",
+    "breakpoint",
+}
+
+
+class CpuLimitExceeded(Exception):
+    pass
+
+
+def _on_sigxcpu(signum: int, frame: Optional[FrameType]) -> None:
+    raise CpuLimitExceeded("CPU time limit exceeded")
+
+
+def _read_exact(stream: IO[bytes], size: int) -> Optional[bytes]:
+    buf = b""
+    while len(buf) < size:
+        chunk = stream.read(size - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return buf
+
+
+def _write_frame(stream: IO[bytes], payload: Dict[str, Any]) -> None:
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    stream.write(_FRAME.pack(len(body)) + body)
+    stream.flush()
+
+
+def _make_builtins(allowed: Iterable[str]) -> Dict[str, Any]:
+    safe = {k: v for k, v in vars(builtins).items() if k not in _DENIED_BUILTINS}
+    original_import = builtins.__import__
+    allowed_bases = {module.split(".")[0] for module in allowed}
+
+    def restricted_import(
+        name: str,
+        globals: Optional[Mapping[str, Any]] = None,
+        locals: Optional[Mapping[str, Any]] = None,
+        fromlist: Sequence[str] = (),
+        level: int = 0,
+    ) -> Any:
+        if name.split(".")[0] not in allowed_bases and not name.startswith("_"):
+            raise ImportError(f"Import of '{name}' is not allowed in sandbox")
+        return original_import(name, globals, locals, fromlist, level)
+
+    safe["__import__"] = restricted_import
+    return safe
+
+
+def _set_soft_limit(which: int, soft: int) -> None:
+    try:
+        _, hard = resource.getrlimit(which)
+        if hard != resource.RLIM_INFINITY and soft != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        elif hard != resource.RLIM_INFINITY:
+            soft = hard
+        resource.setrlimit(which, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _usage(started: float) -> Dict[str, float]:
+    # ru_maxrss is the worker's lifetime peak (KiB on Linux)
+    return {
+        "cpu_seconds": _cpu_seconds() - started,
+        "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def _run_task(request: Dict[str, Any]) -> Dict[str, Any]:
+    allowed = set(request.get("allowed") or [])
+    context = request.get("context") or {}
+    namespace: Dict[str, Any] = {
+        "__builtins__": _make_builtins(allowed),
+        "__name__": "__sandbox__",
+        "context": context,
+        "inputs": context,
+        "output": {},
+        "result": None,
+    }
+    for module in allowed:
+        try:
+            namespace[module.split(".")[0]] = __import__(module)
+        except ImportError:
+            pass
+
+    cpu_seconds = request.get("cpu_seconds")
+    memory_mb = request.get("memory_mb")
+    if cpu_seconds:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = usage.ru_utime + usage.ru_stime
+        _set_soft_limit(resource.RLIMIT_CPU, int(used + float(cpu_seconds)) + 1)
+    if memory_mb:
+        _set_soft_limit(resource.RLIMIT_AS, int(memory_mb) * 1024 * 1024)
+
+    captured = io.StringIO()
+    sys.stdout = captured
+    started = _cpu_seconds()
+    try:
+        exec(compile(request["code"], "<sandbox>", "exec"), namespace)
+        output = dict(namespace.get("output") or {})
+        output["result"] = namespace.get("result")
+        return {"ok": True, "output": output, "usage": _usage(started)}
+    except (CpuLimitExceeded, MemoryError) as exc:
+        return {
+            "ok": False,
+            "error": str(exc) or type(exc).__name__,
+            "error_type": type(exc).__name__,
+            "recycle": True,
+            "usage": _usage(started),
+        }
+    except BaseException as exc:  # noqa: BLE001 – report everything to parent
+        return {
+            "ok": False,
+            "error": str(exc),
+            "error_type": type(exc).__name__,
+            "traceback": traceback.format_exc(),
+            "usage": _usage(started),
+        }
+    finally:
+        sys.stdout = sys.__stdout__
+        _set_soft_limit(resource.RLIMIT_AS, resource.RLIM_INFINITY)
+        _set_soft_limit(resource.RLIMIT_CPU, resource.RLIM_INFINITY)
+
+
+def _describe_exit(status: int) -> str:
+    if os.WIFSIGNALED(status):
+        return f"killed by signal {os.WTERMSIG(status)}"
+    return f"exit status {os.WEXITSTATUS(status)}"
+
+
+def _run_forked(request: Dict[str, Any]) -> Dict[str, Any]:
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child: run the task and hand the response back
+        os.close(read_fd)
+        try:
+            body = json.dumps(
+                _run_task(request), separators=(",", ":"), default=str
+            ).encode("utf-8")
+            with os.fdopen(write_fd, "wb") as out:
+                out.write(body)
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as inp:
+        body = inp.read()
+    _, status = os.waitpid(pid, 0)
+    if not body:
+        # Killed before it could answer (hard rlimit, OOM killer, ...)
+        return {
+            "ok": False,
+            "error": f"sandbox task died ({_describe_exit(status)})",
+            "error_type": "SandboxTaskDied",
+            "usage": {},
+        }
+    response: Dict[str, Any] = json.loads(body)
+    return response
+
+
+def main() -> None:
+    # Keep a private handle on the protocol pipe and point fd 1 at stderr so
+    # stray writes from C extensions cannot interleave with frames.
+    proto_out = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    proto_in = sys.stdin.buffer
+
+    signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    try:
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    except (ValueError, OSError):
+        pass
+
+    # Warm the interpreter: import the modules sandboxed code may use.
+    for module in sys.argv[1:]:
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+    _write_frame(proto_out, {"ready": True, "pid": os.getpid()})
+
+    while True:
+        header = _read_exact(proto_in, _FRAME.size)
+        if header is None:
+            return
+        (length,) = _FRAME.unpack(header)
+        body = _read_exact(proto_in, length)
+        if body is None:
+            return
+        _write_frame(proto_out, _run_forked(json.loads(body)))
+
+
+if __name__ == "__main__":
+    main()
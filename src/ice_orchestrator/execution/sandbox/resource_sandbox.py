@@ -2,34 +2,29 @@ from __future__ import annotations
 
 """Cross-executor resource sandbox context manager.
 
-Applies:
-1. RLIMIT_AS (virtual memory cap) – always attempted; ignored on macOS.
-2. RLIMIT_CPU   – wall-clock cpu seconds cap.
-3. seccomp-bpf   – Linux only; falls back silently when `seccomp` python module missing.
-4. asyncio timeout – guaranteed coroutine cancel after *timeout_seconds*.
-
-This consolidates duplicated sandbox logic so every executor
-(tool, recursive, wasm, etc.) shares identical resource limits.
+Every executor (tool, recursive, wasm, etc.) shares the same limits, but
+how they are enforced depends on the isolation mode:
+
+* ``"none"`` (default) – pure asyncio nodes only get a timeout.  Nothing
+  process-wide is touched, so concurrent nodes never clobber each other's
+  limits.
+* ``"subprocess"`` – :meth:`ResourceSandbox.run_isolated` runs the task in
+  a child interpreter that applies RLIMIT_AS / RLIMIT_CPU to itself.
+* ``"cgroup"`` – like ``"subprocess"`` but the child is additionally
+  placed in its own cgroup v2 when ``ICE_SANDBOX_CGROUP_ROOT`` is set.
+
+The mode defaults to ``ICE_SANDBOX_ISOLATION``.  CPU seconds and peak RSS
+of isolated tasks are recorded in ``SANDBOX_CPU_SECONDS`` /
+``SANDBOX_MAX_RSS_BYTES``.
 """
 
 import asyncio
 import contextlib
 import os
-import platform
-import resource
 from types import TracebackType
-from typing import Optional, Type
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
 
-from ice_core.metrics import SANDBOX_CPU_SECONDS, SANDBOX_MAX_RSS_BYTES
-
-# Optional seccomp import (Linux only)
-try:
-    import seccomp  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover
-    seccomp = None  # type: ignore
-
-
-from typing import Awaitable, TypeVar
+from .isolation import run_isolated
 
 T = TypeVar("T")
 
@@ -38,6 +33,8 @@ DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_MEMORY_LIMIT_MB = 512
 DEFAULT_CPU_LIMIT_SECONDS = 10
 
+ISOLATION_MODES = ("none", "subprocess", "cgroup")
+
 
 class ResourceSandbox(contextlib.AbstractAsyncContextManager["ResourceSandbox"]):
     """Resource limiter for executor coroutines."""
@@ -48,33 +45,28 @@ class ResourceSandbox(contextlib.AbstractAsyncContextManager["ResourceSandbox"])
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
         memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
         cpu_limit_seconds: int = DEFAULT_CPU_LIMIT_SECONDS,
+        isolation: Optional[str] = None,
     ) -> None:
         self._timeout = timeout_seconds
-        self._mem_bytes = memory_limit_mb * 1024 * 1024
+        self._memory_limit_mb = memory_limit_mb
         self._cpu_seconds = cpu_limit_seconds
-        self._timeout_handle: Optional[asyncio.TimerHandle] = None
-        # Metrics snapshot
-        self._cpu_start: float | None = None
-        self._rss_start: int | None = None
-        # Original rlimits snapshot for restoration
-        self._orig_limits: dict[int, tuple[int, int]] = {}
+        mode = (isolation or os.getenv("ICE_SANDBOX_ISOLATION") or "none").lower()
+        if mode not in ISOLATION_MODES:
+            raise ValueError(
+                f"Unknown sandbox isolation {mode!r}; expected one of {ISOLATION_MODES}"
+            )
+        self.isolation = mode
+        self._deadline: Optional[asyncio.Timeout] = None
 
     # --------------------------------------------------------------
     # Async context management
     # --------------------------------------------------------------
 
     async def __aenter__(self) -> "ResourceSandbox":
-        loop = asyncio.get_running_loop()
-        # Schedule timeout cancellation.
-        self._timeout_handle = loop.call_later(self._timeout, self._cancel_current_task)
-
-        # Snapshot resource usage at entry for delta calculation
-        usage = resource.getrusage(resource.RUSAGE_SELF)
-        self._cpu_start = usage.ru_utime + usage.ru_stime
-        self._rss_start = usage.ru_maxrss
-
-        self._apply_rlimits()
-        self._apply_seccomp()
+        # Bound the body of the ``async with`` block; only the entering task
+        # is affected, never the rest of the process.
+        self._deadline = asyncio.timeout(self._timeout)
+        await self._deadline.__aenter__()
         return self
 
     async def __aexit__(
@@ -83,114 +75,44 @@ class ResourceSandbox(contextlib.AbstractAsyncContextManager["ResourceSandbox"])
         exc: Optional[BaseException],
         tb: Optional[TracebackType],
     ) -> bool:  # noqa: D401 – returns False to propagate exceptions
-        if self._timeout_handle:
-            self._timeout_handle.cancel()
-
-        # Record resource usage metrics if snapshot available
-        try:
-            usage = resource.getrusage(resource.RUSAGE_SELF)
-            cpu_end = usage.ru_utime + usage.ru_stime
-            rss_end = usage.ru_maxrss
-            if self._cpu_start is not None:
-                SANDBOX_CPU_SECONDS.observe(max(cpu_end - self._cpu_start, 0.0))
-            if self._rss_start is not None:
-                # ru_maxrss is kilobytes on Linux, bytes on macOS/BSD.
-                rss_bytes = (
-                    rss_end * 1024 if resource.getpagesize() == 4096 else rss_end
-                )
-                # ru_maxrss is already cumulative (peak), so take end value.
-                SANDBOX_MAX_RSS_BYTES.observe(rss_bytes)
-        except Exception:
-            # Metrics must never break sandbox teardown.
-            pass
-
-        # Restore original rlimits to avoid leaking constraints to other threads
-        try:
-            for res, limits in self._orig_limits.items():
-                try:
-                    resource.setrlimit(res, limits)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
+        if self._deadline is not None:
+            deadline, self._deadline = self._deadline, None
+            await deadline.__aexit__(exc_type, exc, tb)
         # Propagate exceptions (do not suppress)
         return False
 
     # --------------------------------------------------------------
-    # Public helper
+    # Public helpers
     # --------------------------------------------------------------
 
     async def run_with_timeout(self, coro: Awaitable[T]) -> T:
         """Run *coro* ensuring overall timeout."""
         return await asyncio.wait_for(coro, timeout=self._timeout)
 
-    # --------------------------------------------------------------
-    # Internal helpers
-    # --------------------------------------------------------------
-
-    def _cancel_current_task(self) -> None:  # pragma: no cover
-        task = asyncio.current_task()
-        if task and not task.done():
-            task.cancel()
-
-    def _apply_rlimits(self) -> None:
-        # RLIMIT_AS (virtual memory)
-        try:
-            self._orig_limits[resource.RLIMIT_AS] = resource.getrlimit(
-                resource.RLIMIT_AS
-            )
-            resource.setrlimit(resource.RLIMIT_AS, (self._mem_bytes, self._mem_bytes))
-        except (ValueError, OSError):
-            # macOS typically raises; ignore.
-            pass
-        # RLIMIT_CPU
-        try:
-            self._orig_limits[resource.RLIMIT_CPU] = resource.getrlimit(
-                resource.RLIMIT_CPU
-            )
-            resource.setrlimit(
-                resource.RLIMIT_CPU, (self._cpu_seconds, self._cpu_seconds)
-            )
-        except (ValueError, OSError):
-            pass
-        # Disable core dumps
-        try:
-            self._orig_limits[resource.RLIMIT_CORE] = resource.getrlimit(
-                resource.RLIMIT_CORE
-            )
-            resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
-        except (ValueError, OSError):
-            pass
-
-    def _apply_seccomp(self) -> None:  # pragma: linux-only
-        # Allow disabling seccomp in test/CI environments where thread creation is required
-        if (
-            os.getenv("ICE_DISABLE_SECCOMP", "0") == "1"
-            or os.getenv("ICE_SKIP_STRESS", "0") == "1"
-        ):
-            return
-        if platform.system() != "Linux" or seccomp is None:
-            return  # no-op on non-Linux or missing module
-        # Allow basic syscalls only (whitelist)
-        filt = seccomp.SyscallFilter(defaction=seccomp.KILL)
-        allowed = [
-            "read",
-            "write",
-            "exit",
-            "exit_group",
-            "clock_gettime",
-            "getpid",
-            "futex",
-            "nanosleep",
-            # Allow thread/process creation for runtime components and clean shutdown
-            "clone",
-            "set_robust_list",
-            "set_tid_address",
-        ]
-        for name in allowed:
-            try:
-                filt.add_rule(seccomp.ALLOW, name)
-            except Exception:
-                pass
-        filt.load()
+    async def run_isolated(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` under this sandbox's per-task limits.
+
+        With isolation ``"none"`` the callable runs in-process (awaited if it
+        returns an awaitable) with only the timeout applied.  Otherwise it
+        must be picklable and runs in a resource-limited child process.
+        """
+        if self.isolation == "none":
+
+            async def _inline() -> Any:
+                value = fn(*args, **kwargs)
+                if asyncio.iscoroutine(value) or isinstance(value, asyncio.Future):
+                    value = await value
+                return value
+
+            return await self.run_with_timeout(_inline())
+        return await run_isolated(
+            fn,
+            *args,
+            timeout=self._timeout,
+            memory_limit_mb=self._memory_limit_mb,
+            cpu_limit_seconds=self._cpu_seconds,
+            use_cgroup=self.isolation == "cgroup",
+            **kwargs,
+        )
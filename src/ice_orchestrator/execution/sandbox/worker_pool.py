@@ -0,0 +1,301 @@
+"""Pool of pre-warmed sandbox worker processes.
+
+Spawning ``python script.py`` per code execution costs a full interpreter
+start-up (50–100 ms) and, when done with :func:`subprocess.run`, blocks the
+event loop for every concurrent workflow in the process.  The pool keeps a
+small number of isolated (``python -I``) interpreters alive with the allowed
+standard-library modules already imported and dispatches tasks to them over
+length-prefixed JSON frames using asyncio pipes.
+
+Per-task limits:
+
+* CPU seconds and address space – applied via soft rlimits in the child
+  the worker forks for each task (see :mod:`pool_worker`); with
+  ``ICE_SANDBOX_CGROUP_ROOT`` each worker also gets its own cgroup v2.
+* Wall-clock timeout – enforced here; the worker's process group (task
+  included) is killed and the worker replaced.
+
+Because every task runs in a fresh fork of the warm worker, module state
+changed by user code never reaches the next task.  Workers are still
+recycled after ``max_tasks_per_worker`` tasks to bound their own growth.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+
+from .isolation import CgroupSlot, cgroup_root, record_usage
+from .resource_sandbox import DEFAULT_CPU_LIMIT_SECONDS, DEFAULT_MEMORY_LIMIT_MB
+
+__all__ = [
+    "SandboxPoolError",
+    "SandboxWorkerPool",
+    "get_sandbox_pool",
+]
+
+logger = structlog.get_logger(__name__)
+
+_FRAME = struct.Struct(">I")
+_WORKER_SOURCE = (Path(__file__).with_name("pool_worker.py")).read_text("utf-8")
+
+DEFAULT_PRELOAD = (
+    "json",
+    "math",
+    "datetime",
+    "re",
+    "urllib.parse",
+    "base64",
+    "hashlib",
+    "uuid",
+    "random",
+    "string",
+    "time",
+    "collections",
+    "itertools",
+    "functools",
+    "operator",
+)
+
+
+class SandboxPoolError(RuntimeError):
+    """Raised when a sandbox worker dies or breaks the frame protocol."""
+
+
+@dataclass
+class _Worker:
+    proc: asyncio.subprocess.Process
+    tasks: int = 0
+    cgroup: Optional[CgroupSlot] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+    async def send(self, payload: Dict[str, Any]) -> None:
+        assert self.proc.stdin is not None
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        self.proc.stdin.write(_FRAME.pack(len(body)) + body)
+        await self.proc.stdin.drain()
+
+    async def receive(self) -> Dict[str, Any]:
+        assert self.proc.stdout is not None
+        try:
+            header = await self.proc.stdout.readexactly(_FRAME.size)
+            (length,) = _FRAME.unpack(header)
+            body = await self.proc.stdout.readexactly(length)
+        except asyncio.IncompleteReadError as exc:
+            raise SandboxPoolError("sandbox worker exited unexpectedly") from exc
+        return dict(json.loads(body))
+
+    def kill(self) -> None:
+        if self.alive:
+            try:
+                # The worker leads its own session: take the task child too
+                os.killpg(self.proc.pid, signal.SIGKILL)
+            except ProcessLookupError:  # pragma: no cover – already gone
+                pass
+        if self.cgroup is not None:
+            self.cgroup.remove()
+            self.cgroup = None
+
+
+class SandboxWorkerPool:
+    """Fixed-size pool of warm, resource-limited Python worker processes."""
+
+    def __init__(
+        self,
+        *,
+        size: Optional[int] = None,
+        max_tasks_per_worker: Optional[int] = None,
+        preload: Iterable[str] = DEFAULT_PRELOAD,
+        cpu_limit_seconds: int = DEFAULT_CPU_LIMIT_SECONDS,
+        memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+    ) -> None:
+        self.size = size or int(
+            os.getenv("ICE_SANDBOX_POOL_SIZE", str(min(4, os.cpu_count() or 1)))
+        )
+        self.max_tasks_per_worker = max_tasks_per_worker or int(
+            os.getenv("ICE_SANDBOX_POOL_MAX_TASKS", "100")
+        )
+        self.preload: List[str] = list(preload)
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self.memory_limit_mb = memory_limit_mb
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle: Optional[asyncio.Queue[_Worker]] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._workers: List[_Worker] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # Pipes belong to the loop that created them; start over on a new one.
+        for worker in self._workers:
+            worker.kill()
+        self._workers = []
+        self._loop = loop
+        self._idle = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def _spawn(self) -> _Worker:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-I",
+            "-c",
+            _WORKER_SOURCE,
+            *self.preload,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        worker = _Worker(proc)
+        root = cgroup_root()
+        if root is not None:
+            # One cgroup per worker: hard memory cap and CPU accounting that
+            # also covers anything the task forks.
+            try:
+                worker.cgroup = CgroupSlot(
+                    root,
+                    memory_limit_mb=self.memory_limit_mb,
+                    name=f"ice-sandbox-{proc.pid}",
+                )
+                worker.cgroup.attach(proc.pid)
+            except OSError as exc:
+                logger.debug("sandbox worker cgroup unavailable", error=str(exc))
+        try:
+            hello = await asyncio.wait_for(worker.receive(), timeout=10)
+        except BaseException:
+            worker.kill()
+            raise
+        if not hello.get("ready"):
+            worker.kill()
+            raise SandboxPoolError("sandbox worker failed to start")
+        self._workers.append(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.kill()
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+    async def start(self) -> None:
+        """Pre-spawn every worker so the first tasks skip start-up cost."""
+
+        self._bind_loop()
+        assert self._idle is not None
+        missing = self.size - len(self._workers)
+        if missing > 0:
+            for worker in await asyncio.gather(
+                *(self._spawn() for _ in range(missing))
+            ):
+                self._idle.put_nowait(worker)
+
+    async def close(self) -> None:
+        """Terminate all workers."""
+
+        for worker in list(self._workers):
+            self._retire(worker)
+            try:
+                await worker.proc.wait()
+            except Exception:  # pragma: no cover – best effort
+                pass
+
+    @property
+    def worker_pids(self) -> List[int]:
+        return [w.proc.pid for w in self._workers if w.alive]
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+    async def _acquire(self) -> _Worker:
+        assert self._idle is not None
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker.alive:
+                return worker
+            self._retire(worker)
+        return await self._spawn()
+
+    def _release(self, worker: _Worker, *, recycle: bool) -> None:
+        assert self._idle is not None
+        worker.tasks += 1
+        if recycle or not worker.alive or worker.tasks >= self.max_tasks_per_worker:
+            self._retire(worker)
+        else:
+            self._idle.put_nowait(worker)
+
+    async def run(
+        self,
+        code: str,
+        context: Dict[str, Any],
+        *,
+        allowed_imports: Iterable[str] = (),
+        timeout: float = 10.0,
+        cpu_limit_seconds: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Execute *code* in a warm worker and return the worker's response.
+
+        The response is ``{"ok": True, "output": {...}}`` on success or
+        ``{"ok": False, "error": ..., "error_type": ...}`` when user code
+        raised.  Raises :class:`asyncio.TimeoutError` when *timeout* elapses
+        and :class:`SandboxPoolError` if the worker crashed.
+        """
+
+        self._bind_loop()
+        assert self._slots is not None
+        request = {
+            "code": code,
+            "context": context,
+            "allowed": sorted(set(allowed_imports)),
+            "cpu_seconds": cpu_limit_seconds or self.cpu_limit_seconds,
+            "memory_mb": memory_limit_mb or self.memory_limit_mb,
+        }
+        async with self._slots:
+            worker = await self._acquire()
+            try:
+                await worker.send(request)
+                response = await asyncio.wait_for(worker.receive(), timeout=timeout)
+            except BaseException:
+                # Timed out, cancelled or crashed mid-task: the worker's state
+                # is unknown, so never hand it to another task.
+                self._retire(worker)
+                raise
+            usage = response.pop("usage", None) or {}
+            record_usage(usage.get("cpu_seconds"), usage.get("max_rss_bytes"))
+            self._release(worker, recycle=bool(response.get("recycle")))
+            return response
+
+
+_pool: Optional[SandboxWorkerPool] = None
+
+
+def get_sandbox_pool() -> SandboxWorkerPool:
+    """Return the process-wide sandbox worker pool (created lazily)."""
+
+    global _pool  # pylint: disable=global-statement
+    if _pool is None:
+        _pool = SandboxWorkerPool(
+            cpu_limit_seconds=int(
+                os.getenv("ICE_SANDBOX_CODE_CPU_SECONDS", DEFAULT_CPU_LIMIT_SECONDS)
+            ),
+            memory_limit_mb=int(
+                os.getenv("ICE_SANDBOX_CODE_MEMORY_MB", DEFAULT_MEMORY_LIMIT_MB)
+            ),
+        )
+    return _pool
@@ -0,0 +1,259 @@
+"""Critical-path priority scheduling for ready nodes.
+
+Within a level every node is ready at once, and with ``max_parallel`` capping
+concurrency the order in which nodes claim a slot decides the makespan.
+The ``critical_path`` policy starts nodes by descending *upward rank*
+(HEFT): a node's expected latency plus the longest expected chain of work
+that still depends on it.  Long-tail nodes therefore start first instead of
+queueing behind quick ones.
+
+Expected latencies come from :class:`NodeLatencyStore`, an exponentially
+weighted moving average per ``(blueprint, node)`` that survives across runs.
+The blueprint is identified by :func:`blueprint_key`, a content hash of its
+node configs, so unrelated workflows that share a name (or have none) never
+mix histories and an edited blueprint starts afresh:
+
+* an in-process tier (always on), and
+* a Redis hash per blueprint shared by every worker, enabled when
+  ``REDIS_URL`` is set (``ICE_NODE_LATENCY_REDIS=0`` turns it off).  Redis
+  errors are never fatal – the tier is skipped for a short cooldown.
+
+Nodes without history fall back to the
+:attr:`WorkflowCostEstimator.DURATION_ESTIMATES` prior for their type.
+``ICE_SCHEDULER_POLICY=fifo`` restores plain list order.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+from ice_core.utils.hashing import HashMode, compute_hash
+from ice_orchestrator.execution.cost_estimator import WorkflowCostEstimator
+
+__all__ = [
+    "CriticalPathScheduler",
+    "NodeLatencyStore",
+    "blueprint_key",
+    "get_latency_store",
+    "upward_ranks",
+]
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PRIOR_SECONDS = 1.0
+
+
+def blueprint_key(nodes: Iterable[Any]) -> str:
+    """Return the content hash of *nodes* that keys their latency history.
+
+    Node ``metadata`` (timestamps and the like) is not part of the content.
+    """
+
+    payload = sorted(
+        (
+            (
+                node.model_dump(exclude={"metadata"}, exclude_none=True)
+                if hasattr(node, "model_dump")
+                else node
+            )
+            for node in nodes
+        ),
+        key=lambda n: str(n.get("id", "") if isinstance(n, dict) else n),
+    )
+    return compute_hash(
+        json.dumps(payload, sort_keys=True, default=str), HashMode.PERFORMANCE
+    )
+
+
+def upward_ranks(graph: nx.DiGraph, weights: Dict[str, float]) -> Dict[str, float]:
+    """Return the HEFT upward rank of every node in *graph*.
+
+    ``rank(n) = weight(n) + max(rank(s) for s in successors(n))``.  Graphs
+    with (recursive-flow) cycles fall back to the node's own weight.
+    """
+
+    try:
+        order = list(nx.topological_sort(graph))
+    except nx.NetworkXUnfeasible:
+        return {str(n): weights.get(str(n), 0.0) for n in graph.nodes}
+
+    ranks: Dict[str, float] = {}
+    for node in reversed(order):
+        tail = max((ranks[str(s)] for s in graph.successors(node)), default=0.0)
+        ranks[str(node)] = weights.get(str(node), 0.0) + tail
+    return ranks
+
+
+class NodeLatencyStore:
+    """EWMA of node latencies per blueprint, process-local plus optional Redis."""
+
+    ALPHA = 0.3
+    _REDIS_COOLDOWN_SECONDS = 30.0
+
+    def __init__(
+        self,
+        *,
+        redis_client: Any = None,
+        redis_url: Optional[str] = None,
+        prefix: str = "node_latency:",
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        self.prefix = prefix
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else int(os.getenv("ICE_NODE_LATENCY_TTL_SECONDS", str(30 * 86400)))
+        )
+        # blueprint -> node -> (ewma seconds, samples)
+        self._local: Dict[str, Dict[str, Tuple[float, int]]] = {}
+        self._redis = redis_client
+        self._redis_url = redis_url
+        self._redis_down_until = 0.0
+
+    # ------------------------------------------------------------------
+    # Redis tier (best-effort)
+    # ------------------------------------------------------------------
+    def _client(self) -> Any:
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None and self._redis_url:
+            try:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.from_url(
+                    self._redis_url,
+                    decode_responses=True,
+                    socket_timeout=0.25,
+                    socket_connect_timeout=0.25,
+                )
+            except Exception as exc:  # pragma: no cover – optional dep
+                logger.debug("Node latency Redis tier unavailable: %s", exc)
+                self._redis_url = None
+        return self._redis
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.debug("Node latency Redis tier error: %s", exc)
+        self._redis_down_until = time.monotonic() + self._REDIS_COOLDOWN_SECONDS
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def load(self, blueprint: str) -> Dict[str, float]:
+        """Return ``{node_id: expected seconds}`` known for *blueprint*."""
+
+        local = self._local.setdefault(blueprint, {})
+        client = self._client()
+        if client is not None:
+            try:
+                remote = await client.hgetall(self.prefix + blueprint)
+            except Exception as exc:
+                self._redis_failed(exc)
+                remote = {}
+            for node_id, raw in (remote or {}).items():
+                try:
+                    ewma, samples = json.loads(raw)
+                except (TypeError, ValueError):
+                    continue
+                # Other workers may have seen more runs than we have
+                if samples >= local.get(node_id, (0.0, 0))[1]:
+                    local[node_id] = (float(ewma), int(samples))
+        return {node_id: ewma for node_id, (ewma, _) in local.items()}
+
+    async def record(self, blueprint: str, node_id: str, seconds: float) -> None:
+        """Fold one observed latency into the moving average."""
+
+        local = self._local.setdefault(blueprint, {})
+        previous = local.get(node_id)
+        if previous is None:
+            entry = (float(seconds), 1)
+        else:
+            ewma, samples = previous
+            entry = (ewma + self.ALPHA * (seconds - ewma), samples + 1)
+        local[node_id] = entry
+
+        client = self._client()
+        if client is None:
+            return
+        key = self.prefix + blueprint
+        try:
+            # Last writer wins across workers; losing a sample is harmless
+            await client.hset(key, node_id, json.dumps(entry))
+            if self.ttl_seconds > 0:
+                await client.expire(key, self.ttl_seconds)
+        except Exception as exc:
+            self._redis_failed(exc)
+
+
+_latency_store: Optional[NodeLatencyStore] = None
+
+
+def get_latency_store() -> NodeLatencyStore:
+    """Return the process-wide latency store (Redis tier from env)."""
+
+    global _latency_store  # pylint: disable=global-statement
+    if _latency_store is None:
+        url = os.getenv("REDIS_URL")
+        if os.getenv("ICE_NODE_LATENCY_REDIS", "1").lower() in {"0", "false", "off"}:
+            url = None
+        _latency_store = NodeLatencyStore(redis_url=url)
+    return _latency_store
+
+
+class CriticalPathScheduler:
+    """Orders ready nodes of one workflow by upward rank."""
+
+    def __init__(
+        self,
+        blueprint: str,
+        graph: nx.DiGraph,
+        nodes: Dict[str, Any],
+        *,
+        store: Optional[NodeLatencyStore] = None,
+        policy: Optional[str] = None,
+    ) -> None:
+        self.blueprint = blueprint
+        self.policy = (
+            policy or os.getenv("ICE_SCHEDULER_POLICY") or "critical_path"
+        ).lower()
+        self._graph = graph
+        self._nodes = nodes
+        self._store = store or get_latency_store()
+        self.expected: Dict[str, float] = {}
+        self.ranks: Dict[str, float] = {}
+
+    @staticmethod
+    def prior(node: Any) -> float:
+        node_type = str(getattr(node, "type", "") or "")
+        return float(
+            WorkflowCostEstimator.DURATION_ESTIMATES.get(node_type, {}).get(
+                "avg", _DEFAULT_PRIOR_SECONDS
+            )
+        )
+
+    async def prepare(self) -> None:
+        """Load latency history and compute ranks before the run starts."""
+
+        if self.policy != "critical_path":
+            return
+        observed = await self._store.load(self.blueprint)
+        self.expected = {
+            node_id: observed.get(node_id, self.prior(node))
+            for node_id, node in self._nodes.items()
+        }
+        self.ranks = upward_ranks(self._graph, self.expected)
+
+    def order(self, ready: Sequence[Any]) -> List[Any]:
+        """Return *ready* nodes in start order (stable for equal ranks)."""
+
+        if self.policy != "critical_path" or not self.ranks:
+            return list(ready)
+        return sorted(ready, key=lambda n: -self.ranks.get(str(n.id), 0.0))
+
+    async def observe(self, node_id: str, seconds: float) -> None:
+        await self._store.record(self.blueprint, node_id, seconds)
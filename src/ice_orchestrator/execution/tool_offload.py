@@ -0,0 +1,345 @@
+"""Offload tool execution from the event loop.
+
+Node executors share the asyncio loop that also serves the API, so a tool
+doing CPU-heavy work (parsing, aggregation, repository scans) stalls every
+other run in the process.  Tools declare where they should run through
+:attr:`ToolBase.execution_mode`:
+
+* ``"async"``   – awaited on the loop (default, right for network-bound tools)
+* ``"process"`` – dispatched to a shared :class:`ProcessPoolExecutor` so
+  CPU-bound work scales with cores
+* ``"thread"``  – run on a dedicated thread pool for tools that block on I/O
+
+``ICE_TOOL_EXECUTION_MODES="name=mode,..."`` overrides the declaration per
+deployment.
+
+Large arguments and results do not travel through the pool's pipe.  Raw
+buffers in a payload (``bytes``, ``bytearray``, ``memoryview``, and anything
+else pickling out-of-band under protocol 5, such as numpy arrays) are not
+pickled: they are copied once, straight from their own memory, into a
+:class:`multiprocessing.shared_memory.SharedMemory` block next to a small
+pickled skeleton of the rest, and only the block name crosses the process
+boundary.  The receiver copies each buffer out of the block (so the block
+can be unlinked).  This happens once buffers plus skeleton exceed
+``ICE_TOOL_SHM_THRESHOLD_BYTES``.  Payloads without raw buffers (a large
+list of dicts, say) are still pickled, and then copied into the block.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from ice_core.metrics import (
+    TOOL_POOL_IN_FLIGHT,
+    TOOL_POOL_QUEUE_DEPTH,
+    TOOL_POOL_WAIT_SECONDS,
+)
+
+__all__ = [
+    "dispatch_tool",
+    "resolve_execution_mode",
+    "shutdown_tool_pools",
+]
+
+logger = logging.getLogger(__name__)
+
+_MODES = {"async", "process", "thread"}
+
+# A payload is either ("inline", skeleton, [(buffer, readonly), ...]) or
+# ("shm", block_name, skeleton_size, [(buffer_size, readonly), ...]).
+_Payload = Tuple[Any, ...]
+
+# Smaller bytes-like values are simply pickled in-band
+_OUT_OF_BAND_MIN_BYTES = 4096
+
+
+def _shm_threshold() -> int:
+    return int(os.getenv("ICE_TOOL_SHM_THRESHOLD_BYTES", str(256 * 1024)))
+
+
+def _wrap_buffers(obj: Any) -> Any:
+    """Mark large bytes-like values (in nested dicts/lists) as out-of-band."""
+
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        if isinstance(obj, memoryview) and not obj.contiguous:
+            obj = obj.tobytes()
+        if len(obj) >= _OUT_OF_BAND_MIN_BYTES:
+            return pickle.PickleBuffer(obj)
+        return obj.tobytes() if isinstance(obj, memoryview) else obj
+    if isinstance(obj, dict):
+        return {k: _wrap_buffers(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_wrap_buffers(v) for v in obj]
+    if type(obj) is tuple:  # namedtuples keep their type
+        return tuple(_wrap_buffers(v) for v in obj)
+    return obj
+
+
+def _pack(obj: Any) -> _Payload:
+    buffers: List[pickle.PickleBuffer] = []
+    skeleton = pickle.dumps(
+        _wrap_buffers(obj), protocol=5, buffer_callback=buffers.append
+    )
+    raws = [buf.raw() for buf in buffers]
+    total = len(skeleton) + sum(raw.nbytes for raw in raws)
+    if total < _shm_threshold():
+        return ("inline", skeleton, [(raw.tobytes(), raw.readonly) for raw in raws])
+    block = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    try:
+        buf = block.buf
+        assert buf is not None
+        pos = len(skeleton)
+        buf[:pos] = skeleton
+        for raw in raws:
+            buf[pos : pos + raw.nbytes] = raw
+            pos += raw.nbytes
+        layout = [(raw.nbytes, raw.readonly) for raw in raws]
+        return ("shm", block.name, len(skeleton), layout)
+    finally:
+        for raw in raws:
+            raw.release()
+        block.close()
+
+
+def _unpack(payload: _Payload, *, unlink: bool) -> Any:
+    if payload[0] == "inline":
+        _, skeleton, inline = payload
+        return pickle.loads(
+            skeleton,
+            buffers=[
+                data if readonly else bytearray(data) for data, readonly in inline
+            ],
+        )
+    _, name, skeleton_size, layout = payload
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        buf = block.buf
+        assert buf is not None
+        skeleton = bytes(buf[:skeleton_size])
+        buffers: List[Any] = []
+        pos = skeleton_size
+        for size, readonly in layout:
+            chunk = buf[pos : pos + size]
+            buffers.append(bytes(chunk) if readonly else bytearray(chunk))
+            chunk.release()
+            pos += size
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+    return pickle.loads(skeleton, buffers=buffers)
+
+
+def _release(payload: _Payload) -> None:
+    if payload[0] != "shm":
+        return
+    try:
+        block = shared_memory.SharedMemory(name=payload[1])
+        block.close()
+        block.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _release_abandoned(
+    payload: _Payload,
+    future: "concurrent.futures.Future[Tuple[float, _Payload]]",
+) -> None:
+    """Free the blocks of a call whose caller went away (cancel, timeout)."""
+
+    _release(payload)
+    if not future.cancelled() and future.exception() is None:
+        _release(future.result()[1])
+
+
+def _run_tool_sync(tool: Any, inputs: Dict[str, Any]) -> Any:
+    return asyncio.run(tool.execute(**inputs))
+
+
+def _process_entry(
+    tool: Any, payload: _Payload, submitted_at: float
+) -> Tuple[float, _Payload]:
+    """Worker-side entry point: unpack inputs, run the tool, pack the result.
+
+    Shared-memory blocks are always unlinked by the parent, which keeps the
+    (shared) resource tracker's bookkeeping balanced.
+    """
+    started_at = time.time()
+    inputs = _unpack(payload, unlink=False)
+    return started_at, _pack(_run_tool_sync(tool, inputs))
+
+
+# ---------------------------------------------------------------------------
+# Pools -----------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+class _Pool:
+    """Lazily created executor plus queue accounting."""
+
+    def __init__(self, label: str, workers: int) -> None:
+        self.label = label
+        self.workers = max(1, workers)
+        self._executor: Optional[Executor] = None
+        self._outstanding = 0
+        self._lock = threading.Lock()
+
+    def _create(self) -> Executor:
+        if self.label == "process":
+            method = os.getenv("ICE_TOOL_POOL_START_METHOD", "spawn")
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ice-tool"
+        )
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create()
+            return self._executor
+
+    def reset(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _publish(self) -> None:
+        running = min(self._outstanding, self.workers)
+        TOOL_POOL_IN_FLIGHT.labels(pool=self.label).set(running)
+        TOOL_POOL_QUEUE_DEPTH.labels(pool=self.label).set(
+            max(self._outstanding - self.workers, 0)
+        )
+
+    def enter(self) -> None:
+        with self._lock:
+            self._outstanding += 1
+            self._publish()
+
+    def leave(self) -> None:
+        with self._lock:
+            self._outstanding -= 1
+            self._publish()
+
+
+_process_pool = _Pool(
+    "process", int(os.getenv("ICE_TOOL_PROCESS_POOL_SIZE", str(os.cpu_count() or 1)))
+)
+_thread_pool = _Pool("thread", int(os.getenv("ICE_TOOL_THREAD_POOL_SIZE", "8")))
+
+
+def shutdown_tool_pools() -> None:
+    """Stop the shared pools (they are recreated on next use)."""
+
+    _process_pool.reset()
+    _thread_pool.reset()
+
+
+def _mode_overrides() -> Dict[str, str]:
+    raw = os.getenv("ICE_TOOL_EXECUTION_MODES", "")
+    overrides: Dict[str, str] = {}
+    for item in raw.split(","):
+        name, _, mode = item.partition("=")
+        if name.strip() and mode.strip() in _MODES:
+            overrides[name.strip()] = mode.strip()
+    return overrides
+
+
+def resolve_execution_mode(tool: Any) -> str:
+    """Return ``"async"``, ``"process"`` or ``"thread"`` for *tool*."""
+
+    name = str(getattr(tool, "name", "") or "")
+    mode = _mode_overrides().get(name) or getattr(tool, "execution_mode", "async")
+    return mode if mode in _MODES else "async"
+
+
+# ---------------------------------------------------------------------------
+# Dispatch --------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+
+
+async def _run_in_threads(tool: Any, inputs: Dict[str, Any]) -> Any:
+    pool = _thread_pool
+    submitted_at = time.time()
+
+    def _call() -> Any:
+        TOOL_POOL_WAIT_SECONDS.labels(pool=pool.label).observe(
+            time.time() - submitted_at
+        )
+        return _run_tool_sync(tool, inputs)
+
+    pool.enter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool.executor, _call)
+    finally:
+        pool.leave()
+
+
+async def _run_in_processes(tool: Any, inputs: Dict[str, Any]) -> Any:
+    pool = _process_pool
+    try:
+        pickle.dumps(tool)
+        payload = _pack(inputs)
+    except Exception as exc:
+        # Live handles (memory backends, clients) in the tool or its inputs
+        # cannot cross a process boundary.
+        logger.warning(
+            "Tool %s cannot be sent to the process pool (%s); using threads",
+            getattr(tool, "name", type(tool).__name__),
+            exc,
+        )
+        return await _run_in_threads(tool, inputs)
+
+    submitted_at = time.time()
+    abandoned = False
+    pool.enter()
+    try:
+        future = pool.executor.submit(_process_entry, tool, payload, submitted_at)
+        try:
+            started_at, result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # The worker may still be reading the inputs and will leave a
+            # result block behind: free both once it is done.
+            abandoned = True
+            future.add_done_callback(functools.partial(_release_abandoned, payload))
+            raise
+        TOOL_POOL_WAIT_SECONDS.labels(pool=pool.label).observe(
+            max(started_at - submitted_at, 0.0)
+        )
+    except BrokenProcessPool as exc:
+        # A worker died (OOM kill, segfault); start a fresh pool next time.
+        pool.reset()
+        raise RuntimeError(f"tool process pool crashed: {exc}") from exc
+    finally:
+        pool.leave()
+        if not abandoned:
+            _release(payload)
+    return _unpack(result, unlink=True)
+
+
+async def dispatch_tool(tool: Any, inputs: Dict[str, Any]) -> Any:
+    """Execute ``tool.execute(**inputs)`` according to its execution mode."""
+
+    mode = resolve_execution_mode(tool)
+    if mode == "process":
+        return await _run_in_processes(tool, inputs)
+    if mode == "thread":
+        return await _run_in_threads(tool, inputs)
+    return await tool.execute(**inputs)
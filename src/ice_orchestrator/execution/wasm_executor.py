@@ -8,14 +8,10 @@ ensuring secure isolation with resource limits and monitoring.
 import ast
 import asyncio
 import inspect
-import json
-import os
 import resource
 import sys
-import tempfile
 import time
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import structlog
@@ -62,6 +58,7 @@ except Exception:  # pragma: no cover
 
 
 from ice_core.models import NodeExecutionResult, NodeMetadata
+from ice_orchestrator.execution.sandbox.worker_pool import get_sandbox_pool
 
 tracer = trace.get_tracer(__name__)
 logger = structlog.get_logger(__name__)
@@ -219,7 +216,9 @@ class WasmExecutor:
             execution_start = time.perf_counter()
 
             # Get resource limits for node type
-            limits = self.resource_limits.get(node_type, self.resource_limits["code"])
+            limits = dict(
+                self.resource_limits.get(node_type, self.resource_limits["code"])
+            )
             if custom_limits:
                 limits.update(custom_limits)
 
@@ -328,16 +327,15 @@ class WasmExecutor:
     ) -> Dict[str, Any]:
         """Execute code in WASM sandbox with wasmtime-py."""
 
-        # Create Python script for WASM execution
-        python_script = self._create_sandbox_script(code, context, allowed_imports)
-
-        # Use cache key for compiled modules
-        cache_key = str(hash((python_script, tuple(sorted(allowed_imports)))))
+        # The accounting module does not embed the script, so one compiled
+        # module per import set is enough (keying on the script would grow
+        # the cache with every distinct context).
+        cache_key = ",".join(sorted(allowed_imports))
 
         # Compile Python to WASM (or get from cache)
         if cache_key not in self._module_cache:
             wasm_module = await self._compile_python_to_wasm(
-                python_script, allowed_imports, node_id
+                code, allowed_imports, node_id
             )
             self._module_cache[cache_key] = wasm_module
         else:
@@ -364,7 +362,9 @@ class WasmExecutor:
         try:
             # Execute with timeout
             result = await asyncio.wait_for(
-                self._run_wasm_instance(store, instance, context, allowed_imports),
+                self._run_wasm_instance(
+                    store, instance, context, allowed_imports, limits
+                ),
                 timeout=limits["timeout"],
             )
 
@@ -405,23 +405,13 @@ class WasmExecutor:
         Python via a minimal runtime. In the future, this could use Pyodide
         or other Python-to-WASM compilers.
         """
-        # Write Python script to temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(python_script)
-            script_path = Path(f.name)
-
-        try:
-            # Medium path: for MVP, we don't compile Python to WASM. Instead,
-            # we create a trivial module and use the sandbox only for resource
-            # accounting, while executing user code in a tightly controlled
-            # subprocess (no network by default) to get real results.
-            module = wasmtime.Module(
-                self.engine, '(module (memory 1) (export "memory" (memory 0)))'
-            )
-            return module
-
-        finally:
-            script_path.unlink(missing_ok=True)
+        # Medium path: for MVP, we don't compile Python to WASM. Instead, we
+        # create a trivial module and use the sandbox only for resource
+        # accounting, while user code runs in a warm, resource-limited worker
+        # from the sandbox pool (no network by default) to get real results.
+        return wasmtime.Module(
+            self.engine, '(module (memory 1) (export "memory" (memory 0)))'
+        )
 
     async def _run_wasm_instance(
         self,
@@ -429,126 +419,35 @@ class WasmExecutor:
         instance: wasmtime.Instance,
         context: Dict[str, Any],
         allowed_imports: set[str],
+        limits: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Run WASM instance and return results."""
-        # Execute Python code in a constrained subprocess for MVP.
-        import json as _json
-        import shlex
-        import subprocess
+        """Run WASM instance and return results.
 
-        tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False)
-        try:
-            tmp.write(
-                self._create_sandbox_script(
-                    code=context.get("__code", ""),
-                    context=context,
-                    allowed_imports=allowed_imports,
-                )
-            )
-            tmp.flush()
-            cmd = f"python {shlex.quote(tmp.name)}"
-            proc = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if proc.returncode != 0:
-                return {"success": False, "error": proc.stderr.strip()}
-            out = proc.stdout.strip()
-            try:
-                data = _json.loads(out)
-            except Exception:
-                data = {"result": out}
-            return data
-        finally:
-            try:
-                os.unlink(tmp.name)
-            except Exception:
-                pass
-
-    def _create_sandbox_script(
-        self, user_code: str, context: Dict[str, Any], allowed_imports: set[str]
-    ) -> str:
-        """Create a sandboxed Python script with restricted imports."""
-
-        # Convert allowed imports to import statements
-        import_statements = []
-        for module in sorted(allowed_imports):
-            import_statements.append(f"import {module}")
-
-        # Create the sandboxed script
-        script = f"""
-import json
-import sys
-import os
-import traceback
-
-# Restrict imports by overriding __import__
-_original_import = __builtins__.__import__
-_allowed_modules = {repr(allowed_imports)}
-
-def restricted_import(name, globals=None, locals=None, fromlist=(), level=0):
-    if name not in _allowed_modules and not name.startswith('_'):
-        raise ImportError(f"Import of '{{name}}' is not allowed in sandbox")
-    return _original_import(name, globals, locals, fromlist, level)
-
-__builtins__.__import__ = restricted_import
-
-# Disable dangerous built-ins
-dangerous_builtins = ['open', 'file', 'execfile', 'reload', '__import__', 'eval', 'exec']
-for name in dangerous_builtins:
-    if hasattr(__builtins__, name):
-        delattr(__builtins__, name)
-
-# Safe built-ins only
-safe_builtins = {{
-    'abs': abs, 'round': round, 'min': min, 'max': max, 'sum': sum,
-    'int': int, 'float': float, 'str': str, 'bool': bool,
-    'list': list, 'dict': dict, 'set': set, 'tuple': tuple,
-    'len': len, 'range': range, 'enumerate': enumerate, 'zip': zip,
-    'map': map, 'filter': filter, 'sorted': sorted, 'reversed': reversed,
-    'print': print, 'type': type, 'isinstance': isinstance,
-    'hasattr': hasattr, 'getattr': getattr, 'setattr': setattr
-}}
-
-# Allowed imports
-{chr(10).join(import_statements)}
-
-# Input context
-context = {json.dumps(context, default=str)}
-inputs = context  # Alias for backwards compatibility
-
-# Output container
-output = {{}}
-result = None
-
-try:
-    # Execute user code
-{chr(10).join("    " + line for line in user_code.split(chr(10)))}
-
-    # Capture result if set
-    if 'result' in locals():
-        output['result'] = result
-
-    # Get memory usage (basic approximation)
-    import sys
-    output['_memory_used'] = sys.getsizeof(output) / 1024 / 1024  # MB
-
-    # Output result as JSON
-    print(json.dumps(output, default=str))
-
-except Exception as e:
-    error_result = {{
-        "error": str(e),
-        "error_type": type(e).__name__,
-        "traceback": traceback.format_exc()
-    }}
-    print(json.dumps(error_result), file=sys.stderr)
-    sys.exit(1)
-"""
-        return script
+        User code executes in a pre-warmed worker from the sandbox pool
+        (fully async, per-task CPU/memory limits) rather than a fresh
+        interpreter per call.
+        """
+        limits = limits or self.resource_limits["code"]
+        memory_mb = limits.get("memory_mb")
+        if memory_mb is None and "memory_pages" in limits:
+            # WASM pages are 64 KiB
+            memory_mb = max(1, limits["memory_pages"] * 64 // 1024)
+        user_context = {k: v for k, v in context.items() if k != "__code"}
+        response = await get_sandbox_pool().run(
+            context.get("__code", ""),
+            user_context,
+            allowed_imports=allowed_imports,
+            timeout=limits.get("timeout", 10),
+            cpu_limit_seconds=limits.get("cpu_seconds", limits.get("timeout")),
+            memory_limit_mb=memory_mb,
+        )
+        if not response.get("ok"):
+            return {
+                "success": False,
+                "error": response.get("error", "sandbox execution failed"),
+                "error_type": response.get("error_type"),
+            }
+        return dict(response.get("output") or {})
 
     def _set_resource_limits(
         self, memory_limit_mb: int, cpu_limit_seconds: float
@@ -87,6 +87,11 @@ class WorkflowExecutionState:
     last_checkpoint: Optional[datetime] = None
     checkpoint_data: Dict[str, Any] = field(default_factory=dict)
 
+    # Incremental execution support
+    node_fingerprints: Dict[str, str] = field(default_factory=dict)
+    inputs_fingerprint: Optional[str] = None
+    reused_nodes: Set[str] = field(default_factory=set)
+
     def record_node_start(self, node_id: str) -> None:
         """Record that a node has started executing."""
         self.executing_nodes.add(node_id)
@@ -95,8 +100,17 @@ class WorkflowExecutionState:
         """Record node completion."""
         self.executing_nodes.discard(node_id)
         self.completed_nodes.add(node_id)
-        from ice_core.models.enums import NodeType
+        self._store_result(node_id, result)
+
+        if not result.success:
+            self.failed_nodes.add(node_id)
+            if result.error:
+                self.errors.append(f"Node {node_id}: {result.error}")
+        else:
+            # A resumed run may succeed where the checkpointed attempt failed
+            self.failed_nodes.discard(node_id)
 
+    def _store_result(self, node_id: str, result: NodeExecutionResult) -> None:
         raw_type = (
             getattr(result.metadata, "node_type", None)
             if hasattr(result, "metadata") and result.metadata
@@ -108,11 +122,6 @@ class WorkflowExecutionState:
             node_type_enum = NodeType.TOOL
         self.node_results[node_type_enum][node_id] = result
 
-        if not result.success:
-            self.failed_nodes.add(node_id)
-            if result.error:
-                self.errors.append(f"Node {node_id}: {result.error}")
-
     def record_node_skipped(self, node_id: str, reason: str) -> None:
         """Record that a node was skipped."""
         self.skipped_nodes.add(node_id)
@@ -147,43 +156,19 @@ class WorkflowExecutionState:
         self.last_checkpoint = datetime.utcnow()
         return {
             "workflow_id": self.workflow_id,
+            "workflow_name": self.workflow_name,
             "timestamp": self.last_checkpoint.isoformat(),
             "phase": self.phase.value,
             "completed_nodes": list(self.completed_nodes),
+            "failed_nodes": list(self.failed_nodes),
             "node_results": {
                 node_type.value: {
-                    nid: {
-                        "success": res.success,
-                        "error": res.error,
-                        "output": res.output,
-                        "execution_time": res.execution_time,
-                        "metadata": (
-                            {
-                                "node_id": res.metadata.node_id,
-                                "node_type": res.metadata.node_type,
-                                "name": res.metadata.name,
-                                "version": res.metadata.version,
-                                "start_time": (
-                                    res.metadata.start_time.isoformat()
-                                    if res.metadata.start_time
-                                    else None
-                                ),
-                                "end_time": (
-                                    res.metadata.end_time.isoformat()
-                                    if res.metadata.end_time
-                                    else None
-                                ),
-                                "duration": res.metadata.duration,
-                                "error_type": res.metadata.error_type,
-                            }
-                            if res.metadata
-                            else None
-                        ),
-                    }
-                    for nid, res in results.items()
+                    nid: res.model_dump(mode="json") for nid, res in results.items()
                 }
                 for node_type, results in self.node_results.items()
             },
+            "node_fingerprints": dict(self.node_fingerprints),
+            "inputs_fingerprint": self.inputs_fingerprint,
             "branch_decisions": self.branch_decisions.copy(),
             "total_tokens": self.total_tokens,
             "total_cost": self.total_cost,
@@ -201,16 +186,51 @@ class WorkflowExecutionState:
 
         # Restore completed nodes
         state.completed_nodes = set(checkpoint_data.get("completed_nodes", []))
-
-        # Restore results (would need proper deserialization)
-        # state.node_results = checkpoint_data.get("node_results", {})
-
+        state.failed_nodes = set(checkpoint_data.get("failed_nodes", []))
+
+        # Restore results into their NodeType buckets.  Entries that no longer
+        # validate (older checkpoint layouts) are dropped so the node re-runs.
+        for raw_type, results in (checkpoint_data.get("node_results") or {}).items():
+            try:
+                node_type = NodeType(str(raw_type))
+            except ValueError:
+                node_type = NodeType.TOOL
+            for nid, payload in (results or {}).items():
+                try:
+                    restored = NodeExecutionResult.model_validate(payload)
+                except Exception:
+                    continue
+                state.node_results[node_type][nid] = restored
+
+        state.node_fingerprints = dict(checkpoint_data.get("node_fingerprints") or {})
+        state.inputs_fingerprint = checkpoint_data.get("inputs_fingerprint")
         state.branch_decisions = checkpoint_data.get("branch_decisions", {})
         state.total_tokens = checkpoint_data.get("total_tokens", 0)
         state.total_cost = checkpoint_data.get("total_cost", 0.0)
 
         return state
 
+    def get_result(self, node_id: str) -> Optional[NodeExecutionResult]:
+        """Return the stored result for *node_id* regardless of NodeType."""
+        for results in self.node_results.values():
+            if node_id in results:
+                return results[node_id]
+        return None
+
+    def flat_results(self) -> Dict[str, NodeExecutionResult]:
+        """Return all stored results keyed by node id."""
+        flat: Dict[str, NodeExecutionResult] = {}
+        for results in self.node_results.values():
+            flat.update(results)
+        return flat
+
+    def record_node_reused(self, node_id: str, result: NodeExecutionResult) -> None:
+        """Record that a checkpointed result was reused instead of re-running."""
+        self.reused_nodes.add(node_id)
+        self.completed_nodes.add(node_id)
+        self.failed_nodes.discard(node_id)
+        self._store_result(node_id, result)
+
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get a summary of the execution state."""
         duration = None
@@ -230,6 +250,7 @@ class WorkflowExecutionState:
             "completed_nodes": len(self.completed_nodes),
             "failed_nodes": len(self.failed_nodes),
             "skipped_nodes": len(self.skipped_nodes),
+            "reused_nodes": len(self.reused_nodes),
             "errors": self.errors,
             "warnings": self.warnings,
             "total_tokens": self.total_tokens,
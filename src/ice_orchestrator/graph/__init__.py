@@ -1,7 +1,11 @@
+from .analytics_cache import GraphAnalyticsCache, get_analytics_cache, graph_fingerprint
 from .dependency_graph import DependencyGraph
 from .level_resolver import BranchGatingResolver
 
 __all__ = [
     "DependencyGraph",
     "BranchGatingResolver",
+    "GraphAnalyticsCache",
+    "get_analytics_cache",
+    "graph_fingerprint",
 ]
@@ -0,0 +1,336 @@
+"""Structural-fingerprint keyed cache for graph analytics and canvas layout.
+
+Graph analytics (spring layout, betweenness centrality, path enumeration,
+pattern search) depend only on the *shape* of a workflow – node ids, node
+types and edges – yet the canvas endpoints rebuild a :class:`Workflow` per
+request and recompute everything from scratch.  This module memoises those
+results under a fingerprint of the structure:
+
+* an in-process LRU tier (always on), and
+* a Redis tier shared by every API worker, enabled when ``REDIS_URL`` is set
+  (``ICE_GRAPH_CACHE_REDIS=0`` turns it off).  Redis errors are never fatal –
+  the tier is skipped for a short cooldown and the value is computed locally.
+
+The accessors are synchronous (they run inside graph construction and
+scheduling) and never block on the network: async callers load the shared
+entries for a graph up front with :meth:`GraphAnalyticsCache.warm`, and new
+results are written back to Redis in background tasks.
+
+Layouts are additionally remembered per *lineage* (usually the workflow
+name) so that adding or removing a few nodes only places the new nodes,
+keeping existing ones where the user last saw them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+import networkx as nx
+
+from ice_core.cache import LRUCache
+from ice_core.utils.hashing import HashMode, compute_hash
+
+__all__ = [
+    "GraphAnalyticsCache",
+    "get_analytics_cache",
+    "graph_fingerprint",
+]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Positions = Dict[str, Tuple[float, float]]
+
+# Per-graph analytics loaded by ``warm()`` (pattern searches are per query)
+_WARM_KINDS = (
+    "centrality",
+    "metrics",
+    "node_analytics",
+    "path_analysis",
+    "positions",
+    "suggestions",
+)
+
+
+def graph_fingerprint(graph: nx.DiGraph) -> str:
+    """Return a stable hash of the node ids, node types and edges of *graph*."""
+
+    nodes = sorted(
+        (str(n), str(data.get("node_type") or data.get("type") or ""))
+        for n, data in graph.nodes(data=True)
+    )
+    edges = sorted((str(u), str(v)) for u, v in graph.edges())
+    payload = json.dumps([nodes, edges], separators=(",", ":"))
+    return compute_hash(payload, HashMode.PERFORMANCE)
+
+
+class GraphAnalyticsCache:
+    """Two-tier (process LRU + optional Redis) cache of graph analytics.
+
+    Values must be JSON-serialisable so they can be shared through Redis.
+    Callers always receive a copy, so mutating a returned dict never leaks
+    into the cache.
+    """
+
+    # Layout tuning ----------------------------------------------------------
+    LAYOUT_K = 3
+    LAYOUT_ITERATIONS = 50
+    INCREMENTAL_ITERATIONS = 15
+    # Re-layout from scratch once more than this share of nodes changed
+    INCREMENTAL_MAX_CHANGE = 0.25
+
+    _REDIS_COOLDOWN_SECONDS = 30.0
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 256,
+        redis_client: Any = None,
+        redis_url: Optional[str] = None,
+        prefix: str = "graph:analytics:",
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        self._local = LRUCache(capacity=capacity)
+        self.prefix = prefix
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else int(os.getenv("ICE_GRAPH_CACHE_TTL_SECONDS", "86400"))
+        )
+        self._redis = redis_client
+        self._redis_url = redis_url
+        self._redis_down_until = 0.0
+        self._writes: Set["asyncio.Task[None]"] = set()
+
+    # ------------------------------------------------------------------
+    # Redis tier (best-effort, async only)
+    # ------------------------------------------------------------------
+    def _client(self) -> Any:
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is not None or self._redis_url is None:
+            return self._redis
+        try:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                self._redis_url,
+                decode_responses=True,
+                socket_timeout=0.25,
+                socket_connect_timeout=0.25,
+            )
+        except Exception as exc:  # pragma: no cover – optional dep
+            logger.debug("Graph analytics Redis tier unavailable: %s", exc)
+            self._redis_url = None
+        return self._redis
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.debug("Graph analytics Redis tier error: %s", exc)
+        self._redis_down_until = time.monotonic() + self._REDIS_COOLDOWN_SECONDS
+
+    async def _remote_set(self, client: Any, key: str, raw: str) -> None:
+        ttl = self.ttl_seconds if self.ttl_seconds > 0 else None
+        try:
+            await client.set(self.prefix + key, raw, ex=ttl)
+        except Exception as exc:
+            self._redis_failed(exc)
+
+    def _schedule_remote_set(self, key: str, value: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop to write from – the local tier still has it
+        client = self._client()
+        if client is None:
+            return
+        try:
+            raw = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        task = loop.create_task(self._remote_set(client, key, raw))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def warm(self, graph: nx.DiGraph, *, lineage: Optional[str] = None) -> None:
+        """Load the shared Redis entries for *graph* into the local tier.
+
+        One ``MGET`` per call; keys already cached locally are skipped.
+        """
+
+        fingerprint = graph_fingerprint(graph)
+        keys = [f"{fingerprint}:{kind}" for kind in _WARM_KINDS]
+        if lineage:
+            keys.append(f"lineage:{lineage}")
+        keys = [k for k in keys if self._local.get(k) is None]
+        client = self._client()
+        if not keys or client is None:
+            return
+        try:
+            raws = await client.mget([self.prefix + k for k in keys])
+        except Exception as exc:
+            self._redis_failed(exc)
+            return
+        for key, raw in zip(keys, raws or []):
+            if raw is None:
+                continue
+            try:
+                self._local.set(key, json.loads(raw))
+            except (TypeError, ValueError):
+                continue
+
+    async def flush(self) -> None:
+        """Wait for pending background writes to Redis."""
+
+        if self._writes:
+            await asyncio.gather(*list(self._writes), return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> Optional[Any]:
+        value = self._local.get(key)
+        if value is None:
+            return None
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        self._local.set(key, value)
+        self._schedule_remote_set(key, value)
+
+    def get_or_compute(
+        self, fingerprint: str, kind: str, compute: Callable[[], T]
+    ) -> T:
+        """Return the cached *kind* analytics for *fingerprint* or compute them."""
+
+        key = f"{fingerprint}:{kind}"
+        cached = self.get(key)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+        value = compute()
+        self.set(key, value)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        """Drop the process-local tier (Redis entries expire on their own)."""
+
+        self._local.clear()
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def positions(
+        self, graph: nx.DiGraph, *, lineage: Optional[str] = None
+    ) -> Positions:
+        """Return spring-layout positions for *graph*, computed once per shape.
+
+        When *lineage* names an earlier layout of the same workflow and only a
+        few nodes differ, unchanged nodes keep their coordinates and only the
+        new ones are placed.
+        """
+
+        fingerprint = graph_fingerprint(graph)
+        key = f"{fingerprint}:positions"
+        cached = self.get(key)
+        if cached is None:
+            previous = self.get(f"lineage:{lineage}") if lineage else None
+            cached = self._layout(graph, previous)
+            self.set(key, cached)
+            if lineage:
+                self.set(f"lineage:{lineage}", cached)
+        return {n: (float(p[0]), float(p[1])) for n, p in cached.items()}
+
+    def _layout(
+        self, graph: nx.DiGraph, previous: Optional[Dict[str, List[float]]]
+    ) -> Dict[str, List[float]]:
+        if graph.number_of_nodes() == 0:
+            return {}
+
+        kept = [n for n in graph.nodes() if previous and str(n) in previous]
+        added = graph.number_of_nodes() - len(kept)
+        incremental = (
+            previous is not None
+            and kept
+            and added <= graph.number_of_nodes() * self.INCREMENTAL_MAX_CHANGE
+        )
+
+        if incremental and previous is not None:
+            pos: Dict[Any, Any] = {n: tuple(previous[str(n)]) for n in kept}
+            if added:
+                # Seed new nodes next to their placed neighbours so the short
+                # relaxation below only has to fine-tune them.
+                for n in graph.nodes():
+                    if n in pos:
+                        continue
+                    near = [pos[m] for m in nx.all_neighbors(graph, n) if m in pos]
+                    if near:
+                        pos[n] = (
+                            sum(p[0] for p in near) / len(near),
+                            sum(p[1] for p in near) / len(near) + 0.05,
+                        )
+                pos = self._spring(
+                    graph, pos=pos, fixed=kept, iterations=self.INCREMENTAL_ITERATIONS
+                )
+        else:
+            pos = self._spring(graph, iterations=self.LAYOUT_ITERATIONS)
+        return {str(n): [float(p[0]), float(p[1])] for n, p in pos.items()}
+
+    def _spring(
+        self,
+        graph: nx.DiGraph,
+        *,
+        iterations: int,
+        pos: Optional[Dict[Any, Any]] = None,
+        fixed: Optional[List[Any]] = None,
+    ) -> Dict[Any, Any]:
+        try:
+            return dict(
+                nx.spring_layout(
+                    graph,
+                    k=self.LAYOUT_K,
+                    pos=pos,
+                    fixed=fixed,
+                    iterations=iterations,
+                    seed=0,
+                )
+            )
+        except ImportError:
+            # spring_layout needs numpy (optional extra) – spread nodes by
+            # topological generation instead, keeping any seeded positions.
+            return _generation_layout(graph, pos or {})
+
+
+def _generation_layout(graph: nx.DiGraph, seeded: Dict[Any, Any]) -> Dict[Any, Any]:
+    pos = dict(seeded)
+    try:
+        generations = [list(g) for g in nx.topological_generations(graph)]
+    except nx.NetworkXException:
+        generations = [list(graph.nodes())]
+    depth = max(len(generations) - 1, 1)
+    for row, nodes in enumerate(generations):
+        width = max(len(nodes) - 1, 1)
+        for col, n in enumerate(nodes):
+            if n not in pos:
+                pos[n] = (2.0 * col / width - 1.0, 2.0 * row / depth - 1.0)
+    return pos
+
+
+_analytics_cache: Optional[GraphAnalyticsCache] = None
+
+
+def get_analytics_cache() -> GraphAnalyticsCache:
+    """Return the process-wide analytics cache (Redis tier from env)."""
+
+    global _analytics_cache  # pylint: disable=global-statement
+    if _analytics_cache is None:
+        url = os.getenv("REDIS_URL")
+        if os.getenv("ICE_GRAPH_CACHE_REDIS", "1").lower() in {"0", "false", "off"}:
+            url = None
+        _analytics_cache = GraphAnalyticsCache(redis_url=url)
+    return _analytics_cache
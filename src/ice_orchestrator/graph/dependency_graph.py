@@ -1,9 +1,15 @@
+import copy
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import networkx as nx
 
 from ice_core.exceptions import CycleDetectionError as CircularDependencyError
+from ice_orchestrator.graph.analytics_cache import (
+    get_analytics_cache,
+    graph_fingerprint,
+)
 
 
 class DependencyGraph:
@@ -15,16 +21,42 @@ class DependencyGraph:
     - Rich edge attributes for data flow analysis
     - Advanced NetworkX algorithms for critical path and bottleneck detection
     - Canvas layout hints and performance insights
+
+    Construction is linear in nodes + edges: cycle validation uses strongly
+    connected components and levels come from Kahn's algorithm.  Centrality
+    and critical-path analytics are computed lazily on first use and cached.
     """
 
+    # Above this size betweenness centrality is estimated from a node sample
+    _CENTRALITY_EXACT_MAX_NODES = 500
+    _CENTRALITY_SAMPLE = 200
+
     def __init__(self, nodes: List[Any]):
         self.graph = nx.DiGraph()
         # Mapping of node_id -> topological level (depth) ------------------
         self.node_levels: Dict[str, int] = {}
         self._node_map = {node.id: node for node in nodes}
+        # Edges ignored for levelling (recursive node -> member of its loop)
+        self._recursive_back_edges: Set[Tuple[str, str]] = set()
+        self._centrality: Optional[Dict[str, float]] = None
+        self._analytics_ready = False
         self._build_graph(nodes)
         self._assign_levels(nodes)
 
+    def clone(self) -> "DependencyGraph":
+        """Return an independent copy for a new run.
+
+        Node/edge attribute dicts (execution state, transfer stats) are
+        copied; node configs and cached analytics are shared.
+        """
+
+        other = copy.copy(self)
+        other.graph = self.graph.copy()
+        other.node_levels = dict(self.node_levels)
+        other._node_map = dict(self._node_map)
+        other._recursive_back_edges = set(self._recursive_back_edges)
+        return other
+
     def _build_graph(self, nodes: List[Any]) -> None:
         """Enhanced graph construction with rich node and edge attributes."""
         node_ids = {node.id for node in nodes}
@@ -99,8 +131,7 @@ class DependencyGraph:
         # Check for cycles - now supports controlled cycles for recursive nodes
         self._check_cycles_with_recursive_support(nodes)
 
-        # Enhanced analysis after graph construction
-        self._compute_advanced_metrics()
+        # Centrality / critical-path analysis is deferred to _ensure_analytics()
 
         # Security & compliance validations
         self._validate_no_sensitive_data_flows(nodes)
@@ -230,62 +261,108 @@ class DependencyGraph:
             return getattr(target_node, "type", "") == "agent"
         return False
 
-    def _compute_advanced_metrics(self) -> None:
-        """Compute advanced graph metrics using NetworkX algorithms."""
+    def _get_centrality(self) -> Dict[str, float]:
+        """Betweenness centrality, computed once (sampled on large graphs)."""
+        if self._centrality is None:
+            scores = get_analytics_cache().get_or_compute(
+                graph_fingerprint(self.graph), "centrality", self._compute_centrality
+            )
+            self._centrality = {
+                node_id: scores.get(str(node_id), 0.0) for node_id in self.graph.nodes
+            }
+        return self._centrality
+
+    def _compute_centrality(self) -> Dict[str, float]:
+        n = self.graph.number_of_nodes()
+        try:
+            if n > self._CENTRALITY_EXACT_MAX_NODES:
+                scores = nx.betweenness_centrality(
+                    self.graph, k=self._CENTRALITY_SAMPLE, seed=0
+                )
+            else:
+                scores = nx.betweenness_centrality(self.graph)
+        except Exception:
+            return {}
+        return {str(node_id): float(score) for node_id, score in scores.items()}
+
+    def _ensure_analytics(self) -> None:
+        """Annotate nodes with centrality / critical-path data on first use.
+
+        The graph structure is fixed after construction, so the result is
+        cached for the lifetime of the instance.
+        """
+        if self._analytics_ready:
+            return
+        self._analytics_ready = True
         if not self.graph.nodes():
             return
 
         # Centrality analysis
-        try:
-            centrality = nx.betweenness_centrality(self.graph)
-            for node_id, score in centrality.items():
-                self.graph.nodes[node_id]["centrality_score"] = score
-                self.graph.nodes[node_id]["is_bottleneck"] = score > 0.3
-        except Exception:
-            pass  # Skip if graph analysis fails
+        for node_id, score in self._get_centrality().items():
+            self.graph.nodes[node_id]["centrality_score"] = score
+            self.graph.nodes[node_id]["is_bottleneck"] = score > 0.3
 
         # Critical path analysis (by complexity score)
         try:
-            critical_path = nx.dag_longest_path(self.graph, weight="complexity_score")
+            critical_path = self._heaviest_path("complexity_score")
             for node_id in critical_path:
                 self.graph.nodes[node_id]["is_critical_path"] = True
-                # Mark edges on critical path
-                for i in range(len(critical_path) - 1):
-                    if self.graph.has_edge(critical_path[i], critical_path[i + 1]):
-                        self.graph.edges[critical_path[i], critical_path[i + 1]][
-                            "critical_path"
-                        ] = True
+            # Mark edges on critical path
+            for u, v in zip(critical_path, critical_path[1:]):
+                if self.graph.has_edge(u, v):
+                    self.graph.edges[u, v]["critical_path"] = True
         except Exception:
             pass
 
-        # Parallel group assignment
-        levels = self.get_level_nodes()
-        for level, nodes in levels.items():
-            for node_id in nodes:
-                self.graph.nodes[node_id]["parallel_group"] = level
-
     # 🚀 ADVANCED NETWORKX ANALYSIS METHODS
 
+    def _heaviest_path(self, attr: str) -> List[str]:
+        """Return the path with the largest sum of the node attribute *attr*.
+
+        ``nx.dag_longest_path`` only weighs edges, so the node costs are
+        summed here instead.
+        """
+        best: Dict[Any, Tuple[float, Any]] = {}
+        for node in nx.topological_sort(self.graph):
+            head = max(
+                ((best[p][0], p) for p in self.graph.predecessors(node)),
+                key=lambda item: item[0],
+                default=(0.0, None),
+            )
+            cost = float(self.graph.nodes[node].get(attr) or 0.0)
+            best[node] = (head[0] + cost, head[1])
+        if not best:
+            return []
+        cursor: Any = max(best, key=lambda n: best[n][0])
+        path: List[str] = []
+        while cursor is not None:
+            path.append(str(cursor))
+            cursor = best[cursor][1]
+        return path[::-1]
+
     def get_critical_path(self) -> List[str]:
-        """Get the critical path using NetworkX longest path algorithm."""
-        try:
-            path = nx.dag_longest_path(self.graph, weight="avg_execution_time")
-            return list(path) if path else []
-        except Exception:
-            try:
-                path = nx.dag_longest_path(self.graph, weight="complexity_score")
-                return list(path) if path else []
-            except Exception:
-                return []
+        """Get the path with the largest expected duration.
 
-    def get_bottleneck_nodes(self) -> List[str]:
-        """Identify bottleneck nodes using betweenness centrality."""
+        Nodes are weighed by ``avg_execution_time`` (seeded from latency
+        history by the workflow), or by ``complexity_score`` before any
+        timings are known.
+        """
+        timed = any(
+            data.get("avg_execution_time") for _, data in self.graph.nodes(data=True)
+        )
         try:
-            centrality = nx.betweenness_centrality(self.graph)
-            return [str(node) for node, score in centrality.items() if score > 0.3]
+            return self._heaviest_path(
+                "avg_execution_time" if timed else "complexity_score"
+            )
         except Exception:
             return []
 
+    def get_bottleneck_nodes(self) -> List[str]:
+        """Identify bottleneck nodes using (cached) betweenness centrality."""
+        return [
+            str(node) for node, score in self._get_centrality().items() if score > 0.3
+        ]
+
     def get_parallel_execution_groups(
         self,
     ) -> Dict[int, Dict[str, Union[List[str], int]]]:
@@ -432,18 +509,24 @@ class DependencyGraph:
             (current_avg * (count - 1)) + transfer_time
         ) / count
 
-    def get_canvas_layout_hints(self) -> Dict[str, Dict[str, Any]]:
-        """Generate intelligent canvas layout hints using NetworkX algorithms."""
+    def get_canvas_layout_hints(
+        self, lineage: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Generate intelligent canvas layout hints using NetworkX algorithms.
+
+        Base positions come from the shared analytics cache, so the spring
+        layout runs once per graph shape; *lineage* lets a changed graph
+        reuse the positions of its previous version.
+        """
         if not self.graph.nodes():
             return {}
 
+        self._ensure_analytics()
         layout_hints = {}
 
         try:
-            # Use spring layout as base positioning
-            pos = nx.spring_layout(self.graph, k=3, iterations=50)
-
-            # Get levels for Y-axis positioning (unused but kept for future use)
+            # Spring layout as base positioning (cached per structure)
+            pos = get_analytics_cache().positions(self.graph, lineage=lineage)
 
             for node_id in self.graph.nodes():
                 node_data = self.graph.nodes[node_id]
@@ -451,7 +534,7 @@ class DependencyGraph:
 
                 layout_hints[node_id] = {
                     "position": {
-                        "x": pos[node_id][0] * 800,  # Scale for screen coordinates
+                        "x": pos[str(node_id)][0] * 800,  # Scale for screen coordinates
                         "y": level * 150,  # Level-based Y positioning
                     },
                     "styling": {
@@ -500,6 +583,7 @@ class DependencyGraph:
 
     def export_for_analysis(self) -> Dict[str, Any]:
         """Export rich graph data for external analysis tools."""
+        self._ensure_analytics()
         return {
             "graph_data": {
                 "nodes": [
@@ -517,63 +601,50 @@ class DependencyGraph:
         }
 
     def _assign_levels(self, nodes: List[Any]) -> None:
-        """Assign execution levels to nodes, handling cycles for recursive nodes."""
+        """Assign execution levels with Kahn's algorithm in O(V + E).
 
-        # Get all recursive node IDs
-        recursive_nodes = {
-            node.id
-            for node in nodes
-            if hasattr(node, "type") and node.type == "recursive"
-        }
-
-        # Create a temporary graph without recursive edges for level assignment
-        temp_graph = self.graph.copy()
-        recursive_edges = []
-
-        # Remove edges that create cycles involving recursive nodes
-        for edge in list(temp_graph.edges()):
-            from_node, to_node = edge
-            if from_node in recursive_nodes or to_node in recursive_nodes:
-                # Check if this edge creates a cycle
-                temp_graph.remove_edge(from_node, to_node)
-                if nx.has_path(temp_graph, to_node, from_node):
-                    # This edge creates a cycle, keep it removed for level assignment
-                    recursive_edges.append((from_node, to_node))
-                else:
-                    # This edge doesn't create a cycle, add it back
-                    temp_graph.add_edge(from_node, to_node)
+        Back edges of recursive loops (found by the SCC pass in
+        ``_check_cycles_with_recursive_support``) are ignored so the loop's
+        sources are levelled before the recursive node that re-drives them.
+        """
 
-        # Now assign levels using the cycle-free temporary graph
-        node_map = {node.id: node for node in nodes}
+        cut = self._recursive_back_edges
+        indegree: Dict[str, int] = {node_id: 0 for node_id in self._node_map}
+        for u, v in self.graph.edges():
+            if (u, v) not in cut:
+                indegree[v] += 1
+
+        levels: Dict[str, int] = {node_id: 0 for node_id in self._node_map}
+        queue: Deque[str] = deque(n for n, deg in indegree.items() if deg == 0)
+        visited = 0
+        while queue:
+            u = queue.popleft()
+            visited += 1
+            for v in self.graph.successors(u):
+                if (u, v) in cut:
+                    continue
+                if levels[u] + 1 > levels[v]:
+                    levels[v] = levels[u] + 1
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    queue.append(v)
+
+        if visited < len(levels):
+            # Defensive: cycles the validator let through run sequentially last
+            next_level = max(levels.values(), default=0) + 1
+            for node_id, deg in indegree.items():
+                if deg > 0:
+                    levels[node_id] = next_level
+                    next_level += 1
 
-        try:
-            for node_id in nx.topological_sort(temp_graph):
-                node = node_map[node_id]
-                node.level = (
-                    max(
-                        (
-                            node_map[dep].level
-                            for dep in (
-                                getattr(node, "dependencies", [])
-                                if isinstance(getattr(node, "dependencies", []), list)
-                                else [getattr(node, "dependencies", [])]
-                            )
-                            # Filter out dependencies that create cycles
-                            if dep
-                            not in {e[0] for e in recursive_edges if e[1] == node_id}
-                        ),
-                        default=-1,
-                    )
-                    + 1
-                )
-        except nx.NetworkXUnfeasible:
-            # Fallback: assign levels manually for remaining cycles
-            remaining_nodes = [n for n in nodes if not hasattr(n, "level")]
-            for i, node in enumerate(remaining_nodes):
-                node.level = i + 1
+        for node in nodes:
+            node.level = levels[node.id]
 
         # Store the level mapping for quick lookup
         self.node_levels = {node.id: node.level for node in nodes}
+        for node_id, level in self.node_levels.items():
+            self.graph.nodes[node_id]["level"] = level
+            self.graph.nodes[node_id]["parallel_group"] = level
 
     def get_level_nodes(self) -> Dict[int, List[str]]:
         """Return mapping of *level → node_ids*.
@@ -597,9 +668,30 @@ class DependencyGraph:
     def get_node_dependents(self, node_id: str) -> List[str]:
         return list(self.graph.successors(node_id))
 
+    def get_downstream_nodes(self, node_ids: Iterable[str]) -> Set[str]:
+        """Return *node_ids* plus every node reachable from them."""
+
+        reachable: Set[str] = set()
+        for node_id in node_ids:
+            if node_id in reachable or node_id not in self.graph:
+                continue
+            reachable.add(node_id)
+            reachable.update(nx.descendants(self.graph, node_id))
+        return reachable
+
+    def get_upstream_nodes(self, node_id: str) -> Set[str]:
+        """Return *node_id* plus every node it transitively depends on."""
+
+        return {node_id, *nx.ancestors(self.graph, node_id)}
+
     def get_node_level(self, node_id: str) -> int:
         return self.node_levels[node_id]
 
+    def get_node_data(self, node_id: str) -> Dict[str, Any]:
+        """Return the node's attributes, including lazily computed analytics."""
+        self._ensure_analytics()
+        return dict(self.graph.nodes.get(node_id, {}))
+
     def get_leaf_nodes(self) -> List[str]:
         """Return nodes without outgoing edges (terminal nodes).
 
@@ -677,7 +769,7 @@ class DependencyGraph:
         for node in nodes:
             if getattr(node, "contains_sensitive_data", False):
                 for succ in self.get_node_dependents(node.id):
-                    succ_node = next((n for n in nodes if n.id == succ), None)
+                    succ_node = self._node_map.get(succ)
                     if succ_node and getattr(succ_node, "requires_external_io", False):
                         raise ValueError(
                             f"Sensitive data from node '{node.id}' flows into external I/O node '{succ}'."
@@ -709,24 +801,58 @@ class DependencyGraph:
         )
 
     def _check_cycles_with_recursive_support(self, nodes: List[Any]) -> None:
-        """Allow controlled cycles for recursive nodes, block unintended cycles."""
+        """Allow controlled cycles for recursive nodes, block unintended cycles.
+
+        Works per strongly connected component (linear time) instead of
+        enumerating every simple cycle.  A cyclic component is valid when it
+        contains a recursive node, at least one other member is among that
+        node's ``recursive_sources``, and removing the recursive nodes'
+        outgoing edges inside the component leaves it acyclic – i.e. every
+        cycle passes through a recursive node.  Those removed edges are the
+        loop's back edges and are skipped when assigning levels.
+        """
 
-        # Get all recursive node IDs and their configuration
-        recursive_nodes = {}
-        for node in nodes:
-            if hasattr(node, "type") and node.type == "recursive":
-                recursive_nodes[node.id] = node
-
-        cycles = list(nx.simple_cycles(self.graph))
-        if cycles:
-            for cycle in cycles:
-                # Check if cycle involves only recursive nodes and their declared sources
-                if not self._is_valid_recursive_cycle(cycle, recursive_nodes):
-                    cycle_str = " -> ".join(cycle)
-                    raise CircularDependencyError(
-                        f"Invalid cycle detected: {cycle_str}. "
-                        f"Only recursive nodes with properly declared recursive_sources may form cycles."
-                    )
+        recursive_nodes = {
+            node.id: node
+            for node in nodes
+            if hasattr(node, "type") and node.type == "recursive"
+        }
+
+        for component in nx.strongly_connected_components(self.graph):
+            if len(component) == 1:
+                (only,) = component
+                if not self.graph.has_edge(only, only):
+                    continue
+
+            back_edges = {
+                (u, v)
+                for u in component
+                if u in recursive_nodes
+                for v in self.graph.successors(u)
+                if v in component
+            }
+            residual = self.graph.subgraph(component).copy()
+            residual.remove_edges_from(back_edges)
+
+            if not (
+                back_edges
+                and self._is_valid_recursive_cycle(list(component), recursive_nodes)
+                and nx.is_directed_acyclic_graph(residual)
+            ):
+                offending = residual if back_edges else self.graph.subgraph(component)
+                try:
+                    cycle = [u for u, _ in nx.find_cycle(offending)]
+                except nx.NetworkXNoCycle:
+                    cycle = [
+                        u for u, _ in nx.find_cycle(self.graph.subgraph(component))
+                    ]
+                cycle_str = " -> ".join(cycle + cycle[:1])
+                raise CircularDependencyError(
+                    f"Invalid cycle detected: {cycle_str}. "
+                    f"Only recursive nodes with properly declared recursive_sources may form cycles."
+                )
+
+            self._recursive_back_edges.update(back_edges)
 
     def _is_valid_recursive_cycle(
         self, cycle: List[str], recursive_nodes: Dict[str, Any]
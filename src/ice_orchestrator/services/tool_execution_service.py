@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Optional
+import os
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Optional, cast
 
-from ice_core.metrics import EXEC_COMPLETED, EXEC_STARTED
+from ice_core.metrics import EXEC_COMPLETED, EXEC_STARTED, SINGLEFLIGHT_COALESCED
 from ice_core.models import NodeType
 from ice_core.protocols.tool import ITool
 from ice_core.unified_registry import registry
+from ice_core.utils.singleflight import SingleFlight, fingerprint
+
+# Process-wide so identical calls from different runs coalesce
+_inflight: SingleFlight[Dict[str, Any]] = SingleFlight()
 
 
 class ToolExecutionService:
@@ -58,7 +64,7 @@ class ToolExecutionService:
             if (
                 "memory" in sig.parameters
                 and context is not None
-                and isinstance(context, dict)
+                and isinstance(context, Mapping)
             ):
                 mem = context.get("memory")
                 if mem is not None:
@@ -66,13 +72,57 @@ class ToolExecutionService:
         except Exception:
             pass
 
-        if asyncio.iscoroutinefunction(execute_fn):
+        key = self._coalesce_key(tool_name, tool_instance, inputs)
+        if key is None:
+            result = await self._run(tool_instance, execute_fn, inputs)
+        else:
+            shared_result, shared = await _inflight.do(
+                key, lambda: self._run(tool_instance, execute_fn, inputs)
+            )
+            if shared:
+                SINGLEFLIGHT_COALESCED.labels("tool").inc()
+            # Top-level copy so callers can't mutate each other's result
+            result = dict(shared_result)
+
+        EXEC_COMPLETED.inc()
+        # Ensure str keys
+        return {str(k): v for k, v in result.items()}
+
+    @staticmethod
+    def _coalesce_key(
+        tool_name: str, tool_instance: Any, inputs: Dict[str, Any]
+    ) -> Optional[str]:
+        """Return the in-flight dedup key, or ``None`` to run the call alone.
+
+        Only tools declaring ``deterministic = True`` coalesce, and only when
+        ``ICE_TOOL_SINGLEFLIGHT=1``.  Inputs that are not JSON-serialisable
+        (e.g. injected memory handles) disable coalescing for the call.
+        """
+
+        if os.getenv("ICE_TOOL_SINGLEFLIGHT", "0") != "1":
+            return None
+        if not getattr(tool_instance, "deterministic", False):
+            return None
+        return fingerprint("tool", tool_name, inputs)
+
+    @staticmethod
+    async def _run(
+        tool_instance: Any, execute_fn: Callable[..., Any], inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        from ice_orchestrator.execution.tool_offload import (
+            dispatch_tool,
+            resolve_execution_mode,
+        )
+
+        if resolve_execution_mode(tool_instance) != "async":
+            # CPU-bound / blocking tools leave the event loop entirely
+            result = await dispatch_tool(tool_instance, inputs)
+        elif asyncio.iscoroutinefunction(execute_fn):
             result = await execute_fn(**inputs)
         else:
             # Run sync function in thread pool
             result = await asyncio.to_thread(execute_fn, **inputs)
 
-        EXEC_COMPLETED.inc()
         if result is None:
             result = {}
         if not isinstance(result, dict):
@@ -80,9 +130,7 @@ class ToolExecutionService:
                 result = dict(result)  # type: ignore[arg-type]
             except Exception:
                 result = {"result": result}
-        # Ensure str keys
-        coerced: Dict[str, Any] = {str(k): v for k, v in result.items()}
-        return coerced
+        return cast(Dict[str, Any], result)
 
     def _get_tool_instance(self, tool_name: str) -> Optional[ITool]:
         """Get tool instance from unified registry.
@@ -7,7 +7,11 @@ from typing import Any, Dict, List, Optional
 from ice_core.metrics import EXEC_COMPLETED, EXEC_STARTED
 from ice_core.models.mcp import NodeSpec
 from ice_core.models.node_models import NodeExecutionResult
-from ice_core.utils.node_conversion import convert_node_specs
+from ice_orchestrator.execution.checkpoint_store import (
+    CheckpointStore,
+    checkpoint_store_from_env,
+)
+from ice_orchestrator.execution.plan_cache import get_plan_cache
 from ice_orchestrator.workflow import Workflow
 
 # Importing registry solely for side-effects would be unused; remove to satisfy linter
@@ -28,6 +32,8 @@ class WorkflowExecutionService:
         inputs: Optional[Dict[str, Any]] = None,
         max_parallel: int = 5,
         name: str = "blueprint_run",
+        run_id: Optional[str] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ) -> NodeExecutionResult:
         """Execute a workflow from MCP blueprint specification.
 
@@ -36,6 +42,9 @@ class WorkflowExecutionService:
             inputs: Initial inputs for the workflow
             max_parallel: Maximum parallel execution
             name: Workflow name
+            run_id: Stable run identifier; with a checkpoint store, re-running
+                the same ``run_id`` resumes from the stored node results
+            checkpoint_store: Store override (defaults to ``ICE_CHECKPOINT_STORE``)
 
         Returns:
             Workflow execution results
@@ -43,10 +52,8 @@ class WorkflowExecutionService:
         # Preprocess: inject memory-aware helpers if requested (no duplication)
         processed_specs = self._apply_memory_aware_policy(node_specs)
 
-        # Convert NodeSpec to NodeConfig
-        node_configs = convert_node_specs(processed_specs)
-
         # Ensure first-party generated tools are registered explicitly
+        # (before conversion so their schemas are picked up)
         try:
             from ice_orchestrator.plugins import load_first_party_tools
 
@@ -54,23 +61,34 @@ class WorkflowExecutionService:
         except Exception:
             pass
 
+        # Conversion, schema population and graph construction are cached
+        # per spec content; each run only instantiates the plan
+        plan = await get_plan_cache().get_or_convert(processed_specs)
+
         # Create workflow with proper initial context
         # Merge provided inputs at the top level and also under the "inputs" key
         # so prompts can access placeholders like {topic} without nesting.
         initial_ctx = None
         if inputs:
             initial_ctx = {**inputs, "inputs": inputs}
-        workflow = Workflow(
-            nodes=node_configs,
+        store = None
+        if run_id is not None:
+            store = checkpoint_store or checkpoint_store_from_env()
+        workflow = plan.instantiate(
             name=name,
             max_parallel=max_parallel,
             initial_context=initial_ctx,
+            chain_id=run_id,
+            checkpoint_store=store,
         )
 
         # Execute workflow
         EXEC_STARTED.inc()
         try:
-            result = await workflow.execute()
+            if store is not None:
+                result = await workflow.resume()
+            else:
+                result = await workflow.execute()
             EXEC_COMPLETED.inc()
             return result
         except Exception:
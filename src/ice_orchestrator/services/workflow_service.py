@@ -14,6 +14,7 @@ import structlog
 from ice_core.models import NodeConfig
 from ice_core.services.contracts import IWorkflowService
 from ice_orchestrator.context import GraphContextManager
+from ice_orchestrator.execution.plan_cache import CompiledPlan
 from ice_orchestrator.workflow import Workflow
 
 # Tools are accessed via unified registry, not imported directly
@@ -51,6 +52,7 @@ class WorkflowService(IWorkflowService):
         *,
         run_id: str | None = None,
         event_emitter: Any | None = None,
+        plan: CompiledPlan | None = None,
     ) -> Dict[str, Any]:
         """Execute a workflow with the given nodes.
 
@@ -58,6 +60,8 @@ class WorkflowService(IWorkflowService):
             nodes: List of NodeConfig objects or compatible dicts
             name: Name of the workflow
             max_parallel: Maximum parallel execution (default: 5)
+            plan: Compiled plan for *nodes*; when given the workflow is
+                instantiated from it and per-blueprint validation is skipped
 
         Returns:
             Dictionary containing execution results with metrics
@@ -83,16 +87,24 @@ class WorkflowService(IWorkflowService):
                 if event_emitter:
                     event_emitter(event_name, payload)
 
-            workflow = Workflow(
-                nodes=node_configs,
-                name=name,
-                chain_id=run_id,
-                context_manager=self._context_manager,
-            )
-
-            # Validate workflow before execution
-            if hasattr(workflow, "validate"):
-                workflow.validate()
+            if plan is not None:
+                # Validated once when the plan was compiled
+                workflow = plan.instantiate(
+                    name=name,
+                    chain_id=run_id,
+                    context_manager=self._context_manager,
+                )
+            else:
+                workflow = Workflow(
+                    nodes=node_configs,
+                    name=name,
+                    chain_id=run_id,
+                    context_manager=self._context_manager,
+                )
+
+                # Validate workflow before execution
+                if hasattr(workflow, "validate"):
+                    workflow.validate()
 
             start_time = datetime.utcnow()
 
@@ -105,7 +105,7 @@ class ContextBuilder:  # – utility helper
             return data
 
         for key in path.split("."):
-            if isinstance(data, dict):
+            if isinstance(data, Mapping):
                 data = data[key]
             elif isinstance(data, list):
                 data = data[int(key)]
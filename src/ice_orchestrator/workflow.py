@@ -27,7 +27,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
 
 import structlog
 
@@ -83,12 +83,22 @@ from ice_core.utils.perf import WeightedSemaphore, estimate_complexity
 from ice_core.validation import SafetyValidator, SchemaValidator
 from ice_orchestrator.base_workflow import BaseWorkflow, FailurePolicy
 from ice_orchestrator.config import runtime_config
-from ice_orchestrator.context import GraphContextManager
+from ice_orchestrator.context import GraphContextManager, LayeredContext
 from ice_orchestrator.execution.cost_estimator import WorkflowCostEstimator
 
 # Canonical node executor implementation
+from ice_orchestrator.execution.checkpoint_store import CheckpointStore
 from ice_orchestrator.execution.executor import NodeExecutor
+from ice_orchestrator.execution.incremental import (
+    IncrementalPlan,
+    context_fingerprint,
+    node_fingerprint,
+)
 from ice_orchestrator.execution.metrics import ChainMetrics
+from ice_orchestrator.execution.scheduling import (
+    CriticalPathScheduler,
+    blueprint_key,
+)
 from ice_orchestrator.execution.workflow_events import (
     NodeCompleted,
     NodeFailed,
@@ -154,6 +164,8 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         depth_guard: Any | None = None,
         session_id: Optional[str] = None,
         use_cache: bool = True,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        dependency_graph: Optional[DependencyGraph] = None,
     ) -> None:
         """Initialize Workflow.
 
@@ -177,17 +189,19 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
             depth_guard: Depth guard for execution
             session_id: Session identifier
             use_cache: Engine-level cache toggle
+            checkpoint_store: Durable per-node checkpoint store keyed by
+                ``chain_id``; enables :meth:`resume` on another worker
+            dependency_graph: Graph already built by :meth:`prepare_nodes`
+                for exactly these *nodes* (see
+                :mod:`ice_orchestrator.execution.plan_cache`); skips schema
+                population, safety checks and graph construction
         """
         self.chain_id = chain_id or f"wf_{datetime.utcnow().isoformat()}"
         # Semantic version for migration tracking -----------------------
         self.version: str = version
 
-        # Blueprint layer: Auto-populate schemas for tool nodes BEFORE validation
-        nodes = self._populate_missing_schemas(nodes)
-
-        # Safety checks BEFORE super().__init__ builds runtime structures ----
-        SafetyValidator.validate_layer_boundaries()
-        SafetyValidator.validate_node_tool_access(nodes)
+        if dependency_graph is None:
+            nodes, dependency_graph = self.prepare_nodes(nodes)
 
         # Ensure _chain_tools is set before any use
         self._chain_tools = tools or []
@@ -214,9 +228,7 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         self._token_guard = token_guard
         self._depth_guard = depth_guard
 
-        # Build dependency graph
-        self.graph = DependencyGraph(nodes)
-        self.graph.validate_schema_alignment(nodes)
+        self.graph = dependency_graph
         self.levels = self.graph.get_level_nodes()
 
         # Track decisions made by *condition* nodes - must be after graph building
@@ -254,12 +266,20 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         self._event_handler = WorkflowEventHandler()
         self._cost_estimator: WorkflowCostEstimator = WorkflowCostEstimator()  # type: ignore[no-untyped-call]
         self._execution_state: Optional[WorkflowExecutionState] = None
+        self._incremental_plan: Optional[IncrementalPlan] = None
+        self._inputs_fingerprint: Optional[str] = None
+        self._checkpoint_store = checkpoint_store
+        self._run_fingerprints: Dict[str, str] = {}
+        # Orders ready nodes by remaining critical-path length
+        self._scheduler = CriticalPathScheduler(
+            blueprint_key(self.nodes.values()), self.graph.graph, self.nodes
+        )
 
         # Graph intelligence analyzer
         from ice_orchestrator.context.graph_analyzer import GraphAnalyzer
 
         self._graph_analyzer = GraphAnalyzer(
-            self.graph.graph
+            self.graph.graph, lineage=self.name
         )  # Use the NetworkX graph from DependencyGraph
 
         # Agent instance cache
@@ -269,7 +289,30 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         self._execution_start_times: Dict[str, float] = {}
         self._optimization_insights_enabled = True
 
-    def _populate_missing_schemas(self, nodes: List[NodeConfig]) -> List[NodeConfig]:
+    @classmethod
+    def prepare_nodes(
+        cls, nodes: List[NodeConfig]
+    ) -> Tuple[List[NodeConfig], DependencyGraph]:
+        """Run the per-blueprint setup: schemas, safety checks, graph.
+
+        Returns the schema-populated nodes and their validated dependency
+        graph.  The result depends only on *nodes*, so it can be computed
+        once per blueprint and handed to every run.
+        """
+
+        # Blueprint layer: Auto-populate schemas for tool nodes BEFORE validation
+        nodes = cls._populate_missing_schemas(nodes)
+
+        # Safety checks BEFORE any runtime structures are built ----------
+        SafetyValidator.validate_layer_boundaries()
+        SafetyValidator.validate_node_tool_access(nodes)
+
+        graph = DependencyGraph(nodes)
+        graph.validate_schema_alignment(nodes)
+        return nodes, graph
+
+    @staticmethod
+    def _populate_missing_schemas(nodes: List[NodeConfig]) -> List[NodeConfig]:
         """Blueprint layer: Auto-populate schemas for tool nodes.
 
         This is the critical bridge that makes the blueprint layer seamless -
@@ -293,10 +336,39 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
 
     async def execute(self) -> NodeExecutionResult:
         """Execute the workflow and return a ChainExecutionResult."""
+        self._incremental_plan = None
+        return await self._execute_plan(None)
+
+    async def _execute_plan(
+        self, plan: Optional[IncrementalPlan]
+    ) -> NodeExecutionResult:
+        """Run the level loop; with *plan*, reuse checkpointed results where valid."""
         start_time = datetime.utcnow()
+        metadata = self._context_metadata()
+        self._inputs_fingerprint = context_fingerprint(metadata)
+        if self._checkpoint_store is not None:
+            self._run_fingerprints = self._node_fingerprints()
+            inputs = metadata.get("inputs")
+            await self._persist_checkpoint(
+                self._checkpoint_store.write_header(
+                    self.chain_id,
+                    workflow_name=self.name or "unnamed",
+                    inputs=inputs if isinstance(inputs, dict) else None,
+                    inputs_fingerprint=self._inputs_fingerprint,
+                )
+            )
         results: Dict[str, NodeExecutionResult] = {}
         errors: List[str] = []
 
+        await self._scheduler.prepare()
+        await self.warm_analytics()
+        # Seed the graph with historical latencies so get_critical_path()
+        # weighs nodes by expected duration before this run has timed anything
+        for node_id, seconds in self._scheduler.expected.items():
+            node_data = self.graph.graph.nodes.get(node_id)
+            if node_data is not None and not node_data.get("execution_count"):
+                node_data["avg_execution_time"] = seconds
+
         logger.info(
             "Starting execution of workflow '%s' (ID: %s)", self.name, self.chain_id
         )
@@ -326,18 +398,41 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                     break
 
                 level_node_ids = self.levels[level_num]
+                if plan is not None:
+                    level_node_ids = plan.in_scope(level_node_ids)
                 # Filter nodes by branch decisions (condition gating) -----
                 active_node_ids = [
                     nid for nid in level_node_ids if self._is_node_active(nid)
                 ]
-                level_nodes = [self.nodes[node_id] for node_id in active_node_ids]
+
+                # Incremental runs: take still-valid results from the checkpoint
+                reused_results: Dict[str, NodeExecutionResult] = {}
+                if plan is not None:
+                    for nid in active_node_ids:
+                        if plan.can_reuse(nid, self.nodes[nid].dependencies, results):
+                            reused_results[nid] = plan.previous_results[nid]
+                            if self._execution_state:
+                                self._execution_state.record_node_reused(
+                                    nid, reused_results[nid]
+                                )
+                    plan.reused.update(reused_results)
+
+                level_nodes = [
+                    self.nodes[node_id]
+                    for node_id in active_node_ids
+                    if node_id not in reused_results
+                ]
 
                 level_results = await self._execute_level(level_nodes, results)
+                if plan is not None:
+                    plan.executed.update(level_results)
+                level_results = {**reused_results, **level_results}
 
                 for node_id, result in level_results.items():
                     results[node_id] = result
 
-                    if result.success:
+                    # Reused results cost nothing in this run ----------------
+                    if result.success and node_id not in reused_results:
                         if hasattr(result, "usage") and result.usage:
                             self.metrics.update(node_id, result)
 
@@ -393,6 +488,13 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                 duration=duration,
             )
 
+            if plan is not None and self._checkpoint_store is not None:
+                await self._persist_checkpoint(
+                    self._checkpoint_store.discard(
+                        self.chain_id, self._stale_nodes(plan)
+                    )
+                )
+
             chain_span.set_attribute("success", len(errors) == 0)
             if errors:
                 chain_span.set_status(Status(StatusCode.ERROR, ";".join(errors)))
@@ -467,6 +569,16 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                     node.id,
                     self._build_node_context(node, accumulated_results),
                 )
+                # Persist as soon as the node finishes so a crash mid-level
+                # keeps every completed node.
+                if self._checkpoint_store is not None:
+                    fingerprint = self._run_fingerprints.get(node.id)
+                    if fingerprint is not None:
+                        await self._persist_checkpoint(
+                            self._checkpoint_store.record_node(
+                                self.chain_id, node.id, result, fingerprint=fingerprint
+                            )
+                        )
                 return node.id, result
 
             # The context manager above always returns; this line is never
@@ -474,7 +586,8 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
             # exists on all code paths (mypy + pyright).
             raise RuntimeError("unreachable")  # pragma: no cover
 
-        tasks = [process_node(node) for node in level_nodes]
+        # Slots are granted in submission order, so submit long-tail nodes first
+        tasks = [process_node(node) for node in self._scheduler.order(level_nodes)]
         # Gather with *return_exceptions* so that a single processor failure does not
         # crash the entire level when *failure_policy* allows continuation.  Any
         # exception is immediately converted into a failed *NodeExecutionResult*
@@ -592,8 +705,8 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
             # Build enhanced context for recursive execution
             base_context = self._build_node_context(node, accumulated_results)
 
-            # Merge recursive context
-            enhanced_context = {**base_context, **recursive_context}
+            # Overlay recursive context
+            enhanced_context = base_context.overlay(recursive_context)
 
             # Execute the node with recursive context
             result = await self.execute_node(node_id, enhanced_context)
@@ -645,15 +758,18 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         self,
         node: NodeConfig,
         accumulated_results: Dict[str, NodeExecutionResult],
-    ) -> Dict[str, Any]:
+    ) -> LayeredContext:
         """Compose processor input context.
 
         1. Start with ContextBuilder-derived inputs (dependencies & mappings).
-        2. Merge **session metadata** from the active GraphContext so that
-           root-level placeholders like ``{tone}`` are resolvable without the
-           boilerplate of explicit ``input_mappings``.  Chain-level metadata
-           always takes *lower* precedence so explicit mappings win when keys
-           collide.
+        2. Layer **session metadata** from the active GraphContext underneath
+           so that root-level placeholders like ``{tone}`` are resolvable
+           without the boilerplate of explicit ``input_mappings``.  Chain-level
+           metadata always takes *lower* precedence so explicit mappings win
+           when keys collide.
+
+        Metadata is layered by reference, not copied; see
+        :class:`~ice_orchestrator.context.layered.LayeredContext`.
         """
 
         node_ctx = ContextBuilder.build_node_context(node, accumulated_results)
@@ -672,30 +788,23 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                 # Store only the output, not the entire NodeExecutionResult
                 node_ctx.setdefault(dep_id, dep_result.output)
 
-        # Inject high-level metadata provided via ``chain.context_manager`` so
+        # Layer high-level metadata provided via ``chain.context_manager`` so
         # that first-level nodes can access user inputs (e.g. tone, guardrails)
         # without needing dummy upstream nodes.
+        layers: List[Mapping[str, Any]] = [node_ctx]
         try:
             current_ctx = self.context_manager.get_context()
             if current_ctx and current_ctx.metadata:
-                # Merge top-level inputs for direct placeholder access (e.g., {topic})
-                md = dict(current_ctx.metadata)
-                inputs_dict = (
-                    md.get("inputs") if isinstance(md.get("inputs"), dict) else None
-                )
-                if inputs_dict is not None:
+                md = current_ctx.metadata
+                layers.append(md)
+                inputs_dict = md.get("inputs")
+                if isinstance(inputs_dict, dict):
                     # Expose inputs both flattened (for {name}) and nested (for {inputs.name})
-                    md_flat = {**inputs_dict, **md}
-                    # Ensure nested 'inputs' remains available for templates expecting it
-                    merged = {"inputs": inputs_dict, **md_flat, **node_ctx}
-                else:
-                    merged = {**md, **node_ctx}
-                # Preserve explicit mappings when keys overlap ----------------
-                return merged
+                    layers.extend([inputs_dict, {"inputs": inputs_dict}])
         except Exception:  # – never break execution due to ctx issues
             pass
 
-        return node_ctx
+        return LayeredContext(*layers)
 
     @staticmethod
     def _resolve_nested_path(data: Any, path: str) -> Any:
@@ -974,13 +1083,19 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
     ) -> NodeExecutionResult:
         """Execute workflow incrementally for debugging or preview.
 
+        Results in *from_checkpoint* are reused for nodes whose configuration
+        and upstream outputs are unchanged; only the dirty subgraph runs.
+
         Args:
-            up_to_node_id: Stop after this node completes
-            from_checkpoint: Resume from saved state
+            up_to_node_id: Only run this node and its ancestors
+            from_checkpoint: Resume from saved state (see ``create_checkpoint``)
 
         Returns:
             Partial execution result
         """
+        if up_to_node_id is not None and up_to_node_id not in self.nodes:
+            raise ValueError(f"Unknown node '{up_to_node_id}'")
+
         if from_checkpoint:
             self._execution_state = WorkflowExecutionState.from_checkpoint(
                 from_checkpoint
@@ -990,9 +1105,98 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                 workflow_id=self.chain_id, workflow_name=self.name or "unnamed"
             )
 
-        # Incremental execution not yet implemented
-        # For now, delegate to regular execute
-        return await self.execute()
+        fingerprints = self._node_fingerprints()
+        plan = IncrementalPlan.build(
+            self.graph,
+            fingerprints,
+            context_fingerprint(self._context_metadata()),
+            from_checkpoint or {},
+            self._execution_state.flat_results(),
+            up_to_node_id=up_to_node_id,
+        )
+        logger.info(
+            "Incremental execution planned",
+            workflow=self.name,
+            changed=len(plan.changed),
+            dirty=len(plan.dirty),
+            scope=len(plan.scope),
+        )
+        self._incremental_plan = plan
+        return await self._execute_plan(plan)
+
+    def create_checkpoint(self) -> Dict[str, Any]:
+        """Snapshot the current execution state for a later incremental run.
+
+        Node fingerprints are stamped only for results that are valid for the
+        current configuration, so stale results are re-executed on resume.
+        """
+        if not self._execution_state:
+            raise RuntimeError("No execution state – run the workflow first")
+
+        state = self._execution_state
+        fingerprints = self._node_fingerprints()
+        plan = self._incremental_plan
+        if plan is None:
+            valid = state.completed_nodes - state.failed_nodes
+            stale: set[str] = set()
+        else:
+            valid = plan.executed | plan.reused
+            stale = self._stale_nodes(plan)
+
+        for nid in valid:
+            if nid in fingerprints:
+                state.node_fingerprints[nid] = fingerprints[nid]
+        for nid in stale:
+            state.node_fingerprints.pop(nid, None)
+        state.inputs_fingerprint = self._inputs_fingerprint
+        return state.create_checkpoint()
+
+    async def resume(self) -> NodeExecutionResult:
+        """Continue this run (``chain_id``) from the configured checkpoint store.
+
+        Nodes whose results were persisted by a previous worker are reused;
+        everything else executes.  Without stored data this is a full run.
+        The checkpoint is deleted once the run succeeds.
+        """
+        if self._checkpoint_store is None:
+            raise RuntimeError("resume() requires a checkpoint_store")
+        checkpoint = await self._checkpoint_store.load(self.chain_id)
+        if checkpoint:
+            logger.info(
+                "Resuming workflow from checkpoint",
+                chain_id=self.chain_id,
+                stored_nodes=len(checkpoint.get("node_fingerprints") or {}),
+            )
+        result = await self.execute_incremental(from_checkpoint=checkpoint)
+        if result.success:
+            await self._persist_checkpoint(
+                self._checkpoint_store.delete(self.chain_id)
+            )
+        return result
+
+    def _stale_nodes(self, plan: IncrementalPlan) -> set[str]:
+        """Nodes whose stored results no longer match what this run produced."""
+        valid = plan.executed | plan.reused
+        return (plan.dirty | self.graph.get_downstream_nodes(plan.executed)) - valid
+
+    async def _persist_checkpoint(self, op: Any) -> None:
+        # Checkpointing is best-effort: a store outage must not fail the run
+        try:
+            await op
+        except Exception as exc:
+            logger.warning(
+                "Checkpoint write failed", chain_id=self.chain_id, error=str(exc)
+            )
+
+    def _node_fingerprints(self) -> Dict[str, str]:
+        return {nid: node_fingerprint(node) for nid, node in self.nodes.items()}
+
+    def _context_metadata(self) -> Dict[str, Any]:
+        try:
+            ctx = self.context_manager.get_context()
+        except Exception:
+            return {}
+        return dict(ctx.metadata) if ctx and ctx.metadata else {}
 
     def estimate_cost(self, context_size: int = 1000) -> Any:
         """Estimate execution cost before running.
@@ -1192,6 +1396,14 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
             return None
         return self._execution_state.get_execution_summary()
 
+    async def warm_analytics(self) -> None:
+        """Load shared (Redis) graph analytics for this workflow's shape.
+
+        The analytics accessors below are synchronous and only consult the
+        process-local cache; async callers await this first.
+        """
+        await self._graph_analyzer.cache.warm(self.graph.graph, lineage=self.name)
+
     def get_visual_layout_hints(self) -> Dict[str, Dict[str, Any]]:
         """Provide layout hints for canvas visualization.
 
@@ -1307,7 +1519,7 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
     async def execute_node_config(
         self,
         node_config: "NodeConfig",
-        input_data: Dict[str, Any],
+        input_data: Mapping[str, Any],
         parent_id: Optional[str] = None,
     ) -> NodeExecutionResult:
         """Execute a node configuration directly (for nested nodes)."""
@@ -1331,7 +1543,7 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                 self.nodes.pop(temp_id, None)
 
     async def execute_node(
-        self, node_id: str, input_data: Dict[str, Any]
+        self, node_id: str, input_data: Mapping[str, Any]
     ) -> NodeExecutionResult:
         """Execute a single processor with enhanced NetworkX analytics tracking."""
 
@@ -1348,8 +1560,8 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         # Emit node started event with enhanced graph metadata
         node = self.nodes.get(node_id)
         if node:
-            # Get rich node metadata from enhanced graph
-            node_data = self.graph.graph.nodes.get(node_id, {})
+            # Get rich node metadata (and cached analytics) from the graph
+            node_data = self.graph.get_node_data(node_id)
 
             await self._event_handler.emit(
                 NodeStarted(
@@ -1406,10 +1618,18 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
                 str(result.error) if hasattr(result, "error") and result.error else None
             ),
         )
+        if result.success:
+            await self._scheduler.observe(node_id, execution_time)
 
         # 🚀 Track data transfer statistics for dependencies
         if result.success and input_data:
-            estimated_data_size = len(str(input_data).encode("utf-8"))  # Rough estimate
+            # Only the node's own layer; shared session metadata is not transferred
+            own_data = (
+                input_data.local
+                if isinstance(input_data, LayeredContext)
+                else input_data
+            )
+            estimated_data_size = len(str(own_data).encode("utf-8"))  # Rough estimate
             for dep_id in node.dependencies if node else []:
                 self.graph.update_data_transfer_stats(
                     source_id=dep_id,
@@ -1451,7 +1671,7 @@ class Workflow(BaseWorkflow):  # type: ignore[misc]  # mypy cannot resolve BaseS
         # 🚀 Enhanced NetworkX insights - Emit optimization insights
         if self._optimization_insights_enabled:
             optimization_insights = self.graph.get_optimization_insights()
-            canvas_hints = self.graph.get_canvas_layout_hints()
+            canvas_hints = self.graph.get_canvas_layout_hints(lineage=self.name)
 
             # Publish via async event handler (no legacy _emit_event).
             await self._event_handler.emit(
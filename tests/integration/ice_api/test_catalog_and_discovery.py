@@ -47,3 +47,21 @@ def test_meta_nodes_catalog_contains_generated_tools_with_hints() -> None:
     # Some frameworks might not expose generic schemas; we at least ensure endpoint works for 'tool' via type-specific
     res3 = client.get("/api/v1/meta/nodes/tool/schema")
     assert res3.status_code == 200
+
+
+def test_meta_nodes_catalog_revalidates_with_etag() -> None:
+    res = client.get("/api/v1/meta/nodes")
+    assert res.status_code == 200
+    etag = res.headers["etag"]
+
+    not_modified = client.get("/api/v1/meta/nodes", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    from ice_core.registry import registry
+
+    registry.register_agent("etag_probe_agent", "ice_core.base_tool:ToolBase")
+    refreshed = client.get("/api/v1/meta/nodes", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert "etag_probe_agent" in refreshed.json()["agents"]
@@ -1,9 +1,12 @@
 import asyncio
 import os
+import resource
 import sys
+import time
 
 import pytest
 
+from ice_orchestrator.execution.sandbox.isolation import IsolatedTaskError
 from ice_orchestrator.execution.sandbox.resource_sandbox import ResourceSandbox
 
 # Skip stress tests in constrained Docker/CI environments to avoid OOM kills
@@ -13,26 +16,40 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+def _big_alloc() -> str:
+    # Attempt to allocate 1 GB
+    _ = bytearray(1024 * 1024 * 1024)
+    return "allocation succeeded"  # pragma: no cover – should not reach
+
+
+def _fork_bomb() -> None:
+    # Bomb for 3 seconds or until killed
+    end_time = time.monotonic() + 3
+    while time.monotonic() < end_time:
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0)
+        else:
+            os.waitpid(pid, 0)
+
+
 @pytest.mark.asyncio
 @pytest.mark.skipif(
     sys.platform == "darwin",
     reason="Resource sandbox stress tests skipped on macOS due to OS-level limits",
 )
 async def test_big_allocation_memory_limit():
-    """Allocating >512 MB should raise MemoryError or be killed within sandbox."""
-
-    async def _big_alloc():  # noqa: D401
-        # Attempt to allocate 1 GB
-        try:
-            _ = bytearray(1024 * 1024 * 1024)
-        except MemoryError:
-            raise
-        return "allocation succeeded"  # pragma: no cover – should not reach
-
-    sandbox = ResourceSandbox(timeout_seconds=5, memory_limit_mb=512)
-    with pytest.raises((MemoryError, asyncio.TimeoutError, asyncio.CancelledError)):
+    """Allocating >512 MB should raise MemoryError inside the isolated task."""
+
+    before = resource.getrlimit(resource.RLIMIT_AS)
+    sandbox = ResourceSandbox(
+        timeout_seconds=5, memory_limit_mb=512, isolation="subprocess"
+    )
+    with pytest.raises((MemoryError, asyncio.TimeoutError, IsolatedTaskError)):
         async with sandbox as sbx:
-            await sbx.run_with_timeout(_big_alloc())
+            await sbx.run_isolated(_big_alloc)
+    # Limits are per task: the host process is never constrained
+    assert resource.getrlimit(resource.RLIMIT_AS) == before
 
 
 @pytest.mark.asyncio
@@ -46,21 +63,32 @@ async def test_fork_bomb_cpu_limit():
     if not hasattr(os, "fork"):
         pytest.skip("os.fork not available on this platform")
 
-    async def _fork_bomb():  # noqa: D401
-        # Bomb for 3 seconds or until killed
-        end_time = asyncio.get_event_loop().time() + 3
-        while asyncio.get_event_loop().time() < end_time:
-            pid = os.fork()
-            if pid == 0:
-                os._exit(0)
-            else:
-                os.waitpid(pid, 0)
-
     sandbox = ResourceSandbox(
-        timeout_seconds=3, cpu_limit_seconds=1, memory_limit_mb=256
+        timeout_seconds=3,
+        cpu_limit_seconds=1,
+        memory_limit_mb=256,
+        isolation="subprocess",
     )
-    with pytest.raises(
-        (asyncio.TimeoutError, asyncio.CancelledError, ProcessLookupError)
-    ):
+    with pytest.raises((asyncio.TimeoutError, IsolatedTaskError)):
         async with sandbox as sbx:
-            await sbx.run_with_timeout(_fork_bomb())
+            await sbx.run_isolated(_fork_bomb)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sandboxes_do_not_share_limits():
+    """In-process sandboxes only apply a timeout to their own task."""
+
+    async def _work(delay: float) -> float:
+        async with ResourceSandbox(timeout_seconds=1, memory_limit_mb=64):
+            await asyncio.sleep(delay)
+            # Would fail if a sibling's 64 MB RLIMIT_AS leaked process-wide
+            return len(bytearray(128 * 1024 * 1024)) / delay
+
+    before = resource.getrlimit(resource.RLIMIT_AS)
+    results = await asyncio.gather(_work(0.01), _work(0.02), _work(0.03))
+    assert len(results) == 3
+    assert resource.getrlimit(resource.RLIMIT_AS) == before
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with ResourceSandbox(timeout_seconds=0.05):  # type: ignore[arg-type]
+            await asyncio.sleep(1)
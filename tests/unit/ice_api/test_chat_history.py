@@ -0,0 +1,59 @@
+"""Chat session history: O(1) appends, token-budgeted tail, legacy migration."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from ice_api.redis_client import _RedisStub
+from ice_api.services.chat_history import ChatHistory, extractive_summary
+
+
+def _history(**kwargs) -> ChatHistory:  # noqa: ANN003
+    return ChatHistory(_RedisStub(), "agent", uuid.uuid4().hex, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_tail_returns_newest_messages_within_budget() -> None:
+    history = _history()
+    for i in range(40):
+        await history.append({"role": "user", "content": f"message {i:02d} " * 5})
+
+    # Offline estimate: len("user") // 4 + len(content) // 4 + 4 = 18 tokens
+    tail, summary = await history.tail(token_budget=100)
+    assert summary == ""
+    assert [m["content"].split()[1] for m in tail] == ["35", "36", "37", "38", "39"]
+
+    everything, _ = await history.tail(token_budget=10_000)
+    assert len(everything) == 40
+    assert everything[0]["content"].startswith("message 00")
+
+
+@pytest.mark.asyncio
+async def test_legacy_hash_is_migrated_and_reset_clears() -> None:
+    history = _history()
+    legacy = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "yo"}]
+    await history._redis.hset(history.legacy_key, {"messages": json.dumps(legacy)})
+
+    tail, _ = await history.tail(token_budget=1000)
+    assert tail == legacy
+    assert await history._redis.hget(history.legacy_key, "messages") is None
+
+    await history.reset()
+    assert await history.tail(token_budget=1000) == ([], "")
+
+
+@pytest.mark.asyncio
+async def test_evicted_messages_are_summarized_in_background() -> None:
+    history = _history(max_messages=4, summarizer=extractive_summary)
+    for i in range(6):
+        await history.append({"role": "user", "content": f"Turn {i}. Details."})
+    await asyncio.sleep(0)  # let the summarization tasks run
+    await asyncio.sleep(0)
+
+    tail, summary = await history.tail(token_budget=1000)
+    assert [m["content"] for m in tail] == [f"Turn {i}. Details." for i in range(2, 6)]
+    assert summary.splitlines() == ["user: Turn 0", "user: Turn 1"]
@@ -0,0 +1,86 @@
+"""Versioned response cache, ETag matching and the registry generation."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from ice_api.http_cache import VersionedResponseCache, etag_matches
+from ice_core.base_tool import ToolBase
+from ice_core.models import NodeType
+from ice_core.unified_registry import Registry
+
+
+class _EchoTool(ToolBase):
+    name: str = "echo_tool"
+    description: str = "Echo"
+
+    async def _execute_impl(self, **kwargs: Any) -> Dict[str, Any]:
+        return kwargs
+
+
+@pytest.mark.asyncio
+async def test_body_is_built_once_per_version() -> None:
+    cache = VersionedResponseCache()
+    builds: List[int] = []
+
+    def build() -> Dict[str, Any]:
+        builds.append(1)
+        return {"tools": ["a"], "n": len(builds)}
+
+    first = await cache.get("x", 1, build)
+    again = await cache.get("x", 1, build)
+    assert again is first and len(builds) == 1
+
+    bumped = await cache.get("x", 2, build)
+    assert len(builds) == 2
+    assert bumped.etag != first.etag
+    assert bumped.etag.startswith('"') and not bumped.etag.startswith("W/")
+
+
+@pytest.mark.asyncio
+async def test_async_builders_and_identical_content_share_etag() -> None:
+    cache = VersionedResponseCache()
+
+    async def build() -> List[str]:
+        return ["a", "b"]
+
+    one = await cache.get("x", 1, build)
+    two = await cache.get("y", 7, build)
+    assert one.body == b'["a","b"]'
+    assert one.etag == two.etag
+
+
+def test_if_none_match_comparison() -> None:
+    tag = '"abc"'
+    assert etag_matches('"abc"', tag)
+    assert etag_matches('"zzz", W/"abc"', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"abd"', tag)
+    assert not etag_matches(None, tag)
+
+
+def test_registry_generation_bumps_on_registration() -> None:
+    reg = Registry()
+    start = reg.generation
+
+    reg.register_agent("agent_a", "pkg.mod:Agent")
+    assert reg.generation == start + 1
+    # Idempotent re-registration changes nothing
+    reg.register_agent("agent_a", "pkg.mod:Agent")
+    assert reg.generation == start + 1
+
+    reg.register_tool_factory("tool_a", "pkg.mod:create")
+    reg.clear_tool_factories()
+    assert reg.generation == start + 3
+
+
+def test_lazy_tool_factories_do_not_bump_the_generation() -> None:
+    reg = Registry()
+    reg.register_class(NodeType.TOOL, "echo_tool", _EchoTool)  # type: ignore[arg-type]
+    start = reg.generation
+
+    assert isinstance(reg.get_tool_instance("echo_tool"), _EchoTool)
+    assert isinstance(reg.get_tool_instance("echo_tool"), _EchoTool)
+    assert reg.generation == start
@@ -0,0 +1,51 @@
+"""Opaque keyset cursors and page-by-page NDJSON streaming."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from fastapi import HTTPException
+
+from ice_api.pagination import (
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+    stream_pages,
+)
+
+
+def test_cursor_round_trips_datetimes_and_ids() -> None:
+    ts = dt.datetime(2025, 9, 1, 12, 30, tzinfo=dt.timezone.utc)
+    cursor = encode_cursor(ts, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, arity=2) == [ts, 42]
+
+
+@pytest.mark.parametrize("bad", ["not-base64!", encode_cursor(1), "e30"])
+def test_malformed_cursor_is_a_client_error(bad: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(bad, arity=2)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stream_pages_follows_cursors_and_emits_ndjson() -> None:
+    rows = list(range(7))
+    calls: List[Optional[str]] = []
+
+    async def fetch_page(cursor: Optional[str]) -> Tuple[List[Any], Optional[str]]:
+        calls.append(cursor)
+        start = decode_cursor(cursor, arity=1)[0] if cursor else 0
+        page = rows[start : start + 3]
+        more = start + 3 < len(rows)
+        return [{"n": n} for n in page], encode_cursor(start + 3) if more else None
+
+    response = ndjson_response(stream_pages(fetch_page))
+    assert response.media_type == "application/x-ndjson"
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert [json.loads(line)["n"] for line in body.splitlines()] == rows
+    assert len(calls) == 3 and calls[0] is None
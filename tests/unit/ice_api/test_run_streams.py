@@ -0,0 +1,97 @@
+"""Run event streams: one shared reader per stream, resume and catch-up."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import Any, List, Optional
+
+import pytest
+
+from ice_api.redis_client import _RedisStub
+from ice_api.run_streams import StreamMultiplexer
+
+
+class _CountingRedis(_RedisStub):
+    def __init__(self) -> None:
+        self.reads = 0
+
+    async def xread(self, streams: Any, block: int = 0, count: Any = None) -> Any:
+        self.reads += 1
+        if block:
+            await asyncio.sleep(0.01)
+        return await super().xread(streams, block=block, count=count)
+
+
+async def _emit(redis: _RedisStub, stream: str, *events: str) -> None:
+    for name in events:
+        await redis.xadd(stream, {"event": name, "payload": "{}"})
+
+
+async def _collect(
+    mux: StreamMultiplexer, stream: str, last_event_id: Optional[str] = None
+) -> List[str]:
+    ids: List[str] = []
+    async for ev_id, _ in mux.subscribe(stream, last_event_id=last_event_id):
+        ids.append(ev_id)
+    return ids
+
+
+@pytest.fixture
+def stream() -> str:
+    return f"stream:test:{uuid.uuid4().hex}"
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_reader(stream: str) -> None:
+    redis = _CountingRedis()
+    mux = StreamMultiplexer(redis, idle_seconds=5)
+    await _emit(redis, stream, "node.started")
+
+    tasks = [asyncio.create_task(_collect(mux, stream)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    assert mux.active_streams == [stream]
+    reads = redis.reads
+    await _emit(redis, stream, "node.finished", "workflow.finished")
+    results = await asyncio.wait_for(asyncio.gather(*tasks), 2)
+
+    assert all(r == ["1-0", "2-0", "3-0"] for r in results)
+    # A handful of shared reads, not one loop per subscriber
+    assert redis.reads - reads < 10
+    await mux.aclose()
+
+
+@pytest.mark.asyncio
+async def test_resumes_after_last_event_id(stream: str) -> None:
+    redis = _CountingRedis()
+    mux = StreamMultiplexer(redis, idle_seconds=5)
+    await _emit(redis, stream, "a", "b", "c", "workflow.finished")
+
+    assert await asyncio.wait_for(_collect(mux, stream, "2-0"), 2) == ["3-0", "4-0"]
+    await mux.aclose()
+
+
+@pytest.mark.asyncio
+async def test_evicted_entries_are_read_back_from_redis(stream: str) -> None:
+    redis = _CountingRedis()
+    mux = StreamMultiplexer(redis, buffer_size=3, batch_size=4, idle_seconds=5)
+    await _emit(redis, stream, *[f"e{i}" for i in range(11)], "workflow.finished")
+
+    first = await asyncio.wait_for(_collect(mux, stream), 2)
+    late = await asyncio.wait_for(_collect(mux, stream, "4-0"), 2)
+
+    assert first == [f"{i}-0" for i in range(1, 13)]
+    assert late == [f"{i}-0" for i in range(5, 13)]
+    await mux.aclose()
+
+
+@pytest.mark.asyncio
+async def test_reader_stops_when_idle(stream: str) -> None:
+    redis = _CountingRedis()
+    mux = StreamMultiplexer(redis, idle_seconds=0.05)
+    await _emit(redis, stream, "workflow.finished")
+
+    assert await asyncio.wait_for(_collect(mux, stream), 2) == ["1-0"]
+    await asyncio.sleep(0.2)
+
+    assert mux.active_streams == []
@@ -0,0 +1,116 @@
+"""MCP WebSocket gateway: rooms, per-client queues and coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, List, Optional
+
+import pytest
+
+from ice_api import ws_gateway
+from ice_api.ws_gateway import _Client, publish
+
+
+class _RecordingSocket:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.sent: List[dict[str, Any]] = []
+        self.closed: Optional[int] = None
+
+    async def send_text(self, text: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = code
+
+
+@pytest.fixture(autouse=True)
+def _isolated_rooms(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ws_gateway, "_rooms", {})
+    monkeypatch.setattr(ws_gateway, "_get_bridge", lambda: None)
+
+
+def _join(room: str, ws: _RecordingSocket, maxsize: int = 16) -> _Client:
+    client = _Client(ws, room, maxsize)  # type: ignore[arg-type]
+    ws_gateway._rooms.setdefault(room, set()).add(client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_cursor_messages_are_latest_wins_in_place() -> None:
+    ws = _RecordingSocket()
+    client = _join("bp1", ws)
+
+    await publish("bp1", {"t": "cursor", "user": "u1", "x": 1, "y": 1})
+    await publish("bp1", {"t": "patch_node", "node_id": "n", "field": "f", "value": 1})
+    await publish("bp1", {"t": "cursor", "user": "u1", "x": 9, "y": 9})
+    await publish("bp1", {"t": "cursor", "user": "u2", "x": 5, "y": 5})
+
+    sender = asyncio.create_task(client.run(send_timeout=1.0))
+    await asyncio.sleep(0.01)
+    sender.cancel()
+
+    assert [(m["t"], m.get("user"), m.get("x")) for m in ws.sent] == [
+        ("cursor", "u1", 9),
+        ("patch_node", None, None),
+        ("cursor", "u2", 5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rooms_are_isolated_and_slow_clients_do_not_block() -> None:
+    fast, slow, other = (
+        _RecordingSocket(),
+        _RecordingSocket(delay=10),
+        _RecordingSocket(),
+    )
+    clients = [_join("bp1", fast), _join("bp1", slow), _join("bp2", other)]
+    senders = [asyncio.create_task(c.run(send_timeout=0.05)) for c in clients]
+
+    for i in range(3):
+        await publish(
+            "bp1", {"t": "patch_node", "node_id": "n", "field": "f", "value": i}
+        )
+    await asyncio.sleep(0.1)
+
+    assert [m["value"] for m in fast.sent] == [0, 1, 2]
+    assert other.sent == []
+    assert slow.closed == 1013
+    for task in senders:
+        task.cancel()
+
+
+def test_reliable_overflow_disconnects_but_telemetry_is_shed() -> None:
+    client = _Client(_RecordingSocket(), "bp1", maxsize=2)  # type: ignore[arg-type]
+    for node in ("a", "b", "c"):
+        data = {"t": "telemetry", "node_id": node, "latency_ms": 1, "cost": 0}
+        client.offer(data, json.dumps(data))
+    assert len(client._pending) == 2 and not client.overflowed
+
+    for i in range(3):
+        data = {"t": "patch_node", "node_id": "n", "field": "f", "value": i}
+        client.offer(data, json.dumps(data))
+    assert client.overflowed
+
+
+@pytest.mark.asyncio
+async def test_overflow_during_a_send_closes_the_connection() -> None:
+    ws = _RecordingSocket(delay=0.05)
+    client = _Client(ws, "bp1", maxsize=2)  # type: ignore[arg-type]
+    sender = asyncio.create_task(client.run(send_timeout=1.0))
+
+    def patch(i: int) -> None:
+        data = {"t": "patch_node", "node_id": "n", "field": "f", "value": i}
+        client.offer(data, json.dumps(data))
+
+    patch(0)
+    await asyncio.sleep(0.01)  # first send is now in flight
+    for i in range(1, 4):
+        patch(i)
+    assert client.overflowed
+
+    await asyncio.wait_for(sender, 1.0)
+    assert ws.closed == 1013
@@ -0,0 +1,125 @@
+"""Unit tests for the async load generator (``ice loadtest``).
+
+The network layer is stubbed with ``httpx.MockTransport``.
+"""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from ice_cli.commands.loadtest import (
+    LatencyHistogram,
+    LoadTarget,
+    parse_prometheus_text,
+    run_load,
+)
+
+BASE_URL = "http://fake-api"
+
+
+def test_histogram_percentiles_and_buckets() -> None:
+    hist = LatencyHistogram(buckets=(0.1, 1.0, float("inf")))
+    for ms in range(1, 101):
+        hist.observe(ms / 100.0)
+
+    assert hist.count == 100
+    assert hist.percentile(50) == pytest.approx(0.5)
+    assert hist.percentile(95) == pytest.approx(0.95)
+    assert hist.percentile(99) == pytest.approx(0.99)
+    assert [n for _, n in hist.buckets()] == [10, 90, 0]
+
+
+def test_parse_prometheus_text_sums_label_sets() -> None:
+    text = "\n".join(
+        [
+            "# HELP executions_in_flight queue",
+            'executions_in_flight{surface="executions"} 3.0',
+            'executions_in_flight{surface="mcp_runs"} 2.0',
+            "executions_started_total 10.0",
+            "unrelated_metric 99",
+        ]
+    )
+    parsed = parse_prometheus_text(
+        text, ("executions_in_flight", "executions_started_total")
+    )
+    assert parsed == {"executions_in_flight": 5.0, "executions_started_total": 10.0}
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_executions_wait_completion() -> None:
+    seen_wait: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/metrics":
+            return httpx.Response(404)
+        seen_wait.append(request.url.params.get("wait_seconds", ""))
+        body = json.loads(request.content)
+        status = "failed" if body["inputs"]["session_id"] == "s_3" else "completed"
+        return httpx.Response(202, json={"execution_id": "e", "status": status})
+
+    target = LoadTarget(
+        kind="executions",
+        completion="wait",
+        timeout=5.0,
+        blueprint_id="bp",
+        inputs={"session_id": "s_{n}"},
+    )
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    ) as client:
+        stats = await run_load(
+            target, client, mode="closed", duration=5.0, concurrency=4, max_requests=8
+        )
+
+    assert stats.started == 8
+    assert stats.succeeded == 7
+    assert dict(stats.errors) == {"run_failed": 1}
+    assert stats.latency.count == 7
+    assert all(w == "5.0" for w in seen_wait)
+    assert stats.server == {"available": False}
+
+
+@pytest.mark.asyncio
+async def test_open_loop_mcp_runs_consume_sse() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/metrics":
+            return httpx.Response(
+                200, text='executions_in_flight{surface="mcp_runs"} 1.0\n'
+            )
+        if path == "/api/mcp/runs":
+            return httpx.Response(202, json={"run_id": "run_1"})
+        if path == "/api/mcp/runs/run_1/events":
+            stream = (
+                "event: node.completed\ndata: {}\n\n"
+                'event: workflow.finished\ndata: {"run_id": "run_1", "success": true}\n\n'
+            )
+            return httpx.Response(
+                200, text=stream, headers={"content-type": "text/event-stream"}
+            )
+        return httpx.Response(404)
+
+    target = LoadTarget(
+        kind="mcp-runs", completion="sse", timeout=5.0, blueprint_id="bp"
+    )
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    ) as client:
+        stats = await run_load(
+            target,
+            client,
+            mode="open",
+            duration=5.0,
+            rps=200.0,
+            max_requests=5,
+            metrics_interval=0.01,
+        )
+
+    assert stats.started == 5
+    assert stats.succeeded == 5
+    assert stats.failed == 0
+    assert stats.server["available"] is True
+    assert stats.server["executions_in_flight"]["max"] == 1.0
@@ -0,0 +1,203 @@
+"""EpisodicMemory on Redis: index-backed queries, never a keyspace scan."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+
+from ice_core.memory.episodic_memory_store import EpisodicMemory
+from ice_core.memory.memory_base_protocol import MemoryConfig
+
+
+class _FakeAsyncRedis:
+    """The slice of ``redis.asyncio.Redis`` EpisodicMemory uses (no KEYS/SCAN)."""
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.zsets: Dict[str, Dict[str, float]] = {}
+        self.sets: Dict[str, set] = {}
+
+    # -- commands ---------------------------------------------------------
+    def hset(self, key: str, mapping: Dict[str, str]) -> int:
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key: str, seconds: int) -> bool:
+        return True
+
+    def delete(self, *keys: str) -> int:
+        n = 0
+        for key in keys:
+            for store in (self.hashes, self.zsets, self.sets):
+                n += store.pop(key, None) is not None
+        return n
+
+    def sadd(self, key: str, *members: str) -> int:
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    def smembers(self, key: str) -> set:
+        return set(self.sets.get(key, set()))
+
+    def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zrem(self, key: str, *members: str) -> int:
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    def zremrangebyscore(self, key: str, low: Any, high: float) -> int:
+        zset = self.zsets.get(key, {})
+        gone = [m for m, s in zset.items() if s <= high]
+        for m in gone:
+            del zset[m]
+        return len(gone)
+
+    @staticmethod
+    def _bound(value: Any) -> float:
+        return float(str(value).replace("inf", "Infinity")) if value else 0.0
+
+    def zrangebyscore(self, key, low, high, start=0, num=None):  # noqa: ANN001
+        lo, hi = self._bound(low), self._bound(high)
+        items = sorted(
+            (s, m) for m, s in self.zsets.get(key, {}).items() if lo <= s <= hi
+        )
+        members = [m for _, m in items][start:]
+        return members[:num] if num is not None else members
+
+    def zrevrangebyscore(self, key, high, low, start=0, num=None):  # noqa: ANN001
+        members = self.zrangebyscore(key, low, high)[::-1][start:]
+        return members[:num] if num is not None else members
+
+    def zrange(self, key: str, start: int, stop: int) -> List[str]:
+        return self.zrangebyscore(key, "-inf", "+inf")[start : stop + 1]
+
+    def zrangebylex(self, key, low, high, start=0, num=None):  # noqa: ANN001
+        members = sorted(self.zsets.get(key, {}))
+        if low != "-":
+            members = [m for m in members if m >= low[1:]]
+        if high != "+":
+            members = [m for m in members if m <= high[1:]]
+        return members[start : start + num] if num is not None else members
+
+    def zinterstore(self, dest: str, keys: List[str], aggregate: str) -> int:
+        sets = [self.zsets.get(k, {}) for k in keys]
+        common = set(sets[0]).intersection(*sets[1:])
+        self.zsets[dest] = {m: max(s[m] for s in sets) for m in common}
+        return len(common)
+
+    # -- plumbing -----------------------------------------------------------
+    async def ping(self) -> bool:
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError(f"unexpected Redis command {name!r}")
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeAsyncRedis) -> None:
+        self._redis = redis
+        self._calls: List[Any] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _queue(*args: Any, **kwargs: Any) -> "_FakePipeline":
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self) -> List[Any]:
+        return [getattr(self._redis, n)(*a, **k) for n, a, k in self._calls]
+
+
+def _async(redis: _FakeAsyncRedis) -> Any:
+    """Expose direct commands as coroutines, like ``redis.asyncio``."""
+
+    class _Client:
+        def __getattr__(self, name: str) -> Any:
+            attr = getattr(redis, name)
+            if name in {"pipeline", "ping"}:
+                return attr
+
+            async def _call(*args: Any, **kwargs: Any) -> Any:
+                return attr(*args, **kwargs)
+
+            return _call
+
+    return _Client()
+
+
+@pytest.fixture
+async def memory() -> EpisodicMemory:
+    mem = EpisodicMemory(MemoryConfig(ttl_seconds=3600))
+    mem._redis = _async(_FakeAsyncRedis())
+    mem._initialized = True
+    return mem
+
+
+async def test_filtered_search_and_history_are_time_ordered(
+    memory: EpisodicMemory,
+) -> None:
+    for i in range(5):
+        await memory.store(
+            f"conv:{i}",
+            f"hello {i}",
+            {
+                "type": "conversation",
+                "participants": ["alice"] if i % 2 == 0 else ["bob"],
+                "tags": ["sales"] if i < 3 else [],
+            },
+        )
+
+    history = await memory.get_conversation_history("alice")
+    assert [e.key for e in history] == ["conv:4", "conv:2", "conv:0"]
+
+    hits = await memory.search("", filters={"participant": "alice", "tags": ["sales"]})
+    assert [e.key for e in hits] == ["conv:2", "conv:0"]
+
+    hits = await memory.search("hello 3", limit=5)
+    assert [e.key for e in hits] == ["conv:3"]
+
+    recent = await memory.get_recent_episodes(hours=1, episode_type="conversation")
+    assert len(recent) == 5
+    stale = await memory.search(
+        "", filters={"since": datetime.now() + timedelta(hours=1)}
+    )
+    assert stale == []
+
+
+async def test_prefix_listing_delete_and_clear(memory: EpisodicMemory) -> None:
+    for key in ("neg:1", "neg:2", "chat:1"):
+        await memory.store(key, {"k": key}, {"participants": ["carol"]})
+
+    assert await memory.list_keys("neg:") == ["neg:1", "neg:2"]
+    assert await memory.delete("neg:1") is True
+    assert await memory.delete("neg:1") is False
+    assert [e.key for e in await memory.get_conversation_history("carol")] == [
+        "chat:1",
+        "neg:2",
+    ]
+
+    assert await memory.clear("neg:") == 1
+    assert await memory.list_keys() == ["chat:1"]
+    assert await memory.clear() == 1
+    assert await memory.list_keys() == []
+    assert await memory.get_conversation_history("carol") == []
+
+
+async def test_overwrite_drops_old_index_memberships(memory: EpisodicMemory) -> None:
+    await memory.store("conv:1", "hi", {"participants": ["alice"], "tags": ["a"]})
+    await memory.store("conv:1", "hi again", {"participants": ["bob"]})
+
+    assert await memory.get_conversation_history("alice") == []
+    assert await memory.search("", filters={"tags": ["a"]}) == []
+    assert [e.key for e in await memory.get_conversation_history("bob")] == ["conv:1"]
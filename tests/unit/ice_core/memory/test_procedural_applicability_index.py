@@ -0,0 +1,85 @@
+"""ProceduralMemory applicability index agrees with the full per-procedure check."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ice_core.memory.memory_base_protocol import MemoryConfig
+from ice_core.memory.procedural_memory_store import ProceduralMemory
+
+
+def _brute_force(mem: ProceduralMemory, context, category=None):  # noqa: ANN001
+    hits = [
+        e
+        for e in mem._procedures.values()
+        if (category is None or e.metadata.get("category") == category)
+        and mem._is_applicable(e, context)
+    ]
+    hits.sort(key=lambda e: e.metadata.get("success_rate", 0), reverse=True)
+    return [e.key for e in hits]
+
+
+@pytest.mark.asyncio
+async def test_index_matches_full_scan_on_random_procedures() -> None:
+    rng = random.Random(7)
+    mem = ProceduralMemory(MemoryConfig())
+    types = ["offer", "inquiry", "closing"]
+    for i in range(200):
+        conditions = {}
+        if rng.random() < 0.5:
+            low = rng.choice([0.1, 0.3, 0.5, 0.7])
+            conditions["offer_range"] = [low, low + rng.choice([0.1, 0.3])]
+        if rng.random() < 0.4:
+            conditions["demand"] = rng.choice(["low", "high"])
+        if rng.random() < 0.1:
+            conditions["tags"] = {"unhashable": True}
+        await mem.store(
+            f"p{i}",
+            {"name": f"p{i}", "applicable_when": conditions},
+            {
+                "category": rng.choice(["negotiation", "closing"]),
+                "success_rate": rng.random(),
+                "contexts": rng.sample(types, rng.randint(0, 2)),
+                "prerequisites": rng.sample(["verified", "paid"], rng.randint(0, 1)),
+            },
+        )
+
+    for _ in range(100):
+        context = {"type": rng.choice(types + [""])}
+        if rng.random() < 0.7:
+            context["offer_range"] = rng.choice([0.05, 0.3, 0.55, 0.8, 1.5])
+        if rng.random() < 0.7:
+            context["demand"] = rng.choice(["low", "high"])
+        if rng.random() < 0.5:
+            context["verified"] = rng.random() < 0.5
+        category = rng.choice([None, "negotiation"])
+        found = await mem.find_applicable_procedures(context, category=category)
+        assert [e.key for e in found] == _brute_force(mem, context, category)
+
+
+@pytest.mark.asyncio
+async def test_index_follows_store_delete_and_learned_adjustments() -> None:
+    mem = ProceduralMemory(MemoryConfig())
+    await mem.store(
+        "haggle",
+        {"name": "haggle", "applicable_when": {"offer_range": [0.5, 0.9]}},
+        {"contexts": ["offer"]},
+    )
+    ctx = {"type": "offer", "offer_range": 0.6}
+    assert [e.key for e in await mem.find_applicable_procedures(ctx)] == ["haggle"]
+
+    await mem.record_execution(
+        "haggle",
+        {"learned_adjustments": {"condition_adjustments": {"offer_range": [0.7, 1]}}},
+    )
+    assert await mem.find_applicable_procedures(ctx) == []
+    ctx["offer_range"] = 0.8
+    assert [e.key for e in await mem.find_applicable_procedures(ctx)] == ["haggle"]
+
+    await mem.store("haggle", {"name": "haggle"}, {"contexts": ["inquiry"]})
+    assert await mem.find_applicable_procedures(ctx) == []
+    assert await mem.delete("haggle") is True
+    assert await mem.find_applicable_procedures({"type": "inquiry"}) == []
+    assert not mem._applicability.compiled
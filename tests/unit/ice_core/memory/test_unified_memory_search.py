@@ -0,0 +1,67 @@
+"""UnifiedMemory.search: concurrent fan-out, per-backend deadlines, RRF merge."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from ice_core.memory.memory_base_protocol import MemoryEntry
+from ice_core.memory.unified_memory_facade import UnifiedMemory, UnifiedMemoryConfig
+
+
+class _Backend:
+    def __init__(self, keys: List[str], delay: float = 0.0, fail: bool = False):
+        self.keys = keys
+        self.delay = delay
+        self.fail = fail
+
+    async def search(
+        self, query: str, limit: int = 10, filters: Optional[Dict[str, Any]] = None
+    ) -> List[MemoryEntry]:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("backend down")
+        return [MemoryEntry(key=k, content=k) for k in self.keys[:limit]]
+
+
+def _memory(**backends: _Backend) -> UnifiedMemory:
+    mem = UnifiedMemory(
+        UnifiedMemoryConfig(
+            enable_episodic=False, enable_semantic=False, enable_procedural=False
+        )
+    )
+    mem._memories = dict(backends)  # type: ignore[arg-type]
+    return mem
+
+
+@pytest.mark.asyncio
+async def test_backends_run_concurrently_and_slow_ones_are_dropped() -> None:
+    mem = _memory(
+        working=_Backend(["w1", "w2"], delay=0.1),
+        episodic=_Backend(["e1"], delay=0.1),
+        semantic=_Backend(["s1"], delay=5.0),
+        procedural=_Backend(["p1"], fail=True),
+    )
+    started = time.perf_counter()
+    results = await mem.search("q", timeout=0.3)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.3 + 0.15  # max of the deadlines, not the sum of delays
+    assert {e.key for e in results} == {"w1", "w2", "e1"}
+
+
+@pytest.mark.asyncio
+async def test_reciprocal_rank_fusion_with_weights() -> None:
+    mem = _memory(
+        working=_Backend(["a", "shared", "b"]),
+        semantic=_Backend(["c", "shared"]),
+    )
+    # Backends have separate key spaces: "shared" is two distinct results
+    results = await mem.search("q")
+    assert [e.key for e in results] == ["a", "c", "shared", "shared", "b"]
+
+    weighted = await mem.search("q", weights={"semantic": 3.0}, limit=2)
+    assert [e.key for e in weighted] == ["c", "shared"]
@@ -0,0 +1,67 @@
+"""WorkingMemory token index and expiry heap keep substring-search semantics."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ice_core.memory.memory_base_protocol import MemoryConfig
+from ice_core.memory.working_memory_store import WorkingMemory
+
+
+@pytest.mark.asyncio
+async def test_index_matches_plain_substring_search() -> None:
+    mem = WorkingMemory(MemoryConfig(backend="memory", ttl_seconds=300))
+    docs = {
+        "a": "Hello world, the quick brown fox",
+        "b": {"note": "helloworld jumps"},
+        "c": "The lazy DOG sleeps",
+        "d": "quick-brown fox's den",
+    }
+    for key, content in docs.items():
+        await mem.store(key, content, {"kind": "doc" if key != "d" else "other"})
+
+    for query in [
+        "",
+        "hello",
+        "world",
+        "lo wor",
+        "quick brown",
+        "k-bro",
+        "DOG s",
+        "zz",
+    ]:
+        expected = [k for k, v in docs.items() if query.lower() in str(v).lower()]
+        assert [e.key for e in await mem.search(query)] == expected, query
+
+    assert [e.key for e in await mem.search("fox", filters={"kind": "doc"})] == ["a"]
+
+    # Re-storing replaces indexed content; delete drops it from the index
+    await mem.store("c", "no animals here")
+    assert await mem.search("dog") == []
+    assert await mem.delete("a") is True
+    assert [e.key for e in await mem.search("fox")] == ["d"]
+    assert "hello" not in mem._postings
+
+
+@pytest.mark.asyncio
+async def test_expiry_heap_and_lru_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    mem = WorkingMemory(MemoryConfig(backend="memory", ttl_seconds=10, max_entries=3))
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    await mem.store("old", "alpha")
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+    await mem.store("new", "alpha beta")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert [e.key for e in await mem.search("alpha")] == ["new"]
+    assert await mem.retrieve("old") is None
+    assert "old" not in mem._expires_at
+
+    for key in ("x", "y", "z"):
+        await mem.store(key, f"alpha {key}")
+    # max_entries=3 evicts the least recently used entry from every index
+    assert await mem.list_keys() == ["x", "y", "z"]
+    assert [e.key for e in await mem.search("alpha")] == ["x", "y", "z"]
+    assert all("new" not in keys for keys in mem._postings.values())
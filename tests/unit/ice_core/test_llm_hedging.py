@@ -0,0 +1,101 @@
+"""Hedged LLM requests: learned delay, fallback target, spend cap, deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, List, Optional
+
+import pytest
+
+from ice_core.llm import service as service_mod
+from ice_core.llm.hedging import HedgePolicy
+from ice_core.llm.providers.base_handler import BaseLLMHandler
+from ice_core.llm.service import LLMService
+from ice_core.models import LLMConfig, ModelProvider
+from ice_core.utils.deadline import deadline_scope
+
+
+class _Handler(BaseLLMHandler):
+    """First call to *stall_model* hangs; everything else answers quickly."""
+
+    def __init__(self, stall_model: str = "gpt-4o") -> None:
+        self.stall_model = stall_model
+        self.calls: List[str] = []
+        self.cancelled: List[str] = []
+
+    async def generate_text(  # type: ignore[override]
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: dict[str, Any],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> tuple[str, Optional[dict[str, int]], Optional[str]]:
+        model = str(llm_config.model)
+        self.calls.append(model)
+        delay = 5.0 if model == self.stall_model and len(self.calls) == 1 else 0.01
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        return f"from {model}", {"total_tokens": 1}, None
+
+
+def _service(
+    monkeypatch: pytest.MonkeyPatch, handler: _Handler, **policy: Any
+) -> LLMService:
+    hedge_policy = HedgePolicy(min_samples=3, **policy)
+    for _ in range(3):
+        hedge_policy.tracker.record("openai:gpt-4o", 0.05)
+        hedge_policy.note_request("openai:gpt-4o")
+    monkeypatch.setattr(service_mod, "_hedge_policy", hedge_policy)
+    service = LLMService(hedge=True)
+    service.handlers = {ModelProvider.OPENAI: handler}
+    return service
+
+
+@pytest.mark.asyncio
+async def test_stalled_request_is_hedged_to_fallback_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    handler = _Handler()
+    service = _service(monkeypatch, handler, max_ratio=1.0)
+    cfg = LLMConfig(model="gpt-4o", fallback_model="gpt-4o-mini")
+
+    started = time.perf_counter()
+    text, usage, error = await service.generate(cfg, "hi")
+    assert time.perf_counter() - started < 1.0
+    assert (text, error) == ("from gpt-4o-mini", None)
+    assert handler.calls == ["gpt-4o", "gpt-4o-mini"]
+    assert handler.cancelled == ["gpt-4o"]
+    # The cancelled primary's partial latency is not a sample
+    assert service_mod._hedge_policy.tracker.count("openai:gpt-4o") == 3
+
+
+@pytest.mark.asyncio
+async def test_spend_cap_blocks_hedging(monkeypatch: pytest.MonkeyPatch) -> None:
+    handler = _Handler()
+    service = _service(monkeypatch, handler, max_ratio=0.0)
+    text, _, error = await service.generate(
+        LLMConfig(model="gpt-4o"), "hi", timeout_seconds=0.2
+    )
+    assert handler.calls == ["gpt-4o"]
+    assert error == "Request timed out"
+
+
+@pytest.mark.asyncio
+async def test_node_deadline_bounds_the_request() -> None:
+    handler = _Handler()
+    service = LLMService()
+    service.handlers = {ModelProvider.OPENAI: handler}
+
+    started = time.perf_counter()
+    with deadline_scope(0.1):
+        _, _, error = await service.generate(LLMConfig(model="gpt-4o"), "hi")
+    assert error == "Request timed out"
+    assert time.perf_counter() - started < 1.0
+
+    with deadline_scope(0):
+        _, _, error = await service.generate(LLMConfig(model="gpt-4o"), "hi")
+    assert error == "Deadline exceeded"
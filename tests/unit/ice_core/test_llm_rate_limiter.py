@@ -0,0 +1,142 @@
+"""LLM rate limiter: header adaptation, FIFO queueing, reservation settling."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, List, Optional
+
+import pytest
+
+from ice_core.llm.providers.base_handler import BaseLLMHandler
+from ice_core.llm.rate_limiter import (
+    RateLimiter,
+    get_rate_limiter,
+    parse_rate_limit_headers,
+    reset_rate_limiters,
+)
+from ice_core.llm.service import LLMService
+from ice_core.models import LLMConfig, ModelProvider
+
+
+def test_parse_openai_and_anthropic_headers() -> None:
+    update = parse_rate_limit_headers(
+        {
+            "X-RateLimit-Limit-Requests": "500",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-remaining-tokens": "1200",
+            "x-ratelimit-reset-requests": "1m30s",
+            "x-ratelimit-reset-tokens": "20ms",
+        }
+    )
+    assert (update.rpm, update.tpm) == (500, 30000)
+    assert (update.remaining_requests, update.remaining_tokens) == (0, 1200)
+    assert update.block_seconds == 90
+
+    update = parse_rate_limit_headers(
+        {"anthropic-ratelimit-tokens-limit": "40000", "retry-after": "3"}, 429
+    )
+    assert update.tpm == 40000 and update.rpm is None
+    assert update.block_seconds == 3
+    assert parse_rate_limit_headers({}, 429).block_seconds == 1.0
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_arrival_order() -> None:
+    limiter = RateLimiter("openai", "gpt-4o", rpm=6000)  # one request / 10ms
+    limiter._local.requests = 0
+    order: List[int] = []
+
+    async def call(i: int) -> None:
+        await limiter.acquire()
+        order.append(i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+    assert time.perf_counter() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_headers_activate_limits_and_settle_refunds_tokens() -> None:
+    limiter = RateLimiter("anthropic", "claude", tpm=0)
+    assert await limiter.acquire(10**9) == 0  # nothing known yet: pass-through
+
+    await limiter.observe({"anthropic-ratelimit-tokens-limit": "6000"})
+    assert await limiter.acquire(5000) == 5000
+    await limiter.settle(5000, actual_tokens=200)
+    # The unused 4800 tokens were returned, so this fits without waiting
+    started = time.perf_counter()
+    await limiter.acquire(5000)
+    assert time.perf_counter() - started < 0.05
+
+    await limiter.observe({"retry-after-ms": "60"}, status=429)
+    started = time.perf_counter()
+    await limiter.acquire(0)
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_registry_keys_by_provider_model_and_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reset_rate_limiters()
+    monkeypatch.setenv("ICE_LLM_RATE_LIMITS", "openai=100/1000,openai:gpt-4o=5/50")
+    a = get_rate_limiter("openai", "gpt-4o", "sk-one")
+    assert a is get_rate_limiter("openai", "gpt-4o", "sk-one")
+    assert a is not get_rate_limiter("openai", "gpt-4o", "sk-two")
+    assert (a.default_rpm, a.default_tpm) == (5, 50)
+    other = get_rate_limiter("openai", "gpt-4", None)
+    assert other is not None and (other.default_rpm, other.default_tpm) == (100, 1000)
+    assert "sk-one" not in a.redis_key
+
+    monkeypatch.setenv("ICE_LLM_RATE_LIMIT", "0")
+    assert get_rate_limiter("openai", "gpt-4o") is None
+    reset_rate_limiters()
+
+
+class _FailingHandler(BaseLLMHandler):
+    """Sends with its own key and fails without reporting usage."""
+
+    def api_key(self, llm_config: LLMConfig) -> Optional[str]:
+        return "sk-handler"
+
+    async def generate_text(  # type: ignore[override]
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: dict[str, Any],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> tuple[str, Optional[dict[str, int]], Optional[str]]:
+        return "", None, "upstream error"
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_return_their_reservation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reset_rate_limiters()
+    monkeypatch.setenv("ICE_LLM_RATE_LIMITS", "openai=0/1000")
+    monkeypatch.setenv("ICE_LLM_RATE_LIMIT_REDIS", "0")
+    service = LLMService(coalesce=False, hedge=False)
+    service.handlers = {ModelProvider.OPENAI: _FailingHandler()}
+    # Keyed on the key the handler sends, not the one in the config
+    limiter = get_rate_limiter("openai", "gpt-4o", "sk-handler")
+    assert limiter is not None
+    settled: List[Any] = []
+    settle = limiter.settle
+
+    async def spy(reserved: float, actual_tokens: Optional[int]) -> None:
+        settled.append((reserved, actual_tokens))
+        await settle(reserved, actual_tokens)
+
+    monkeypatch.setattr(limiter, "settle", spy)
+
+    _, _, error = await service.generate(
+        LLMConfig(model="gpt-4o", api_key="sk-config", max_tokens=500), "hi"
+    )
+
+    assert error == "upstream error"
+    assert len(settled) == 1 and settled[0][0] >= 500 and settled[0][1] == 0
+    assert limiter._local.tokens > 900
+    reset_rate_limiters()
@@ -0,0 +1,106 @@
+"""Blob offloading: lazy references, round-trips and content addressing."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import jinja2
+import pytest
+
+from ice_core.utils.blob_store import (
+    BlobNotFoundError,
+    BlobRef,
+    BlobStore,
+    is_blob_ref,
+)
+
+
+def test_small_values_stay_inline(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=64)
+    output = {"text": "short", "n": 3, "items": ["a", "b"]}
+    assert store.offload(output) == output
+    assert not any(tmp_path.iterdir())
+
+
+def test_large_text_becomes_a_lazy_reference(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=64)
+    text = "é" * 1000
+    output = store.offload({"text": text, "title": "doc"})
+
+    ref = output["text"]
+    assert isinstance(ref, BlobRef) and ref["kind"] == "text"
+    assert ref["size"] == len(text.encode())
+    assert output["title"] == "doc"
+    assert len(json.dumps(output, ensure_ascii=False)) < 400
+
+    # Templates render the content; the serialised form still resolves
+    rendered = jinja2.Template("{{ doc.text }}").render(doc=output)
+    assert rendered == text
+    assert store.resolve(json.loads(json.dumps(output))) == {
+        "text": text,
+        "title": "doc",
+    }
+
+
+def test_large_collections_are_offloaded_as_json(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=256)
+    chunks = [f"chunk {i}" for i in range(200)]
+    output = store.offload({"chunks": chunks})
+
+    assert is_blob_ref(output["chunks"]) and output["chunks"]["kind"] == "json"
+    assert store.resolve(output) == {"chunks": chunks}
+
+
+def test_identical_content_is_stored_once(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=16)
+    first = store.offload({"a": "x" * 100, "b": "x" * 100})
+    assert first["a"].digest == first["b"].digest
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+
+def test_zero_threshold_disables_offloading(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=0)
+    assert not store.enabled
+    assert store.offload({"text": "x" * 10_000})["text"] == "x" * 10_000
+
+
+def test_offloading_is_off_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("ICE_BLOB_OFFLOAD_BYTES", raising=False)
+    assert not BlobStore(tmp_path).enabled
+
+
+def test_sweep_drops_blobs_not_stored_within_ttl(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=16, ttl_seconds=60)
+    old = store.put(b"old" * 10)
+    kept = store.put(b"kept" * 10)
+    past = time.time() - 120
+    for digest in (old, kept):
+        os.utime(store._path(digest), (past, past))
+
+    # Storing the same content again restarts its retention period
+    assert store.put(b"kept" * 10) == kept
+    assert store.sweep() == 1
+    assert store.get(kept) == b"kept" * 10
+    with pytest.raises(KeyError):
+        store.get(old)
+    with pytest.raises(KeyError):
+        store.get("../" + kept)
+
+
+@pytest.mark.asyncio
+async def test_expired_references_fail_with_a_clear_error(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=16, ttl_seconds=60)
+    output = await store.offload_async({"text": "x" * 100})
+    assert await store.resolve_async(output) == {"text": "x" * 100}
+
+    past = time.time() - 120
+    os.utime(store._path(output["text"].digest), (past, past))
+    store.sweep()
+
+    with pytest.raises(BlobNotFoundError, match="ICE_BLOB_TTL_SECONDS"):
+        await store.resolve_async(json.loads(json.dumps(output)))
@@ -0,0 +1,148 @@
+"""SingleFlight: shared in-flight calls, cancellation, single-owner attribution."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from ice_core.llm.providers.base_handler import BaseLLMHandler
+from ice_core.llm.service import LLMService
+from ice_core.models import LLMConfig, ModelProvider
+from ice_core.utils.singleflight import SingleFlight, fingerprint
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call() -> None:
+    group: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(group.do("k", work) for _ in range(5)))
+    assert calls == 1
+    assert [r for r, _ in results] == [42] * 5
+    assert sorted(shared for _, shared in results) == [False] + [True] * 4
+    assert group.in_flight() == 0
+
+    # Nothing is cached once the call has finished
+    await group.do("k", work)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancellation_only_stops_work_without_waiters() -> None:
+    group: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+    release = asyncio.Event()
+    cancelled = False
+
+    async def work() -> str:
+        nonlocal cancelled
+        started.set()
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return "done"
+
+    leader = asyncio.create_task(group.do("k", work))
+    await started.wait()
+    follower = asyncio.create_task(group.do("k", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled  # the follower still needs the result
+    release.set()
+    # The surviving caller owns the result
+    assert await follower == ("done", False)
+
+    release.clear()
+    started.clear()
+    lone = asyncio.create_task(group.do("k2", work))
+    await started.wait()
+    lone.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+    await asyncio.sleep(0)
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_caller_after_last_cancel_starts_fresh_work() -> None:
+    group: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+    runs = 0
+
+    async def work() -> str:
+        nonlocal runs
+        runs += 1
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # Slow cleanup keeps the cancelled task alive for a while
+            await asyncio.sleep(0.05)
+            raise
+        return "stale"
+
+    lone = asyncio.create_task(group.do("k", work))
+    await started.wait()
+    lone.cancel()
+    await asyncio.sleep(0)
+
+    async def fresh() -> str:
+        return "fresh"
+
+    # Joining the dying task would raise CancelledError here
+    assert await group.do("k", fresh) == ("fresh", False)
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+
+
+def test_fingerprint_rejects_unserialisable_inputs() -> None:
+    assert fingerprint({"b": 1, "a": [1, 2]}) == fingerprint({"a": [1, 2], "b": 1})
+    assert fingerprint({"handle": object()}) is None
+
+
+class _CountingHandler(BaseLLMHandler):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate_text(  # type: ignore[override]
+        self,
+        llm_config: LLMConfig,
+        prompt: str,
+        context: dict[str, Any],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> tuple[str, Optional[dict[str, int]], Optional[str]]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"echo {prompt}", {"prompt_tokens": 3, "total_tokens": 5}, None
+
+
+@pytest.mark.asyncio
+async def test_llm_service_coalesces_identical_prompts() -> None:
+    handler = _CountingHandler()
+    service = LLMService(coalesce=True)
+    service.handlers = {ModelProvider.OPENAI: handler}
+    cfg = LLMConfig(provider=ModelProvider.OPENAI, model="gpt-4o")
+
+    results = await asyncio.gather(
+        service.generate(cfg, "hi"),
+        service.generate(cfg, "hi"),
+        service.generate(cfg, "other"),
+    )
+    assert handler.calls == 2
+    assert [text for text, _, _ in results] == ["echo hi", "echo hi", "echo other"]
+    usages = [usage for _, usage, _ in results[:2]]
+    # Exactly one caller is charged; the other records what it saved
+    assert {"prompt_tokens": 3, "total_tokens": 5} in usages
+    assert {"prompt_tokens": 0, "total_tokens": 0, "coalesced_tokens": 5} in usages
@@ -0,0 +1,124 @@
+"""TokenCountingService: content-hash cache, batch encoding, off-loop loading."""
+
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+from ice_core.utils import token_counter
+from ice_core.utils.token_counter import TokenCountingService
+
+
+class _WordEncoding:
+    """Stand-in for a tiktoken encoding: one token per whitespace word."""
+
+    def __init__(self) -> None:
+        self.encoded: List[str] = []
+
+    def encode(self, text: str, **_: object) -> List[int]:
+        self.encoded.append(text)
+        return list(range(len(text.split())))
+
+    def encode_batch(self, texts: List[str], **kwargs: object) -> List[List[int]]:
+        return [self.encode(t, **kwargs) for t in texts]
+
+
+@pytest.fixture
+def encoding(monkeypatch: pytest.MonkeyPatch) -> _WordEncoding:
+    fake = _WordEncoding()
+    monkeypatch.setitem(token_counter._encodings, "cl100k_base", fake)
+    monkeypatch.setitem(token_counter._encodings, "o200k_base", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_counts_are_cached_and_batched(encoding: _WordEncoding) -> None:
+    service = TokenCountingService()
+    assert service.encoding_name("gpt-4") == "cl100k_base"
+    assert service.encoding_name("claude-3-opus", provider="anthropic") == (
+        "cl100k_base"
+    )
+
+    assert service.count("a b c", model="gpt-4") == 3
+    assert service.count("a b c", model="gpt-4") == 3
+    assert encoding.encoded == ["a b c"]
+
+    counts = await service.count_many(["a b c", "d e", "", "d e", "f"], model="gpt-4")
+    assert counts == [3, 2, 0, 2, 1]
+    # Only the distinct cache misses were encoded
+    assert encoding.encoded == ["a b c", "d e", "f"]
+
+
+@pytest.mark.asyncio
+async def test_count_each_message_matches_single_counts(
+    encoding: _WordEncoding,
+) -> None:
+    service = TokenCountingService()
+    history = [
+        {"role": "user", "content": "hello there"},
+        {"role": "assistant", "content": "hi"},
+    ]
+
+    counts = await service.count_each_message(history, model="gpt-4")
+
+    assert counts == [1 + 2 + 4, 1 + 1 + 4]
+    assert counts == [service.count_message(m, model="gpt-4") for m in history]
+
+
+@pytest.mark.asyncio
+async def test_unloaded_encodings_are_built_off_the_loop(
+    monkeypatch: pytest.MonkeyPatch, encoding: _WordEncoding
+) -> None:
+    loaded_on: List[str] = []
+
+    def fake_get_encoding(name: str) -> _WordEncoding:
+        loaded_on.append(threading.current_thread().name)
+        return encoding
+
+    monkeypatch.setattr(token_counter.tiktoken, "get_encoding", fake_get_encoding)
+    monkeypatch.delitem(token_counter._encodings, "cl100k_base")
+    monkeypatch.delitem(token_counter._encodings, "o200k_base")
+
+    await token_counter.preload_encodings()
+
+    assert len(loaded_on) == 2
+    assert threading.current_thread().name not in loaded_on
+    # The default model (gpt-4o) uses o200k_base
+    assert token_counter._encodings["cl100k_base"] is encoding
+    assert token_counter._encodings["o200k_base"] is encoding
+
+
+def test_sync_count_estimates_until_the_encoding_is_loaded(
+    monkeypatch: pytest.MonkeyPatch, encoding: _WordEncoding
+) -> None:
+    release = threading.Event()
+    loaded_on: List[str] = []
+
+    def fake_get_encoding(name: str) -> _WordEncoding:
+        loaded_on.append(threading.current_thread().name)
+        release.wait(5)
+        return encoding
+
+    monkeypatch.setattr(token_counter.tiktoken, "get_encoding", fake_get_encoding)
+    monkeypatch.delitem(token_counter._encodings, "o200k_base")
+    service = TokenCountingService()
+
+    assert service.count("a b c " * 10, model="gpt-4o") == 15
+    assert service.count("a b c " * 10, model="gpt-4o") == 15
+    release.set()
+    for _ in range(500):
+        if "o200k_base" in token_counter._encodings:
+            break
+        threading.Event().wait(0.01)
+
+    assert service.count("a b c " * 10, model="gpt-4o") == 30
+    assert loaded_on == ["tiktoken-o200k_base"]
+
+
+def test_falls_back_to_estimate_without_encoding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(token_counter._encodings, "cl100k_base", None)
+    assert TokenCountingService().count("x" * 40, model="gpt-4") == 10
@@ -0,0 +1,132 @@
+"""Durable checkpoint store: encoding, torn logs and cross-worker resume."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from ice_core.models import NodeExecutionResult, NodeMetadata
+from ice_core.models.node_models import LLMNodeConfig
+from ice_orchestrator.execution.checkpoint_store import (
+    FileCheckpointStore,
+    checkpoint_store_from_env,
+    decode_record,
+    encode_record,
+    register_checkpoint_backend,
+)
+from ice_orchestrator.workflow import Workflow
+
+
+def _nodes() -> List[Any]:
+    def n(node_id: str, deps: List[str]) -> Any:
+        return LLMNodeConfig(
+            id=node_id,
+            type="llm",
+            model="gpt-4o",
+            prompt="p",
+            dependencies=deps,
+            llm_config={"provider": "openai", "model": "gpt-4o"},
+        )
+
+    return [n("a", []), n("b", ["a"]), n("c", ["b"])]
+
+
+def _workflow(store: FileCheckpointStore, calls: List[str], fail: set[str]) -> Workflow:
+    wf = Workflow(
+        nodes=_nodes(),
+        name="ckpt",
+        chain_id="run-1",
+        initial_context={"topic": "x", "inputs": {"topic": "x"}},
+        checkpoint_store=store,
+    )
+
+    async def fake_execute_node(node_id: str, _ctx: Dict[str, Any]):
+        calls.append(node_id)
+        return NodeExecutionResult(  # type: ignore[call-arg]
+            success=node_id not in fail,
+            error="worker died" if node_id in fail else None,
+            output={"v": node_id},
+            metadata=NodeMetadata(node_id=node_id, node_type="llm"),  # type: ignore[call-arg]
+        )
+
+    wf.execute_node = fake_execute_node  # type: ignore[method-assign]
+    return wf
+
+
+def test_record_roundtrip_is_compact() -> None:
+    record = {"k": "n", "id": "a", "r": {"output": {"text": "x" * 500}}}
+    blob = encode_record(record)
+    assert decode_record(blob) == record
+    assert len(blob) < 200
+
+
+@pytest.mark.asyncio
+async def test_resume_on_new_worker_skips_completed_nodes(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, fsync=False)
+
+    first: List[str] = []
+    result = await _workflow(store, first, fail={"c"}).resume()
+    assert first == ["a", "b", "c"]
+    assert not result.success
+
+    checkpoint = await store.load("run-1")
+    assert checkpoint is not None
+    assert checkpoint["inputs"] == {"topic": "x"}
+    assert set(checkpoint["completed_nodes"]) == {"a", "b"}
+
+    second: List[str] = []
+    result = await _workflow(FileCheckpointStore(tmp_path), second, fail=set()).resume()
+    assert second == ["c"]
+    assert result.success
+    assert result.output["a"] == {"v": "a"}
+    # Completed runs do not leave checkpoints behind
+    assert await store.load("run-1") is None
+
+
+@pytest.mark.asyncio
+async def test_torn_tail_is_ignored(tmp_path: Path) -> None:
+    store = FileCheckpointStore(tmp_path, fsync=False)
+    await _workflow(store, [], fail={"c"}).resume()
+
+    log = next(tmp_path.glob("*.ckpt"))
+    log.write_bytes(log.read_bytes() + b"\x00\x00\x01\x00partial")
+
+    checkpoint = await store.load("run-1")
+    assert checkpoint is not None
+    assert set(checkpoint["completed_nodes"]) == {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_appends_after_a_torn_tail_stay_readable(tmp_path: Path) -> None:
+    await _workflow(
+        FileCheckpointStore(tmp_path, fsync=False), [], fail={"b", "c"}
+    ).resume()
+
+    log = next(tmp_path.glob("*.ckpt"))
+    log.write_bytes(log.read_bytes() + b"\x00\x00\x01\x00partial")
+
+    # A new worker resumes and records more nodes after the crash
+    store = FileCheckpointStore(tmp_path, fsync=False)
+    await _workflow(store, [], fail={"c"}).resume()
+
+    checkpoint = await FileCheckpointStore(tmp_path).load("run-1")
+    assert checkpoint is not None
+    assert set(checkpoint["completed_nodes"]) == {"a", "b"}
+
+
+def test_store_from_env_is_built_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    built: List[FileCheckpointStore] = []
+
+    def factory() -> FileCheckpointStore:
+        built.append(FileCheckpointStore(tmp_path))
+        return built[-1]
+
+    register_checkpoint_backend("test-once", factory)
+    monkeypatch.setenv("ICE_CHECKPOINT_STORE", "test-once")
+
+    assert checkpoint_store_from_env() is checkpoint_store_from_env()
+    assert len(built) == 1
@@ -0,0 +1,118 @@
+"""Incremental execution: checkpoint reuse, dirty subgraph and early cutoff."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from ice_core.models import NodeExecutionResult, NodeMetadata
+from ice_core.models.node_models import LLMNodeConfig
+from ice_orchestrator.workflow import Workflow
+
+
+def _node(node_id: str, deps: List[str] | None = None, prompt: str = "p") -> Any:
+    return LLMNodeConfig(
+        id=node_id,
+        type="llm",
+        model="gpt-4o",
+        prompt=prompt,
+        dependencies=deps or [],
+        llm_config={"provider": "openai", "model": "gpt-4o"},
+    )
+
+
+def _blueprint(b_prompt: str = "p", d_prompt: str = "p") -> List[Any]:
+    # a -> b -> c,  a -> d
+    return [
+        _node("a"),
+        _node("b", ["a"], prompt=b_prompt),
+        _node("c", ["b"]),
+        _node("d", ["a"], prompt=d_prompt),
+    ]
+
+
+def _make_workflow(nodes: List[Any], outputs: Dict[str, Any], calls: List[str]):
+    wf = Workflow(nodes=nodes, name="incr", initial_context={"topic": "x"})
+
+    async def fake_execute_node(node_id: str, _ctx: Dict[str, Any]):
+        calls.append(node_id)
+        result = NodeExecutionResult(  # type: ignore[call-arg]
+            success=True,
+            output=outputs.get(node_id, {"v": node_id}),
+            metadata=NodeMetadata(node_id=node_id, node_type="llm"),  # type: ignore[call-arg]
+        )
+        if wf._execution_state:
+            wf._execution_state.record_node_complete(node_id, result)
+        return result
+
+    wf.execute_node = fake_execute_node  # type: ignore[method-assign]
+    return wf
+
+
+async def _first_run() -> Dict[str, Any]:
+    calls: List[str] = []
+    wf = _make_workflow(_blueprint(), {}, calls)
+    await wf.execute_incremental()
+    assert sorted(calls) == ["a", "b", "c", "d"]
+    return wf.create_checkpoint()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_blueprint_reuses_everything() -> None:
+    checkpoint = await _first_run()
+
+    calls: List[str] = []
+    wf = _make_workflow(_blueprint(), {}, calls)
+    result = await wf.execute_incremental(from_checkpoint=checkpoint)
+
+    assert calls == []
+    assert result.success
+    assert result.output["c"] == {"v": "c"}
+
+
+@pytest.mark.asyncio
+async def test_edited_node_reruns_only_downstream() -> None:
+    checkpoint = await _first_run()
+
+    calls: List[str] = []
+    wf = _make_workflow(_blueprint(b_prompt="edited"), {"b": {"v": "b2"}}, calls)
+    await wf.execute_incremental(from_checkpoint=checkpoint)
+
+    assert sorted(calls) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_same_output_stops_propagation() -> None:
+    checkpoint = await _first_run()
+
+    calls: List[str] = []
+    # b changes config but yields the previous output -> c stays cached
+    wf = _make_workflow(_blueprint(b_prompt="edited"), {}, calls)
+    await wf.execute_incremental(from_checkpoint=checkpoint)
+
+    assert calls == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_up_to_node_limits_scope_and_checkpoint_stays_honest() -> None:
+    checkpoint = await _first_run()
+
+    calls: List[str] = []
+    wf = _make_workflow(
+        _blueprint(b_prompt="edited", d_prompt="edited"), {"b": {"v": "b2"}}, calls
+    )
+    await wf.execute_incremental(up_to_node_id="b", from_checkpoint=checkpoint)
+    assert calls == ["b"]
+
+    # c and d were not refreshed, so the next resume must run them
+    partial = wf.create_checkpoint()
+    calls2: List[str] = []
+    wf2 = _make_workflow(
+        _blueprint(b_prompt="edited", d_prompt="edited"), {"b": {"v": "b2"}}, calls2
+    )
+    await wf2.execute_incremental(from_checkpoint=partial)
+    assert sorted(calls2) == ["c", "d"]
+
+    with pytest.raises(ValueError):
+        await wf2.execute_incremental(up_to_node_id="missing")
@@ -0,0 +1,138 @@
+"""Compiled plan cache: content-hash keys, single compile, per-run graphs."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from ice_core.models.mcp import Blueprint, NodeSpec
+from ice_core.models.node_models import LLMNodeConfig
+from ice_core.unified_registry import registry
+from ice_orchestrator.execution import plan_cache
+from ice_orchestrator.execution.plan_cache import PlanCache, blueprint_hash
+
+pytestmark = [pytest.mark.unit]
+
+
+def _node(node_id: str, deps: List[str] | None = None) -> Any:
+    return LLMNodeConfig(
+        id=node_id,
+        type="llm",
+        model="gpt-4o",
+        prompt="p",
+        dependencies=deps or [],
+        llm_config={"provider": "openai", "model": "gpt-4o"},
+    )
+
+
+def _specs() -> List[NodeSpec]:
+    return [
+        NodeSpec(id="a", type="llm", model="gpt-4o", prompt="p"),
+        NodeSpec(id="b", type="llm", model="gpt-4o", prompt="p", dependencies=["a"]),
+    ]
+
+
+@pytest.fixture
+def conversions(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    calls: List[int] = []
+
+    async def fake_convert(_specs: Any) -> List[Any]:
+        calls.append(1)
+        await asyncio.sleep(0)
+        return [_node("a"), _node("b", ["a"])]
+
+    monkeypatch.setattr(plan_cache, "_converted_configs", fake_convert)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_reuses_compiled_plan(conversions: List[int]) -> None:
+    cache = PlanCache(capacity=4)
+
+    first = await cache.get_or_convert(_specs())
+    second = await cache.get_or_convert(_specs())
+
+    assert second is first
+    assert len(conversions) == 1
+    assert [n.id for n in first.nodes] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compile_once(conversions: List[int]) -> None:
+    cache = PlanCache(capacity=4)
+
+    plans = await asyncio.gather(*(cache.get_or_convert(_specs()) for _ in range(5)))
+
+    assert len(conversions) == 1
+    assert all(p is plans[0] for p in plans)
+
+
+@pytest.mark.asyncio
+async def test_instantiate_gives_each_run_its_own_graph(
+    conversions: List[int],
+) -> None:
+    plan = await PlanCache(capacity=4).get_or_convert(_specs())
+
+    wf1 = plan.instantiate(name="run1")
+    wf2 = plan.instantiate(name="run2")
+
+    assert wf1.graph is not plan.graph and wf1.graph is not wf2.graph
+    assert wf1.graph.get_level_nodes() == plan.graph.get_level_nodes()
+    assert wf1.nodes["a"] is wf2.nodes["a"]
+
+
+@pytest.mark.asyncio
+async def test_registry_changes_invalidate_plans(
+    conversions: List[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = PlanCache(capacity=4)
+    first = await cache.get_or_convert(_specs())
+
+    monkeypatch.setattr(registry, "_generation", registry.generation + 1)
+    second = await cache.get_or_convert(_specs())
+
+    assert second is not first
+    assert len(conversions) == 2
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
+        self.data[key] = value
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_is_keyed_by_registry_contents(
+    conversions: List[int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    redis = _FakeRedis()
+    await PlanCache(capacity=4, redis_client=redis).get_or_convert(_specs())
+    assert len(redis.data) == 1
+
+    # Another worker: same registrations, different registration count
+    monkeypatch.setattr(registry, "_generation", registry.generation + 5)
+    await PlanCache(capacity=4, redis_client=redis).get_or_convert(_specs())
+    assert len(conversions) == 1
+
+    # A worker with an extra executor must not reuse that validation
+    monkeypatch.setitem(registry._executors, "extra", _node)
+    monkeypatch.setattr(registry, "_generation", registry.generation + 1)
+    await PlanCache(capacity=4, redis_client=redis).get_or_convert(_specs())
+    assert len(conversions) == 2
+    assert len(redis.data) == 2
+
+
+def test_blueprint_hash_ignores_blueprint_id() -> None:
+    bp1 = Blueprint(blueprint_id="one", nodes=_specs())
+    bp2 = Blueprint(blueprint_id="two", nodes=_specs())
+    bp3 = Blueprint(blueprint_id="one", nodes=_specs()[:1])
+
+    assert blueprint_hash(bp1) == blueprint_hash(bp2)
+    assert blueprint_hash(bp1) != blueprint_hash(bp3)
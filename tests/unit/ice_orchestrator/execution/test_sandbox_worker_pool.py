@@ -0,0 +1,88 @@
+"""Warm sandbox worker pool: reuse, limits, timeouts and recycling."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ice_orchestrator.execution.sandbox.worker_pool import SandboxWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_workers_are_reused_and_recycled() -> None:
+    pool = SandboxWorkerPool(size=1, max_tasks_per_worker=2, preload=["math"])
+    try:
+        await pool.start()
+        (first_pid,) = pool.worker_pids
+
+        out = await pool.run(
+            "print('noise')\nresult = math.sqrt(context['x'])",
+            {"x": 16},
+            allowed_imports=["math"],
+        )
+        assert out == {"ok": True, "output": {"result": 4.0}}
+        assert pool.worker_pids == [first_pid]
+
+        await pool.run("output['y'] = 1", {})
+        # Second task hit max_tasks_per_worker: next run gets a fresh process
+        await pool.run("result = 1", {})
+        assert pool.worker_pids and pool.worker_pids != [first_pid]
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_module_changes_do_not_leak_into_later_tasks() -> None:
+    pool = SandboxWorkerPool(size=1, preload=["json"])
+    try:
+        await pool.run(
+            "json.dumps = None\nimport json as j\nj.loads = None",
+            {},
+            allowed_imports=["json"],
+        )
+        out = await pool.run(
+            "result = json.loads(json.dumps([1]))", {}, allowed_imports=["json"]
+        )
+        assert out == {"ok": True, "output": {"result": [1]}}
+        assert len(pool.worker_pids) == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_and_denied_imports_are_reported() -> None:
+    pool = SandboxWorkerPool(size=1)
+    try:
+        out = await pool.run("import os", {}, allowed_imports=["json"])
+        assert not out["ok"] and out["error_type"] == "ImportError"
+
+        out = await pool.run("open('/etc/passwd')", {})
+        assert not out["ok"] and out["error_type"] == "NameError"
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_worker_without_blocking_loop() -> None:
+    pool = SandboxWorkerPool(size=1)
+    try:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run("while True:\n    pass", {}, timeout=0.5)
+        task.cancel()
+        assert ticks > 10
+        assert pool.worker_pids == []
+
+        out = await pool.run("result = 2", {})
+        assert out["output"]["result"] == 2
+    finally:
+        await pool.close()
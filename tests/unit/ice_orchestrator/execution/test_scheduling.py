@@ -0,0 +1,121 @@
+"""Critical-path scheduling: upward ranks, latency history, ready-node order."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import networkx as nx
+import pytest
+
+from ice_core.models import NodeExecutionResult, NodeMetadata
+from ice_core.models.node_models import LLMNodeConfig
+from ice_orchestrator.execution.scheduling import NodeLatencyStore, upward_ranks
+from ice_orchestrator.workflow import Workflow
+
+
+def test_upward_rank_is_longest_remaining_path() -> None:
+    graph = nx.DiGraph([("a", "b"), ("a", "c"), ("c", "d")])
+    ranks = upward_ranks(graph, {"a": 1.0, "b": 5.0, "c": 1.0, "d": 2.0})
+    assert ranks == {"d": 2.0, "c": 3.0, "b": 5.0, "a": 6.0}
+
+
+@pytest.mark.asyncio
+async def test_latency_store_moving_average_and_shared_tier() -> None:
+    class _FakeRedis:
+        def __init__(self) -> None:
+            self.hashes: Dict[str, Dict[str, str]] = {}
+
+        async def hgetall(self, key: str) -> Dict[str, str]:
+            return dict(self.hashes.get(key, {}))
+
+        async def hset(self, key: str, field: str, value: str) -> int:
+            self.hashes.setdefault(key, {})[field] = value
+            return 1
+
+        async def expire(self, key: str, ttl: int) -> bool:
+            return True
+
+    redis = _FakeRedis()
+    worker_a = NodeLatencyStore(redis_client=redis)
+    await worker_a.record("bp", "n", 10.0)
+    await worker_a.record("bp", "n", 20.0)
+    assert await worker_a.load("bp") == {"n": pytest.approx(13.0)}
+
+    # Another worker sees the history without having run the node
+    worker_b = NodeLatencyStore(redis_client=redis)
+    assert await worker_b.load("bp") == {"n": pytest.approx(13.0)}
+    assert await worker_b.load("other") == {}
+
+
+def _node(node_id: str, deps: List[str] | None = None) -> Any:
+    return LLMNodeConfig(
+        id=node_id,
+        type="llm",
+        model="gpt-4o",
+        prompt="p",
+        dependencies=deps or [],
+        llm_config={"provider": "openai", "model": "gpt-4o"},
+    )
+
+
+def _nodes() -> List[Any]:
+    # a -> b,  a -> c -> d : c heads the longer chain
+    return [_node("a"), _node("b", ["a"]), _node("c", ["a"]), _node("d", ["c"])]
+
+
+def _workflow(store: NodeLatencyStore, started: List[str]) -> Workflow:
+    nodes = _nodes()
+    # LLM nodes weigh two slots, so at most one runs at a time
+    wf = Workflow(nodes=nodes, name="sched", max_parallel=2)
+    wf._scheduler._store = store
+
+    async def fake_execute_node(node_id: str, _ctx: Dict[str, Any]):
+        started.append(node_id)
+        return NodeExecutionResult(  # type: ignore[call-arg]
+            success=True,
+            output={"v": node_id},
+            metadata=NodeMetadata(node_id=node_id, node_type="llm"),  # type: ignore[call-arg]
+        )
+
+    wf.execute_node = fake_execute_node  # type: ignore[method-assign]
+    return wf
+
+
+@pytest.mark.asyncio
+async def test_ready_nodes_start_by_remaining_critical_path() -> None:
+    store = NodeLatencyStore()
+    started: List[str] = []
+    await _workflow(store, started).execute()
+    # Equal priors: c (c + d remaining) outranks b despite list order
+    assert started == ["a", "c", "b", "d"]
+
+    # Observed history makes b the long pole
+    key = _workflow(store, started)._scheduler.blueprint
+    await store.record(key, "b", 30.0)
+    started.clear()
+    await _workflow(store, started).execute()
+    assert started == ["a", "b", "c", "d"]
+
+    started.clear()
+    wf = _workflow(NodeLatencyStore(), started)
+    wf._scheduler.policy = "fifo"
+    await wf.execute()
+    assert started == ["a", "b", "c", "d"]
+
+
+def test_history_is_keyed_by_blueprint_content_not_name() -> None:
+    key = Workflow(nodes=_nodes(), name="sched")._scheduler.blueprint
+    assert Workflow(nodes=_nodes(), name="other")._scheduler.blueprint == key
+    assert Workflow(nodes=_nodes()[:3], name="sched")._scheduler.blueprint != key
+
+
+def test_critical_path_weighs_node_durations() -> None:
+    wf = Workflow(nodes=_nodes(), name="sched")
+    graph = wf.graph
+    # One slow node outweighs the longer chain of quick ones
+    for node_id, seconds in {"a": 1.0, "b": 30.0, "c": 1.0, "d": 2.0}.items():
+        graph.graph.nodes[node_id]["avg_execution_time"] = seconds
+    assert graph.get_critical_path() == ["a", "b"]
+
+    graph.graph.nodes["d"]["avg_execution_time"] = 40.0
+    assert graph.get_critical_path() == ["a", "c", "d"]
@@ -0,0 +1,143 @@
+"""Tool execution modes: process pool (with shared memory), threads, overrides."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List
+
+import pytest
+
+from ice_core.base_tool import ToolBase
+from ice_orchestrator.execution import tool_offload
+from ice_orchestrator.execution.tool_offload import (
+    dispatch_tool,
+    resolve_execution_mode,
+    shutdown_tool_pools,
+)
+
+
+class _ChecksumTool(ToolBase):
+    name: str = "offload_checksum"
+    description: str = "Sum a large byte payload in a worker process"
+    execution_mode: ClassVar[str] = "process"
+
+    async def _execute_impl(self, *, data: bytes) -> Dict[str, Any]:
+        return {"pid": os.getpid(), "total": sum(data), "echo": data}
+
+
+class _SlowTool(ToolBase):
+    name: str = "offload_slow"
+    description: str = "Return a large payload after a while"
+    execution_mode: ClassVar[str] = "process"
+
+    async def _execute_impl(self, *, data: bytes) -> Dict[str, Any]:
+        time.sleep(0.5)
+        return {"echo": data}
+
+
+class _BlockingTool(ToolBase):
+    name: str = "offload_blocking"
+    description: str = "Report the thread it ran on"
+    execution_mode: ClassVar[str] = "thread"
+
+    async def _execute_impl(self) -> Dict[str, Any]:
+        return {"thread": threading.current_thread().name}
+
+
+@pytest.fixture(autouse=True)
+def _pools():
+    yield
+    shutdown_tool_pools()
+
+
+@pytest.mark.asyncio
+async def test_process_mode_passes_large_payloads_through_shared_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ICE_TOOL_SHM_THRESHOLD_BYTES", "1024")
+    packed = []
+    original = tool_offload._pack
+
+    def _spy(obj: Any):
+        payload = original(obj)
+        packed.append(payload[0])
+        return payload
+
+    monkeypatch.setattr(tool_offload, "_pack", _spy)
+    data = bytes(range(256)) * 64
+
+    out = await dispatch_tool(_ChecksumTool(), {"data": data})
+
+    assert out["pid"] != os.getpid()
+    assert out["total"] == sum(data)
+    assert out["echo"] == data
+    assert packed == ["shm"]
+
+
+def test_raw_buffers_are_not_pickled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ICE_TOOL_SHM_THRESHOLD_BYTES", "1024")
+    pickled: List[int] = []
+    dumps = pickle.dumps
+
+    def _spy(*args: Any, **kwargs: Any) -> bytes:
+        out = dumps(*args, **kwargs)
+        pickled.append(len(out))
+        return out
+
+    monkeypatch.setattr(tool_offload.pickle, "dumps", _spy)
+    data = bytes(range(256)) * 256
+    payload = tool_offload._pack(
+        {"raw": data, "buf": bytearray(data), "view": memoryview(data), "n": 1}
+    )
+
+    assert payload[0] == "shm"
+    assert max(pickled) < 1024
+    out = tool_offload._unpack(payload, unlink=True)
+    assert out == {"raw": data, "buf": bytearray(data), "view": data, "n": 1}
+    assert type(out["raw"]) is bytes and type(out["buf"]) is bytearray
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calls_do_not_leak_shared_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    shm = Path("/dev/shm")
+    if not shm.is_dir():
+        pytest.skip("needs /dev/shm")
+    monkeypatch.setenv("ICE_TOOL_SHM_THRESHOLD_BYTES", "1024")
+
+    def blocks() -> set[str]:
+        # Pool semaphores live here too
+        return {n for n in os.listdir(shm) if not n.startswith("sem.")}
+
+    # Warm the pool so the call below is already running when it times out
+    await dispatch_tool(_ChecksumTool(), {"data": b"warm"})
+    before = blocks()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            dispatch_tool(_SlowTool(), {"data": b"x" * 65536}), timeout=0.2
+        )
+
+    # The worker finishes later; its result block is freed when it does
+    await asyncio.sleep(1.0)
+    deadline = time.monotonic() + 10
+    while blocks() - before and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    assert not blocks() - before
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_and_env_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    out = await dispatch_tool(_BlockingTool(), {})
+    assert out["thread"].startswith("ice-tool")
+
+    monkeypatch.setenv("ICE_TOOL_EXECUTION_MODES", "offload_blocking=async,x=bogus")
+    assert resolve_execution_mode(_BlockingTool()) == "async"
+    out = await dispatch_tool(_BlockingTool(), {})
+    assert out["thread"] == threading.current_thread().name
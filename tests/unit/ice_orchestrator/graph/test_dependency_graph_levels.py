@@ -0,0 +1,77 @@
+"""Level assignment and cycle validation in DependencyGraph."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from ice_core.exceptions import CycleDetectionError
+from ice_orchestrator.graph.dependency_graph import DependencyGraph
+
+
+@dataclass
+class _Node:
+    id: str
+    dependencies: List[str] = field(default_factory=list)
+    type: str = "tool"
+    recursive_sources: List[str] = field(default_factory=list)
+    level: int = 0
+
+
+def test_diamond_levels_and_node_attribute() -> None:
+    nodes = [
+        _Node("a"),
+        _Node("b", ["a"]),
+        _Node("c", ["a"]),
+        _Node("d", ["b", "c"]),
+    ]
+    dg = DependencyGraph(nodes)
+
+    assert dg.get_level_nodes() == {0: ["a"], 1: ["b", "c"], 2: ["d"]}
+    assert [n.level for n in nodes] == [0, 1, 1, 2]
+
+
+def test_recursive_loop_is_levelled_after_its_sources() -> None:
+    # agent <-> loop: the loop re-drives the agent until convergence
+    nodes = [
+        _Node("start"),
+        _Node("agent", ["start", "loop"]),
+        _Node("loop", ["agent"], type="recursive", recursive_sources=["agent"]),
+        _Node("end", ["loop"]),
+    ]
+    dg = DependencyGraph(nodes)
+
+    assert dg.node_levels == {"start": 0, "agent": 1, "loop": 2, "end": 3}
+
+
+def test_cycle_without_recursive_node_is_rejected() -> None:
+    nodes = [_Node("a", ["c"]), _Node("b", ["a"]), _Node("c", ["b"])]
+    with pytest.raises(CycleDetectionError, match="Invalid cycle"):
+        DependencyGraph(nodes)
+
+
+def test_cycle_bypassing_the_recursive_node_is_rejected() -> None:
+    # x <-> y forms a second cycle inside the loop that never hits "loop"
+    nodes = [
+        _Node("x", ["loop", "y"]),
+        _Node("y", ["x"]),
+        _Node("loop", ["x"], type="recursive", recursive_sources=["x"]),
+    ]
+    with pytest.raises(CycleDetectionError):
+        DependencyGraph(nodes)
+
+
+def test_large_graph_defers_analytics() -> None:
+    nodes = [_Node("n0")] + [
+        _Node(f"n{i}", [f"n{i - 1}", f"n{i // 2}"] if i > 1 else ["n0"])
+        for i in range(1, 2000)
+    ]
+    dg = DependencyGraph(nodes)
+
+    assert dg.get_node_level("n1999") == 1999
+    assert dg._centrality is None
+
+    assert dg.get_bottleneck_nodes() == dg.get_bottleneck_nodes()
+    assert dg._centrality is not None
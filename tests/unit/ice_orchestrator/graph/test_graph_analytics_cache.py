@@ -0,0 +1,92 @@
+"""Fingerprint-keyed graph analytics cache and incremental layouts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import networkx as nx
+import pytest
+
+from ice_orchestrator.context.graph_analyzer import GraphAnalyzer
+from ice_orchestrator.graph.analytics_cache import (
+    GraphAnalyticsCache,
+    graph_fingerprint,
+)
+from ice_orchestrator.graph.dependency_graph import DependencyGraph
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: Dict[str, str] = {}
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key: str, value: str, ex: Any = None) -> None:
+        self.data[key] = value
+
+
+@dataclass
+class _Node:
+    id: str
+    dependencies: List[str] = field(default_factory=list)
+    type: str = "tool"
+
+
+def _graph(*edges: tuple[str, str]) -> nx.DiGraph:
+    g = nx.DiGraph()
+    for u, v in edges:
+        g.add_node(u, node_type="tool")
+        g.add_node(v, node_type="tool")
+        g.add_edge(u, v)
+    return g
+
+
+def test_fingerprint_ignores_insertion_order_and_attributes() -> None:
+    a = _graph(("a", "b"), ("a", "c"))
+    b = _graph(("a", "c"), ("a", "b"))
+    b.nodes["a"]["execution_state"] = "running"
+    assert graph_fingerprint(a) == graph_fingerprint(b)
+    assert graph_fingerprint(a) != graph_fingerprint(_graph(("a", "b"), ("b", "c")))
+
+
+@pytest.mark.asyncio
+async def test_results_are_shared_across_analyzers_and_processes() -> None:
+    redis = _FakeRedis()
+    edges = [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+
+    cache = GraphAnalyticsCache(redis_client=redis)
+    first = GraphAnalyzer(_graph(*edges), cache=cache)
+    metrics = first.get_metrics()
+    hints = first.get_spatial_layout_hints()
+    assert metrics.critical_path_length == 2
+    await cache.flush()
+
+    # A second "worker" with a cold local tier is warmed from Redis
+    other = GraphAnalyticsCache(redis_client=redis)
+    await other.warm(_graph(*edges))
+    second = GraphAnalyzer(_graph(*edges), cache=other)
+    calls: list[str] = []
+    second._compute_metrics = lambda: calls.append("metrics")  # type: ignore
+    assert second.get_metrics() == metrics
+    assert second.get_spatial_layout_hints() == hints
+    assert calls == []
+
+
+def test_adding_a_node_keeps_existing_positions() -> None:
+    cache = GraphAnalyticsCache()
+    before = cache.positions(_graph(("a", "b"), ("b", "c"), ("a", "d")), lineage="wf")
+    after = cache.positions(
+        _graph(("a", "b"), ("b", "c"), ("a", "d"), ("c", "e")), lineage="wf"
+    )
+
+    for node_id, xy in before.items():
+        assert after[node_id] == xy
+    assert "e" in after
+
+
+def test_node_data_triggers_lazy_analytics() -> None:
+    dg = DependencyGraph([_Node("a"), _Node("b", ["a"]), _Node("c", ["b"])])
+
+    assert all(dg.get_node_data(n)["is_critical_path"] for n in ("a", "b", "c"))
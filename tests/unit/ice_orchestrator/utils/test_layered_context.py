@@ -0,0 +1,114 @@
+"""LayeredContext: copy-free overlays over shared context layers."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from ice_core.models.node_models import AgentNodeConfig
+from ice_core.unified_registry import registry
+from ice_core.utils.blob_store import BlobStore
+from ice_core.utils.singleflight import fingerprint
+from ice_orchestrator.context import LayeredContext, materialize
+from ice_orchestrator.execution.executors.builtin import agent_executor
+from ice_orchestrator.services.tool_execution_service import ToolExecutionService
+from ice_orchestrator.utils.context_builder import ContextBuilder
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_first_layer_wins_and_writes_stay_on_top() -> None:
+    metadata = {"tone": "formal", "topic": "tides"}
+    ctx = LayeredContext({"topic": "moons"}, metadata)
+
+    item_ctx = ctx.overlay(item=1)
+    item_ctx["summary"] = "done"
+
+    assert item_ctx["topic"] == "moons"
+    assert item_ctx["tone"] == "formal"
+    assert "summary" not in ctx and "item" not in ctx
+    assert metadata == {"tone": "formal", "topic": "tides"}
+    assert item_ctx.local == {"item": 1, "summary": "done"}
+
+
+def test_boundaries_see_the_merged_view() -> None:
+    ctx = LayeredContext({"a": 1}, {"a": 0, "b": {"c": [10, 20]}})
+
+    assert materialize(ctx) == {"a": 1, "b": {"c": [10, 20]}}
+    assert ContextBuilder.resolve_nested_path(ctx, "b.c.1") == 20
+    assert fingerprint(ctx) == fingerprint({"a": 1, "b": {"c": [10, 20]}})
+
+
+def test_blob_resolution_overlays_only_changed_keys(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path, threshold=16)
+    shared = {"doc": store.offload({"text": "x" * 100}), "n": 1}
+    ctx = LayeredContext({}, shared)
+
+    resolved = store.resolve(ctx)
+    assert resolved["doc"] == {"text": "x" * 100}
+    assert resolved["n"] == 1
+    assert shared["doc"]["text"]["kind"] == "text"  # shared layer untouched
+
+    plain = LayeredContext({"n": 2})
+    assert store.resolve(plain) is plain
+
+
+class _MemoryTool:
+    def __init__(self) -> None:
+        self.memory: Optional[Any] = None
+
+    async def execute(self, memory: Any = None) -> Dict[str, Any]:
+        self.memory = memory
+        return {"ok": True}
+
+
+class _ContextAgent:
+    seen: List[str] = []
+
+    def allowed_tools(self) -> List[str]:
+        return ["memory_tool"]
+
+    async def think(self, context: Dict[str, Any]) -> str:
+        return ""
+
+    async def decide(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        self.seen.append(json.dumps(context, sort_keys=True))
+        return {"tool": "memory_tool", "inputs": {}, "done": True}
+
+
+def create_context_agent(**_: Any) -> _ContextAgent:
+    return _ContextAgent()
+
+
+@pytest.mark.asyncio
+async def test_agent_executor_accepts_a_layered_context(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tool = _MemoryTool()
+    monkeypatch.setattr(
+        ToolExecutionService, "_get_tool_instance", lambda self, name: tool
+    )
+    registry.register_agent("layered_ctx_agent", f"{__name__}:create_context_agent")
+    _ContextAgent.seen.clear()
+    cfg = AgentNodeConfig(
+        id="agent1",
+        type="agent",
+        package="layered_ctx_agent",
+        llm_config={"provider": "openai", "model": "gpt-4o"},
+    )
+    shared = {"memory": "mem-handle", "query": "tides"}
+    ctx = LayeredContext({"upstream": {"n": 1}}, shared)
+
+    result = await agent_executor(None, cfg, ctx)
+
+    assert result.success, result.error
+    assert result.output["result"] == {"ok": True}
+    assert json.loads(_ContextAgent.seen[0])["query"] == "tides"
+    assert tool.memory == "mem-handle"
+    assert "agent" not in shared  # agent state never lands in a shared layer
+
+    # Direct callers may still hand the tool service a layered context
+    tool.memory = None
+    await ToolExecutionService().execute_tool("memory_tool", {}, ctx)
+    assert tool.memory == "mem-handle"